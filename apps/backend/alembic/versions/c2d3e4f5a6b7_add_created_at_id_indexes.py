@@ -0,0 +1,43 @@
+"""add (created_at, id) indexes for keyset pagination
+
+Revision ID: c2d3e4f5a6b7
+Revises: a0b1c2d3e4f5
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c2d3e4f5a6b7"
+down_revision: str | Sequence[str] | None = "a0b1c2d3e4f5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = ["users", "roles", "permissions", "files", "audit_logs"]
+
+
+def _existing_tables() -> list[str]:
+    # audit_logs is created outside the migration chain in some deployments
+    inspector = sa.inspect(op.get_bind())
+    return [table for table in TABLES if inspector.has_table(table)]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in _existing_tables():
+        op.create_index(
+            f"ix_{table}_created_at_id", table, ["created_at", "id"], unique=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    for table in _existing_tables():
+        indexes = {index["name"] for index in inspector.get_indexes(table)}
+        if f"ix_{table}_created_at_id" in indexes:
+            op.drop_index(f"ix_{table}_created_at_id", table_name=table)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+"""Benchmark requests/sec through the full middleware stack.
+
+Drives the real application in-process over an ASGI transport, so the numbers
+reflect framework and middleware overhead rather than network I/O. Run it on
+two revisions to compare, e.g.:
+
+    uv run python scripts/bench_middleware.py --requests 2000
+    git stash && uv run python scripts/bench_middleware.py --requests 2000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Run with every middleware enabled, but keep the rate limiter from rejecting
+# and the access log from flooding the terminal
+os.environ.setdefault("RATE_LIMIT_REQUESTS", "1000000000")
+os.environ.setdefault("TRUSTED_HOST_ENABLED", "true")
+os.environ.setdefault("LOG_LEVEL", "warning")
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+from sqlalchemy.ext.asyncio import (  # noqa: E402
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool  # noqa: E402
+from src.app.core.security import create_access_token  # noqa: E402
+from src.app.db.base import Base  # noqa: E402
+from src.app.db.session import get_db  # noqa: E402
+from src.app.main import app  # noqa: E402
+from src.app.models import Permission, Role, User  # noqa: E402
+
+ROUTES = ["/", "/api/v1/users"]
+
+
+async def setup_database() -> tuple[async_sessionmaker[AsyncSession], str]:
+    """Create an in-memory database with one user allowed to list users."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    session_maker = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with session_maker() as session:
+        permission = Permission(
+            code="users:read", name="Read Users", resource="users", action="read"
+        )
+        role = Role(code="bench", name="Benchmark")
+        role.permissions = [permission]
+        user = User(email="bench@example.com", name="Bench", is_active=True)
+        user.roles = [role]
+        session.add(user)
+        await session.commit()
+        token = create_access_token(user.id)
+
+    return session_maker, token
+
+
+async def run_route(
+    client: AsyncClient,
+    path: str,
+    headers: dict[str, str],
+    total: int,
+    concurrency: int,
+) -> float:
+    """Issue ``total`` GET requests to ``path`` and return requests/sec."""
+    remaining = total
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            response = await client.get(path, headers=headers)
+            response.raise_for_status()
+
+    # Warm up routing, dependency caches and the database connection
+    for _ in range(20):
+        await client.get(path, headers=headers)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return total / elapsed
+
+
+async def main() -> None:
+    """Run the benchmark and print requests/sec per route."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    session_maker, token = await setup_database()
+
+    async def override_get_db():
+        async with session_maker() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    headers = {"Authorization": f"Bearer {token}"}
+
+    print(
+        f"Middleware benchmark: {args.requests} requests, {args.concurrency} concurrent"
+    )
+    print("==========================================================")
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://localhost"
+    ) as client:
+        for path in ROUTES:
+            rps = await run_route(
+                client, path, headers, args.requests, args.concurrency
+            )
+            print(f"  GET {path:<20} {rps:>10.1f} req/s")
+
+    app.dependency_overrides.clear()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
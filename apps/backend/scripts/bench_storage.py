@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+"""Benchmark per-operation S3 latency with and without the shared client.
+
+Runs StorageService against a local moto server over real HTTP, once opening
+a client per operation (the behaviour before ``start()`` is called) and once
+with the long-lived client opened by the app lifespan. Requires moto's server
+extras, e.g.:
+
+    uv run --with "moto[server]" python scripts/bench_storage.py --iterations 200
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import socket
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+BUCKET = "bench"
+
+os.environ.update(
+    {
+        "S3_ACCESS_KEY_ID": "testing",
+        "S3_SECRET_ACCESS_KEY": "testing",
+        "S3_BUCKET_NAME": BUCKET,
+        "S3_REGION": "us-east-1",
+        "S3_USE_SSL": "false",
+        "LOG_LEVEL": "warning",
+    }
+)
+
+from moto.server import ThreadedMotoServer  # noqa: E402
+from src.app.core.config import settings  # noqa: E402
+from src.app.services.storage_service import StorageService  # noqa: E402
+
+PAYLOAD = b"x" * 16 * 1024
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def measure(
+    operation: Callable[[int], Awaitable[object]], iterations: int
+) -> float:
+    """Run ``operation`` sequentially and return its mean latency in ms."""
+    for i in range(5):
+        await operation(i)
+    start = time.perf_counter()
+    for i in range(iterations):
+        await operation(i)
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+async def run_operations(service: StorageService, iterations: int) -> dict[str, float]:
+    """Measure each StorageService operation on the bench bucket."""
+    uploaded: list[str] = []
+
+    async def upload(_: int) -> None:
+        result = await service.upload_file(PAYLOAD, "bench.txt", "text/plain")
+        uploaded.append(result["key"])
+
+    results = {"upload_file": await measure(upload, iterations)}
+    key = uploaded[0]
+    results["download_file"] = await measure(
+        lambda _: service.download_file(key), iterations
+    )
+    results["file_exists"] = await measure(
+        lambda _: service.file_exists(key), iterations
+    )
+    results["get_presigned_url"] = await measure(
+        lambda _: service.get_presigned_url(key), iterations
+    )
+    results["list_files"] = await measure(lambda _: service.list_files(), iterations)
+    results["delete_file"] = await measure(
+        lambda i: service.delete_file(uploaded[i]), iterations
+    )
+    return results
+
+
+async def main() -> None:
+    """Run the benchmark and print mean latency per operation."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    # Silence moto's per-request access log
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    port = free_port()
+    server = ThreadedMotoServer(ip_address="127.0.0.1", port=port, verbose=False)
+    server.start()
+    settings.s3_endpoint_url = f"http://127.0.0.1:{port}"
+
+    try:
+        per_operation = StorageService()
+        await per_operation.ensure_bucket_exists()
+        before = await run_operations(per_operation, args.iterations)
+
+        shared = StorageService()
+        await shared.start()
+        try:
+            after = await run_operations(shared, args.iterations)
+        finally:
+            await shared.close()
+    finally:
+        server.stop()
+
+    print(f"S3 storage benchmark (moto): {args.iterations} iterations, mean ms/op")
+    print("===================================================================")
+    print(
+        f"  {'operation':<20} {'per-op client':>14} {'shared client':>14} {'speedup':>9}"
+    )
+    for operation, before_ms in before.items():
+        after_ms = after[operation]
+        print(
+            f"  {operation:<20} {before_ms:>14.2f} {after_ms:>14.2f} "
+            f"{before_ms / after_ms:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,19 +1,17 @@
 """Admin API endpoints."""
 
-from datetime import UTC, datetime, timedelta
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel, Field
-from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.app.core.config import settings
 from src.app.core.deps import require_permissions
-from src.app.db import get_db
-from src.app.models import File, User
+from src.app.db import get_read_db
+from src.app.services.admin_stats import admin_stats_counters, query_dashboard_stats
 
 # Type alias for dependency injection
-DbSession = Annotated[AsyncSession, Depends(get_db)]
+DbSession = Annotated[AsyncSession, Depends(get_read_db)]
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
@@ -56,63 +54,31 @@ class AdminStatsResponse(BaseModel):
     response_model=AdminStatsResponse,
     summary="取得系統統計資料",
     description="取得管理後台首頁的統計資料。需要 admin:access 權限。",
-    dependencies=[Depends(require_permissions(["admin:access"]))],
+    dependencies=[Depends(require_permissions("admin:access"))],
 )
 async def get_admin_stats(
     db: DbSession,
 ) -> AdminStatsResponse:
     """Get admin dashboard statistics."""
-    now = datetime.now(UTC)
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    week_start = today_start - timedelta(days=today_start.weekday())
-
-    # User statistics
-    total_users = await db.scalar(
-        select(func.count()).select_from(User).where(User.deleted_at.is_(None))
-    )
-    active_users = await db.scalar(
-        select(func.count())
-        .select_from(User)
-        .where(User.deleted_at.is_(None), User.is_active.is_(True))
-    )
-    new_today = await db.scalar(
-        select(func.count())
-        .select_from(User)
-        .where(User.deleted_at.is_(None), User.created_at >= today_start)
-    )
-    new_this_week = await db.scalar(
-        select(func.count())
-        .select_from(User)
-        .where(User.deleted_at.is_(None), User.created_at >= week_start)
-    )
-
-    # File statistics
-    total_files = await db.scalar(
-        select(func.count()).select_from(File).where(File.deleted_at.is_(None))
-    )
-    total_size = (
-        await db.scalar(
-            select(func.sum(File.size)).where(File.deleted_at.is_(None))
-        )
-        or 0
-    )
-    uploads_today = await db.scalar(
-        select(func.count())
-        .select_from(File)
-        .where(File.deleted_at.is_(None), File.created_at >= today_start)
-    )
+    stats = None
+    if settings.admin_stats_counters_enabled:
+        stats = await admin_stats_counters.get()
+        if stats is None:
+            stats = await admin_stats_counters.reconcile(db)
+    if stats is None:
+        stats = await query_dashboard_stats(db)
 
     return AdminStatsResponse(
         users=UserStats(
-            total=total_users or 0,
-            active=active_users or 0,
-            new_today=new_today or 0,
-            new_this_week=new_this_week or 0,
+            total=stats.users_total,
+            active=stats.users_active,
+            new_today=stats.users_new_today,
+            new_this_week=stats.users_new_this_week,
         ),
         files=FileStats(
-            total=total_files or 0,
-            total_size=total_size,
-            uploads_today=uploads_today or 0,
+            total=stats.files_total,
+            total_size=stats.files_total_size,
+            uploads_today=stats.files_uploaded_today,
         ),
         system=SystemStats(
             status="healthy",
@@ -8,19 +8,51 @@ from fastapi import APIRouter, Depends, Path, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.app.core.deps import require_permissions
 from src.app.core.exceptions import AuditLogNotFoundException
-from src.app.db.session import get_db
-from src.app.models import User
+from src.app.db.session import get_read_db
 from src.app.schemas import (
     AuditLogFilter,
     AuditLogRead,
     ErrorResponse,
     PaginatedAuditLogs,
 )
-from src.app.services import AuditLogNotFoundError, AuditService
+from src.app.schemas.pagination import create_pagination_meta
+from src.app.services import AuditLogNotFoundError, AuditService, Principal
 
 router = APIRouter(prefix="/audit-logs", tags=["audit"])
 
 
+async def _get_page(
+    db: AsyncSession,
+    filter_params: AuditLogFilter,
+    skip: int,
+    limit: int,
+    cursor: str | None,
+    include_total: bool | None,
+    exact_count: bool,
+) -> PaginatedAuditLogs:
+    """Get a page of audit logs by offset or cursor."""
+    service = AuditService(db)
+    page = await service.paginate_logs(
+        filter_params,
+        limit=limit,
+        cursor=cursor,
+        offset=skip,
+        include_total=cursor is None if include_total is None else include_total,
+        exact_total=exact_count,
+    )
+    return PaginatedAuditLogs(
+        data=[AuditLogRead.model_validate(log) for log in page.items],
+        meta=create_pagination_meta(
+            limit,
+            page.total,
+            page.next_cursor,
+            page=(skip // limit) + 1,
+            cursor=cursor,
+            total_estimated=page.total_estimated,
+        ),
+    )
+
+
 @router.get(
     "",
     response_model=PaginatedAuditLogs,
@@ -46,8 +78,8 @@ Supports filtering by:
     },
 )
 async def get_audit_logs(
-    _: Annotated[User, Depends(require_permissions("audit:read"))],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    _: Annotated[Principal, Depends(require_permissions("audit:read"))],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     action: Annotated[str | None, Query(description="Filter by action type")] = None,
     entity_type: Annotated[
         str | None, Query(description="Filter by entity type")
@@ -64,6 +96,18 @@ async def get_audit_logs(
     limit: Annotated[
         int, Query(ge=1, le=100, description="Maximum records to return")
     ] = 20,
+    cursor: Annotated[
+        str | None,
+        Query(description="next_cursor of the previous page; overrides skip"),
+    ] = None,
+    include_total: Annotated[
+        bool | None,
+        Query(description="Count all matching logs (default: only without a cursor)"),
+    ] = None,
+    exact_count: Annotated[
+        bool,
+        Query(description="Count exactly instead of a cached or estimated total"),
+    ] = False,
 ) -> PaginatedAuditLogs:
     """Get audit logs with optional filters."""
     filter_params = AuditLogFilter(
@@ -75,21 +119,8 @@ async def get_audit_logs(
         end_date=end_date,
     )
 
-    service = AuditService(db)
-    logs, total = await service.list_logs(filter_params, skip, limit)
-
-    page = (skip // limit) + 1 if limit > 0 else 1
-    total_pages = ((total + limit - 1) // limit) if limit > 0 else 1
-    return PaginatedAuditLogs(
-        data=[AuditLogRead.model_validate(log) for log in logs],
-        meta={
-            "page": page,
-            "limit": limit,
-            "total_items": total,
-            "total_pages": total_pages,
-            "has_next_page": page < total_pages,
-            "has_prev_page": page > 1,
-        },
+    return await _get_page(
+        db, filter_params, skip, limit, cursor, include_total, exact_count
     )
 
 
@@ -111,8 +142,8 @@ Get a single audit log by its ID.
     },
 )
 async def get_audit_log(
-    _: Annotated[User, Depends(require_permissions("audit:read"))],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    _: Annotated[Principal, Depends(require_permissions("audit:read"))],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     audit_log_id: Annotated[UUID, Path(description="Audit log ID")],
 ) -> AuditLogRead:
     """Get a single audit log by ID."""
@@ -143,31 +174,31 @@ Returns all audit logs related to the specified entity, ordered by creation time
     },
 )
 async def get_audit_logs_by_entity(
-    _: Annotated[User, Depends(require_permissions("audit:read"))],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    _: Annotated[Principal, Depends(require_permissions("audit:read"))],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     entity_type: Annotated[str, Path(description="Entity type (e.g., User, Role)")],
     entity_id: Annotated[UUID, Path(description="Entity ID")],
     skip: Annotated[int, Query(ge=0, description="Number of records to skip")] = 0,
     limit: Annotated[
         int, Query(ge=1, le=100, description="Maximum records to return")
     ] = 20,
+    cursor: Annotated[
+        str | None,
+        Query(description="next_cursor of the previous page; overrides skip"),
+    ] = None,
+    include_total: Annotated[
+        bool | None,
+        Query(description="Count all matching logs (default: only without a cursor)"),
+    ] = None,
+    exact_count: Annotated[
+        bool,
+        Query(description="Count exactly instead of a cached or estimated total"),
+    ] = False,
 ) -> PaginatedAuditLogs:
     """Get audit logs for a specific entity."""
-    service = AuditService(db)
-    logs, total = await service.get_by_entity(entity_type, entity_id, skip, limit)
-
-    page = (skip // limit) + 1 if limit > 0 else 1
-    total_pages = ((total + limit - 1) // limit) if limit > 0 else 1
-    return PaginatedAuditLogs(
-        data=[AuditLogRead.model_validate(log) for log in logs],
-        meta={
-            "page": page,
-            "limit": limit,
-            "total_items": total,
-            "total_pages": total_pages,
-            "has_next_page": page < total_pages,
-            "has_prev_page": page > 1,
-        },
+    filter_params = AuditLogFilter(entity_type=entity_type, entity_id=entity_id)
+    return await _get_page(
+        db, filter_params, skip, limit, cursor, include_total, exact_count
     )
 
 
@@ -190,28 +221,28 @@ Returns all audit logs performed by the specified user, ordered by creation time
     },
 )
 async def get_audit_logs_by_actor(
-    _: Annotated[User, Depends(require_permissions("audit:read"))],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    _: Annotated[Principal, Depends(require_permissions("audit:read"))],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     actor_id: Annotated[UUID, Path(description="Actor (user) ID")],
     skip: Annotated[int, Query(ge=0, description="Number of records to skip")] = 0,
     limit: Annotated[
         int, Query(ge=1, le=100, description="Maximum records to return")
     ] = 20,
+    cursor: Annotated[
+        str | None,
+        Query(description="next_cursor of the previous page; overrides skip"),
+    ] = None,
+    include_total: Annotated[
+        bool | None,
+        Query(description="Count all matching logs (default: only without a cursor)"),
+    ] = None,
+    exact_count: Annotated[
+        bool,
+        Query(description="Count exactly instead of a cached or estimated total"),
+    ] = False,
 ) -> PaginatedAuditLogs:
     """Get audit logs for a specific actor."""
-    service = AuditService(db)
-    logs, total = await service.get_by_actor(actor_id, skip, limit)
-
-    page = (skip // limit) + 1 if limit > 0 else 1
-    total_pages = ((total + limit - 1) // limit) if limit > 0 else 1
-    return PaginatedAuditLogs(
-        data=[AuditLogRead.model_validate(log) for log in logs],
-        meta={
-            "page": page,
-            "limit": limit,
-            "total_items": total,
-            "total_pages": total_pages,
-            "has_next_page": page < total_pages,
-            "has_prev_page": page > 1,
-        },
+    filter_params = AuditLogFilter(actor_id=actor_id)
+    return await _get_page(
+        db, filter_params, skip, limit, cursor, include_total, exact_count
     )
@@ -6,14 +6,13 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, File, Path, Query, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.app.core.config import settings
-from src.app.core.deps import CurrentUser, require_permissions
+from src.app.core.deps import CurrentPrincipal, require_permissions
 from src.app.core.exceptions import (
     FileNotFoundException,
     ForbiddenException,
     StorageException,
 )
 from src.app.db.session import get_db
-from src.app.models import User
 from src.app.schemas import (
     BatchDeleteRequest,
     BatchDeleteResponse,
@@ -32,6 +31,7 @@ from src.app.services import (
     FileService,
     FileTooLargeError,
     InvalidFileTypeError,
+    Principal,
     StorageError,
     storage_service,
 )
@@ -39,6 +39,15 @@ from src.app.services import (
 router = APIRouter(prefix="/files", tags=["files"])
 
 
+def _batch_upload_error(error: StorageError) -> str:
+    """Get the message reported for a file that failed in a batch upload."""
+    if isinstance(error, FileTooLargeError):
+        return f"File exceeds maximum size of {settings.s3_max_file_size} bytes"
+    if isinstance(error, InvalidFileTypeError):
+        return "File type not permitted."
+    return f"Storage error: {error}"
+
+
 @router.post(
     "/upload",
     response_model=FileUploadResponse,
@@ -62,7 +71,7 @@ Upload a file to storage.
     },
 )
 async def upload_file(
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     file: Annotated[UploadFile, File(description="File to upload")],
     db: Annotated[AsyncSession, Depends(get_db)],
     prefix: Annotated[
@@ -71,12 +80,9 @@ async def upload_file(
     ] = "",
 ) -> FileUploadResponse:
     """Upload a file to S3 storage."""
-    # Read file content
-    content = await file.read()
-
-    # Upload to storage (exceptions handled by global handler)
+    # Stream to storage in parts (exceptions handled by global handler)
     result = await storage_service.upload_file(
-        file_content=content,
+        file_content=file,
         filename=file.filename or "unnamed",
         content_type=file.content_type,
         prefix=prefix,
@@ -129,7 +135,7 @@ Upload multiple files to storage in a single request.
     },
 )
 async def upload_files_batch(
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     files: Annotated[list[UploadFile], File(description="Files to upload (max 10)")],
     db: Annotated[AsyncSession, Depends(get_db)],
     prefix: Annotated[
@@ -143,70 +149,54 @@ async def upload_files_batch(
     if len(files) > max_files:
         files = files[:max_files]
 
-    results: list[BatchFileUploadResult] = []
-    file_service = FileService(db)
+    # Upload concurrently; each file succeeds or fails on its own
+    uploads = await storage_service.upload_files(
+        [(file, file.filename or "unnamed", file.content_type) for file in files],
+        prefix=prefix,
+    )
 
-    for file in files:
+    results: list[BatchFileUploadResult] = []
+    stored: list[dict] = []
+    for file, upload in zip(files, uploads, strict=True):
         filename = file.filename or "unnamed"
-        try:
-            # Read file content
-            content = await file.read()
-
-            # Upload to storage
-            result = await storage_service.upload_file(
-                file_content=content,
-                filename=filename,
-                content_type=file.content_type,
-                prefix=prefix,
-            )
-
-            # Save file record to database
-            await file_service.create(
-                key=result["key"],
-                filename=filename,
-                size=result["size"],
-                bucket=result["bucket"],
-                user_id=current_user.id,
-                content_type=result["content_type"],
-            )
-
-            # Generate presigned URL
-            url = await storage_service.get_presigned_url(result["key"])
-
-            results.append(
-                BatchFileUploadResult(
-                    filename=filename,
-                    success=True,
-                    key=result["key"],
-                    size=result["size"],
-                    content_type=result["content_type"],
-                    url=url,
-                )
-            )
-        except FileTooLargeError:
-            results.append(
-                BatchFileUploadResult(
-                    filename=filename,
-                    success=False,
-                    error=f"File exceeds maximum size of {settings.s3_max_file_size} bytes",
-                )
-            )
-        except InvalidFileTypeError:
+        if isinstance(upload, StorageError):
             results.append(
                 BatchFileUploadResult(
                     filename=filename,
                     success=False,
-                    error="File type not permitted.",
+                    error=_batch_upload_error(upload),
                 )
             )
-        except StorageError as e:
-            results.append(
-                BatchFileUploadResult(
-                    filename=filename,
-                    success=False,
-                    error=f"Storage error: {e}",
-                )
+            continue
+        stored.append({**upload, "filename": filename})
+        results.append(
+            BatchFileUploadResult(
+                filename=filename,
+                success=True,
+                key=upload["key"],
+                size=upload["size"],
+                content_type=upload["content_type"],
             )
+        )
+
+    if stored:
+        # Save all file records in one transaction
+        file_service = FileService(db)
+        try:
+            await file_service.create_many(stored, user_id=current_user.id)
+        except Exception:
+            await storage_service.delete_files([f["key"] for f in stored])
+            raise
+
+        # Sign download URLs for all uploaded files at once
+        try:
+            urls = await storage_service.get_presigned_urls([f["key"] for f in stored])
+        except StorageError:
+            # The files are stored; clients can request URLs separately
+            urls = {}
+        for r in results:
+            if r.success:
+                r.url = urls.get(r.key)
 
     successful = sum(1 for r in results if r.success)
     failed = len(results) - successful
@@ -234,17 +224,34 @@ List files owned by the current user.
     },
 )
 async def list_files(
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     db: Annotated[AsyncSession, Depends(get_db)],
     skip: Annotated[int, Query(description="Number of files to skip", ge=0)] = 0,
     limit: Annotated[
         int, Query(description="Maximum number of files to return", ge=1, le=1000)
     ] = 100,
+    cursor: Annotated[
+        str | None,
+        Query(description="next_cursor of the previous page; overrides skip"),
+    ] = None,
+    include_total: Annotated[
+        bool | None,
+        Query(description="Count all files (default: only without a cursor)"),
+    ] = None,
+    exact_count: Annotated[
+        bool,
+        Query(description="Count exactly instead of a cached or estimated total"),
+    ] = False,
 ) -> FileListResponse:
     """List files owned by the current user."""
     file_service = FileService(db)
-    files, total = await file_service.list_files(
-        user_id=current_user.id, skip=skip, limit=limit
+    page = await file_service.paginate_files(
+        user_id=current_user.id,
+        limit=limit,
+        cursor=cursor,
+        offset=skip,
+        include_total=cursor is None if include_total is None else include_total,
+        exact_total=exact_count,
     )
 
     return FileListResponse(
@@ -255,9 +262,11 @@ async def list_files(
                 last_modified=f.updated_at,
                 content_type=f.content_type,
             )
-            for f in files
+            for f in page.items
         ],
-        count=total,
+        count=page.total,
+        count_estimated=page.total_estimated,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -278,7 +287,7 @@ Get a file's details by its ID.
     },
 )
 async def get_file(
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     file_id: Annotated[UUID, Path(description="The ID of the file to retrieve")],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> FileRead:
@@ -316,7 +325,7 @@ The URL is temporary and expires after the specified duration (default: 1 hour).
     },
 )
 async def get_presigned_url_by_id(
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     file_id: Annotated[UUID, Path(description="The ID of the file")],
     db: Annotated[AsyncSession, Depends(get_db)],
     expires_in: Annotated[
@@ -364,7 +373,7 @@ Returns the count of successful and failed deletions.
     },
 )
 async def batch_delete_files(
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     request: BatchDeleteRequest,
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> BatchDeleteResponse:
@@ -385,7 +394,6 @@ async def batch_delete_files(
 
 @router.delete(
     "/{file_id}",
-    
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete file by ID",
     description="""
@@ -402,7 +410,7 @@ Delete a file from storage by its ID.
     },
 )
 async def delete_file_by_id(
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     file_id: Annotated[UUID, Path(description="The ID of the file to delete")],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> None:
@@ -450,7 +458,7 @@ The file cannot be recovered after hard deletion.
 async def hard_delete_file(
     file_id: Annotated[UUID, Path(description="The ID of the file to delete")],
     db: Annotated[AsyncSession, Depends(get_db)],
-    _: Annotated[User, Depends(require_permissions("files:hard_delete"))],
+    _: Annotated[Principal, Depends(require_permissions("files:hard_delete"))],
 ) -> MessageResponse:
     """Permanently delete a file (Super Admin only)."""
     file_service = FileService(db)
@@ -491,7 +499,7 @@ Restore a previously soft-deleted file.
 async def restore_file(
     file_id: Annotated[UUID, Path(description="The ID of the file to restore")],
     db: Annotated[AsyncSession, Depends(get_db)],
-    _: Annotated[User, Depends(require_permissions("files:hard_delete"))],
+    _: Annotated[Principal, Depends(require_permissions("files:hard_delete"))],
 ) -> FileRead:
     """Restore a soft-deleted file."""
     file_service = FileService(db)
@@ -517,7 +525,7 @@ Update a file's metadata (filename and/or custom metadata).
     },
 )
 async def update_file(
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     file_id: Annotated[UUID, Path(description="The ID of the file to update")],
     file_update: FileUpdate,
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -562,7 +570,7 @@ Generate a presigned URL for file download using the file key.
     },
 )
 async def get_presigned_url(
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     file_key: str,
     db: Annotated[AsyncSession, Depends(get_db)],
     expires_in: Annotated[
@@ -606,7 +614,7 @@ Get a file's details by its storage key.
     },
 )
 async def get_file_by_key(
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     file_key: str,
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> FileRead:
@@ -647,7 +655,7 @@ the database and storage.
 async def hard_delete_file_by_key(
     file_key: str,
     db: Annotated[AsyncSession, Depends(get_db)],
-    _: Annotated[User, Depends(require_permissions("files:hard_delete"))],
+    _: Annotated[Principal, Depends(require_permissions("files:hard_delete"))],
 ) -> MessageResponse:
     """Permanently delete a file by key."""
     file_service = FileService(db)
@@ -657,7 +665,6 @@ async def hard_delete_file_by_key(
 
 @router.delete(
     "/key/{file_key:path}",
-    
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete file by key",
     description="""
@@ -674,7 +681,7 @@ Delete a file from storage using the file key.
     },
 )
 async def delete_file(
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     file_key: str,
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> None:
@@ -696,9 +703,6 @@ async def delete_file(
 
     # Delete from database
     await file_service.delete(file_record.id)
-<<<<<<< HEAD
-=======
-    return MessageResponse(message="File deleted successfully")
 
 
 @router.post(
@@ -721,10 +725,9 @@ Restore a previously soft-deleted file using the file key.
 async def restore_file_by_key(
     file_key: str,
     db: Annotated[AsyncSession, Depends(get_db)],
-    _: Annotated[User, Depends(require_permissions("files:hard_delete"))],
+    _: Annotated[Principal, Depends(require_permissions("files:hard_delete"))],
 ) -> FileRead:
     """Restore a soft-deleted file by key."""
     file_service = FileService(db)
     file_record = await file_service.restore_by_key(file_key)
     return FileRead.model_validate(file_record)
->>>>>>> 41ea1315c (Feat(Module): Add role-based access control (RBAC) system)
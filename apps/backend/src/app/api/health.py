@@ -11,12 +11,18 @@ from fastapi import APIRouter, Depends, Response
 from pydantic import BaseModel, Field
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
+from src.app.core.audit import audit_buffer
 from src.app.core.config import settings
 from src.app.core.deps import require_roles
 from src.app.core.redis import RedisPool
+from src.app.core.security import password_hasher
 from src.app.core.shutdown import shutdown_state
 from src.app.db import get_db
-from src.app.models import User
+from src.app.db.pool import pool_metrics
+from src.app.db.session import engine
+from src.app.graphql.pubsub import broker
+from src.app.messaging.outbox import outbox_relay
+from src.app.services import Principal
 from src.app.services.storage_service import storage_service
 
 # Health check timeout from config
@@ -79,6 +85,66 @@ class MemoryInfo(BaseModel):
     total: int
 
 
+class PasswordHasherInfo(BaseModel):
+    """Password hashing pool metrics."""
+
+    workers: int
+    in_flight: int
+    queue_depth: int = Field(description="Calls waiting for a free worker")
+    max_queue: int
+    rejected: int = Field(description="Calls rejected because the queue was full")
+
+
+class SubscriptionsInfo(BaseModel):
+    """GraphQL subscription broker metrics for this worker."""
+
+    backend: str
+    subscribers: int
+    channels: dict[str, int] = Field(description="Subscribers per channel")
+    published: int
+    delivered: int
+    dropped: int = Field(description="Events dropped because a queue was full")
+    disconnected: int = Field(description="Subscribers closed for falling behind")
+
+
+class AuditBufferInfo(BaseModel):
+    """In-process audit log buffer metrics."""
+
+    running: bool
+    queued: int
+    max_size: int
+    reserved: int = Field(description="Slots held for uncommitted changes")
+    written: int
+    overflowed: int = Field(description="Entries written synchronously when full")
+    dropped: int = Field(description="Entries lost as the buffer stopped")
+    failed: int = Field(description="Entries that could not be written")
+
+
+class OutboxRelayInfo(BaseModel):
+    """Outbox relay metrics for this worker."""
+
+    running: bool
+    published: int
+    dropped: int = Field(description="Rows removed because they were unreadable")
+    failed: int = Field(description="Batches left in the outbox after an error")
+
+
+class DatabasePoolInfo(BaseModel):
+    """Database connection pool metrics for this worker."""
+
+    pool_size: int | None = Field(description="None for pools without limits")
+    checked_out: int | None
+    overflow: int | None
+    sessions: int = Field(description="Request sessions closed")
+    sessions_with_connection: int = Field(description="Sessions that ran SQL")
+    connections_per_session: float = Field(
+        description="Average connection checkouts per session"
+    )
+    max_connections_per_session: int
+    held_ms_avg: float = Field(description="Average time a checkout was held")
+    held_ms_max: float
+
+
 class DetailedHealthResponse(BaseModel):
     """Detailed health check response for admin."""
 
@@ -86,6 +152,11 @@ class DetailedHealthResponse(BaseModel):
     version: str
     uptime: int = Field(description="Uptime in seconds")
     memory: MemoryInfo
+    password_hasher: PasswordHasherInfo
+    subscriptions: SubscriptionsInfo
+    audit_buffer: AuditBufferInfo
+    outbox_relay: OutboxRelayInfo
+    database_pool: DatabasePoolInfo
     checks: dict[str, ComponentHealth]
 
 
@@ -290,7 +361,7 @@ async def readiness(
 async def health_details(
     response: Response,
     db: DbSession,
-    _current_user: Annotated[User, Depends(require_roles("super_admin", "admin"))],
+    _current_user: Annotated[Principal, Depends(require_roles("super_admin", "admin"))],
 ) -> DetailedHealthResponse:
     """Detailed health check endpoint for administrators."""
     checks: dict[str, ComponentHealth] = {}
@@ -328,5 +399,10 @@ async def health_details(
             used=used_memory,
             total=0,  # Total system memory not easily available in Python
         ),
+        password_hasher=PasswordHasherInfo(**password_hasher.stats()),
+        subscriptions=SubscriptionsInfo(**broker.stats()),
+        audit_buffer=AuditBufferInfo(**audit_buffer.stats()),
+        outbox_relay=OutboxRelayInfo(**outbox_relay.stats()),
+        database_pool=DatabasePoolInfo(**pool_metrics.stats(engine)),
         checks=checks,
     )
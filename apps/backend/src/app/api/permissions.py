@@ -7,7 +7,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.app.core.deps import require_permissions, require_superadmin
 from src.app.core.exceptions import NotFoundException
 from src.app.db import get_db
-from src.app.models import User
 from src.app.schemas import (
     ErrorResponse,
     MessageResponse,
@@ -17,15 +16,16 @@ from src.app.schemas import (
     PermissionRead,
     PermissionUpdate,
 )
-from src.app.services import PermissionService
+from src.app.schemas.pagination import create_pagination_meta
+from src.app.services import PermissionService, Principal
 
 router = APIRouter(prefix="/permissions", tags=["permissions"])
 
 # Permission dependencies
 RequirePermissionsRead = Annotated[
-    User, Depends(require_permissions("permissions:read"))
+    Principal, Depends(require_permissions("permissions:read"))
 ]
-RequireSuperAdmin = Annotated[User, Depends(require_superadmin())]
+RequireSuperAdmin = Annotated[Principal, Depends(require_superadmin())]
 
 
 async def get_permission_service(
@@ -83,21 +83,23 @@ async def list_permissions(
     pagination: Annotated[PaginationParams, Depends()],
 ) -> PaginatedResponse[PermissionRead]:
     """List all permissions with pagination."""
-    permissions, total = await service.list_permissions(
-        skip=pagination.offset, limit=pagination.limit
+    page = await service.paginate_permissions(
+        limit=pagination.limit,
+        cursor=pagination.cursor,
+        offset=pagination.offset,
+        include_total=pagination.include_total,
+        exact_total=pagination.exact_count,
     )
-    page = pagination.page
-    total_pages = ((total + pagination.limit - 1) // pagination.limit) if pagination.limit > 0 else 1
     return PaginatedResponse[PermissionRead](
-        data=[PermissionRead.model_validate(p) for p in permissions],
-        meta={
-            "page": page,
-            "limit": pagination.limit,
-            "total_items": total,
-            "total_pages": total_pages,
-            "has_next_page": page < total_pages,
-            "has_prev_page": page > 1,
-        },
+        data=[PermissionRead.model_validate(p) for p in page.items],
+        meta=create_pagination_meta(
+            pagination.limit,
+            page.total,
+            page.next_cursor,
+            page=pagination.page,
+            cursor=pagination.cursor,
+            total_estimated=page.total_estimated,
+        ),
     )
 
 
@@ -7,7 +7,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.app.core.deps import require_permissions, require_superadmin
 from src.app.core.exceptions import NotFoundException
 from src.app.db import get_db
-from src.app.models import User
 from src.app.schemas import (
     AssignPermissionsRequest,
     ErrorResponse,
@@ -20,13 +19,14 @@ from src.app.schemas import (
     RoleReadWithPermissions,
     RoleUpdate,
 )
-from src.app.services import RoleService
+from src.app.schemas.pagination import create_pagination_meta
+from src.app.services import Principal, RoleService
 
 router = APIRouter(prefix="/roles", tags=["roles"])
 
 # Permission dependencies
-RequireRolesRead = Annotated[User, Depends(require_permissions("roles:read"))]
-RequireSuperAdmin = Annotated[User, Depends(require_superadmin())]
+RequireRolesRead = Annotated[Principal, Depends(require_permissions("roles:read"))]
+RequireSuperAdmin = Annotated[Principal, Depends(require_superadmin())]
 
 
 async def get_role_service(
@@ -90,21 +90,23 @@ async def list_roles(
     ] = False,
 ) -> PaginatedResponse[RoleRead] | PaginatedResponse[RoleReadWithPermissions]:
     """List all roles with pagination."""
-    roles, total = await service.list_roles(
-        skip=pagination.offset,
+    page = await service.paginate_roles(
         limit=pagination.limit,
+        cursor=pagination.cursor,
+        offset=pagination.offset,
+        include_total=pagination.include_total,
+        exact_total=pagination.exact_count,
         include_permissions=include_permissions,
     )
-    page = pagination.page
-    total_pages = ((total + pagination.limit - 1) // pagination.limit) if pagination.limit > 0 else 1
-    meta = {
-        "page": page,
-        "limit": pagination.limit,
-        "total_items": total,
-        "total_pages": total_pages,
-        "has_next_page": page < total_pages,
-        "has_prev_page": page > 1,
-    }
+    roles = page.items
+    meta = create_pagination_meta(
+        pagination.limit,
+        page.total,
+        page.next_cursor,
+        page=pagination.page,
+        cursor=pagination.cursor,
+        total_estimated=page.total_estimated,
+    )
 
     if include_permissions:
         return PaginatedResponse[RoleReadWithPermissions](
@@ -11,7 +11,6 @@ from src.app.core.rabbitmq import RabbitMQPool
 from src.app.db import get_db
 from src.app.messaging.producer import MessageProducer
 from src.app.messaging.types import ScheduledTaskMessage
-from src.app.models import User
 from src.app.models.task_execution import TaskTriggerType
 from src.app.schemas import (
     ErrorResponse,
@@ -24,14 +23,14 @@ from src.app.schemas import (
     TaskExecutionResponse,
     TaskTypeInfo,
 )
-from src.app.services import ScheduledTaskService
+from src.app.services import Principal, ScheduledTaskService
 from src.app.tasks.registry import task_registry
 
 router = APIRouter(prefix="/scheduled-tasks", tags=["scheduled-tasks"])
 
 # Permission dependencies
-RequireTasksRead = Annotated[User, Depends(require_permissions("tasks:read"))]
-RequireSuperAdmin = Annotated[User, Depends(require_superadmin())]
+RequireTasksRead = Annotated[Principal, Depends(require_permissions("tasks:read"))]
+RequireSuperAdmin = Annotated[Principal, Depends(require_superadmin())]
 
 
 async def get_task_service(
@@ -7,7 +7,6 @@ from fastapi import APIRouter, Depends, Path, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.app.core.deps import require_permissions, require_superadmin
 from src.app.db import get_db
-from src.app.models import User
 from src.app.schemas import (
     AssignRolesRequest,
     ErrorResponse,
@@ -21,20 +20,20 @@ from src.app.schemas import (
     UserReadWithRoles,
     UserUpdate,
 )
-from src.app.schemas.pagination import PaginationMeta
-from src.app.services import UserService
+from src.app.schemas.pagination import PaginationMeta, create_pagination_meta
+from src.app.services import Principal, UserService
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 # Permission dependencies
-RequireUsersRead = Annotated[User, Depends(require_permissions("users:read"))]
-RequireUsersCreate = Annotated[User, Depends(require_permissions("users:create"))]
-RequireUsersUpdate = Annotated[User, Depends(require_permissions("users:update"))]
-RequireUsersDelete = Annotated[User, Depends(require_permissions("users:delete"))]
+RequireUsersRead = Annotated[Principal, Depends(require_permissions("users:read"))]
+RequireUsersCreate = Annotated[Principal, Depends(require_permissions("users:create"))]
+RequireUsersUpdate = Annotated[Principal, Depends(require_permissions("users:update"))]
+RequireUsersDelete = Annotated[Principal, Depends(require_permissions("users:delete"))]
 RequireUsersHardDelete = Annotated[
-    User, Depends(require_permissions("users:hard_delete"))
+    Principal, Depends(require_permissions("users:hard_delete"))
 ]
-RequireSuperAdmin = Annotated[User, Depends(require_superadmin())]
+RequireSuperAdmin = Annotated[Principal, Depends(require_superadmin())]
 
 
 async def get_user_service(
@@ -100,18 +99,24 @@ async def list_users(
     ] = False,
 ) -> PaginatedResponse[UserRead] | PaginatedResponse[UserReadWithRoles]:
     """List all users with pagination."""
-    users, total = await service.list_users(
-        skip=pagination.offset, limit=pagination.limit, include_roles=include_roles
+    page = await service.paginate_users(
+        limit=pagination.limit,
+        cursor=pagination.cursor,
+        offset=pagination.offset,
+        include_total=pagination.include_total,
+        exact_total=pagination.exact_count,
+        include_roles=include_roles,
     )
-
-    total_pages = ((total + pagination.limit - 1) // pagination.limit) if pagination.limit > 0 else 1
+    users = page.items
     meta = PaginationMeta(
-        page=pagination.page,
-        limit=pagination.limit,
-        total_items=total,
-        total_pages=total_pages,
-        has_next_page=pagination.page < total_pages,
-        has_prev_page=pagination.page > 1,
+        **create_pagination_meta(
+            pagination.limit,
+            page.total,
+            page.next_cursor,
+            page=pagination.page,
+            cursor=pagination.cursor,
+            total_estimated=page.total_estimated,
+        )
     )
 
     if include_roles:
@@ -256,13 +261,8 @@ async def update_user(
 
 
 @router.delete(
-<<<<<<< HEAD
-    "/{user_id}",
-    status_code=status.HTTP_204_NO_CONTENT,
-=======
     "/{id}",
     status_code=status.HTTP_204_NO_CONTENT,
->>>>>>> 41ea1315c (Feat(Module): Add role-based access control (RBAC) system)
     summary="Delete user",
     description="Permanently delete a user by their ID.",
     responses={
@@ -1,8 +1,10 @@
 """Core module exports."""
 
 from src.app.core.audit import (
+    AuditBuffer,
     AuditContext,
     AuditLogConfig,
+    audit_buffer,
     audit_context_var,
     audit_log,
     clear_audit_context,
@@ -28,7 +30,10 @@ from src.app.core.security import (
     create_refresh_token,
     decode_token,
     get_password_hash,
+    hash_password_async,
+    password_hasher,
     verify_password,
+    verify_password_async,
 )
 from src.app.core.validators import (
     EMAIL_MAX_LENGTH,
@@ -50,8 +55,10 @@ from src.app.core.validators import (
 
 __all__ = [
     # Audit
+    "AuditBuffer",
     "AuditContext",
     "AuditLogConfig",
+    "audit_buffer",
     "audit_context_var",
     "audit_log",
     "clear_audit_context",
@@ -83,7 +90,10 @@ __all__ = [
     "create_refresh_token",
     "decode_token",
     "get_password_hash",
+    "hash_password_async",
+    "password_hasher",
     "verify_password",
+    "verify_password_async",
     # Validation constants
     "EMAIL_MAX_LENGTH",
     "PASSWORD_MIN_LENGTH",
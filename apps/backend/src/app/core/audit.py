@@ -1,13 +1,17 @@
 """Audit logging utilities and decorators."""
 
+import asyncio
 import logging
 import uuid
+from collections.abc import Callable
 from contextvars import ContextVar
 from dataclasses import dataclass, field
 from functools import wraps
 from typing import Any, TypeVar
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 from src.app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -158,6 +162,209 @@ def model_to_dict(model: Any, exclude: set[str] | None = None) -> dict[str, Any]
     return result
 
 
+_STOP = object()
+
+
+class AuditBuffer:
+    """Bounded in-process queue of audit log entries written in the background.
+
+    Used when RabbitMQ is disabled, so requests do not pay for inserting their
+    audit logs. A background task writes whatever has queued up with one
+    multi-row INSERT, so batches grow with load. When the queue is full,
+    ``put`` reports the overflow and the caller writes the entry itself.
+    Entries queued only once their change commits hold a slot from
+    ``reserve`` until then, so the commit cannot find the queue full.
+    """
+
+    def __init__(self, max_size: int = 10000, batch_size: int = 500):
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self._queue: asyncio.Queue[Any] | None = None
+        self._flusher: asyncio.Task | None = None
+        self._session_factory: Callable[[], AsyncSession] | None = None
+        self._reserved = 0
+        self._written = 0
+        self._overflowed = 0
+        self._dropped = 0
+        self._failed = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether entries are being accepted and written."""
+        return self._flusher is not None
+
+    def stats(self) -> dict[str, Any]:
+        """Get buffer metrics."""
+        return {
+            "running": self.running,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "max_size": self.max_size,
+            "reserved": self._reserved,
+            "written": self._written,
+            "overflowed": self._overflowed,
+            "dropped": self._dropped,
+            "failed": self._failed,
+        }
+
+    def start(self, session_factory: Callable[[], AsyncSession] | None = None) -> None:
+        """Start the background flusher.
+
+        Args:
+            session_factory: Session factory for writes, defaults to the app's
+        """
+        if self.running:
+            return
+        if session_factory is None:
+            # Import here to avoid circular imports
+            from src.app.db.session import async_session_maker
+
+            session_factory = async_session_maker
+        self._session_factory = session_factory
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._flusher = asyncio.create_task(self._run(), name="audit_buffer")
+
+    async def stop(self) -> None:
+        """Stop accepting entries and write the ones still queued."""
+        flusher, self._flusher = self._flusher, None
+        if flusher is None or self._queue is None:
+            return
+        # Entries queued before this are written before the flusher exits
+        await self._queue.put(_STOP)
+        await flusher
+
+    def reserve(self) -> bool:
+        """Hold a slot for an entry to be queued later with ``put``.
+
+        Returns:
+            False if the buffer is not running or is full
+        """
+        if not self._has_room():
+            return False
+        self._reserved += 1
+        return True
+
+    def release(self) -> None:
+        """Give back a reserved slot whose entry will not be queued."""
+        self._reserved -= 1
+
+    def put(self, entry: dict[str, Any], reserved: bool = False) -> bool:
+        """Queue an audit log entry without waiting.
+
+        Args:
+            entry: AuditLog column values
+            reserved: Whether the entry takes a slot held with ``reserve``
+
+        Returns:
+            False if the buffer is not running or is full
+        """
+        if reserved:
+            self.release()
+        elif not self._has_room():
+            return False
+        if self._queue is None or not self.running:
+            return False
+        self._queue.put_nowait(entry)
+        return True
+
+    def _has_room(self) -> bool:
+        """Check for a free slot, counting a full buffer as an overflow."""
+        if self._queue is None or not self.running:
+            return False
+        if self._queue.qsize() + self._reserved >= self.max_size:
+            self._overflowed += 1
+            logger.warning("Audit buffer is full (%d entries)", self.max_size)
+            return False
+        return True
+
+    def drop(self, entry: dict[str, Any]) -> None:
+        """Report an entry that could not be written."""
+        self._dropped += 1
+        logger.error(
+            "Dropped audit log: action=%s, entity_type=%s, entity_id=%s",
+            entry.get("action"),
+            entry.get("entity_type"),
+            entry.get("entity_id"),
+        )
+
+    async def _run(self) -> None:
+        """Write queued entries as they arrive, until stopped."""
+        assert self._queue is not None
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            stopping = batch[-1] is _STOP
+            if stopping:
+                batch.pop()
+            if batch:
+                await self._write(batch)
+            if stopping:
+                return
+
+    async def _write(self, batch: list[dict[str, Any]]) -> None:
+        """Insert a batch, falling back to one entry at a time if it fails."""
+        # Import here to avoid circular imports
+        from sqlalchemy import insert
+        from src.app.models.audit_log import AuditLog
+
+        assert self._session_factory is not None
+        try:
+            async with self._session_factory() as session:
+                await session.execute(insert(AuditLog), batch)
+                await session.commit()
+            self._written += len(batch)
+            return
+        except Exception as e:
+            if len(batch) == 1:
+                self._failed += 1
+                logger.error("Failed to write audit log: %s", str(e))
+                return
+            logger.warning(
+                "Failed to write %d audit logs, retrying one by one: %s",
+                len(batch),
+                str(e),
+            )
+        for entry in batch:
+            await self._write([entry])
+
+
+# Global audit buffer, started by the app lifespan when RabbitMQ is disabled
+audit_buffer = AuditBuffer(
+    max_size=settings.audit_buffer_size,
+    batch_size=settings.audit_buffer_batch_size,
+)
+
+
+# Session.info key of audit entries queued once the session commits
+_PENDING_ENTRIES = "audit_pending"
+
+
+@event.listens_for(Session, "after_commit")
+def _queue_committed_entries(session: Session) -> None:
+    for entry in session.info.pop(_PENDING_ENTRIES, ()):
+        if not audit_buffer.put(entry, reserved=True):
+            # Only if the buffer stopped meanwhile, nothing can write it now
+            audit_buffer.drop(entry)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_rolled_back_entries(session: Session, transaction: Any) -> None:
+    # Still pending once the transaction ended: rolled back or closed
+    if transaction.parent is None:
+        for _ in session.info.pop(_PENDING_ENTRIES, ()):
+            audit_buffer.release()
+
+
+def _has_pending_writes(db: AsyncSession) -> bool:
+    """Check whether the session has changes its caller has yet to commit."""
+    return bool(
+        db.new
+        or db.dirty
+        or db.deleted
+        or getattr(db.sync_session, "in_write_transaction", False)
+    )
+
+
 async def log_audit_action(
     db: AsyncSession | None,
     action: str,
@@ -172,8 +379,15 @@ async def log_audit_action(
     """
     Log an audit action.
 
-    When RabbitMQ is enabled, publishes to the audit queue for async processing.
-    Otherwise, writes directly to the database (fallback/sync mode).
+    Call it before committing the change it records. When RabbitMQ is
+    enabled, the message for the audit queue is added to the outbox of the
+    given session and committed with the change, or on its own if the
+    session has nothing else to commit. Without a session, it is published
+    directly.
+    Otherwise, the entry goes to the in-process audit buffer once the change
+    commits, with a slot reserved until then, or is added to the given
+    session when the buffer is not running or is full (sync mode), and
+    committed if the session has nothing else to commit.
 
     Args:
         db: Database session (optional when RabbitMQ is enabled)
@@ -189,9 +403,9 @@ async def log_audit_action(
     # Try async via RabbitMQ first
     if settings.rabbitmq_enabled:
         try:
-            from src.app.messaging.producer import message_producer
+            from src.app.messaging.types import AuditLogMessage
 
-            await message_producer.publish_audit_log(
+            message = AuditLogMessage(
                 action=action,
                 entity_type=entity_type,
                 entity_id=entity_id,
@@ -201,8 +415,20 @@ async def log_audit_action(
                 changes=changes,
                 extra_data=extra_data,
             )
+            if db is not None:
+                from src.app.messaging.outbox import enqueue
+
+                committed = not _has_pending_writes(db)
+                enqueue(db, message, "audit.log")
+                if committed:
+                    # Logged after the change committed, e.g. by @audit_log
+                    await db.commit()
+            else:
+                from src.app.messaging.producer import message_producer
+
+                await message_producer.publish(message, "audit.log")
             logger.debug(
-                "Audit log published to queue: action=%s, entity_type=%s",
+                "Audit log queued for RabbitMQ: action=%s, entity_type=%s",
                 action,
                 entity_type,
             )
@@ -214,6 +440,24 @@ async def log_audit_action(
             )
             # Fall through to sync mode
 
+    entry = {
+        "action": action,
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "actor_id": actor_id,
+        "actor_ip": actor_ip,
+        "actor_user_agent": actor_user_agent,
+        "changes": changes,
+        "extra_data": extra_data,
+    }
+    if db is not None and _has_pending_writes(db):
+        if audit_buffer.reserve():
+            # Not logged if the change it records rolls back
+            db.info.setdefault(_PENDING_ENTRIES, []).append(entry)
+            return
+    elif audit_buffer.put(entry):
+        return
+
     # Fallback: Write directly to database
     if db is None:
         logger.error(
@@ -224,19 +468,11 @@ async def log_audit_action(
     # Import here to avoid circular imports
     from src.app.models.audit_log import AuditLog
 
-    audit_log = AuditLog(
-        action=action,
-        entity_type=entity_type,
-        entity_id=entity_id,
-        actor_id=actor_id,
-        actor_ip=actor_ip,
-        actor_user_agent=actor_user_agent,
-        changes=changes,
-        extra_data=extra_data,
-    )
-
-    db.add(audit_log)
-    # Note: The caller is responsible for committing the transaction
+    committed = not _has_pending_writes(db)
+    db.add(AuditLog(**entry))
+    if committed:
+        # Nothing left for the caller to commit
+        await db.commit()
 
 
 async def log_audit_from_context(
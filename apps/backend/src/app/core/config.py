@@ -86,6 +86,15 @@ To get a token:
     db_pool_idle_timeout: int = 300000  # 5 minutes in milliseconds
     db_pool_max_lifetime: int = 3600000  # 1 hour in milliseconds
     db_connection_timeout: int = 10000  # 10 seconds in milliseconds
+    db_release_after_read: bool = True  # Return connections between reads
+
+    # Database Read Replicas (empty sends every query to the primary)
+    database_replica_urls: list[str] = []
+    database_replica_balancing: Literal["round_robin", "least_connections"] = (
+        "round_robin"
+    )
+    database_replica_max_lag: float = 5.0  # Seconds behind before a replica is skipped
+    database_replica_check_interval: float = 5.0  # Seconds between lag checks
 
     # TimescaleDB Settings (only effective when database_engine=timescaledb)
     timescale_compression_enabled: bool = True
@@ -93,6 +102,10 @@ To get a token:
     timescale_retention_days: int = 0  # 0 means no retention policy
     timescale_chunk_interval: str = "1 day"
 
+    # Pagination Totals
+    pagination_count_cache_ttl: int = 30  # Seconds a list total is reused (0 disables)
+    pagination_estimate_threshold: int = 100000  # Larger Postgres estimates skip COUNT
+
     # Redis
     redis_host: str = "localhost"
     redis_port: int = 6379
@@ -113,8 +126,24 @@ To get a token:
     jwt_access_token_expire_minutes: int = 30
     jwt_refresh_token_expire_days: int = 7
 
+    # Principal Cache (authenticated user snapshot used for authorization)
+    principal_cache_enabled: bool = True
+    principal_cache_ttl: int = 30  # In-process entry lifetime (seconds)
+    principal_cache_max_size: int = 10000  # In-process entries before LRU eviction
+
+    # Admin Dashboard Stats (Redis counters kept up to date by the services)
+    admin_stats_counters_enabled: bool = (
+        False  # False aggregates the tables per request
+    )
+
+    # Password Hashing (bcrypt runs on a dedicated thread pool)
+    password_hash_workers: int = 4
+    password_hash_max_queue: int = 64  # Waiting calls before rejecting with 503
+
     # Rate Limiting
     rate_limit_enabled: bool = True
+    # memory: per-process token bucket; redis: GCRA shared across workers
+    rate_limit_backend: Literal["memory", "redis"] = "memory"
     rate_limit_trust_proxy: bool = False  # Only trust X-Forwarded-For behind a proxy
     rate_limit_requests: int = 100  # Default requests per window
     rate_limit_window: int = 60  # Default window in seconds
@@ -139,15 +168,49 @@ To get a token:
     rabbitmq_max_retries: int = 3
     rabbitmq_retry_delay_base: int = 1000  # 1 second in milliseconds
     rabbitmq_retry_delay_max: int = 60000  # 60 seconds in milliseconds
+    rabbitmq_publish_confirm_window: int = 100  # Publishes awaiting confirms at once
+    rabbitmq_audit_batch_size: int = 100  # Audit logs written per INSERT
+    rabbitmq_audit_batch_timeout: int = 200  # Max wait to fill a batch, in ms
+    rabbitmq_file_processes: int = 2  # Processes for CPU-heavy file operations
+
+    # Worker Metrics (Prometheus endpoint of each worker process)
+    worker_metrics_host: str = "127.0.0.1"
+    worker_metrics_port: int = 9100  # 0 disables the endpoint
+
+    # Message Idempotency (processed message ids of idempotent consumers)
+    message_idempotency_ttl: int = 86400  # Seconds a handled message id is kept
+    message_idempotency_lock_ttl: int = 30  # Claim lifetime, refreshed while handling
+    message_idempotency_local_size: int = 10000  # In-process ids before LRU eviction
+
+    # Outbox (messages committed with the data, published by a background relay)
+    outbox_relay_enabled: bool = True  # Run the relay in each API worker
+    outbox_relay_batch_size: int = 500  # Outbox rows published per transaction
+    outbox_relay_interval: float = 1.0  # Seconds between polls when idle
+
+    # Audit Buffer (background audit log writes without RabbitMQ)
+    audit_buffer_enabled: bool = True  # False writes audit logs in the request
+    audit_buffer_size: int = 10000  # Queued entries before writing synchronously
+    audit_buffer_batch_size: int = 500  # Max audit logs per INSERT
 
     # Scheduler Worker
     scheduler_check_interval_seconds: int = 60  # Interval between task checks
 
     # GraphQL Security
     graphql_max_depth: int = 10  # Maximum query depth
-    graphql_max_complexity: int = 100  # Maximum query complexity
+    graphql_max_complexity: int = 1000  # Maximum query cost (see graphql/complexity.py)
+    graphql_report_complexity: bool = True  # Add depth and cost to response extensions
     graphql_ide: Literal["sandbox", "graphiql", "none"] = "sandbox"  # GraphQL IDE
 
+    # GraphQL Document Cache (parsed and validated operations)
+    graphql_document_cache_size: int = 1000  # Operations kept before LRU eviction
+    graphql_apq_enabled: bool = True  # Automatic Persisted Queries (sha256 hashes)
+    graphql_apq_ttl: int = 86400  # Lifetime of persisted queries in Redis (seconds)
+
+    # GraphQL Subscriptions
+    graphql_pubsub_backend: Literal["memory", "redis"] = "redis"  # Redis: all workers
+    graphql_subscription_queue_size: int = 100  # Pending events per subscriber
+    graphql_subscription_overflow: Literal["drop_oldest", "disconnect"] = "drop_oldest"
+
     # S3 Storage
     s3_endpoint_url: str | None = None  # None uses AWS S3; set URL for S3-compatible
     s3_access_key_id: str = ""
@@ -156,6 +219,13 @@ To get a token:
     s3_region: str = "us-east-1"
     s3_use_ssl: bool = True
     s3_max_file_size: int = 10 * 1024 * 1024  # 10MB default
+    s3_multipart_part_size: int = 5 * 1024 * 1024  # S3 minimum part size is 5MB
+    s3_multipart_concurrency: int = 4  # Parts uploaded (and held in memory) at once
+    s3_batch_upload_concurrency: int = 4  # Files of a batch upload sent at once
+    s3_max_pool_connections: int = 20  # HTTP connections kept by the shared client
+    s3_keepalive_timeout: int = 30  # Seconds idle connections are kept open
+    s3_presigned_url_cache_size: int = 10000  # Presigned URLs kept for reuse
+    s3_presigned_url_cache_ttl: int = 300  # Max seconds a presigned URL is reused
     s3_allowed_extensions: list[str] = [
         ".jpg",
         ".jpeg",
@@ -8,7 +8,6 @@ from fastapi import Depends, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 from src.app.core.audit import get_audit_context
 from src.app.core.exceptions import (
     InactiveUserException,
@@ -19,7 +18,9 @@ from src.app.core.exceptions import (
 )
 from src.app.core.security import decode_token
 from src.app.db.session import get_db
-from src.app.models import Role, User
+from src.app.models import User
+from src.app.models.loading import user_loader
+from src.app.services.principal_cache import Principal, principal_cache
 
 
 class CustomHTTPBearer(HTTPBearer):
@@ -36,11 +37,8 @@ class CustomHTTPBearer(HTTPBearer):
 security = CustomHTTPBearer()
 
 
-async def get_current_user(
-    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> User:
-    """Get current authenticated user from JWT token."""
+def _get_token_subject(credentials: HTTPAuthorizationCredentials) -> tuple[str, str]:
+    """Validate an access token and return (user_id, token_id)."""
     token = credentials.credentials
     payload = decode_token(token)
 
@@ -54,6 +52,48 @@ async def get_current_user(
     if not user_id:
         raise InvalidTokenException(detail="Invalid token payload")
 
+    token_id = payload.get("jti") or str(payload.get("iat", ""))
+    return user_id, token_id
+
+
+def _set_audit_actor(user_id: uuid.UUID) -> None:
+    """Set actor_id in audit context for audit logging."""
+    audit_context = get_audit_context()
+    if audit_context:
+        audit_context.actor_id = user_id
+
+
+async def get_current_principal(
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> Principal:
+    """Get the authenticated user's cached principal from JWT token.
+
+    Only hits the database when the principal is not cached, so prefer this
+    over get_current_user when the full user row is not needed.
+    """
+    user_id, token_id = _get_token_subject(credentials)
+
+    principal = await principal_cache.get(db, uuid.UUID(user_id), token_id)
+
+    if not principal:
+        raise UnauthenticatedException(detail="User not found")
+
+    if not principal.is_active:
+        raise InactiveUserException()
+
+    _set_audit_actor(principal.id)
+
+    return principal
+
+
+async def get_current_user(
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> User:
+    """Get current authenticated user from JWT token."""
+    user_id, _ = _get_token_subject(credentials)
+
     result = await db.execute(select(User).where(User.id == uuid.UUID(user_id)))
     user = result.scalar_one_or_none()
 
@@ -63,10 +103,7 @@ async def get_current_user(
     if not user.is_active:
         raise InactiveUserException()
 
-    # Set actor_id in audit context for audit logging
-    audit_context = get_audit_context()
-    if audit_context:
-        audit_context.actor_id = user.id
+    _set_audit_actor(user.id)
 
     return user
 
@@ -76,23 +113,10 @@ async def get_current_user_with_roles(
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> User:
     """Get current authenticated user with roles loaded."""
-    token = credentials.credentials
-    payload = decode_token(token)
-
-    if not payload:
-        raise InvalidTokenException()
-
-    if payload.get("type") != "access":
-        raise InvalidTokenTypeException()
-
-    user_id = payload.get("sub")
-    if not user_id:
-        raise InvalidTokenException(detail="Invalid token payload")
+    user_id, _ = _get_token_subject(credentials)
 
     result = await db.execute(
-        select(User)
-        .where(User.id == uuid.UUID(user_id))
-        .options(selectinload(User.roles).selectinload(Role.permissions))
+        select(User).where(User.id == uuid.UUID(user_id)).options(*user_loader("auth"))
     )
     user = result.scalar_one_or_none()
 
@@ -102,10 +126,7 @@ async def get_current_user_with_roles(
     if not user.is_active:
         raise InactiveUserException()
 
-    # Set actor_id in audit context for audit logging
-    audit_context = get_audit_context()
-    if audit_context:
-        audit_context.actor_id = user.id
+    _set_audit_actor(user.id)
 
     return user
 
@@ -120,7 +141,7 @@ async def get_current_active_user(
 def require_permissions(
     *permission_codes: str,
     require_all: bool = True,
-) -> Callable[[User], User]:
+) -> Callable[[Principal], Principal]:
     """
     Dependency factory for requiring specific permissions.
 
@@ -131,26 +152,21 @@ def require_permissions(
     Usage:
         @router.get("/admin")
         async def admin_endpoint(
-            user: Annotated[User, Depends(require_permissions("admin:read"))]
+            user: Annotated[Principal, Depends(require_permissions("admin:read"))]
         ):
             ...
 
         @router.get("/any-permission")
         async def any_permission(
-            user: Annotated[User, Depends(require_permissions("a:read", "b:read", require_all=False))]
+            user: Annotated[Principal, Depends(require_permissions("a:read", "b:read", require_all=False))]
         ):
             ...
     """
 
     async def permission_checker(
-        user: Annotated[User, Depends(get_current_user_with_roles)],
-    ) -> User:
-        # Collect all permission codes from user's roles
-        user_permissions: set[str] = set()
-        for role in user.roles:
-            for permission in role.permissions:
-                user_permissions.add(permission.code)
-
+        user: Annotated[Principal, Depends(get_current_principal)],
+    ) -> Principal:
+        user_permissions = user.permission_codes
         required = set(permission_codes)
 
         if require_all:
@@ -177,7 +193,7 @@ def require_permissions(
 def require_roles(
     *role_codes: str,
     require_all: bool = False,
-) -> Callable[[User], User]:
+) -> Callable[[Principal], Principal]:
     """
     Dependency factory for requiring specific roles.
 
@@ -188,15 +204,15 @@ def require_roles(
     Usage:
         @router.get("/admin-only")
         async def admin_only(
-            user: Annotated[User, Depends(require_roles("admin", "super_admin"))]
+            user: Annotated[Principal, Depends(require_roles("admin", "super_admin"))]
         ):
             ...
     """
 
     async def role_checker(
-        user: Annotated[User, Depends(get_current_user_with_roles)],
-    ) -> User:
-        user_roles = {role.code for role in user.roles}
+        user: Annotated[Principal, Depends(get_current_principal)],
+    ) -> Principal:
+        user_roles = user.role_codes
         required = set(role_codes)
 
         if require_all:
@@ -220,14 +236,14 @@ def require_roles(
     return role_checker
 
 
-def require_superadmin() -> Callable[[User], User]:
+def require_superadmin() -> Callable[[Principal], Principal]:
     """
     Dependency for requiring superadmin role.
 
     Usage:
         @router.delete("/dangerous")
         async def dangerous_action(
-            user: Annotated[User, Depends(require_superadmin())]
+            user: Annotated[Principal, Depends(require_superadmin())]
         ):
             ...
     """
@@ -235,5 +251,6 @@ def require_superadmin() -> Callable[[User], User]:
 
 
 # Type aliases for cleaner dependency injection
+CurrentPrincipal = Annotated[Principal, Depends(get_current_principal)]
 CurrentUser = Annotated[User, Depends(get_current_user)]
 CurrentUserWithRoles = Annotated[User, Depends(get_current_user_with_roles)]
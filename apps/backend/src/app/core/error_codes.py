@@ -17,7 +17,8 @@ class ErrorCode(str, Enum):
     - Validation (3xxx): Input validation failures
     - Resource (4xxx): Resource-related errors
     - Server (5xxx): Internal server errors
-    - Security (6xxx): Rate limiting and query complexity
+    - Security (6xxx): Rate limiting, query complexity, subscriptions and
+      persisted queries
     """
 
     # Authentication errors (1xxx)
@@ -54,6 +55,7 @@ class ErrorCode(str, Enum):
     # Validation errors (3xxx)
     VALIDATION_ERROR = "VALIDATION_ERROR"
     INVALID_INPUT = "INVALID_INPUT"
+    INVALID_CURSOR = "INVALID_CURSOR"
     INVALID_EMAIL = "INVALID_EMAIL"
     WEAK_PASSWORD = "WEAK_PASSWORD"
     INVALID_PASSWORD = "INVALID_PASSWORD"
@@ -85,8 +87,15 @@ class ErrorCode(str, Enum):
     # Server errors (5xxx)
     INTERNAL_SERVER_ERROR = "INTERNAL_SERVER_ERROR"
     DATABASE_ERROR = "DATABASE_ERROR"
+    SERVICE_UNAVAILABLE = "SERVICE_UNAVAILABLE"
 
-    # Security errors (6xxx) - Rate limiting and GraphQL complexity
+    # Security errors (6xxx) - Rate limiting, GraphQL complexity and slow subscribers
     RATE_LIMITED = "RATE_LIMITED"
     QUERY_TOO_DEEP = "QUERY_TOO_DEEP"
     QUERY_TOO_COMPLEX = "QUERY_TOO_COMPLEX"
+    SUBSCRIBER_TOO_SLOW = "SUBSCRIBER_TOO_SLOW"
+
+    # GraphQL persisted query errors (65xx) - Codes match the APQ protocol
+    PERSISTED_QUERY_NOT_FOUND = "PERSISTED_QUERY_NOT_FOUND"
+    PERSISTED_QUERY_NOT_SUPPORTED = "PERSISTED_QUERY_NOT_SUPPORTED"
+    INVALID_PERSISTED_QUERY = "INVALID_PERSISTED_QUERY"
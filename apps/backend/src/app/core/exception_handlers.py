@@ -56,11 +56,13 @@ async def service_exception_handler(
         InactiveUserError,
         Invalid2FACodeError,
         InvalidCredentialsError,
+        InvalidCursorError,
         InvalidFileTypeError,
         InvalidResetTokenError,
         InvalidTokenError,
         InvalidTokenTypeError,
         InvalidVerificationTokenError,
+        PasswordHasherBusyError,
         PermissionCodeAlreadyExistsError,
         PermissionNotFoundError,
         RefreshTokenInvalidError,
@@ -126,6 +128,15 @@ async def service_exception_handler(
             request_id=request_id,
         )
 
+    if isinstance(exc, PasswordHasherBusyError):
+        return _create_error_response(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy, please retry shortly.",
+            code=ErrorCode.SERVICE_UNAVAILABLE,
+            headers={"Retry-After": "1"},
+            request_id=request_id,
+        )
+
     # Email verification errors
     if isinstance(exc, InvalidVerificationTokenError):
         return _create_error_response(
@@ -184,6 +195,15 @@ async def service_exception_handler(
             request_id=request_id,
         )
 
+    # Pagination errors
+    if isinstance(exc, InvalidCursorError):
+        return _create_error_response(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor.",
+            code=ErrorCode.INVALID_CURSOR,
+            request_id=request_id,
+        )
+
     # Two-factor authentication errors
     if isinstance(exc, TwoFactorRequiredError):
         return _create_error_response(
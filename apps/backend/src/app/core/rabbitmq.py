@@ -42,7 +42,8 @@ class RabbitMQPool:
             raise RuntimeError("RabbitMQ pool not initialized")
 
         async with cls._connection_pool.acquire() as connection:
-            return await connection.channel()
+            # Publishes return once the broker confirmed them
+            return await connection.channel(publisher_confirms=True)
 
     @classmethod
     async def init_pool(cls) -> None:
@@ -173,6 +174,72 @@ async def get_connection() -> AsyncGenerator[Connection]:
         yield connection
 
 
+def retry_delays() -> list[int]:
+    """
+    Get the delay of each retry tier, in milliseconds.
+
+    Retry ``n`` waits ``rabbitmq_retry_delay_base * 2 ** (n - 1)``, capped
+    at ``rabbitmq_retry_delay_max``. Retries beyond the last tier reuse it.
+    """
+    delays: list[int] = []
+    for step in range(max(settings.rabbitmq_max_retries, 1)):
+        delay = min(
+            settings.rabbitmq_retry_delay_base * 2**step,
+            settings.rabbitmq_retry_delay_max,
+        )
+        if delays and delay == delays[-1]:
+            break
+        delays.append(delay)
+    return delays
+
+
+def retry_queue_name(queue_name: str, delay_ms: int) -> str:
+    """Get the name of the retry queue holding messages for ``delay_ms``."""
+    return f"{queue_name}.retry.{delay_ms}"
+
+
+async def declare_retry_queues(
+    channel: Channel,
+    queue_name: str,
+    *,
+    durable: bool = True,
+) -> list[aio_pika.Queue]:
+    """
+    Declare the delayed retry queues of a queue, one per retry tier.
+
+    Failed messages are published to a retry queue through the default
+    exchange. Nothing consumes it: once the message TTL expires, the broker
+    dead-letters the message through the default exchange straight back to
+    ``queue_name``, so the consumer never waits for a retry itself.
+
+    Args:
+        channel: RabbitMQ channel
+        queue_name: Name of the queue to retry messages of
+        durable: Whether the queues should survive broker restarts
+
+    Returns:
+        The declared retry queues, by increasing delay
+    """
+    delays = retry_delays()
+    queues = []
+    for delay_ms in delays:
+        queues.append(
+            await channel.declare_queue(
+                retry_queue_name(queue_name, delay_ms),
+                durable=durable,
+                arguments={
+                    "x-message-ttl": delay_ms,
+                    "x-dead-letter-exchange": "",
+                    "x-dead-letter-routing-key": queue_name,
+                },
+            )
+        )
+
+    logger.debug("Retry queues declared: %s, delays=%s", queue_name, delays)
+
+    return queues
+
+
 async def declare_queue(
     channel: Channel,
     queue_name: str,
@@ -180,6 +247,7 @@ async def declare_queue(
     *,
     durable: bool = True,
     dead_letter: bool = True,
+    retry: bool = True,
     arguments: dict[str, Any] | None = None,
 ) -> aio_pika.Queue:
     """
@@ -191,6 +259,7 @@ async def declare_queue(
         routing_keys: List of routing keys to bind
         durable: Whether the queue should survive broker restarts
         dead_letter: Whether to configure dead letter routing
+        retry: Whether to declare the delayed retry queues
         arguments: Additional queue arguments
 
     Returns:
@@ -217,6 +286,9 @@ async def declare_queue(
     for routing_key in routing_keys:
         await queue.bind(exchange, routing_key=routing_key)
 
+    if retry:
+        await declare_retry_queues(channel, queue_name, durable=durable)
+
     logger.debug(
         "Queue declared: %s, routing_keys=%s",
         queue_name,
@@ -1,11 +1,21 @@
 """Security utilities for JWT authentication."""
 
+import asyncio
+import logging
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
+from typing import Any, TypeVar
 
 import bcrypt
 from jose import jwt
 from src.app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash."""
@@ -19,6 +29,96 @@ def get_password_hash(password: str) -> str:
     return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
 
 
+class PasswordHasher:
+    """Runs bcrypt on a dedicated, size-limited thread pool.
+
+    bcrypt takes hundreds of milliseconds per call, which would block the
+    event loop. Calls run on their own pool so they cannot starve the
+    default executor, and are rejected once ``max_queue`` calls are already
+    waiting for a worker, so a login burst fails fast instead of queueing
+    without bound.
+    """
+
+    def __init__(self, max_workers: int = 4, max_queue: int = 64):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending = 0
+        self._rejected = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently running on a worker."""
+        return min(self._pending, self.max_workers)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of calls waiting for a free worker."""
+        return max(self._pending - self.max_workers, 0)
+
+    def stats(self) -> dict[str, int]:
+        """Get pool metrics."""
+        return {
+            "workers": self.max_workers,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "max_queue": self.max_queue,
+            "rejected": self._rejected,
+        }
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a hashing function on the pool.
+
+        Raises:
+            PasswordHasherBusyError: If the queue is full.
+        """
+        if self._pending >= self.max_workers + self.max_queue:
+            # Import here to avoid circular imports
+            from src.app.services.exceptions import PasswordHasherBusyError
+
+            self._rejected += 1
+            logger.warning(
+                "Password hashing queue is full (%d waiting)", self.queue_depth
+            )
+            raise PasswordHasherBusyError("Password hashing queue is full")
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="bcrypt"
+            )
+
+        # Only touched from the event loop thread, so no lock is needed
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+
+    def shutdown(self) -> None:
+        """Shut down the pool, waiting for running calls to finish."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+# Global password hasher instance
+password_hasher = PasswordHasher(
+    max_workers=settings.password_hash_workers,
+    max_queue=settings.password_hash_max_queue,
+)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against a hash without blocking the event loop."""
+    return await password_hasher.run(verify_password, plain_password, hashed_password)
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password without blocking the event loop."""
+    return await password_hasher.run(get_password_hash, password)
+
+
 def create_access_token(
     subject: str | int, expires_delta: timedelta | None = None
 ) -> str:
@@ -29,7 +129,13 @@ def create_access_token(
         expire = datetime.now(UTC) + timedelta(
             minutes=settings.jwt_access_token_expire_minutes
         )
-    to_encode = {"exp": expire, "sub": str(subject), "type": "access"}
+    to_encode = {
+        "exp": expire,
+        "iat": datetime.now(UTC),
+        "jti": uuid.uuid4().hex,
+        "sub": str(subject),
+        "type": "access",
+    }
     return jwt.encode(
         to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm
     )
@@ -45,7 +151,13 @@ def create_refresh_token(
         expire = datetime.now(UTC) + timedelta(
             days=settings.jwt_refresh_token_expire_days
         )
-    to_encode = {"exp": expire, "sub": str(subject), "type": "refresh"}
+    to_encode = {
+        "exp": expire,
+        "iat": datetime.now(UTC),
+        "jti": uuid.uuid4().hex,
+        "sub": str(subject),
+        "type": "refresh",
+    }
     return jwt.encode(
         to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm
     )
@@ -80,6 +80,36 @@ async def lifespan(app: Any) -> AsyncGenerator[None]:
                 extra={"error": str(e)},
             )
 
+    # Open the S3 client shared by all requests
+    from src.app.services.storage_service import storage_service
+
+    try:
+        await storage_service.start()
+    except Exception as e:
+        logger.warning(
+            "Failed to start S3 client, falling back to per-request clients",
+            extra={"error": str(e)},
+        )
+
+    # Publish messages committed to the outbox
+    if settings.rabbitmq_enabled and settings.outbox_relay_enabled:
+        from src.app.core.rabbitmq import RabbitMQPool
+        from src.app.messaging.outbox import outbox_relay
+
+        if RabbitMQPool.is_initialized():
+            outbox_relay.start()
+
+    # Write audit logs in the background instead of in each request
+    if settings.audit_buffer_enabled:
+        from src.app.core.audit import audit_buffer
+
+        audit_buffer.start()
+
+    # Skip read replicas that fall behind the primary
+    from src.app.db.session import replica_set
+
+    replica_set.start(settings.database_replica_check_interval)
+
     logger.info("Application startup complete")
 
     yield
@@ -91,8 +121,23 @@ async def lifespan(app: Any) -> AsyncGenerator[None]:
     logger.info("Waiting for connections to drain...")
     await asyncio.sleep(settings.shutdown_drain_delay)
 
+    # Write the audit logs still buffered
+    try:
+        from src.app.core.audit import audit_buffer
+
+        await audit_buffer.stop()
+    except Exception as e:
+        logger.warning("Failed to drain audit buffer", extra={"error": str(e)})
+
     # Close RabbitMQ connection (if enabled)
     if settings.rabbitmq_enabled:
+        try:
+            from src.app.messaging.outbox import outbox_relay
+
+            await outbox_relay.stop()
+        except Exception as e:
+            logger.warning("Failed to stop outbox relay", extra={"error": str(e)})
+
         try:
             from src.app.core.rabbitmq import RabbitMQPool
 
@@ -101,6 +146,21 @@ async def lifespan(app: Any) -> AsyncGenerator[None]:
         except Exception as e:
             logger.warning("Failed to close RabbitMQ", extra={"error": str(e)})
 
+    # Stop relaying GraphQL subscription events
+    try:
+        from src.app.graphql.pubsub import broker
+
+        await broker.close()
+    except Exception as e:
+        logger.warning("Failed to close pub/sub broker", extra={"error": str(e)})
+
+    # Close the S3 client
+    try:
+        await storage_service.close()
+        logger.info("S3 client closed")
+    except Exception as e:
+        logger.warning("Failed to close S3 client", extra={"error": str(e)})
+
     # Close Redis connection
     try:
         await RedisPool.close_pool()
@@ -108,10 +168,16 @@ async def lifespan(app: Any) -> AsyncGenerator[None]:
     except Exception as e:
         logger.warning("Failed to close Redis", extra={"error": str(e)})
 
+    # Stop the password hashing pool
+    from src.app.core.security import password_hasher
+
+    password_hasher.shutdown()
+
     # Close database connection
     try:
-        from src.app.db.session import engine
+        from src.app.db.session import engine, replica_set
 
+        await replica_set.stop()
         await engine.dispose()
         logger.info("Database connection closed")
     except Exception as e:
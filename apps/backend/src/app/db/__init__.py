@@ -1,6 +1,6 @@
 """Database module."""
 
 from src.app.db.base import Base
-from src.app.db.session import get_db
+from src.app.db.session import get_db, get_read_db
 
-__all__ = ["Base", "get_db"]
+__all__ = ["Base", "get_db", "get_read_db"]
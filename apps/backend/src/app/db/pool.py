@@ -0,0 +1,137 @@
+"""Connection usage of database sessions.
+
+A session checks out a connection at its first statement and, left alone,
+keeps it until the request closes the session, because the read transaction
+it began is never ended. ``ReleasingSession`` ends such transactions right
+after each read, so requests only hold a connection while a statement runs
+or while they have uncommitted writes.
+
+``PoolMetrics`` records how many connections each session used and for how
+long, next to the state of the pool itself.
+"""
+
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session, SessionTransactionOrigin
+
+
+class ReleasingSession(AsyncSession):
+    """AsyncSession returning its connection to the pool after each read.
+
+    After ``execute()``, ``scalar()``, ``scalars()``, ``get()`` and
+    ``refresh()``, a transaction the session began on its own is committed
+    if it has not written or locked anything and no changes are pending.
+    Results are already buffered, and committing rather than rolling back
+    keeps loaded objects usable (``expire_on_commit=False``).
+
+    Transactions opened with ``begin()``/``begin_nested()`` are left alone.
+    Requires a ``RoutingSession`` as the sync session class, which tracks
+    whether the current transaction wrote.
+    """
+
+    async def execute(self, *args: Any, **kwargs: Any) -> Any:
+        result = await super().execute(*args, **kwargs)
+        await self._release()
+        return result
+
+    async def scalar(self, *args: Any, **kwargs: Any) -> Any:
+        value = await super().scalar(*args, **kwargs)
+        await self._release()
+        return value
+
+    async def get(self, *args: Any, **kwargs: Any) -> Any:
+        instance = await super().get(*args, **kwargs)
+        await self._release()
+        return instance
+
+    async def refresh(self, *args: Any, **kwargs: Any) -> None:
+        await super().refresh(*args, **kwargs)
+        await self._release()
+
+    async def _release(self) -> None:
+        session = self.sync_session
+        transaction = session.get_transaction()
+        if (
+            transaction is None
+            or transaction.origin is not SessionTransactionOrigin.AUTOBEGIN
+            or session.in_nested_transaction()
+            or getattr(session, "in_write_transaction", True)
+            or session.new
+            or session.deleted
+            or session.identity_map.check_modified()
+        ):
+            return
+        await self.commit()
+
+
+class PoolMetrics:
+    """Connections held by the sessions of this worker."""
+
+    def __init__(self) -> None:
+        self._sessions = 0
+        self._sessions_with_connection = 0
+        self._connections = 0
+        self._max_connections = 0
+        self._checkins = 0
+        self._held = 0.0
+        self._max_held = 0.0
+
+    def instrument(self, session_class: type[Session]) -> None:
+        """Track the connections used by sessions of ``session_class``."""
+        event.listen(session_class, "after_begin", self._on_begin)
+        event.listen(session_class, "after_transaction_end", self._on_end)
+
+    def _on_begin(self, session: Session, transaction: Any, connection: Any) -> None:
+        # One call per connection joined to the transaction
+        session.info.setdefault("_held_since", []).append(time.perf_counter())
+        session.info["_connections"] = session.info.get("_connections", 0) + 1
+
+    def _on_end(self, session: Session, transaction: Any) -> None:
+        if transaction.parent is not None:
+            return
+        now = time.perf_counter()
+        for since in session.info.pop("_held_since", []):
+            self._checkins += 1
+            self._held += now - since
+            self._max_held = max(self._max_held, now - since)
+
+    def record_session(self, session: AsyncSession) -> None:
+        """Count the connections of a closed session, e.g. one per request."""
+        connections = session.info.pop("_connections", 0)
+        self._sessions += 1
+        self._connections += connections
+        if connections:
+            self._sessions_with_connection += 1
+            self._max_connections = max(self._max_connections, connections)
+
+    def stats(self, engine: AsyncEngine) -> dict[str, Any]:
+        """Get pool and per-session connection metrics."""
+        pool = engine.sync_engine.pool
+        return {
+            "pool_size": _pool_value(pool, "size"),
+            "checked_out": _pool_value(pool, "checkedout"),
+            "overflow": _pool_value(pool, "overflow"),
+            "sessions": self._sessions,
+            "sessions_with_connection": self._sessions_with_connection,
+            "connections_per_session": (
+                self._connections / self._sessions if self._sessions else 0.0
+            ),
+            "max_connections_per_session": self._max_connections,
+            "held_ms_avg": (
+                self._held * 1000 / self._checkins if self._checkins else 0.0
+            ),
+            "held_ms_max": self._max_held * 1000,
+        }
+
+
+def _pool_value(pool: Any, name: str) -> int | None:
+    # NullPool (SQLite) does not track connections
+    method = getattr(pool, name, None)
+    return method() if method else None
+
+
+# Global pool metrics instance
+pool_metrics = PoolMetrics()
@@ -0,0 +1,231 @@
+"""Read replica routing.
+
+``RoutingSession`` sends plain ``SELECT`` statements to a read replica and
+everything else (flushes, DML, ``SELECT ... FOR UPDATE``, raw SQL) to the
+primary. Services keep using one session; routing happens per statement.
+
+Reads that follow a write must see it, so the first statement sent to the
+primary pins the session to the primary. Inside ``request_scope()`` (entered
+by ``DatabaseRoutingMiddleware``) the pin also covers every other session of
+the same request. Read-modify-write code that must not start from a lagging
+row can lock it with ``with_for_update()`` or call ``pin_to_primary()``
+first.
+
+``ReplicaSet`` balances reads across the replicas (round-robin or least
+checked-out connections) and skips replicas that fail the periodic lag check
+or fall more than ``max_lag`` seconds behind. With no replica available,
+reads go to the primary.
+"""
+
+import asyncio
+import itertools
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from sqlalchemy import Select, event, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+Balancing = Literal["round_robin", "least_connections"]
+
+# Seconds the replica has not replayed, 0 once it caught up with the WAL
+_POSTGRES_LAG_SQL = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+    " END"
+)
+
+
+@dataclass
+class Replica:
+    """A read replica and the result of its last lag check."""
+
+    engine: AsyncEngine
+    available: bool = True
+    lag: float | None = None
+
+
+class ReplicaSet:
+    """Read replicas with load balancing and a replication lag guard."""
+
+    def __init__(
+        self,
+        engines: list[AsyncEngine],
+        balancing: Balancing = "round_robin",
+        max_lag: float = 5.0,
+    ):
+        self.replicas = [Replica(engine) for engine in engines]
+        self.balancing = balancing
+        self.max_lag = max_lag
+        self._counter = itertools.count()
+        self._checker: asyncio.Task | None = None
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def choose(self) -> AsyncEngine | None:
+        """Pick the replica for the next read, or None if none is available."""
+        available = [replica for replica in self.replicas if replica.available]
+        if not available:
+            return None
+        if self.balancing == "least_connections":
+            return min(available, key=_checked_out).engine
+        return available[next(self._counter) % len(available)].engine
+
+    async def check_lag(self) -> None:
+        """Measure the lag of every replica and update its availability."""
+        for replica in self.replicas:
+            try:
+                replica.lag = await _measure_lag(replica.engine)
+            except Exception as e:
+                replica.lag = None
+                available = False
+                logger.warning(
+                    "Read replica %s is unreachable: %s",
+                    replica.engine.url.render_as_string(hide_password=True),
+                    e,
+                )
+            else:
+                available = replica.lag <= self.max_lag
+            if available != replica.available:
+                logger.info(
+                    "Read replica %s %s (lag=%s)",
+                    replica.engine.url.render_as_string(hide_password=True),
+                    "available" if available else "skipped",
+                    replica.lag,
+                )
+            replica.available = available
+
+    def start(self, interval: float) -> None:
+        """Start checking the replica lag every ``interval`` seconds."""
+        if self.replicas and self._checker is None:
+            self._checker = asyncio.create_task(
+                self._run(interval), name="replica_lag_check"
+            )
+
+    async def stop(self) -> None:
+        """Stop the lag checks and close the replica connections."""
+        checker, self._checker = self._checker, None
+        if checker is not None:
+            checker.cancel()
+            try:
+                await checker
+            except asyncio.CancelledError:
+                pass
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    async def _run(self, interval: float) -> None:
+        while True:
+            await self.check_lag()
+            await asyncio.sleep(interval)
+
+
+def _checked_out(replica: Replica) -> int:
+    # NullPool (SQLite) does not track connections
+    checkedout = getattr(replica.engine.sync_engine.pool, "checkedout", None)
+    return checkedout() if checkedout else 0
+
+
+async def _measure_lag(engine: AsyncEngine) -> float:
+    async with engine.connect() as conn:
+        if engine.dialect.name != "postgresql":
+            await conn.execute(text("SELECT 1"))
+            return 0.0
+        return float(await conn.scalar(_POSTGRES_LAG_SQL) or 0)
+
+
+@dataclass
+class _RequestPin:
+    pinned: bool = False
+
+
+_request_pin: ContextVar[_RequestPin | None] = ContextVar(
+    "db_request_pin", default=None
+)
+
+
+@contextmanager
+def request_scope() -> Iterator[None]:
+    """Share the primary pin between all sessions used inside the block."""
+    token = _request_pin.set(_RequestPin())
+    try:
+        yield
+    finally:
+        _request_pin.reset(token)
+
+
+def pin_to_primary() -> None:
+    """Send the remaining queries of the current request to the primary."""
+    pin = _request_pin.get()
+    if pin is not None:
+        pin.pinned = True
+
+
+def is_pinned_to_primary() -> bool:
+    """Check whether the current request was pinned to the primary."""
+    pin = _request_pin.get()
+    return pin is not None and pin.pinned
+
+
+def _is_read(clause: Any) -> bool:
+    return isinstance(clause, Select) and clause._for_update_arg is None
+
+
+class RoutingSession(Session):
+    """Session routing reads to read replicas and writes to the primary.
+
+    Args:
+        replicas: Replicas to read from; without any, everything uses the
+            primary.
+        read_only: Send every statement, including raw SQL, to a replica
+            unless the request was pinned to the primary.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        replicas: ReplicaSet | None = None,
+        read_only: bool = False,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+        self.read_only = read_only
+        self.pinned = False
+        # Whether the current transaction wrote (or locked) anything
+        self.in_write_transaction = False
+
+    def get_bind(self, mapper: Any = None, *, clause: Any = None, **kw: Any) -> Any:
+        primary = super().get_bind(mapper, clause=clause, **kw)
+        write = self._flushing or (
+            clause is not None and not (self.read_only or _is_read(clause))
+        )
+        if write:
+            self.in_write_transaction = True
+        # Lookups without a statement (e.g. the dialect) run nothing
+        if not self.replicas or (clause is None and not write):
+            return primary
+
+        if write:
+            # Later reads of this session and request must see the write
+            self.pinned = True
+            pin_to_primary()
+            return primary
+        if self.pinned or is_pinned_to_primary():
+            return primary
+
+        engine = self.replicas.choose()
+        return engine.sync_engine if engine is not None else primary
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _transaction_ended(session: RoutingSession, transaction: Any) -> None:
+    if transaction.parent is None:
+        session.in_write_transaction = False
@@ -7,6 +7,8 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import NullPool
 from src.app.core.config import settings
+from src.app.db.pool import ReleasingSession, pool_metrics
+from src.app.db.routing import ReplicaSet, RoutingSession
 
 logger = logging.getLogger(__name__)
 
@@ -46,17 +48,61 @@ if not _is_sqlite:
         settings.db_pool_max_lifetime // 1000,
     )
 
+# Read replicas share the primary's pool configuration
+replica_set = ReplicaSet(
+    [
+        create_async_engine(url, echo=settings.database_echo, **_pool_config)
+        for url in settings.database_replica_urls
+    ],
+    balancing=settings.database_replica_balancing,
+    max_lag=settings.database_replica_max_lag,
+)
+
+if replica_set:
+    logger.info(
+        "Database read replicas configured: count=%d, balancing=%s",
+        len(replica_set.replicas),
+        settings.database_replica_balancing,
+    )
+
+pool_metrics.instrument(RoutingSession)
+
+# Sessions check out a connection at their first statement; with
+# db_release_after_read they return it as soon as a read transaction ends
 async_session_maker = async_sessionmaker(
     engine,
-    class_=AsyncSession,
+    class_=ReleasingSession if settings.db_release_after_read else AsyncSession,
+    sync_session_class=RoutingSession,
     expire_on_commit=False,
+    replicas=replica_set,
 )
 
 
 async def get_db() -> AsyncGenerator[AsyncSession]:
-    """Dependency for getting async database sessions."""
-    async with async_session_maker() as session:
+    """Dependency for getting async database sessions.
+
+    Reads go to a read replica, if configured, until the session writes.
+    """
+    session = async_session_maker()
+    try:
+        yield session
+    finally:
+        await session.close()
+        pool_metrics.record_session(session)
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession]:
+    """Dependency for sessions that only read.
+
+    Every statement, including raw SQL, goes to a read replica unless the
+    request has already written through another session.
+    """
+    session = async_session_maker(read_only=True)
+    try:
         yield session
+    finally:
+        await session.close()
+        pool_metrics.record_session(session)
 
 
 async def verify_timescaledb_extension() -> bool:
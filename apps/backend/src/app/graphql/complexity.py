@@ -0,0 +1,296 @@
+"""GraphQL query analysis: depth and cost in a single AST traversal.
+
+The cost model:
+
+- Every field costs its weight (1 unless annotated with ``@cost``) times the
+  number of times it is expected to be resolved.
+- Fields taking a ``limit`` or ``first`` argument multiply the cost of the
+  list they return. For pagination wrappers (e.g. ``users`` returning
+  ``PaginatedUsers``) the multiplier applies to the wrapper's list fields
+  (``data``), not to non-list siblings such as ``meta``.
+- The list size comes from the literal argument, the request variables, the
+  variable's default, or the argument's default in the schema, in that order.
+
+Introspection fields are ignored, since the standard introspection query used
+by IDEs is deeply nested by design.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+import strawberry
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLField,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLSchema,
+    InlineFragmentNode,
+    IntValueNode,
+    OperationDefinitionNode,
+    SelectionNode,
+    VariableNode,
+    get_named_type,
+)
+from strawberry.schema_directive import Location
+
+# Arguments that bound the size of the list a field returns
+LIST_SIZE_ARGUMENTS = ("limit", "first")
+
+
+@strawberry.schema_directive(
+    locations=[Location.FIELD_DEFINITION],
+    description="Relative cost of resolving the field, used by query analysis.",
+)
+class Cost:
+    """Per-field cost annotation, e.g. ``strawberry.field(directives=[Cost(weight=5)])``."""
+
+    weight: int = 1
+
+
+@dataclass(frozen=True, slots=True)
+class QueryAnalysis:
+    """Depth and cost of a GraphQL document."""
+
+    depth: int
+    complexity: int
+    # True if a list size came from a variable, so the cost is per request
+    uses_variables: bool = False
+
+
+def analyze_document(
+    document: DocumentNode,
+    schema: GraphQLSchema | None = None,
+    variables: dict[str, Any] | None = None,
+) -> QueryAnalysis:
+    """Compute the depth and cost of a document in one traversal.
+
+    Without a schema, field weights and list types are unknown: every field
+    costs 1 and a ``limit``/``first`` argument multiplies its whole selection.
+    """
+    return _Analyzer(document, schema, variables or {}).analyze()
+
+
+class _Analyzer:
+    """Single-pass walker over the operations of a document."""
+
+    def __init__(
+        self,
+        document: DocumentNode,
+        schema: GraphQLSchema | None,
+        variables: dict[str, Any],
+    ):
+        self.document = document
+        self.schema = schema
+        self.variables = variables
+        self.variable_defaults: dict[str, Any] = {}
+        self.uses_variables = False
+        self.fragments: dict[str, FragmentDefinitionNode] = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+        # (depth, cost) of fragment spreads already walked in the same context
+        self.fragment_results: dict[tuple, tuple[int, int]] = {}
+
+    def analyze(self) -> QueryAnalysis:
+        max_depth = 0
+        total_complexity = 0
+
+        for definition in self.document.definitions:
+            if not isinstance(definition, OperationDefinitionNode):
+                continue
+            self.variable_defaults = {
+                var.variable.name.value: _int_literal(var.default_value)
+                for var in definition.variable_definitions or ()
+            }
+            self.fragment_results = {}
+            depth, complexity = self._walk(
+                definition.selection_set.selections,
+                self._root_type(definition),
+                depth_so_far=0,
+                multiplier=1,
+                sized_lists=None,
+                visited_fragments=frozenset(),
+            )
+            max_depth = max(max_depth, depth)
+            total_complexity += complexity
+
+        return QueryAnalysis(
+            depth=max_depth,
+            complexity=total_complexity,
+            uses_variables=self.uses_variables,
+        )
+
+    def _walk(
+        self,
+        selections: tuple[SelectionNode, ...],
+        parent_type: Any,
+        depth_so_far: int,
+        multiplier: int,
+        sized_lists: int | None,
+        visited_fragments: frozenset[str],
+    ) -> tuple[int, int]:
+        """Return the (depth, cost) of a selection set.
+
+        ``sized_lists`` is the size bound a pagination wrapper passes down to
+        its list fields. ``visited_fragments`` holds the fragments spread on
+        the current path, so cycles stop while every spread is counted.
+        """
+        max_depth = depth_so_far
+        complexity = 0
+
+        for selection in selections:
+            if isinstance(selection, FieldNode):
+                if selection.name.value.startswith("__"):
+                    continue
+                field = self._get_field(parent_type, selection.name.value)
+                complexity += _field_weight(field) * multiplier
+
+                if not selection.selection_set:
+                    max_depth = max(max_depth, depth_so_far + 1)
+                    continue
+
+                child_multiplier = multiplier
+                child_sized_lists = None
+                is_list = field is not None and _is_list(field.type)
+                size = self._list_size(selection, field)
+                if size is not None:
+                    if field is None or is_list:
+                        child_multiplier *= size
+                    else:
+                        child_sized_lists = size
+                if sized_lists is not None and is_list:
+                    child_multiplier *= sized_lists
+
+                child_depth, child_complexity = self._walk(
+                    selection.selection_set.selections,
+                    get_named_type(field.type) if field is not None else None,
+                    depth_so_far + 1,
+                    child_multiplier,
+                    child_sized_lists,
+                    visited_fragments,
+                )
+                max_depth = max(max_depth, child_depth)
+                complexity += child_complexity
+
+            elif isinstance(selection, InlineFragmentNode):
+                fragment_type = parent_type
+                if selection.type_condition is not None:
+                    fragment_type = self._get_type(selection.type_condition.name.value)
+                child_depth, child_complexity = self._walk(
+                    selection.selection_set.selections,
+                    fragment_type,
+                    depth_so_far,
+                    multiplier,
+                    sized_lists,
+                    visited_fragments,
+                )
+                max_depth = max(max_depth, child_depth)
+                complexity += child_complexity
+
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment_name = selection.name.value
+                fragment = self.fragments.get(fragment_name)
+                if fragment is None or fragment_name in visited_fragments:
+                    continue
+                # Reused fragments are walked once per context, not per spread
+                key = (
+                    fragment_name,
+                    depth_so_far,
+                    multiplier,
+                    sized_lists,
+                    visited_fragments,
+                )
+                result = self.fragment_results.get(key)
+                if result is None:
+                    result = self.fragment_results[key] = self._walk(
+                        fragment.selection_set.selections,
+                        self._get_type(fragment.type_condition.name.value),
+                        depth_so_far,
+                        multiplier,
+                        sized_lists,
+                        visited_fragments | {fragment_name},
+                    )
+                child_depth, child_complexity = result
+                max_depth = max(max_depth, child_depth)
+                complexity += child_complexity
+
+        return max_depth, complexity
+
+    def _list_size(self, node: FieldNode, field: GraphQLField | None) -> int | None:
+        """Get the list size bound by a field's ``limit``/``first`` argument."""
+        for argument in node.arguments or ():
+            if argument.name.value not in LIST_SIZE_ARGUMENTS:
+                continue
+            value = argument.value
+            if isinstance(value, VariableNode):
+                self.uses_variables = True
+                name = value.name.value
+                size = self.variables.get(name)
+                if size is None:
+                    size = self.variable_defaults.get(name)
+                if size is None:
+                    size = _default_size(field, argument.name.value)
+            else:
+                size = _int_literal(value)
+            return max(size, 1) if isinstance(size, int) else None
+
+        if field is not None:
+            for name in LIST_SIZE_ARGUMENTS:
+                size = _default_size(field, name)
+                if size is not None:
+                    return max(size, 1)
+        return None
+
+    def _root_type(self, operation: OperationDefinitionNode) -> Any:
+        if self.schema is None:
+            return None
+        return self.schema.get_root_type(operation.operation)
+
+    def _get_type(self, name: str) -> Any:
+        if self.schema is None:
+            return None
+        return self.schema.get_type(name)
+
+    @staticmethod
+    def _get_field(parent_type: Any, name: str) -> GraphQLField | None:
+        fields = getattr(parent_type, "fields", None)
+        if fields is None:
+            return None
+        return fields.get(name)
+
+
+def _is_list(type_: Any) -> bool:
+    if isinstance(type_, GraphQLNonNull):
+        type_ = type_.of_type
+    return isinstance(type_, GraphQLList)
+
+
+def _int_literal(value: Any) -> int | None:
+    if isinstance(value, IntValueNode):
+        return int(value.value)
+    return None
+
+
+def _default_size(field: GraphQLField | None, argument_name: str) -> int | None:
+    if field is None:
+        return None
+    argument = field.args.get(argument_name)
+    if argument is None or not isinstance(argument.default_value, int):
+        return None
+    return argument.default_value
+
+
+def _field_weight(field: GraphQLField | None) -> int:
+    """Get a field's weight from its ``@cost`` directive, defaulting to 1."""
+    if field is None:
+        return 1
+    definition = field.extensions.get("strawberry-definition")
+    for directive in getattr(definition, "directives", ()):
+        if isinstance(directive, Cost):
+            return directive.weight
+    return 1
@@ -0,0 +1,51 @@
+"""Relay connection helpers for cursor-paginated queries."""
+
+from typing import Any
+
+from src.app.graphql.types.pagination import PageInfo
+from src.app.services.pagination import Page, encode_cursor
+from strawberry.types import Info
+from strawberry.types.nodes import SelectedField, Selection
+
+
+def item_cursor(item: Any) -> str:
+    """Get the cursor of a paginated model instance."""
+    return encode_cursor(item.created_at, item.id)
+
+
+def build_page_info(page: Page, cursors: list[str], after: str | None) -> PageInfo:
+    """Build the page information of a connection.
+
+    Args:
+        page: Page the edges were built from.
+        cursors: Cursors of the edges, in order.
+        after: Cursor the page was requested after.
+    """
+    return PageInfo(
+        has_next_page=page.has_next,
+        has_previous_page=after is not None,
+        start_cursor=cursors[0] if cursors else None,
+        end_cursor=cursors[-1] if cursors else None,
+    )
+
+
+def _selects(selections: list[Selection], name: str) -> bool:
+    for selection in selections:
+        if isinstance(selection, SelectedField):
+            if selection.name == name:
+                return True
+        elif _selects(selection.selections, name):
+            # Fragment spreads and inline fragments
+            return True
+    return False
+
+
+def requests_total_count(info: Info) -> bool:
+    """Check whether the query selects ``totalCount`` of the connection.
+
+    Counting is the expensive part of a page, so it is skipped unless the
+    client asks for it.
+    """
+    return any(
+        _selects(field.selections, "totalCount") for field in info.selected_fields
+    )
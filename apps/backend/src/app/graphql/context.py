@@ -4,21 +4,24 @@ import uuid
 from typing import Annotated
 
 from fastapi import Depends, Request
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.app.core.security import decode_token
 from src.app.db import get_db
+from src.app.graphql.loaders import create_loaders
 from src.app.models import User
+from src.app.services.principal_cache import Principal, principal_cache
+from strawberry.types import Info
 
 DbDep = Annotated[AsyncSession, Depends(get_db)]
 
 
 async def get_current_user_from_request(
     request: Request, db: AsyncSession
-) -> User | None:
-    """Extract current user from Authorization header if present.
+) -> Principal | None:
+    """Extract current user's principal from Authorization header if present.
 
-    Loads user with roles and permissions for RBAC checks.
+    The principal carries role and permission codes for RBAC checks and is
+    served from the principal cache, so most requests skip the database.
     """
     auth_header = request.headers.get("Authorization")
     if not auth_header or not auth_header.startswith("Bearer "):
@@ -37,20 +40,39 @@ async def get_current_user_from_request(
     if not user_id:
         return None
 
-    # Load user - roles and permissions use lazy="selectin" in models
-    result = await db.execute(select(User).where(User.id == uuid.UUID(user_id)))
-    user = result.scalar_one_or_none()
+    token_id = payload.get("jti") or str(payload.get("iat", ""))
+    principal = await principal_cache.get(db, uuid.UUID(user_id), token_id)
 
-    if not user or not user.is_active:
+    if not principal or not principal.is_active:
         return None
 
-    return user
+    return principal
+
+
+async def get_context_user(info: Info) -> User | None:
+    """Load the full user row for the authenticated principal.
+
+    For resolvers that need more than the principal (e.g. email or password
+    hash). The row is loaded at most once per request.
+    """
+    if "current_user" not in info.context:
+        principal = info.context.get("user")
+        user = None
+        if principal:
+            user = await info.context["db"].get(User, principal.id)
+        info.context["current_user"] = user
+    return info.context["current_user"]
 
 
 async def get_context(
     request: Request,
     db: DbDep,
 ) -> dict:
-    """Get GraphQL context with database session and optional user."""
+    """Get GraphQL context with database session, optional user and loaders."""
     user = await get_current_user_from_request(request, db)
-    return {"request": request, "db": db, "user": user}
+    return {
+        "request": request,
+        "db": db,
+        "user": user,
+        "loaders": create_loaders(db),
+    }
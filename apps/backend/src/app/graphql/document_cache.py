@@ -0,0 +1,118 @@
+"""Cache of parsed and validated GraphQL documents.
+
+Clients send the same operations over and over, so parsing, validating and
+analyzing (depth, complexity) each operation is done once per process:
+
+- L1: in-process LRU keyed by the sha256 of the query text, holding the
+  validated ``DocumentNode`` together with its precomputed depth and cost.
+- L2: Redis, holding the query text of Automatic Persisted Queries (APQ) so a
+  hash registered on one worker can be resolved by every worker. Parsed
+  documents are not portable between processes, so a worker that only finds
+  the text in Redis parses and validates it once and keeps it in L1.
+"""
+
+import hashlib
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import redis.asyncio as redis
+from graphql import DocumentNode
+from redis.exceptions import RedisError
+from src.app.core.config import settings
+from src.app.core.redis import RedisPool
+from src.app.graphql.complexity import QueryAnalysis
+from src.app.services.cache import KEY_PREFIX
+
+logger = logging.getLogger(__name__)
+
+APQ_KEY_PREFIX = KEY_PREFIX + "graphql:apq:"
+
+
+def query_hash(query: str) -> str:
+    """Get the APQ hash (hex sha256) of a query."""
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class CachedDocument:
+    """A validated document and its precomputed analysis."""
+
+    query: str
+    document: DocumentNode
+    analysis: QueryAnalysis
+
+
+class DocumentCache:
+    """In-process LRU of validated documents backed by Redis for APQ."""
+
+    def __init__(self, max_size: int = 1000, apq_ttl: int = 86400):
+        self.max_size = max_size
+        self.apq_ttl = apq_ttl
+        self._entries: OrderedDict[str, CachedDocument] = OrderedDict()
+        self._redis: redis.Redis | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def reset(self) -> None:
+        """Clear the in-process tier. Useful for testing."""
+        self._entries.clear()
+
+    def get(self, key: str) -> CachedDocument | None:
+        """Get a cached document by query hash."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, entry: CachedDocument) -> None:
+        """Store a validated document, evicting the least recently used."""
+        if self.max_size <= 0:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def get_query(self, key: str) -> str | None:
+        """Resolve a persisted query hash to its text from either tier."""
+        entry = self.get(key)
+        if entry is not None:
+            return entry.query
+
+        client = self._get_redis()
+        if client is None:
+            return None
+        try:
+            return await client.get(APQ_KEY_PREFIX + key)
+        except RedisError as e:
+            logger.warning("Failed to read persisted query: %s", e)
+            return None
+
+    async def register_query(self, key: str, query: str) -> None:
+        """Share a persisted query with other workers through Redis."""
+        client = self._get_redis()
+        if client is None:
+            return
+        try:
+            await client.set(APQ_KEY_PREFIX + key, query, ex=self.apq_ttl)
+        except RedisError as e:
+            logger.warning("Failed to store persisted query: %s", e)
+
+    def _get_redis(self) -> redis.Redis | None:
+        """Get a client on the shared Redis pool, if it is initialized."""
+        try:
+            pool = RedisPool.get_pool()
+        except RuntimeError:
+            return None
+        if self._redis is None or self._redis.connection_pool is not pool:
+            self._redis = redis.Redis(connection_pool=pool)
+        return self._redis
+
+
+# Global document cache instance
+document_cache = DocumentCache(
+    max_size=settings.graphql_document_cache_size,
+    apq_ttl=settings.graphql_apq_ttl,
+)
@@ -31,8 +31,13 @@ __all__ = [
     "CannotModifySystemRoleError",
     "EmailAlreadyExistsError",
     "RateLimitedError",
+    "ServiceUnavailableError",
     "QueryDepthError",
     "QueryComplexityError",
+    "PersistedQueryNotFoundError",
+    "PersistedQueryNotSupportedError",
+    "InvalidPersistedQueryError",
+    "SubscriberTooSlowError",
     "IsAuthenticated",
     "RequirePermissions",
     "RequireSuperadmin",
@@ -214,6 +219,20 @@ class RateLimitedError(GraphQLError):
         super().__init__("Too many requests.", ErrorCode.RATE_LIMITED, details)
 
 
+class ServiceUnavailableError(GraphQLError):
+    """Raised when the server is too busy to handle the request."""
+
+    def __init__(self, retry_after: int | None = None):
+        details = {}
+        if retry_after:
+            details["retry_after"] = retry_after
+        super().__init__(
+            "Server is busy, please retry shortly.",
+            ErrorCode.SERVICE_UNAVAILABLE,
+            details,
+        )
+
+
 # Query Complexity Errors
 class QueryDepthError(GraphQLError):
     """Raised when query depth exceeds the maximum allowed."""
@@ -235,6 +254,45 @@ class QueryComplexityError(GraphQLError):
         )
 
 
+# Persisted Query Errors
+class PersistedQueryNotFoundError(GraphQLError):
+    """Raised when a persisted query hash is not known to the server.
+
+    The message is part of the APQ protocol: clients retry with the full query.
+    """
+
+    def __init__(self):
+        super().__init__("PersistedQueryNotFound", ErrorCode.PERSISTED_QUERY_NOT_FOUND)
+
+
+class PersistedQueryNotSupportedError(GraphQLError):
+    """Raised when persisted queries are disabled."""
+
+    def __init__(self):
+        super().__init__(
+            "PersistedQueryNotSupported", ErrorCode.PERSISTED_QUERY_NOT_SUPPORTED
+        )
+
+
+class InvalidPersistedQueryError(GraphQLError):
+    """Raised when a persisted query extension is malformed or its hash mismatches."""
+
+    def __init__(self, message: str = "Provided sha256Hash does not match query."):
+        super().__init__(message, ErrorCode.INVALID_PERSISTED_QUERY)
+
+
+# Subscription Errors
+class SubscriberTooSlowError(GraphQLError):
+    """Raised when a subscriber is disconnected because its queue overflowed."""
+
+    def __init__(self, max_queue_size: int):
+        super().__init__(
+            "Subscription closed because the client is not keeping up.",
+            ErrorCode.SUBSCRIBER_TOO_SLOW,
+            {"max_queue_size": max_queue_size},
+        )
+
+
 # Permission Classes
 class IsAuthenticated(BasePermission):
     """Permission class to check if user is authenticated."""
@@ -261,14 +319,8 @@ class RequirePermissions(BasePermission):
         if not user:
             raise UnauthenticatedError()
 
-        # Get all permission codes from user's roles
-        user_permissions: set[str] = set()
-        for role in user.roles:
-            for perm in role.permissions:
-                user_permissions.add(perm.code)
-
         # Check if user has all required permissions
-        missing = [p for p in self.permissions if p not in user_permissions]
+        missing = [p for p in self.permissions if not user.has_permission(p)]
         if missing:
             raise InsufficientPermissionsError(required_permissions=self.permissions)
 
@@ -286,9 +338,8 @@ class RequireSuperadmin(BasePermission):
             raise UnauthenticatedError()
 
         # Check if user has superadmin role
-        for role in user.roles:
-            if role.code == "super_admin":
-                return True
+        if user.has_role("super_admin"):
+            return True
 
         raise InsufficientPermissionsError(
             message="Superadmin role required", required_roles=["super_admin"]
@@ -25,15 +25,23 @@ from src.app.graphql.errors import (
 from src.app.graphql.errors import (
     RoleNotFoundError as GQLRoleNotFoundError,
 )
+from src.app.graphql.errors import (
+    ServiceUnavailableError as GQLServiceUnavailableError,
+)
 from src.app.graphql.errors import (
     UserNotFoundError as GQLUserNotFoundError,
 )
+from src.app.graphql.errors import (
+    ValidationError as GQLValidationError,
+)
 from src.app.services.exceptions import (
     EmailAlreadyExistsError,
     InactiveUserError,
     InvalidCredentialsError,
+    InvalidCursorError,
     InvalidTokenError,
     InvalidTokenTypeError,
+    PasswordHasherBusyError,
     PermissionNotFoundError,
     RoleNotFoundError,
     SystemRoleModificationError,
@@ -64,6 +72,9 @@ def map_service_exception_to_graphql(exc: Exception) -> Exception:
     if isinstance(exc, InactiveUserError):
         return GQLInactiveUserError()
 
+    if isinstance(exc, PasswordHasherBusyError):
+        return GQLServiceUnavailableError(retry_after=1)
+
     # Resource errors
     if isinstance(exc, UserNotFoundError):
         return GQLUserNotFoundError()
@@ -81,5 +92,9 @@ def map_service_exception_to_graphql(exc: Exception) -> Exception:
     if isinstance(exc, SystemRoleModificationError):
         return GQLCannotModifySystemRoleError()
 
+    # Pagination errors
+    if isinstance(exc, InvalidCursorError):
+        return GQLValidationError("Invalid pagination cursor.", "after")
+
     # No mapping found, re-raise original
     return exc
@@ -1,23 +1,55 @@
-"""GraphQL security extensions for depth, complexity limiting, and request tracing."""
+"""GraphQL extensions for document caching, depth and cost limiting, and request tracing."""
 
 import time
 from typing import Any
 
-from graphql import (
-    DocumentNode,
-    FieldNode,
-    FragmentDefinitionNode,
-    FragmentSpreadNode,
-    InlineFragmentNode,
-    OperationDefinitionNode,
-)
+from graphql import DocumentNode, GraphQLSchema, validate
 from src.app.core.config import settings
-from src.app.graphql.errors import QueryComplexityError, QueryDepthError
+from src.app.graphql.complexity import QueryAnalysis, analyze_document
+from src.app.graphql.document_cache import (
+    CachedDocument,
+    document_cache,
+    query_hash,
+)
+from src.app.graphql.errors import (
+    InvalidPersistedQueryError,
+    PersistedQueryNotFoundError,
+    PersistedQueryNotSupportedError,
+    QueryComplexityError,
+    QueryDepthError,
+)
 from src.app.middleware.request_id import get_request_id
 from strawberry.extensions import SchemaExtension
 from strawberry.types import ExecutionContext
 
 
+def _is_valid_document(execution_context: ExecutionContext) -> bool:
+    """Check if the operation was parsed and validated without errors."""
+    return (
+        execution_context.graphql_document is not None
+        and not execution_context.pre_execution_errors
+    )
+
+
+def _get_cached_document(execution_context: ExecutionContext) -> CachedDocument | None:
+    """Get the document cache entry of the operation being executed."""
+    if not execution_context.query:
+        return None
+    cached = document_cache.get(query_hash(execution_context.query))
+    if cached is None or cached.document is not execution_context.graphql_document:
+        return None
+    return cached
+
+
+def _analyze(execution_context: ExecutionContext) -> QueryAnalysis:
+    """Analyze the operation being executed with its variables."""
+    return analyze_document(
+        execution_context.graphql_document,
+        execution_context.schema._schema,
+        execution_context.variables,
+    )
+
+
 class DepthLimitExtension(SchemaExtension):
     """Extension to limit query depth and prevent deeply nested attacks."""
 
@@ -29,97 +61,41 @@ class DepthLimitExtension(SchemaExtension):
     ):
         super().__init__(execution_context=execution_context)
         self.max_depth = max_depth or settings.graphql_max_depth
+        self.depth: int | None = None
 
-    def on_operation(self):
-        """Check query depth before execution."""
+    def on_validate(self):
+        """Check query depth before the operation is executed."""
         execution_context = self.execution_context
+        if _is_valid_document(execution_context):
+            # Depth does not depend on variables, so a cached analysis always applies
+            cached = _get_cached_document(execution_context)
+            analysis = cached.analysis if cached else _analyze(execution_context)
+            self.depth = analysis.depth
 
-        if execution_context.graphql_document is not None:
-            depth = self._calculate_depth(execution_context.graphql_document)
-
-            if depth > self.max_depth:
-                raise QueryDepthError(depth, self.max_depth)
+            if self.depth > self.max_depth:
+                execution_context.pre_execution_errors = [
+                    QueryDepthError(self.depth, self.max_depth)
+                ]
 
         yield
 
-    def _calculate_depth(self, document: DocumentNode) -> int:
-        """Calculate the maximum depth of a GraphQL document."""
-        fragments: dict[str, FragmentDefinitionNode] = {}
-        max_depth = 0
-
-        # First pass: collect all fragment definitions
-        for definition in document.definitions:
-            if isinstance(definition, FragmentDefinitionNode):
-                fragments[definition.name.value] = definition
-
-        # Second pass: calculate depth for each operation
-        for definition in document.definitions:
-            if isinstance(definition, OperationDefinitionNode):
-                depth = self._get_selection_set_depth(
-                    definition.selection_set.selections,
-                    fragments,
-                    depth_so_far=0,
-                    visited_fragments=set(),
-                )
-                max_depth = max(max_depth, depth)
-
-        return max_depth
+    def get_results(self) -> dict[str, Any]:
+        """Report the query depth in response extensions."""
+        if self.depth is None or not settings.graphql_report_complexity:
+            return {}
+        return {"queryDepth": self.depth, "maxQueryDepth": self.max_depth}
 
-    def _get_selection_set_depth(
-        self,
-        selections,
-        fragments: dict[str, FragmentDefinitionNode],
-        depth_so_far: int,
-        visited_fragments: set[str],
-    ) -> int:
-        """Recursively calculate the depth of a selection set."""
-        max_depth = depth_so_far
-
-        for selection in selections:
-            if isinstance(selection, FieldNode):
-                if selection.selection_set:
-                    child_depth = self._get_selection_set_depth(
-                        selection.selection_set.selections,
-                        fragments,
-                        depth_so_far + 1,
-                        visited_fragments,
-                    )
-                    max_depth = max(max_depth, child_depth)
-                else:
-                    max_depth = max(max_depth, depth_so_far + 1)
-
-            elif isinstance(selection, InlineFragmentNode):
-                if selection.selection_set:
-                    child_depth = self._get_selection_set_depth(
-                        selection.selection_set.selections,
-                        fragments,
-                        depth_so_far,
-                        visited_fragments,
-                    )
-                    max_depth = max(max_depth, child_depth)
-
-            elif isinstance(selection, FragmentSpreadNode):
-                fragment_name = selection.name.value
-                if (
-                    fragment_name not in visited_fragments
-                    and fragment_name in fragments
-                ):
-                    visited_fragments.add(fragment_name)
-                    fragment = fragments[fragment_name]
-                    if fragment.selection_set:
-                        child_depth = self._get_selection_set_depth(
-                            fragment.selection_set.selections,
-                            fragments,
-                            depth_so_far,
-                            visited_fragments,
-                        )
-                        max_depth = max(max_depth, child_depth)
-
-        return max_depth
+    @staticmethod
+    def _calculate_depth(document: DocumentNode) -> int:
+        """Calculate the maximum depth of a GraphQL document."""
+        return analyze_document(document).depth
 
 
 class QueryComplexityExtension(SchemaExtension):
-    """Extension to limit query complexity based on field count."""
+    """Extension to limit query cost.
+
+    See ``src.app.graphql.complexity`` for the cost model.
+    """
 
     def __init__(
         self,
@@ -129,95 +105,129 @@ class QueryComplexityExtension(SchemaExtension):
     ):
         super().__init__(execution_context=execution_context)
         self.max_complexity = max_complexity or settings.graphql_max_complexity
+        self.complexity: int | None = None
 
-    def on_operation(self):
-        """Check query complexity before execution."""
+    def on_validate(self):
+        """Check query cost before the operation is executed."""
         execution_context = self.execution_context
+        if _is_valid_document(execution_context):
+            cached = _get_cached_document(execution_context)
+            if cached is not None and not cached.analysis.uses_variables:
+                analysis = cached.analysis
+            else:
+                analysis = _analyze(execution_context)
+            self.complexity = analysis.complexity
+
+            if self.complexity > self.max_complexity:
+                execution_context.pre_execution_errors = [
+                    QueryComplexityError(self.complexity, self.max_complexity)
+                ]
+
+        yield
+
+    def get_results(self) -> dict[str, Any]:
+        """Report the query cost in response extensions."""
+        if self.complexity is None or not settings.graphql_report_complexity:
+            return {}
+        return {
+            "queryComplexity": self.complexity,
+            "maxQueryComplexity": self.max_complexity,
+        }
+
+    @staticmethod
+    def _calculate_complexity(
+        document: DocumentNode, schema: GraphQLSchema | None = None
+    ) -> int:
+        """Calculate the cost of a GraphQL document."""
+        return analyze_document(document, schema).complexity
+
+
+class DocumentCacheExtension(SchemaExtension):
+    """Extension for Automatic Persisted Queries and parsed-document caching.
 
-        if execution_context.graphql_document is not None:
-            complexity = self._calculate_complexity(execution_context.graphql_document)
+    Clients may send ``extensions.persistedQuery.sha256Hash`` without the query
+    text. Unknown hashes are answered with ``PersistedQueryNotFound`` so the
+    client retries with the full query, which is then registered.
+
+    Every operation's validated document is cached with its depth and
+    complexity, so repeated operations skip parsing, validation and analysis.
+    List it before the depth and complexity extensions, so the analysis is
+    cached by the time they look it up.
+    """
 
-            if complexity > self.max_complexity:
-                raise QueryComplexityError(complexity, self.max_complexity)
+    def __init__(self, *, execution_context: ExecutionContext | None = None):
+        super().__init__(execution_context=execution_context)
+        self._key: str | None = None
+        self._cached: CachedDocument | None = None
+        self._register = False
+
+    async def on_operation(self):
+        """Resolve a persisted query hash to the query text."""
+        operation_extensions = self.execution_context.operation_extensions or {}
+        persisted_query = operation_extensions.get("persistedQuery")
+        if persisted_query is not None:
+            await self._resolve_persisted_query(persisted_query)
+        yield
 
+    def on_parse(self):
+        """Serve the document from the cache instead of parsing it."""
+        execution_context = self.execution_context
+        if execution_context.query:
+            self._key = self._key or query_hash(execution_context.query)
+            self._cached = document_cache.get(self._key)
+            if self._cached is not None:
+                execution_context.graphql_document = self._cached.document
         yield
 
-    def _calculate_complexity(self, document: DocumentNode) -> int:
-        """Calculate the complexity of a GraphQL document."""
-        fragments: dict[str, FragmentDefinitionNode] = {}
-        total_complexity = 0
-
-        # First pass: collect all fragment definitions
-        for definition in document.definitions:
-            if isinstance(definition, FragmentDefinitionNode):
-                fragments[definition.name.value] = definition
-
-        # Second pass: calculate complexity for each operation
-        for definition in document.definitions:
-            if isinstance(definition, OperationDefinitionNode):
-                complexity = self._get_selection_set_complexity(
-                    definition.selection_set.selections,
-                    fragments,
-                    visited_fragments=set(),
+    async def on_validate(self):
+        """Validate uncached documents once and cache them with their analysis."""
+        execution_context = self.execution_context
+        if self._cached is None and self._key is not None:
+            document = execution_context.graphql_document
+            errors = validate(
+                execution_context.schema._schema,
+                document,
+                execution_context.validation_rules,
+            )
+            execution_context.pre_execution_errors = errors
+            if not errors:
+                self._cached = CachedDocument(
+                    query=execution_context.query,
+                    document=document,
+                    analysis=analyze_document(
+                        document, execution_context.schema._schema
+                    ),
                 )
-                total_complexity += complexity
+                document_cache.put(self._key, self._cached)
+        elif self._cached is not None:
+            # Cached documents have already passed validation
+            execution_context.pre_execution_errors = []
 
-        return total_complexity
+        if self._register and self._cached is not None:
+            await document_cache.register_query(self._key, execution_context.query)
+        yield
 
-    def _get_selection_set_complexity(
-        self,
-        selections,
-        fragments: dict[str, FragmentDefinitionNode],
-        visited_fragments: set[str],
-        multiplier: int = 1,
-    ) -> int:
-        """Recursively calculate the complexity of a selection set."""
-        complexity = 0
-
-        for selection in selections:
-            if isinstance(selection, FieldNode):
-                # Each field adds 1 to complexity
-                complexity += multiplier
-
-                if selection.selection_set:
-                    # Check for list fields that multiply complexity
-                    field_multiplier = 1
-                    # You could add custom logic here to increase multiplier
-                    # for fields known to return lists
-
-                    complexity += self._get_selection_set_complexity(
-                        selection.selection_set.selections,
-                        fragments,
-                        visited_fragments,
-                        multiplier * field_multiplier,
-                    )
-
-            elif isinstance(selection, InlineFragmentNode):
-                if selection.selection_set:
-                    complexity += self._get_selection_set_complexity(
-                        selection.selection_set.selections,
-                        fragments,
-                        visited_fragments,
-                        multiplier,
-                    )
-
-            elif isinstance(selection, FragmentSpreadNode):
-                fragment_name = selection.name.value
-                if (
-                    fragment_name not in visited_fragments
-                    and fragment_name in fragments
-                ):
-                    visited_fragments.add(fragment_name)
-                    fragment = fragments[fragment_name]
-                    if fragment.selection_set:
-                        complexity += self._get_selection_set_complexity(
-                            fragment.selection_set.selections,
-                            fragments,
-                            visited_fragments,
-                            multiplier,
-                        )
-
-        return complexity
+    async def _resolve_persisted_query(self, persisted_query: Any) -> None:
+        """Validate the persistedQuery extension and load or verify the query."""
+        if not settings.graphql_apq_enabled:
+            raise PersistedQueryNotSupportedError()
+        if not isinstance(persisted_query, dict) or persisted_query.get("version") != 1:
+            raise InvalidPersistedQueryError("Unsupported persisted query version.")
+        key = persisted_query.get("sha256Hash")
+        if not isinstance(key, str):
+            raise InvalidPersistedQueryError("Persisted query sha256Hash is required.")
+
+        execution_context = self.execution_context
+        if not execution_context.query:
+            query = await document_cache.get_query(key)
+            if query is None:
+                raise PersistedQueryNotFoundError()
+            execution_context.query = query
+        elif query_hash(execution_context.query) != key:
+            raise InvalidPersistedQueryError()
+        else:
+            self._register = True
+        self._key = key
 
 
 class RequestTracingExtension(SchemaExtension):
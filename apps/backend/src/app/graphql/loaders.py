@@ -0,0 +1,93 @@
+"""Request-scoped DataLoaders for GraphQL.
+
+Nested fields (``User.roles``, ``Role.permissions``, ``AuditLog.actor``)
+resolve through these loaders instead of ORM relationships, so each level
+of a query is fetched with a single ``IN`` query, and only when the field is
+selected. ``File.url`` likewise signs all of a page's URLs in one batch.
+Loaders are created per request in ``get_context`` so cached results never
+leak between requests.
+"""
+
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import partial
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+from src.app.models import Permission, Role, User, role_permissions, user_roles
+from src.app.services import storage_service
+from strawberry.dataloader import DataLoader
+
+
+async def load_users(db: AsyncSession, user_ids: list[uuid.UUID]) -> list[User | None]:
+    """Batch load users by ID."""
+    result = await db.execute(
+        select(User).where(User.id.in_(user_ids)).options(raiseload("*"))
+    )
+    users = {user.id: user for user in result.scalars()}
+    return [users.get(user_id) for user_id in user_ids]
+
+
+async def load_roles_by_user(
+    db: AsyncSession, user_ids: list[uuid.UUID]
+) -> list[list[Role]]:
+    """Batch load the roles assigned to each user."""
+    result = await db.execute(
+        select(user_roles.c.user_id, Role)
+        .join(Role, Role.id == user_roles.c.role_id)
+        .where(user_roles.c.user_id.in_(user_ids))
+        .order_by(Role.id)
+        .options(raiseload("*"))
+    )
+    roles: dict[uuid.UUID, list[Role]] = defaultdict(list)
+    for user_id, role in result:
+        roles[user_id].append(role)
+    return [roles[user_id] for user_id in user_ids]
+
+
+async def load_permissions_by_role(
+    db: AsyncSession, role_ids: list[int]
+) -> list[list[Permission]]:
+    """Batch load the permissions granted to each role."""
+    result = await db.execute(
+        select(role_permissions.c.role_id, Permission)
+        .join(Permission, Permission.id == role_permissions.c.permission_id)
+        .where(role_permissions.c.role_id.in_(role_ids))
+        .order_by(Permission.id)
+        .options(raiseload("*"))
+    )
+    permissions: dict[int, list[Permission]] = defaultdict(list)
+    for role_id, permission in result:
+        permissions[role_id].append(permission)
+    return [permissions[role_id] for role_id in role_ids]
+
+
+async def load_presigned_urls(keys: list[str]) -> list[str]:
+    """Batch sign download URLs for storage keys."""
+    urls = await storage_service.get_presigned_urls(keys)
+    return [urls[key] for key in keys]
+
+
+@dataclass
+class Loaders:
+    """DataLoaders available on the GraphQL context as ``loaders``.
+
+    Audit log actors are users, so ``AuditLog.actor`` shares ``users``.
+    """
+
+    users: DataLoader[uuid.UUID, User | None]
+    roles_by_user: DataLoader[uuid.UUID, list[Role]]
+    permissions_by_role: DataLoader[int, list[Permission]]
+    presigned_urls: DataLoader[str, str]
+
+
+def create_loaders(db: AsyncSession) -> Loaders:
+    """Create a fresh set of loaders bound to a request's session."""
+    return Loaders(
+        users=DataLoader(load_fn=partial(load_users, db)),
+        roles_by_user=DataLoader(load_fn=partial(load_roles_by_user, db)),
+        permissions_by_role=DataLoader(load_fn=partial(load_permissions_by_role, db)),
+        presigned_urls=DataLoader(load_fn=load_presigned_urls),
+    )
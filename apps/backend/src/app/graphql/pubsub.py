@@ -0,0 +1,308 @@
+"""Pub/sub brokers for GraphQL subscriptions.
+
+Each subscriber gets a bounded queue. Publishing never waits on a subscriber:
+when a queue is full, the overflow policy either drops the subscriber's oldest
+message or disconnects it, so one slow WebSocket client cannot hold up the
+others or grow memory without limit.
+
+- ``PubSubBroker``: delivers messages to subscribers in this process.
+- ``RedisPubSubBroker``: relays messages through Redis pub/sub, so a message
+  published on one worker reaches subscribers on every worker. Each process
+  holds one Redis subscription per channel, shared by its local subscribers,
+  and falls back to in-process delivery while Redis is not initialized.
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncGenerator
+from enum import Enum
+from typing import Any
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+from src.app.core.config import settings
+from src.app.core.redis import RedisPool
+from src.app.graphql.errors import SubscriberTooSlowError
+from src.app.services.cache import KEY_PREFIX
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = KEY_PREFIX + "graphql:pubsub:"
+
+# Delay before resubscribing after the Redis subscription connection fails
+RECONNECT_DELAY = 1.0
+
+
+class OverflowPolicy(str, Enum):
+    """What to do when a subscriber's queue is full."""
+
+    DROP_OLDEST = "drop_oldest"
+    DISCONNECT = "disconnect"
+
+
+_DISCONNECTED = object()
+
+
+class Subscriber:
+    """A subscription's bounded message queue."""
+
+    def __init__(self, max_queue_size: int):
+        self.queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=max_queue_size)
+        self.disconnected = False
+
+
+class PubSubBroker:
+    """In-process broker with bounded per-subscriber queues."""
+
+    def __init__(
+        self,
+        max_queue_size: int = 100,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ):
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self._channels: dict[str, set[Subscriber]] = {}
+        self._published = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._disconnected = 0
+
+    def subscriber_count(self, channel: str | None = None) -> int:
+        """Get the number of subscribers of a channel, or of all channels."""
+        if channel is not None:
+            return len(self._channels.get(channel, ()))
+        return sum(len(subscribers) for subscribers in self._channels.values())
+
+    def stats(self) -> dict[str, Any]:
+        """Get broker metrics."""
+        return {
+            "backend": self.backend,
+            "subscribers": self.subscriber_count(),
+            "channels": {
+                channel: len(subscribers)
+                for channel, subscribers in self._channels.items()
+            },
+            "published": self._published,
+            "delivered": self._delivered,
+            "dropped": self._dropped,
+            "disconnected": self._disconnected,
+        }
+
+    @property
+    def backend(self) -> str:
+        return "memory"
+
+    async def publish(self, channel: str, message: dict[str, Any]) -> None:
+        """Publish a message to every subscriber of a channel."""
+        self._published += 1
+        self._deliver(channel, message)
+
+    async def subscribe(self, channel: str) -> AsyncGenerator[dict[str, Any]]:
+        """Subscribe to a channel.
+
+        Raises:
+            SubscriberTooSlowError: If the subscriber is disconnected because
+                its queue overflowed.
+        """
+        subscriber = Subscriber(self.max_queue_size)
+        await self._add_subscriber(channel, subscriber)
+        try:
+            while True:
+                message = await subscriber.queue.get()
+                if message is _DISCONNECTED:
+                    raise SubscriberTooSlowError(self.max_queue_size)
+                yield message
+        finally:
+            await self._remove_subscriber(channel, subscriber)
+
+    async def close(self) -> None:
+        """Release the broker's resources."""
+
+    async def _add_subscriber(self, channel: str, subscriber: Subscriber) -> None:
+        self._channels.setdefault(channel, set()).add(subscriber)
+
+    async def _remove_subscriber(self, channel: str, subscriber: Subscriber) -> None:
+        subscribers = self._channels.get(channel)
+        if subscribers is None:
+            return
+        subscribers.discard(subscriber)
+        if not subscribers:
+            del self._channels[channel]
+
+    def _deliver(self, channel: str, message: dict[str, Any]) -> None:
+        """Hand a message to the local subscribers of a channel without waiting."""
+        for subscriber in tuple(self._channels.get(channel, ())):
+            if subscriber.disconnected:
+                continue
+            queue = subscriber.queue
+            if queue.full():
+                if self.overflow_policy == OverflowPolicy.DISCONNECT:
+                    self._disconnect(subscriber)
+                    continue
+                queue.get_nowait()
+                self._dropped += 1
+            queue.put_nowait(message)
+            self._delivered += 1
+
+    def _disconnect(self, subscriber: Subscriber) -> None:
+        """Discard a subscriber's backlog and end its subscription."""
+        subscriber.disconnected = True
+        self._dropped += subscriber.queue.qsize() + 1
+        self._disconnected += 1
+        while not subscriber.queue.empty():
+            subscriber.queue.get_nowait()
+        subscriber.queue.put_nowait(_DISCONNECTED)
+
+
+class RedisPubSubBroker(PubSubBroker):
+    """Broker relaying messages between workers through Redis pub/sub."""
+
+    def __init__(
+        self,
+        max_queue_size: int = 100,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ):
+        super().__init__(max_queue_size, overflow_policy)
+        self._redis: redis.Redis | None = None
+        self._pubsub: redis.client.PubSub | None = None
+        self._listener: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def backend(self) -> str:
+        return "redis"
+
+    async def publish(self, channel: str, message: dict[str, Any]) -> None:
+        """Publish a message to the subscribers of a channel on every worker."""
+        client = self._get_redis()
+        if client is None:
+            await super().publish(channel, message)
+            return
+        self._published += 1
+        try:
+            await client.publish(
+                CHANNEL_PREFIX + channel, json.dumps(message, default=str)
+            )
+        except RedisError as e:
+            logger.warning("Failed to publish to Redis, delivering locally: %s", e)
+            self._deliver(channel, message)
+
+    async def close(self) -> None:
+        """Stop listening and close the Redis subscription connection."""
+        async with self._lock:
+            await self._stop_listener()
+
+    async def _add_subscriber(self, channel: str, subscriber: Subscriber) -> None:
+        await super()._add_subscriber(channel, subscriber)
+        async with self._lock:
+            pubsub = await self._get_pubsub()
+            if pubsub is None:
+                return
+            # Not just for the first subscriber, so a failed SUBSCRIBE is retried
+            if CHANNEL_PREFIX + channel not in pubsub.channels:
+                try:
+                    await pubsub.subscribe(CHANNEL_PREFIX + channel)
+                except RedisError as e:
+                    logger.warning("Failed to subscribe to Redis channel: %s", e)
+                    return
+            if self._listener is None or self._listener.done():
+                self._listener = asyncio.create_task(self._listen())
+
+    async def _remove_subscriber(self, channel: str, subscriber: Subscriber) -> None:
+        await super()._remove_subscriber(channel, subscriber)
+        if self.subscriber_count(channel) > 0:
+            return
+        async with self._lock:
+            if self._pubsub is None:
+                return
+            if not self._channels:
+                await self._stop_listener()
+                return
+            try:
+                await self._pubsub.unsubscribe(CHANNEL_PREFIX + channel)
+            except RedisError as e:
+                logger.warning("Failed to unsubscribe from Redis channel: %s", e)
+
+    async def _listen(self) -> None:
+        """Deliver messages from Redis to local subscribers."""
+        while self._pubsub is not None:
+            try:
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+            except (RedisError, OSError) as e:
+                logger.warning("Redis pub/sub connection lost: %s", e)
+                await asyncio.sleep(RECONNECT_DELAY)
+                await self._resubscribe()
+                continue
+            if message is None:
+                continue
+            channel = message["channel"].removeprefix(CHANNEL_PREFIX)
+            try:
+                data = json.loads(message["data"])
+            except ValueError:
+                logger.warning("Ignoring malformed pub/sub message on %s", channel)
+                continue
+            self._deliver(channel, data)
+
+    async def _resubscribe(self) -> None:
+        """Subscribe again to the channels that still have local subscribers."""
+        if self._pubsub is None or not self._channels:
+            return
+        try:
+            await self._pubsub.subscribe(
+                *(CHANNEL_PREFIX + channel for channel in self._channels)
+            )
+        except RedisError as e:
+            logger.warning("Failed to resubscribe to Redis channels: %s", e)
+
+    async def _get_pubsub(self) -> redis.client.PubSub | None:
+        if self._pubsub is None:
+            client = self._get_redis()
+            if client is None:
+                return None
+            self._pubsub = client.pubsub()
+        return self._pubsub
+
+    async def _stop_listener(self) -> None:
+        listener, self._listener = self._listener, None
+        pubsub, self._pubsub = self._pubsub, None
+        if listener is not None and listener is not asyncio.current_task():
+            listener.cancel()
+            try:
+                await listener
+            except asyncio.CancelledError:
+                pass
+        if pubsub is not None:
+            try:
+                await pubsub.aclose()
+            except RedisError as e:
+                logger.warning("Failed to close Redis pub/sub connection: %s", e)
+
+    def _get_redis(self) -> redis.Redis | None:
+        """Get a client on the shared Redis pool, if it is initialized."""
+        try:
+            pool = RedisPool.get_pool()
+        except RuntimeError:
+            return None
+        if self._redis is None or self._redis.connection_pool is not pool:
+            self._redis = redis.Redis(connection_pool=pool)
+        return self._redis
+
+
+def create_broker() -> PubSubBroker:
+    """Create the broker configured in settings."""
+    broker_class = (
+        RedisPubSubBroker
+        if settings.graphql_pubsub_backend == "redis"
+        else PubSubBroker
+    )
+    return broker_class(
+        max_queue_size=settings.graphql_subscription_queue_size,
+        overflow_policy=OverflowPolicy(settings.graphql_subscription_overflow),
+    )
+
+
+# Global broker instance
+broker = create_broker()
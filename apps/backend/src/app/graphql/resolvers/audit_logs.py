@@ -3,18 +3,27 @@
 import uuid
 
 import strawberry
+from src.app.graphql.complexity import Cost
+from src.app.graphql.connections import (
+    build_page_info,
+    item_cursor,
+    requests_total_count,
+)
 from src.app.graphql.errors import (
     IsAuthenticated,
     require_permissions,
 )
+from src.app.graphql.exception_mapper import map_service_exception_to_graphql
 from src.app.graphql.types.audit_log import (
+    AuditLogConnection,
+    AuditLogEdge,
     AuditLogFilterInput,
     AuditLogType,
     PaginatedAuditLogs,
 )
-from src.app.graphql.validators import validate_pagination
+from src.app.graphql.validators import validate_first, validate_offset_pagination
 from src.app.schemas.audit_log import AuditLogFilter
-from src.app.services import AuditLogNotFoundError, AuditService
+from src.app.services import AuditLogNotFoundError, AuditService, InvalidCursorError
 from strawberry.types import Info
 
 
@@ -23,15 +32,35 @@ def convert_audit_log_to_type(audit_log) -> AuditLogType:
     return AuditLogType.from_model(audit_log)
 
 
+def _to_filter(filter: AuditLogFilterInput | None) -> AuditLogFilter | None:
+    """Convert GraphQL filter input to the service filter."""
+    if not filter:
+        return None
+    return AuditLogFilter(
+        action=filter.action,
+        entity_type=filter.entity_type,
+        entity_id=uuid.UUID(str(filter.entity_id)) if filter.entity_id else None,
+        actor_id=uuid.UUID(str(filter.actor_id)) if filter.actor_id else None,
+        start_date=filter.start_date,
+        end_date=filter.end_date,
+    )
+
+
 # Create permission class for audit:read
 RequireAuditRead = require_permissions("audit:read")
 
+# Listing counts matching rows in the (large) audit log table
+AUDIT_LIST_COST = Cost(weight=10)
+
 
 @strawberry.type
 class AuditLogQuery:
     """Audit log query resolvers."""
 
-    @strawberry.field(permission_classes=[IsAuthenticated, RequireAuditRead])
+    @strawberry.field(
+        permission_classes=[IsAuthenticated, RequireAuditRead],
+        directives=[AUDIT_LIST_COST],
+    )
     async def audit_logs(
         self,
         info: Info,
@@ -43,26 +72,14 @@ class AuditLogQuery:
 
         Requires audit:read permission.
         """
-        skip, limit = validate_pagination(skip, limit, max_limit=1000)
+        skip, limit = validate_offset_pagination(skip, limit, max_limit=1000)
 
         db = info.context["db"]
         service = AuditService(db)
 
-        # Convert GraphQL input to service filter
-        filter_params = None
-        if filter:
-            filter_params = AuditLogFilter(
-                action=filter.action,
-                entity_type=filter.entity_type,
-                entity_id=uuid.UUID(str(filter.entity_id))
-                if filter.entity_id
-                else None,
-                actor_id=uuid.UUID(str(filter.actor_id)) if filter.actor_id else None,
-                start_date=filter.start_date,
-                end_date=filter.end_date,
-            )
-
-        logs, total = await service.list_logs(filter_params, skip, limit)
+        logs, total = await service.list_logs(
+            _to_filter(filter), skip, limit, include_actor=False
+        )
 
         items = [convert_audit_log_to_type(log) for log in logs]
         has_more = skip + len(items) < total
@@ -75,6 +92,50 @@ class AuditLogQuery:
             has_more=has_more,
         )
 
+    @strawberry.field(
+        permission_classes=[IsAuthenticated, RequireAuditRead],
+        directives=[AUDIT_LIST_COST],
+    )
+    async def audit_logs_connection(
+        self,
+        info: Info,
+        filter: AuditLogFilterInput | None = None,
+        first: int = 20,
+        after: str | None = None,
+        exact_count: bool = False,
+    ) -> AuditLogConnection:
+        """Get audit logs newest first, one cursor page at a time.
+
+        Requires audit:read permission.
+        """
+        first = validate_first(first, max_limit=1000)
+
+        db = info.context["db"]
+        service = AuditService(db)
+
+        try:
+            page = await service.paginate_logs(
+                _to_filter(filter),
+                limit=first,
+                cursor=after,
+                include_total=requests_total_count(info),
+                exact_total=exact_count,
+                include_actor=False,
+            )
+        except InvalidCursorError as e:
+            raise map_service_exception_to_graphql(e) from e
+
+        edges = [
+            AuditLogEdge(node=convert_audit_log_to_type(log), cursor=item_cursor(log))
+            for log in page.items
+        ]
+        return AuditLogConnection(
+            edges=edges,
+            page_info=build_page_info(page, [edge.cursor for edge in edges], after),
+            total_count=page.total,
+            total_count_estimated=page.total_estimated,
+        )
+
     @strawberry.field(permission_classes=[IsAuthenticated, RequireAuditRead])
     async def audit_log(self, info: Info, id: strawberry.ID) -> AuditLogType | None:
         """Get a single audit log by ID.
@@ -85,12 +146,15 @@ class AuditLogQuery:
         service = AuditService(db)
 
         try:
-            log = await service.get_by_id(uuid.UUID(str(id)))
+            log = await service.get_by_id(uuid.UUID(str(id)), include_actor=False)
             return convert_audit_log_to_type(log)
         except AuditLogNotFoundError:
             return None
 
-    @strawberry.field(permission_classes=[IsAuthenticated, RequireAuditRead])
+    @strawberry.field(
+        permission_classes=[IsAuthenticated, RequireAuditRead],
+        directives=[AUDIT_LIST_COST],
+    )
     async def audit_logs_by_entity(
         self,
         info: Info,
@@ -103,13 +167,13 @@ class AuditLogQuery:
 
         Requires audit:read permission.
         """
-        skip, limit = validate_pagination(skip, limit, max_limit=1000)
+        skip, limit = validate_offset_pagination(skip, limit, max_limit=1000)
 
         db = info.context["db"]
         service = AuditService(db)
 
         logs, total = await service.get_by_entity(
-            entity_type, uuid.UUID(str(entity_id)), skip, limit
+            entity_type, uuid.UUID(str(entity_id)), skip, limit, include_actor=False
         )
 
         items = [convert_audit_log_to_type(log) for log in logs]
@@ -123,7 +187,10 @@ class AuditLogQuery:
             has_more=has_more,
         )
 
-    @strawberry.field(permission_classes=[IsAuthenticated, RequireAuditRead])
+    @strawberry.field(
+        permission_classes=[IsAuthenticated, RequireAuditRead],
+        directives=[AUDIT_LIST_COST],
+    )
     async def audit_logs_by_actor(
         self,
         info: Info,
@@ -135,12 +202,14 @@ class AuditLogQuery:
 
         Requires audit:read permission.
         """
-        skip, limit = validate_pagination(skip, limit, max_limit=1000)
+        skip, limit = validate_offset_pagination(skip, limit, max_limit=1000)
 
         db = info.context["db"]
         service = AuditService(db)
 
-        logs, total = await service.get_by_actor(uuid.UUID(str(actor_id)), skip, limit)
+        logs, total = await service.get_by_actor(
+            uuid.UUID(str(actor_id)), skip, limit, include_actor=False
+        )
 
         items = [convert_audit_log_to_type(log) for log in logs]
         has_more = skip + len(items) < total
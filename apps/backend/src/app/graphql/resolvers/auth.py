@@ -1,6 +1,7 @@
 """Authentication GraphQL resolvers."""
 
 import strawberry
+from src.app.graphql.context import get_context_user
 from src.app.graphql.exception_mapper import map_service_exception_to_graphql
 from src.app.graphql.resolvers.users import convert_user_to_type
 from src.app.graphql.subscriptions import publish_user_created, publish_user_logged_out
@@ -42,7 +43,7 @@ class AuthQuery:
     @strawberry.field
     async def me(self, info: Info) -> UserType | None:
         """Get current authenticated user."""
-        user = info.context.get("user")
+        user = await get_context_user(info)
         if not user:
             return None
         return convert_user_to_type(user)
@@ -134,7 +135,7 @@ class AuthMutation:
 
         The client should clear all stored tokens after calling this mutation.
         """
-        user = info.context.get("user")
+        user = await get_context_user(info)
         if not user:
             raise map_service_exception_to_graphql(
                 ServiceError("User not authenticated.")
@@ -206,7 +207,7 @@ class AuthMutation:
     @strawberry.mutation
     async def send_verification_email(self, info: Info) -> bool:
         """Send verification email to authenticated user."""
-        user = info.context.get("user")
+        user = await get_context_user(info)
         if not user:
             raise map_service_exception_to_graphql(
                 ServiceError("User not authenticated.")
@@ -221,7 +222,7 @@ class AuthMutation:
     @strawberry.mutation
     async def update_profile(self, info: Info, input: UpdateProfileInput) -> UserType:
         """Update current user's profile."""
-        user = info.context.get("user")
+        user = await get_context_user(info)
         if not user:
             raise map_service_exception_to_graphql(
                 ServiceError("User not authenticated.")
@@ -242,7 +243,7 @@ class AuthMutation:
     @strawberry.mutation
     async def change_password(self, info: Info, input: ChangePasswordInput) -> Message:
         """Change current user's password."""
-        user = info.context.get("user")
+        user = await get_context_user(info)
         if not user:
             raise map_service_exception_to_graphql(
                 ServiceError("User not authenticated.")
@@ -265,7 +266,7 @@ class AuthMutation:
     @strawberry.mutation(name="setup2FA")
     async def setup_2fa(self, info: Info) -> Setup2FAType:
         """Initialize 2FA setup."""
-        user = info.context.get("user")
+        user = await get_context_user(info)
         if not user:
             raise map_service_exception_to_graphql(
                 ServiceError("User not authenticated.")
@@ -287,7 +288,7 @@ class AuthMutation:
     @strawberry.mutation(name="enable2FA")
     async def enable_2fa(self, info: Info, input: Enable2FAInput) -> Enable2FAType:
         """Enable 2FA with verification code."""
-        user = info.context.get("user")
+        user = await get_context_user(info)
         if not user:
             raise map_service_exception_to_graphql(
                 ServiceError("User not authenticated.")
@@ -305,7 +306,7 @@ class AuthMutation:
     @strawberry.mutation(name="disable2FA")
     async def disable_2fa(self, info: Info, input: Disable2FAInput) -> Message:
         """Disable 2FA."""
-        user = info.context.get("user")
+        user = await get_context_user(info)
         if not user:
             raise map_service_exception_to_graphql(
                 ServiceError("User not authenticated.")
@@ -343,7 +344,7 @@ class AuthMutation:
         self, info: Info, input: RegenerateBackupCodesInput
     ) -> Enable2FAType:
         """Regenerate 2FA backup codes."""
-        user = info.context.get("user")
+        user = await get_context_user(info)
         if not user:
             raise map_service_exception_to_graphql(
                 ServiceError("User not authenticated.")
@@ -361,7 +362,7 @@ class AuthMutation:
     @strawberry.mutation(name="verify2FACode")
     async def verify_2fa_code(self, info: Info, input: Verify2FACodeInput) -> bool:
         """Verify TOTP code for current authenticated user."""
-        user = info.context.get("user")
+        user = await get_context_user(info)
         if not user:
             raise map_service_exception_to_graphql(
                 ServiceError("User not authenticated.")
@@ -380,7 +381,7 @@ class AuthMutation:
         self, info: Info, input: Verify2FABackupCodeInput
     ) -> bool:
         """Verify and consume a backup code for current authenticated user."""
-        user = info.context.get("user")
+        user = await get_context_user(info)
         if not user:
             raise map_service_exception_to_graphql(
                 ServiceError("User not authenticated.")
@@ -4,29 +4,38 @@ import uuid
 
 import strawberry
 from src.app.core.config import settings
+from src.app.graphql.connections import (
+    build_page_info,
+    item_cursor,
+    requests_total_count,
+)
 from src.app.graphql.errors import (
     ForbiddenError,
     IsAuthenticated,
     NotFoundError,
     ValidationError,
 )
+from src.app.graphql.exception_mapper import map_service_exception_to_graphql
 from src.app.graphql.types import Message
 from src.app.graphql.types.file import (
     BatchDeleteFilesInput,
     BatchDeleteFilesResponse,
     BatchFileUploadResponseType,
     BatchFileUploadResultType,
+    FileConnection,
+    FileEdge,
     FileType,
     FileUploadType,
     PaginatedFiles,
     PresignedUrlType,
     UpdateFileInput,
 )
-from src.app.graphql.validators import validate_pagination
+from src.app.graphql.validators import validate_first, validate_offset_pagination
 from src.app.services import (
     FileNotFoundError,
     FileService,
     FileTooLargeError,
+    InvalidCursorError,
     InvalidFileTypeError,
     StorageError,
     storage_service,
@@ -41,6 +50,21 @@ def convert_file_to_type(file) -> FileType:
     return FileType.from_model(file)
 
 
+async def _add_presigned_urls(results: list[BatchFileUploadResultType]) -> None:
+    """Set the download URL of each successful upload result."""
+    keys = [result.key for result in results if result.success]
+    if not keys:
+        return
+    try:
+        urls = await storage_service.get_presigned_urls(keys, expires_in=3600)
+    except StorageError:
+        # The files are stored; clients can request URLs separately
+        return
+    for result in results:
+        if result.success:
+            result.url = urls[result.key]
+
+
 @strawberry.type
 class FileQuery:
     """File query resolvers."""
@@ -53,7 +77,7 @@ class FileQuery:
         limit: int = 100,
     ) -> PaginatedFiles:
         """Get paginated list of files owned by the current user."""
-        skip, limit = validate_pagination(skip, limit, max_limit=1000)
+        skip, limit = validate_offset_pagination(skip, limit, max_limit=1000)
 
         db = info.context["db"]
         user = info.context["user"]
@@ -72,6 +96,43 @@ class FileQuery:
             has_more=has_more,
         )
 
+    @strawberry.field(permission_classes=[IsAuthenticated])
+    async def files_connection(
+        self,
+        info: Info,
+        first: int = 20,
+        after: str | None = None,
+        exact_count: bool = False,
+    ) -> FileConnection:
+        """Get files owned by the current user, one cursor page at a time."""
+        first = validate_first(first, max_limit=1000)
+
+        db = info.context["db"]
+        user = info.context["user"]
+        service = FileService(db)
+
+        try:
+            page = await service.paginate_files(
+                user_id=user.id,
+                limit=first,
+                cursor=after,
+                include_total=requests_total_count(info),
+                exact_total=exact_count,
+            )
+        except InvalidCursorError as e:
+            raise map_service_exception_to_graphql(e) from e
+
+        edges = [
+            FileEdge(node=convert_file_to_type(f), cursor=item_cursor(f))
+            for f in page.items
+        ]
+        return FileConnection(
+            edges=edges,
+            page_info=build_page_info(page, [edge.cursor for edge in edges], after),
+            total_count=page.total,
+            total_count_estimated=page.total_estimated,
+        )
+
     @strawberry.field(permission_classes=[IsAuthenticated])
     async def file(self, info: Info, id: strawberry.ID) -> FileType:
         """Get a file by ID."""
@@ -216,15 +277,13 @@ class FileMutation:
         db = info.context["db"]
         user = info.context["user"]
 
-        # Read file content
-        content = await file.read()
         filename = file.filename or "unnamed"
         content_type = file.content_type
 
         try:
-            # Upload to storage
+            # Stream to storage in parts
             result = await storage_service.upload_file(
-                file_content=content,
+                file_content=file,
                 filename=filename,
                 content_type=content_type,
                 prefix=prefix,
@@ -277,60 +336,49 @@ class FileMutation:
         if len(files) > max_files:
             files = files[:max_files]
 
-        results: list[BatchFileUploadResultType] = []
-        successful = 0
-        failed = 0
-        file_service = FileService(db)
+        # Upload concurrently; each file succeeds or fails on its own
+        uploads = await storage_service.upload_files(
+            [(f, f.filename or "unnamed", f.content_type) for f in files],
+            prefix=prefix,
+        )
 
-        for upload_file in files:
+        results: list[BatchFileUploadResultType] = []
+        stored: list[dict] = []
+        for upload_file, upload in zip(files, uploads, strict=True):
             filename = upload_file.filename or "unnamed"
-            try:
-                # Read file content
-                content = await upload_file.read()
-
-                # Upload to storage
-                result = await storage_service.upload_file(
-                    file_content=content,
-                    filename=filename,
-                    content_type=upload_file.content_type,
-                    prefix=prefix,
-                )
-
-                # Save file record to database
-                await file_service.create(
-                    key=result["key"],
-                    filename=filename,
-                    size=result["size"],
-                    bucket=result["bucket"],
-                    user_id=user.id,
-                    content_type=result["content_type"],
-                )
-
-                # Generate presigned URL for download
-                url = await storage_service.get_presigned_url(
-                    result["key"], expires_in=3600
-                )
-
-                results.append(
-                    BatchFileUploadResultType(
-                        filename=filename,
-                        success=True,
-                        key=result["key"],
-                        size=result["size"],
-                        content_type=result["content_type"],
-                        url=url,
-                    )
-                )
-                successful += 1
-            except (FileTooLargeError, InvalidFileTypeError, StorageError) as e:
+            if isinstance(upload, StorageError):
                 results.append(
                     BatchFileUploadResultType(
                         filename=filename,
                         success=False,
-                        error=str(e) if str(e) else "Upload failed",
+                        error=str(upload) if str(upload) else "Upload failed",
                     )
                 )
-                failed += 1
+                continue
+            stored.append({**upload, "filename": filename})
+            results.append(
+                BatchFileUploadResultType(
+                    filename=filename,
+                    success=True,
+                    key=upload["key"],
+                    size=upload["size"],
+                    content_type=upload["content_type"],
+                )
+            )
+
+        if stored:
+            # Save all file records in one transaction
+            try:
+                await FileService(db).create_many(stored, user_id=user.id)
+            except Exception:
+                await storage_service.delete_files([f["key"] for f in stored])
+                raise
+
+            # Sign download URLs for all uploaded files at once
+            await _add_presigned_urls(results)
+
+        successful = len(stored)
+        failed = len(results) - successful
 
         return BatchFileUploadResponseType(
             results=results,
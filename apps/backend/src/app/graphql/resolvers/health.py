@@ -6,6 +6,7 @@ from datetime import UTC, datetime
 import strawberry
 from sqlalchemy import text
 from src.app.core.config import settings
+from src.app.graphql.complexity import Cost
 from src.app.graphql.types import (
     ComponentHealthEntry,
     ComponentHealthType,
@@ -50,7 +51,7 @@ async def check_database(info: Info) -> ComponentHealthType:
 class HealthQuery:
     """Health check query resolvers."""
 
-    @strawberry.field
+    @strawberry.field(directives=[Cost(weight=10)])
     async def health(self, info: Info) -> HealthType:
         """Comprehensive health check endpoint."""
         components: list[ComponentHealthEntry] = []
@@ -81,7 +82,7 @@ class HealthQuery:
         """Simple liveness probe - returns OK if the service is running."""
         return LivenessType(status="OK")
 
-    @strawberry.field
+    @strawberry.field(directives=[Cost(weight=10)])
     async def health_ready(self, info: Info) -> ReadinessType:
         """Readiness probe - checks if the service can handle requests."""
         db_health = await check_database(info)
@@ -1,6 +1,11 @@
 """Permission GraphQL resolvers."""
 
 import strawberry
+from src.app.graphql.connections import (
+    build_page_info,
+    item_cursor,
+    requests_total_count,
+)
 from src.app.graphql.errors import require_permissions, require_superadmin
 from src.app.graphql.exception_mapper import map_service_exception_to_graphql
 from src.app.graphql.types import (
@@ -8,10 +13,12 @@ from src.app.graphql.types import (
     Message,
     PaginatedPermissions,
     PaginationMeta,
+    PermissionConnection,
+    PermissionEdge,
     PermissionType,
     UpdatePermissionInput,
 )
-from src.app.graphql.validators import validate_pagination
+from src.app.graphql.validators import validate_first, validate_pagination
 from src.app.schemas import PermissionCreate, PermissionUpdate
 from src.app.services import PermissionService
 from src.app.services.exceptions import PermissionNotFoundError, ServiceError
@@ -20,16 +27,7 @@ from strawberry.types import Info
 
 def convert_permission_to_type(permission) -> PermissionType:
     """Convert database Permission model to GraphQL PermissionType."""
-    return PermissionType(
-        id=permission.id,
-        code=permission.code,
-        name=permission.name,
-        description=permission.description,
-        resource=permission.resource,
-        action=permission.action,
-        created_at=permission.created_at,
-        updated_at=permission.updated_at,
-    )
+    return PermissionType.from_model(permission)
 
 
 @strawberry.type
@@ -42,6 +40,7 @@ class PermissionQuery:
         info: Info,
         page: int = 1,
         limit: int = 100,
+        exact_count: bool = False,
     ) -> PaginatedPermissions:
         """Get paginated list of permissions."""
         page, limit = validate_pagination(page, limit)
@@ -50,7 +49,13 @@ class PermissionQuery:
         db = info.context["db"]
         service = PermissionService(db)
 
-        permissions, total = await service.list_permissions(skip=skip, limit=limit)
+        result = await service.paginate_permissions(
+            limit=limit,
+            offset=skip,
+            include_total=True,
+            exact_total=exact_count,
+        )
+        permissions, total = result.items, result.total or 0
         total_pages = ((total + limit - 1) // limit) if limit > 0 else 1
 
         return PaginatedPermissions(
@@ -65,6 +70,44 @@ class PermissionQuery:
             ),
         )
 
+    @strawberry.field(permission_classes=[require_permissions("permissions:read")])
+    async def permissions_connection(
+        self,
+        info: Info,
+        first: int = 20,
+        after: str | None = None,
+        exact_count: bool = False,
+    ) -> PermissionConnection:
+        """Get permissions oldest first, one cursor page at a time."""
+        first = validate_first(first)
+
+        db = info.context["db"]
+        service = PermissionService(db)
+
+        try:
+            page = await service.paginate_permissions(
+                limit=first,
+                cursor=after,
+                include_total=requests_total_count(info),
+                exact_total=exact_count,
+            )
+        except ServiceError as e:
+            raise map_service_exception_to_graphql(e) from e
+
+        edges = [
+            PermissionEdge(
+                node=convert_permission_to_type(permission),
+                cursor=item_cursor(permission),
+            )
+            for permission in page.items
+        ]
+        return PermissionConnection(
+            edges=edges,
+            page_info=build_page_info(page, [edge.cursor for edge in edges], after),
+            total_count=page.total,
+            total_count_estimated=page.total_estimated,
+        )
+
     @strawberry.field(permission_classes=[require_permissions("permissions:read")])
     async def permission(self, info: Info, id: strawberry.ID) -> PermissionType | None:
         """Get a permission by ID."""
@@ -1,6 +1,11 @@
 """Role GraphQL resolvers."""
 
 import strawberry
+from src.app.graphql.connections import (
+    build_page_info,
+    item_cursor,
+    requests_total_count,
+)
 from src.app.graphql.errors import (
     CannotModifySystemRoleError as GQLCannotModifySystemRoleError,
 )
@@ -18,10 +23,12 @@ from src.app.graphql.types import (
     PaginatedRoles,
     PaginationMeta,
     PermissionType,
+    RoleConnection,
+    RoleEdge,
     RoleType,
     UpdateRoleInput,
 )
-from src.app.graphql.validators import validate_pagination
+from src.app.graphql.validators import validate_first, validate_pagination
 from src.app.schemas import RoleCreate, RoleUpdate
 from src.app.services import RoleService
 from src.app.services.exceptions import (
@@ -34,16 +41,7 @@ from strawberry.types import Info
 
 def convert_role_to_type(role) -> RoleType:
     """Convert database Role model to GraphQL RoleType."""
-    return RoleType(
-        id=role.id,
-        code=role.code,
-        name=role.name,
-        description=role.description,
-        is_system=role.is_system,
-        created_at=role.created_at,
-        updated_at=role.updated_at,
-        permissions=[convert_permission_to_type(p) for p in role.permissions],
-    )
+    return RoleType.from_model(role)
 
 
 @strawberry.type
@@ -56,6 +54,7 @@ class RoleQuery:
         info: Info,
         page: int = 1,
         limit: int = 100,
+        exact_count: bool = False,
     ) -> PaginatedRoles:
         """Get paginated list of roles."""
         page, limit = validate_pagination(page, limit)
@@ -64,9 +63,13 @@ class RoleQuery:
         db = info.context["db"]
         service = RoleService(db)
 
-        roles, total = await service.list_roles(
-            skip=skip, limit=limit, include_permissions=True
+        result = await service.paginate_roles(
+            limit=limit,
+            offset=skip,
+            include_total=True,
+            exact_total=exact_count,
         )
+        roles, total = result.items, result.total or 0
         total_pages = ((total + limit - 1) // limit) if limit > 0 else 1
 
         return PaginatedRoles(
@@ -81,6 +84,41 @@ class RoleQuery:
             ),
         )
 
+    @strawberry.field(permission_classes=[require_permissions("roles:read")])
+    async def roles_connection(
+        self,
+        info: Info,
+        first: int = 20,
+        after: str | None = None,
+        exact_count: bool = False,
+    ) -> RoleConnection:
+        """Get roles oldest first, one cursor page at a time."""
+        first = validate_first(first)
+
+        db = info.context["db"]
+        service = RoleService(db)
+
+        try:
+            page = await service.paginate_roles(
+                limit=first,
+                cursor=after,
+                include_total=requests_total_count(info),
+                exact_total=exact_count,
+            )
+        except ServiceError as e:
+            raise map_service_exception_to_graphql(e) from e
+
+        edges = [
+            RoleEdge(node=convert_role_to_type(role), cursor=item_cursor(role))
+            for role in page.items
+        ]
+        return RoleConnection(
+            edges=edges,
+            page_info=build_page_info(page, [edge.cursor for edge in edges], after),
+            total_count=page.total,
+            total_count_estimated=page.total_estimated,
+        )
+
     @strawberry.field(permission_classes=[require_permissions("roles:read")])
     async def role(self, info: Info, id: strawberry.ID) -> RoleType | None:
         """Get a role by ID."""
@@ -88,7 +126,7 @@ class RoleQuery:
         service = RoleService(db)
 
         try:
-            role = await service.get_by_id(id, include_permissions=True)
+            role = await service.get_by_id(id)
             return convert_role_to_type(role)
         except RoleNotFoundError:
             return None
@@ -102,8 +140,6 @@ class RoleQuery:
         role = await service.get_by_code(code)
         if not role:
             return None
-        # Load permissions
-        role = await service.get_by_id(role.id, include_permissions=True)
         return convert_role_to_type(role)
 
     @strawberry.field(permission_classes=[require_permissions("roles:read")])
@@ -115,8 +151,6 @@ class RoleQuery:
         role = await service.get_by_name(name)
         if not role:
             return None
-        # Load permissions
-        role = await service.get_by_id(role.id, include_permissions=True)
         return convert_role_to_type(role)
 
     @strawberry.field(permission_classes=[require_permissions("roles:read")])
@@ -3,6 +3,11 @@
 import uuid
 
 import strawberry
+from src.app.graphql.connections import (
+    build_page_info,
+    item_cursor,
+    requests_total_count,
+)
 from src.app.graphql.errors import (
     UserNotFoundError as GQLUserNotFoundError,
 )
@@ -27,11 +32,14 @@ from src.app.graphql.types import (
     PermissionType,
     RoleType,
     UpdateUserInput,
+    UserConnection,
+    UserEdge,
     UserType,
     UserTypeWithRoles,
 )
 from src.app.graphql.validators import (
     validate_email,
+    validate_first,
     validate_name,
     validate_pagination,
 )
@@ -43,36 +51,12 @@ from strawberry.types import Info
 
 def convert_user_to_type(user) -> UserType:
     """Convert database User model to GraphQL UserType."""
-    # Handle roles - use empty list if roles not loaded
-    roles = []
-    if hasattr(user, "roles") and user.roles is not None:
-        roles = [convert_role_to_type(r) for r in user.roles]
-    return UserType(
-        id=user.id,
-        email=user.email,
-        name=user.name,
-        is_active=user.is_active,
-        is_email_verified=user.is_email_verified,
-        is_two_factor_enabled=user.is_two_factor_enabled,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
-        roles=roles,
-    )
+    return UserType.from_model(user)
 
 
 def convert_user_to_type_with_roles(user) -> UserTypeWithRoles:
     """Convert database User model to GraphQL UserTypeWithRoles."""
-    return UserTypeWithRoles(
-        id=user.id,
-        email=user.email,
-        name=user.name,
-        is_active=user.is_active,
-        is_email_verified=user.is_email_verified,
-        is_two_factor_enabled=user.is_two_factor_enabled,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
-        roles=[convert_role_to_type(r) for r in user.roles],
-    )
+    return UserTypeWithRoles.from_model(user)
 
 
 @strawberry.type
@@ -85,6 +69,7 @@ class UserQuery:
         info: Info,
         page: int = 1,
         limit: int = 20,
+        exact_count: bool = False,
     ) -> PaginatedUsers:
         """Get paginated list of users."""
         # Validate pagination
@@ -94,7 +79,13 @@ class UserQuery:
         service = UserService(db)
 
         offset = (page - 1) * limit
-        users, total = await service.list_users(skip=offset, limit=limit)
+        result = await service.paginate_users(
+            limit=limit,
+            offset=offset,
+            include_total=True,
+            exact_total=exact_count,
+        )
+        users, total = result.items, result.total or 0
 
         total_pages = ((total + limit - 1) // limit) if limit > 0 else 1
         return PaginatedUsers(
@@ -109,6 +100,41 @@ class UserQuery:
             ),
         )
 
+    @strawberry.field(permission_classes=[require_permissions("users:read")])
+    async def users_connection(
+        self,
+        info: Info,
+        first: int = 20,
+        after: str | None = None,
+        exact_count: bool = False,
+    ) -> UserConnection:
+        """Get users newest first, one cursor page at a time."""
+        first = validate_first(first)
+
+        db = info.context["db"]
+        service = UserService(db)
+
+        try:
+            page = await service.paginate_users(
+                limit=first,
+                cursor=after,
+                include_total=requests_total_count(info),
+                exact_total=exact_count,
+            )
+        except ServiceError as e:
+            raise map_service_exception_to_graphql(e) from e
+
+        edges = [
+            UserEdge(node=convert_user_to_type(user), cursor=item_cursor(user))
+            for user in page.items
+        ]
+        return UserConnection(
+            edges=edges,
+            page_info=build_page_info(page, [edge.cursor for edge in edges], after),
+            total_count=page.total,
+            total_count_estimated=page.total_estimated,
+        )
+
     @strawberry.field(permission_classes=[require_permissions("users:read")])
     async def user(self, info: Info, id: strawberry.ID) -> UserType | None:
         """Get a user by ID."""
@@ -130,7 +156,7 @@ class UserQuery:
         service = UserService(db)
 
         try:
-            user = await service.get_by_id(uuid.UUID(str(id)), include_roles=True)
+            user = await service.get_by_id(uuid.UUID(str(id)))
             return convert_user_to_type_with_roles(user)
         except UserNotFoundError:
             return None
@@ -310,12 +336,7 @@ class UserMutation:
         current_user = info.context.get("user")
 
         # Check if user is super admin
-        is_super_admin = False
-        if current_user:
-            for role in getattr(current_user, "roles", []):
-                if role.code == "super_admin":
-                    is_super_admin = True
-                    break
+        is_super_admin = bool(current_user and current_user.has_role("super_admin"))
 
         try:
             await service.hard_delete(id, is_super_admin=is_super_admin)
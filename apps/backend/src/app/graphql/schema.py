@@ -3,6 +3,7 @@
 import strawberry
 from src.app.graphql.extensions import (
     DepthLimitExtension,
+    DocumentCacheExtension,
     QueryComplexityExtension,
     RequestTracingExtension,
 )
@@ -59,6 +60,8 @@ schema = strawberry.Schema(
     subscription=Subscription,
     extensions=[
         RequestTracingExtension,
+        # Must come before the limit extensions (see its docstring)
+        DocumentCacheExtension,
         DepthLimitExtension,
         QueryComplexityExtension,
     ],
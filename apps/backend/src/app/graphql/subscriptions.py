@@ -4,8 +4,11 @@ import asyncio
 from collections.abc import AsyncGenerator
 from datetime import datetime
 from enum import Enum
+from typing import Any
 
 import strawberry
+from src.app.graphql.pubsub import PubSubBroker
+from src.app.graphql.pubsub import broker as default_broker
 
 
 @strawberry.enum
@@ -30,28 +33,47 @@ class UserActivity:
     message: str
 
 
-# Simple in-memory pub/sub for user activities
 class UserActivityPubSub:
-    """Simple pub/sub for user activities."""
+    """Pub/sub for user activities on top of a broker."""
 
-    def __init__(self):
-        self._subscribers: list[asyncio.Queue] = []
+    channel = "user_activities"
+
+    def __init__(self, broker: PubSubBroker | None = None):
+        self.broker = broker or default_broker
+
+    @property
+    def subscriber_count(self) -> int:
+        """Get the number of user activity subscribers on this worker."""
+        return self.broker.subscriber_count(self.channel)
 
     async def subscribe(self) -> AsyncGenerator[UserActivity]:
         """Subscribe to user activities."""
-        queue: asyncio.Queue = asyncio.Queue()
-        self._subscribers.append(queue)
-        try:
-            while True:
-                activity = await queue.get()
-                yield activity
-        finally:
-            self._subscribers.remove(queue)
+        async for message in self.broker.subscribe(self.channel):
+            yield _activity_from_message(message)
 
     async def publish(self, activity: UserActivity):
         """Publish a user activity to all subscribers."""
-        for queue in self._subscribers:
-            await queue.put(activity)
+        await self.broker.publish(self.channel, _activity_to_message(activity))
+
+
+def _activity_to_message(activity: UserActivity) -> dict[str, Any]:
+    return {
+        "activity_type": activity.activity_type.value,
+        "user_id": activity.user_id,
+        "email": activity.email,
+        "timestamp": activity.timestamp.isoformat(),
+        "message": activity.message,
+    }
+
+
+def _activity_from_message(message: dict[str, Any]) -> UserActivity:
+    return UserActivity(
+        activity_type=UserActivityType(message["activity_type"]),
+        user_id=message["user_id"],
+        email=message["email"],
+        timestamp=datetime.fromisoformat(message["timestamp"]),
+        message=message["message"],
+    )
 
 
 # Global instance
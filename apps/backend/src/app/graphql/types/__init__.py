@@ -1,6 +1,8 @@
 """GraphQL types."""
 
 from src.app.graphql.types.audit_log import (
+    AuditLogConnection,
+    AuditLogEdge,
     AuditLogFilterInput,
     AuditLogType,
     PaginatedAuditLogs,
@@ -39,6 +41,8 @@ from src.app.graphql.types.file import (
     BatchDeleteFilesResponse,
     BatchFileUploadResponseType,
     BatchFileUploadResultType,
+    FileConnection,
+    FileEdge,
     FileType,
     FileUploadType,
     Message,
@@ -65,16 +69,25 @@ from src.app.graphql.types.inputs import (
     UpdateUserInput,
 )
 from src.app.graphql.types.pagination import (
+    PageInfo,
     PaginatedPermissions,
     PaginatedRoles,
     PaginatedUsers,
     PaginationMeta,
+    PermissionConnection,
+    PermissionEdge,
+    RoleConnection,
+    RoleEdge,
+    UserConnection,
+    UserEdge,
 )
 from src.app.graphql.types.permission import PermissionType
 from src.app.graphql.types.role import RoleType
 from src.app.graphql.types.user import Message, UserType, UserTypeWithRoles
 
 __all__ = [
+    "AuditLogConnection",
+    "AuditLogEdge",
     "AuditLogFilterInput",
     "AuditLogType",
     "AssignPermissionsInput",
@@ -96,6 +109,8 @@ __all__ = [
     "Disable2FAType",
     "Enable2FAInput",
     "Enable2FAType",
+    "FileConnection",
+    "FileEdge",
     "FileType",
     "FileUploadType",
     "HealthStatus",
@@ -104,12 +119,15 @@ __all__ = [
     "LoginInput",
     "LoginResultType",
     "Message",
+    "PageInfo",
     "PaginatedAuditLogs",
     "PaginatedFiles",
     "PaginatedPermissions",
     "PaginatedRoles",
     "PaginatedUsers",
     "PaginationMeta",
+    "PermissionConnection",
+    "PermissionEdge",
     "PermissionType",
     "PresignedUrlType",
     "ReadinessType",
@@ -121,6 +139,8 @@ __all__ = [
     "ResendVerificationType",
     "ResetPasswordInput",
     "ResetPasswordType",
+    "RoleConnection",
+    "RoleEdge",
     "RoleType",
     "Setup2FAType",
     "TokenType",
@@ -130,6 +150,8 @@ __all__ = [
     "UpdateProfileInput",
     "UpdateRoleInput",
     "UpdateUserInput",
+    "UserConnection",
+    "UserEdge",
     "UserType",
     "UserTypeWithRoles",
     "Verify2FABackupCodeInput",
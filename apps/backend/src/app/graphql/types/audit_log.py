@@ -1,11 +1,14 @@
 """GraphQL Audit Log type."""
 
+import uuid
 from datetime import datetime
 from typing import Any
 
 import strawberry
+from src.app.graphql.types.pagination import PageInfo
 from src.app.graphql.types.user import UserType
 from strawberry.scalars import JSON
+from strawberry.types import Info
 
 
 @strawberry.type
@@ -17,27 +20,29 @@ class AuditLogType:
     entity_type: str = strawberry.field(name="entityType")
     entity_id: strawberry.ID | None = strawberry.field(name="entityId", default=None)
     actor_id: strawberry.ID | None = strawberry.field(name="actorId", default=None)
-    actor: UserType | None = None
     actor_ip: str = strawberry.field(name="actorIp")
     actor_user_agent: str = strawberry.field(name="actorUserAgent")
     changes: JSON | None = None
     metadata: JSON | None = None
     created_at: datetime = strawberry.field(name="createdAt")
 
+    @strawberry.field
+    async def actor(self, info: Info) -> UserType | None:
+        """User who performed the action, batched per request."""
+        if self.actor_id is None:
+            return None
+        user = await info.context["loaders"].users.load(uuid.UUID(str(self.actor_id)))
+        return UserType.from_model(user) if user else None
+
     @classmethod
     def from_model(cls, audit_log: Any) -> "AuditLogType":
         """Create AuditLogType from an AuditLog model instance."""
-        actor = None
-        if audit_log.actor:
-            actor = UserType.from_model(audit_log.actor)
-
         return cls(
             id=audit_log.id,
             action=audit_log.action,
             entity_type=audit_log.entity_type,
             entity_id=audit_log.entity_id,
             actor_id=audit_log.actor_id,
-            actor=actor,
             actor_ip=audit_log.actor_ip,
             actor_user_agent=audit_log.actor_user_agent,
             changes=audit_log.changes,
@@ -57,6 +62,28 @@ class PaginatedAuditLogs:
     has_more: bool = strawberry.field(name="hasMore")
 
 
+@strawberry.type
+class AuditLogEdge:
+    """Audit log connection edge."""
+
+    node: AuditLogType
+    cursor: str
+
+
+@strawberry.type
+class AuditLogConnection:
+    """Cursor-paginated audit logs."""
+
+    edges: list[AuditLogEdge]
+    page_info: PageInfo = strawberry.field(name="pageInfo")
+    total_count: int | None = strawberry.field(name="totalCount")
+    total_count_estimated: bool = strawberry.field(
+        name="totalCountEstimated",
+        default=False,
+        description="Whether totalCount is an estimate of a large table",
+    )
+
+
 @strawberry.input
 class AuditLogFilterInput:
     """Input type for filtering audit logs."""
@@ -4,7 +4,9 @@ from datetime import datetime
 from typing import Any
 
 import strawberry
+from src.app.graphql.types.pagination import PageInfo
 from strawberry.scalars import JSON
+from strawberry.types import Info
 
 
 @strawberry.type
@@ -23,6 +25,11 @@ class FileType:
     updated_at: datetime = strawberry.field(name="updatedAt")
     deleted_at: datetime | None = strawberry.field(name="deletedAt", default=None)
 
+    @strawberry.field
+    async def url(self, info: Info) -> str:
+        """Presigned download URL valid for an hour, signed in one batch per request."""
+        return await info.context["loaders"].presigned_urls.load(self.key)
+
     @classmethod
     def from_model(cls, file: Any) -> "FileType":
         """Create FileType from a File model instance."""
@@ -52,6 +59,28 @@ class PaginatedFiles:
     has_more: bool = strawberry.field(name="hasMore")
 
 
+@strawberry.type
+class FileEdge:
+    """File connection edge."""
+
+    node: FileType
+    cursor: str
+
+
+@strawberry.type
+class FileConnection:
+    """Cursor-paginated files."""
+
+    edges: list[FileEdge]
+    page_info: PageInfo = strawberry.field(name="pageInfo")
+    total_count: int | None = strawberry.field(name="totalCount")
+    total_count_estimated: bool = strawberry.field(
+        name="totalCountEstimated",
+        default=False,
+        description="Whether totalCount is an estimate of a large table",
+    )
+
+
 @strawberry.type
 class PresignedUrlType:
     """GraphQL type for presigned URL response."""
@@ -40,3 +40,79 @@ class PaginatedRoles:
 
     data: list[RoleType]
     meta: PaginationMeta
+
+
+@strawberry.type
+class PageInfo:
+    """Relay connection page information."""
+
+    has_next_page: bool = strawberry.field(name="hasNextPage")
+    has_previous_page: bool = strawberry.field(name="hasPreviousPage")
+    start_cursor: str | None = strawberry.field(name="startCursor")
+    end_cursor: str | None = strawberry.field(name="endCursor")
+
+
+@strawberry.type
+class UserEdge:
+    """User connection edge."""
+
+    node: UserType
+    cursor: str
+
+
+@strawberry.type
+class UserConnection:
+    """Cursor-paginated users."""
+
+    edges: list[UserEdge]
+    page_info: PageInfo = strawberry.field(name="pageInfo")
+    total_count: int | None = strawberry.field(name="totalCount")
+    total_count_estimated: bool = strawberry.field(
+        name="totalCountEstimated",
+        default=False,
+        description="Whether totalCount is an estimate of a large table",
+    )
+
+
+@strawberry.type
+class PermissionEdge:
+    """Permission connection edge."""
+
+    node: PermissionType
+    cursor: str
+
+
+@strawberry.type
+class PermissionConnection:
+    """Cursor-paginated permissions."""
+
+    edges: list[PermissionEdge]
+    page_info: PageInfo = strawberry.field(name="pageInfo")
+    total_count: int | None = strawberry.field(name="totalCount")
+    total_count_estimated: bool = strawberry.field(
+        name="totalCountEstimated",
+        default=False,
+        description="Whether totalCount is an estimate of a large table",
+    )
+
+
+@strawberry.type
+class RoleEdge:
+    """Role connection edge."""
+
+    node: RoleType
+    cursor: str
+
+
+@strawberry.type
+class RoleConnection:
+    """Cursor-paginated roles."""
+
+    edges: list[RoleEdge]
+    page_info: PageInfo = strawberry.field(name="pageInfo")
+    total_count: int | None = strawberry.field(name="totalCount")
+    total_count_estimated: bool = strawberry.field(
+        name="totalCountEstimated",
+        default=False,
+        description="Whether totalCount is an estimate of a large table",
+    )
@@ -1,6 +1,7 @@
 """GraphQL Permission type."""
 
 from datetime import datetime
+from typing import Any
 
 import strawberry
 
@@ -17,3 +18,17 @@ class PermissionType:
     action: str
     created_at: datetime = strawberry.field(name="createdAt")
     updated_at: datetime = strawberry.field(name="updatedAt")
+
+    @classmethod
+    def from_model(cls, permission: Any) -> "PermissionType":
+        """Create PermissionType from a Permission model instance."""
+        return cls(
+            id=permission.id,
+            code=permission.code,
+            name=permission.name,
+            description=permission.description,
+            resource=permission.resource,
+            action=permission.action,
+            created_at=permission.created_at,
+            updated_at=permission.updated_at,
+        )
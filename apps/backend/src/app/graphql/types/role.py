@@ -1,9 +1,11 @@
 """GraphQL Role type."""
 
 from datetime import datetime
+from typing import Any
 
 import strawberry
 from src.app.graphql.types.permission import PermissionType
+from strawberry.types import Info
 
 
 @strawberry.type
@@ -17,4 +19,23 @@ class RoleType:
     is_system: bool = strawberry.field(name="isSystem")
     created_at: datetime = strawberry.field(name="createdAt")
     updated_at: datetime = strawberry.field(name="updatedAt")
-    permissions: list[PermissionType]
+
+    @strawberry.field
+    async def permissions(self, info: Info) -> list[PermissionType]:
+        """Permissions granted to the role, batched per request."""
+        loader = info.context["loaders"].permissions_by_role
+        permissions = await loader.load(int(self.id))
+        return [PermissionType.from_model(p) for p in permissions]
+
+    @classmethod
+    def from_model(cls, role: Any) -> "RoleType":
+        """Create RoleType from a Role model instance."""
+        return cls(
+            id=role.id,
+            code=role.code,
+            name=role.name,
+            description=role.description,
+            is_system=role.is_system,
+            created_at=role.created_at,
+            updated_at=role.updated_at,
+        )
@@ -1,9 +1,11 @@
 """GraphQL User type."""
 
+import uuid
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, Any
 
 import strawberry
+from strawberry.types import Info
 
 
 @strawberry.type
@@ -13,6 +15,13 @@ class Message:
     message: str
 
 
+async def resolve_user_roles(user_id: Any, info: Info) -> list["RoleType"]:
+    """Load a user's roles through the request's DataLoader."""
+    loader = info.context["loaders"].roles_by_user
+    roles = await loader.load(uuid.UUID(str(user_id)))
+    return [RoleType.from_model(r) for r in roles]
+
+
 @strawberry.type
 class UserType:
     """GraphQL type for User."""
@@ -25,7 +34,27 @@ class UserType:
     is_two_factor_enabled: bool = strawberry.field(name="isTwoFactorEnabled")
     created_at: datetime = strawberry.field(name="createdAt")
     updated_at: datetime = strawberry.field(name="updatedAt")
-    roles: list[Annotated["RoleType", strawberry.lazy("src.app.graphql.types.role")]]
+
+    @strawberry.field
+    async def roles(
+        self, info: Info
+    ) -> list[Annotated["RoleType", strawberry.lazy("src.app.graphql.types.role")]]:
+        """Roles assigned to the user, batched per request."""
+        return await resolve_user_roles(self.id, info)
+
+    @classmethod
+    def from_model(cls, user: Any) -> "UserType":
+        """Create UserType from a User model instance."""
+        return cls(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            is_active=user.is_active,
+            is_email_verified=user.is_email_verified,
+            is_two_factor_enabled=user.is_two_factor_enabled,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
 
 
 @strawberry.type
@@ -40,7 +69,27 @@ class UserTypeWithRoles:
     is_two_factor_enabled: bool = strawberry.field(name="isTwoFactorEnabled")
     created_at: datetime = strawberry.field(name="createdAt")
     updated_at: datetime = strawberry.field(name="updatedAt")
-    roles: list[Annotated["RoleType", strawberry.lazy("src.app.graphql.types.role")]]
+
+    @strawberry.field
+    async def roles(
+        self, info: Info
+    ) -> list[Annotated["RoleType", strawberry.lazy("src.app.graphql.types.role")]]:
+        """Roles assigned to the user, batched per request."""
+        return await resolve_user_roles(self.id, info)
+
+    @classmethod
+    def from_model(cls, user: Any) -> "UserTypeWithRoles":
+        """Create UserTypeWithRoles from a User model instance."""
+        return cls(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            is_active=user.is_active,
+            is_email_verified=user.is_email_verified,
+            is_two_factor_enabled=user.is_two_factor_enabled,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
 
 
 # Import for type completion
@@ -6,6 +6,7 @@ shared core validators module.
 """
 
 from src.app.core.validators import (
+    PAGINATION_MAX_LIMIT,
     normalize_email,
     normalize_name,
     validate_email_format,
@@ -95,3 +96,48 @@ def validate_pagination(page: int, limit: int) -> tuple[int, int]:
         field = "page" if "page" in error_msg.lower() else "limit"
         raise ValidationError(error_msg, field)
     return page, limit
+
+
+def validate_offset_pagination(
+    skip: int, limit: int, max_limit: int = PAGINATION_MAX_LIMIT
+) -> tuple[int, int]:
+    """Validate skip/limit pagination parameters.
+
+    Args:
+        skip: Number of items to skip.
+        limit: Maximum number of items to return.
+        max_limit: Largest accepted limit.
+
+    Returns:
+        Tuple of validated (skip, limit).
+
+    Raises:
+        ValidationError: If pagination parameters are invalid.
+    """
+    if skip < 0:
+        raise ValidationError("Skip must be at least 0", "skip")
+    if limit < 1:
+        raise ValidationError("Limit must be at least 1", "limit")
+    if limit > max_limit:
+        raise ValidationError(f"Limit must be at most {max_limit}", "limit")
+    return skip, limit
+
+
+def validate_first(first: int, max_limit: int = PAGINATION_MAX_LIMIT) -> int:
+    """Validate the page size of a connection.
+
+    Args:
+        first: Maximum number of edges to return.
+        max_limit: Largest accepted page size.
+
+    Returns:
+        The validated page size.
+
+    Raises:
+        ValidationError: If the page size is invalid.
+    """
+    if first < 1:
+        raise ValidationError("First must be at least 1", "first")
+    if first > max_limit:
+        raise ValidationError(f"First must be at most {max_limit}", "first")
+    return first
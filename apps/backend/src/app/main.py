@@ -33,6 +33,7 @@ from src.app.graphql import (
 from src.app.middleware import (
     AccessLogMiddleware,
     AuditContextMiddleware,
+    DatabaseRoutingMiddleware,
     RateLimitConfig,
     RateLimitMiddleware,
     RequestIDMiddleware,
@@ -141,6 +142,7 @@ if settings.rate_limit_enabled:
         },
         exclude_paths=["/", "/health", "/api/docs", "/api/openapi.json", "/api/redoc"],
         trust_proxy=settings.rate_limit_trust_proxy,
+        backend=settings.rate_limit_backend,
     )
 
 app.add_middleware(
@@ -157,6 +159,10 @@ app.add_middleware(RequestIDMiddleware)
 # Add audit context middleware (must be after RequestIDMiddleware)
 app.add_middleware(AuditContextMiddleware)
 
+# Add database routing middleware (pins a request to the primary after a write)
+if settings.database_replica_urls:
+    app.add_middleware(DatabaseRoutingMiddleware)
+
 # Add access log middleware for HTTP request logging
 if settings.access_log_enabled:
     app.add_middleware(
@@ -1,12 +1,13 @@
 """Messaging module for RabbitMQ integration."""
 
-from src.app.messaging.consumer import MessageConsumer
+from src.app.messaging.consumer import BatchMessageConsumer, MessageConsumer
 from src.app.messaging.exceptions import (
     MessageDeserializationError,
     MessagePublishError,
     MessageSerializationError,
     MessagingError,
 )
+from src.app.messaging.outbox import enqueue, outbox_relay
 from src.app.messaging.producer import message_producer
 from src.app.messaging.types import (
     AuditLogMessage,
@@ -35,8 +36,12 @@ __all__ = [
     "AuditLogMessage",
     # Producer
     "message_producer",
+    # Outbox
+    "enqueue",
+    "outbox_relay",
     # Consumer
     "MessageConsumer",
+    "BatchMessageConsumer",
     # Exceptions
     "MessagingError",
     "MessagePublishError",
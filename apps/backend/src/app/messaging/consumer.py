@@ -2,39 +2,68 @@
 
 import asyncio
 import logging
+import multiprocessing
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import AbstractAsyncContextManager, nullcontext
+from typing import Any
 
-from aio_pika import Message
+from aio_pika import Channel, DeliveryMode, Message
 from aio_pika.abc import AbstractIncomingMessage
-from src.app.core.config import settings
 from src.app.core.rabbitmq import (
     RabbitMQPool,
     declare_dead_letter_queue,
     declare_queue,
     get_connection,
+    retry_delays,
+    retry_queue_name,
 )
 from src.app.messaging.exceptions import (
     ConsumerNotStartedError,
     MessageDeserializationError,
     MessageHandlerError,
+    MessageInProgressError,
     MessageRetryExhaustedError,
 )
+from src.app.messaging.idempotency import ClaimResult, idempotency_store
+from src.app.messaging.metrics import consumer_metrics
 from src.app.messaging.types import BaseMessage
 
 logger = logging.getLogger(__name__)
 
+# Log format of the worker processes
+_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+def _init_pool_process(level: int) -> None:
+    """Configure logging in a pool process, which starts without the worker's."""
+    logging.basicConfig(level=level, format=_LOG_FORMAT)
+
 
 class MessageConsumer[T: BaseMessage](ABC):
     """
     Abstract base class for message consumers.
 
     Subclasses must implement the `handle` method to process messages.
+
+    ``prefetch_count`` bounds the unacked deliveries the broker sends ahead,
+    ``max_in_flight`` how many of them are handled at once. CPU-heavy work
+    can be moved off the event loop with ``run_cpu_bound``, which uses a
+    process pool of ``process_workers`` processes when set.
+
+    With ``idempotent = True``, messages already handled from this queue are
+    acked without being handled again (see ``src.app.messaging.idempotency``).
     """
 
     queue_name: str
     routing_keys: list[str]
     message_type: type[T]
     prefetch_count: int = 10
+    max_in_flight: int | None = None  # None handles every prefetched message
+    process_workers: int = 0  # 0 runs run_cpu_bound() calls in a thread
+    idempotent: bool = False  # Skip messages whose id was already handled
 
     def __init__(
         self,
@@ -42,6 +71,8 @@ class MessageConsumer[T: BaseMessage](ABC):
         routing_keys: list[str] | None = None,
         message_type: type[T] | None = None,
         prefetch_count: int | None = None,
+        max_in_flight: int | None = None,
+        process_workers: int | None = None,
     ) -> None:
         """
         Initialize the consumer.
@@ -51,6 +82,8 @@ class MessageConsumer[T: BaseMessage](ABC):
             routing_keys: Override class routing_keys
             message_type: Override class message_type
             prefetch_count: Number of messages to prefetch
+            max_in_flight: Override class max_in_flight
+            process_workers: Override class process_workers
         """
         self._queue_name = queue_name or getattr(self, "queue_name", "default_queue")
         self._routing_keys = routing_keys or getattr(self, "routing_keys", ["#"])
@@ -58,6 +91,16 @@ class MessageConsumer[T: BaseMessage](ABC):
         self._prefetch_count = prefetch_count or getattr(self, "prefetch_count", 10)
         self._running = False
         self._consumer_tag: str | None = None
+        self._channel: Channel | None = None
+        self._max_in_flight = max_in_flight or self.max_in_flight
+        self._in_flight_limit = (
+            asyncio.Semaphore(self._max_in_flight) if self._max_in_flight else None
+        )
+        self._process_workers = (
+            self.process_workers if process_workers is None else process_workers
+        )
+        self._executor: ProcessPoolExecutor | None = None
+        self._metrics = consumer_metrics.for_queue(self._queue_name)
 
     @abstractmethod
     async def handle(self, message: T) -> None:
@@ -93,9 +136,58 @@ class MessageConsumer[T: BaseMessage](ABC):
                 cause=e,
             ) from e
 
+    async def run_cpu_bound[R](self, func: Callable[..., R], *args: Any) -> R:
+        """
+        Run a CPU-heavy function without blocking the event loop.
+
+        With ``process_workers`` set, ``func`` runs in this consumer's process
+        pool, so it and its arguments must be picklable (e.g. a module-level
+        function). Otherwise it runs in a thread.
+
+        Args:
+            func: The function to run
+            *args: Positional arguments for ``func``
+
+        Returns:
+            The result of ``func``
+        """
+        if not self._process_workers:
+            return await asyncio.to_thread(func, *args)
+        if self._executor is None:
+            # Forking a process running the event loop's threads may deadlock
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._process_workers,
+                mp_context=multiprocessing.get_context("forkserver"),
+                initializer=_init_pool_process,
+                initargs=(logging.getLogger().getEffectiveLevel(),),
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
     async def _process_message(self, raw_message: AbstractIncomingMessage) -> None:
         """
-        Process an incoming message.
+        Process an incoming message, recording its outcome and latency.
+
+        Deliveries beyond ``max_in_flight`` wait here, still unacked.
+
+        Args:
+            raw_message: The raw message from RabbitMQ
+        """
+        async with self._in_flight_limit or nullcontext():
+            self._metrics.in_flight += 1
+            started = time.perf_counter()
+            try:
+                await self._handle_delivery(raw_message)
+            except Exception:
+                self._metrics.dead_lettered += 1
+                raise
+            finally:
+                self._metrics.in_flight -= 1
+                self._metrics.observe(time.perf_counter() - started)
+
+    async def _handle_delivery(self, raw_message: AbstractIncomingMessage) -> None:
+        """
+        Handle a delivery and settle it.
 
         Args:
             raw_message: The raw message from RabbitMQ
@@ -110,7 +202,21 @@ class MessageConsumer[T: BaseMessage](ABC):
                     self._queue_name,
                 )
 
-                await self.handle(message)
+                if self.idempotent and not await self._claim(message):
+                    return
+
+                try:
+                    async with self._holding(message.id):
+                        await self.handle(message)
+                except Exception:
+                    if self.idempotent:
+                        await idempotency_store.release(
+                            self._queue_name, str(message.id)
+                        )
+                    raise
+                if self.idempotent:
+                    await idempotency_store.complete(self._queue_name, str(message.id))
+                self._metrics.acked += 1
 
                 logger.debug(
                     "Message processed successfully: id=%s",
@@ -125,9 +231,95 @@ class MessageConsumer[T: BaseMessage](ABC):
                 # Message will be nacked and sent to DLQ
                 raise
 
+            except MessageInProgressError:
+                await self._defer(message)
+
             except Exception as e:
+                self._metrics.nacked += 1
                 await self._handle_failure(raw_message, e)
 
+    async def _claim(self, message: T) -> bool:
+        """
+        Claim a message of an idempotent consumer before handling it.
+
+        Args:
+            message: The deserialized message
+
+        Returns:
+            False if the message was already handled and must be skipped
+
+        Raises:
+            MessageInProgressError: If another delivery is handling the message
+        """
+        claim = await idempotency_store.claim(self._queue_name, str(message.id))
+        if claim is ClaimResult.IN_PROGRESS:
+            raise MessageInProgressError(
+                f"Message {message.id} is being handled by another delivery"
+            )
+        if claim is ClaimResult.DONE:
+            self._metrics.deduplicated += 1
+            logger.info(
+                "Skipping duplicate message: id=%s, queue=%s",
+                message.id,
+                self._queue_name,
+            )
+            return False
+        return True
+
+    def _holding(self, *message_ids: Any) -> AbstractAsyncContextManager:
+        """Keep the claims of an idempotent consumer alive while handling."""
+        if not self.idempotent:
+            return nullcontext()
+        return idempotency_store.hold(self._queue_name, *map(str, message_ids))
+
+    async def _defer(self, message: T) -> None:
+        """
+        Park a message claimed by another delivery until its claim ends.
+
+        The claimant may still fail, or may have died with the message, so
+        the message comes back once the claim could have expired. This does
+        not count as a retry.
+
+        Args:
+            message: The deserialized message
+        """
+        delays = retry_delays()
+        if not delays:
+            raise MessageRetryExhaustedError(
+                f"Message {message.id} is claimed and cannot be retried"
+            )
+        lock_ms = idempotency_store.lock_ttl * 1000
+        delay_ms = next((delay for delay in delays if delay >= lock_ms), delays[-1])
+
+        logger.info(
+            "Message is being handled by another delivery, retrying in %dms: id=%s",
+            delay_ms,
+            message.id,
+        )
+        await self._park(message, delay_ms)
+
+    async def _park(self, message: T, delay_ms: int) -> None:
+        """
+        Publish a message to the retry queue of a delay tier.
+
+        Args:
+            message: The message, with its updated retry count
+            delay_ms: Delay of the retry queue, in milliseconds
+        """
+        if self._channel is None:
+            raise ConsumerNotStartedError("Consumer not started")
+
+        await self._channel.default_exchange.publish(
+            Message(
+                body=message.model_dump_json().encode(),
+                content_type="application/json",
+                delivery_mode=DeliveryMode.PERSISTENT,
+                priority=message.priority,
+                message_id=str(message.id),
+            ),
+            routing_key=retry_queue_name(self._queue_name, delay_ms),
+        )
+
     async def _handle_failure(
         self,
         raw_message: AbstractIncomingMessage,
@@ -136,6 +328,11 @@ class MessageConsumer[T: BaseMessage](ABC):
         """
         Handle a message processing failure.
 
+        A message that can be retried is published to the retry queue of its
+        backoff tier, which returns it to this queue once the delay expired.
+        The delivery is then acked right away instead of holding a prefetch
+        slot during the delay.
+
         Args:
             raw_message: The raw message that failed
             error: The exception that occurred
@@ -145,12 +342,9 @@ class MessageConsumer[T: BaseMessage](ABC):
             message.increment_retry()
 
             if message.can_retry():
-                # Calculate retry delay with exponential backoff
-                delay_ms = min(
-                    settings.rabbitmq_retry_delay_base
-                    * (2 ** (message.retry_count - 1)),
-                    settings.rabbitmq_retry_delay_max,
-                )
+                # Exponential backoff, one retry queue per tier
+                delays = retry_delays()
+                delay_ms = delays[min(message.retry_count, len(delays)) - 1]
 
                 logger.warning(
                     "Message failed, scheduling retry %d/%d in %dms: id=%s, error=%s",
@@ -161,24 +355,9 @@ class MessageConsumer[T: BaseMessage](ABC):
                     str(error),
                 )
 
-                # Wait before retry
-                await asyncio.sleep(delay_ms / 1000)
-
-                # Republish with updated retry count
-                async with get_connection() as connection:
-                    channel = await connection.channel()
-                    exchange = await channel.get_exchange(
-                        settings.rabbitmq_exchange_name
-                    )
-
-                    await exchange.publish(
-                        Message(
-                            body=message.model_dump_json().encode(),
-                            content_type="application/json",
-                            priority=message.priority,
-                        ),
-                        routing_key=raw_message.routing_key or "",
-                    )
+                # Park the message with its updated retry count
+                await self._park(message, delay_ms)
+                self._metrics.retried += 1
 
             else:
                 logger.error(
@@ -222,8 +401,9 @@ class MessageConsumer[T: BaseMessage](ABC):
         async with get_connection() as connection:
             channel = await connection.channel()
             await channel.set_qos(prefetch_count=self._prefetch_count)
+            self._channel = channel
 
-            # Declare the queue
+            # Declare the queue and its retry queues
             queue = await declare_queue(
                 channel,
                 self._queue_name,
@@ -255,4 +435,158 @@ class MessageConsumer[T: BaseMessage](ABC):
             raise ConsumerNotStartedError("Consumer not started")
 
         self._running = False
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.to_thread(executor.shutdown)
         logger.info("Consumer stopped: %s", self._queue_name)
+
+
+class BatchMessageConsumer[T: BaseMessage](MessageConsumer[T]):
+    """
+    Message consumer that processes messages in micro-batches.
+
+    Messages are collected until ``batch_size`` are pending or
+    ``batch_timeout`` milliseconds have passed since the first one arrived,
+    then handed to ``handle_batch`` together. Deliveries are acked only after
+    the batch succeeds. If it fails, each message falls back to ``handle``
+    and the usual retry and dead letter handling, so one bad message cannot
+    fail the others.
+
+    ``prefetch_count`` must be at least ``batch_size`` for batches to fill.
+    """
+
+    batch_size: int = 100
+    batch_timeout: int = 200  # milliseconds
+
+    def __init__(
+        self,
+        queue_name: str | None = None,
+        routing_keys: list[str] | None = None,
+        message_type: type[T] | None = None,
+        prefetch_count: int | None = None,
+        batch_size: int | None = None,
+        batch_timeout: int | None = None,
+    ) -> None:
+        """
+        Initialize the consumer.
+
+        Args:
+            queue_name: Override class queue_name
+            routing_keys: Override class routing_keys
+            message_type: Override class message_type
+            prefetch_count: Number of messages to prefetch
+            batch_size: Override class batch_size
+            batch_timeout: Override class batch_timeout, in milliseconds
+        """
+        super().__init__(queue_name, routing_keys, message_type, prefetch_count)
+        self._batch_size = batch_size or self.batch_size
+        self._batch_timeout = batch_timeout or self.batch_timeout
+        self._batch: list[tuple[AbstractIncomingMessage, T]] = []
+        self._flush_timer: asyncio.Task | None = None
+
+    @abstractmethod
+    async def handle_batch(self, messages: list[T]) -> None:
+        """
+        Handle a batch of messages atomically.
+
+        Args:
+            messages: The deserialized messages
+
+        Raises:
+            Exception: If the batch fails; no message in it may be applied
+        """
+        pass
+
+    async def _process_message(self, raw_message: AbstractIncomingMessage) -> None:
+        """
+        Add an incoming message to the current batch.
+
+        Args:
+            raw_message: The raw message from RabbitMQ
+        """
+        try:
+            message = self._deserialize(raw_message.body)
+        except MessageDeserializationError as e:
+            logger.error("Failed to deserialize message, sending to DLQ: %s", str(e))
+            await raw_message.reject(requeue=False)
+            self._metrics.dead_lettered += 1
+            return
+
+        try:
+            if self.idempotent and not await self._claim(message):
+                await raw_message.ack()
+                return
+        except MessageInProgressError:
+            # Parked in a retry queue by the one-message path
+            await super()._process_message(raw_message)
+            return
+
+        self._batch.append((raw_message, message))
+        if len(self._batch) >= self._batch_size:
+            await self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        """Flush the current batch once the batch timeout has passed."""
+        await asyncio.sleep(self._batch_timeout / 1000)
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Process the pending messages as one batch."""
+        timer, self._flush_timer = self._flush_timer, None
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+
+        self._metrics.in_flight += len(batch)
+        started = time.perf_counter()
+        try:
+            async with self._holding(*(message.id for _, message in batch)):
+                await self.handle_batch([message for _, message in batch])
+        except Exception as e:
+            logger.warning(
+                "Batch of %d messages failed, processing them one by one: %s",
+                len(batch),
+                str(e),
+            )
+            self._metrics.in_flight -= len(batch)
+            if self.idempotent:
+                # Claimed again one by one
+                await idempotency_store.release(
+                    self._queue_name, *(str(message.id) for _, message in batch)
+                )
+            for raw_message, _ in batch:
+                try:
+                    await super()._process_message(raw_message)
+                except Exception as message_error:
+                    # Already rejected to the DLQ by raw_message.process()
+                    logger.debug("Message sent to DLQ: %s", str(message_error))
+            return
+
+        # Each message of the batch waited for the whole batch
+        elapsed = time.perf_counter() - started
+        if self.idempotent:
+            await idempotency_store.complete(
+                self._queue_name, *(str(message.id) for _, message in batch)
+            )
+        self._metrics.in_flight -= len(batch)
+        for raw_message, _ in batch:
+            await raw_message.ack()
+            self._metrics.acked += 1
+            self._metrics.observe(elapsed)
+
+        logger.debug(
+            "Batch processed successfully: size=%d, queue=%s",
+            len(batch),
+            self._queue_name,
+        )
+
+    async def stop(self) -> None:
+        """
+        Stop consuming messages, processing any pending batch first.
+        """
+        await self.flush()
+        await super().stop()
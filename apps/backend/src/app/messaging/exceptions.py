@@ -39,6 +39,12 @@ class MessageRetryExhaustedError(MessagingError):
     pass
 
 
+class MessageInProgressError(MessagingError):
+    """Raised when a message is being handled by another delivery."""
+
+    pass
+
+
 class ConsumerNotStartedError(MessagingError):
     """Raised when trying to stop a consumer that hasn't started."""
 
@@ -1,28 +1,36 @@
 """Audit log message handler."""
 
 import logging
+from typing import Any
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from src.app.core.config import settings
-from src.app.messaging.consumer import MessageConsumer
+from src.app.messaging.consumer import BatchMessageConsumer
 from src.app.messaging.types import AuditLogMessage
 from src.app.models.audit_log import AuditLog
 
 logger = logging.getLogger(__name__)
 
 
-class AuditLogHandler(MessageConsumer[AuditLogMessage]):
-    """Handler for audit log messages."""
+class AuditLogHandler(BatchMessageConsumer[AuditLogMessage]):
+    """Handler for audit log messages, written to the database in batches."""
 
     queue_name = "audit_queue"
     routing_keys = ["audit.log"]
     message_type = AuditLogMessage
-    prefetch_count = 50  # Higher throughput for audit logs
+    idempotent = True
 
     def __init__(self) -> None:
         """Initialize the handler with database session factory."""
-        super().__init__()
+        batch_size = settings.rabbitmq_audit_batch_size
+        super().__init__(
+            # Keep the next batch arriving while the current one is written
+            prefetch_count=2 * batch_size,
+            batch_size=batch_size,
+            batch_timeout=settings.rabbitmq_audit_batch_timeout,
+        )
         # Create async engine for the worker
         self._engine = create_async_engine(
             settings.database_url,
@@ -36,10 +44,28 @@ class AuditLogHandler(MessageConsumer[AuditLogMessage]):
             expire_on_commit=False,
         )
 
+    async def handle_batch(self, messages: list[AuditLogMessage]) -> None:
+        """
+        Write a batch of audit log messages with one multi-row INSERT.
+
+        Args:
+            messages: The audit log messages to process
+        """
+        async with self._session_factory() as session:
+            await session.execute(
+                insert(AuditLog),
+                [self._to_row(message) for message in messages],
+            )
+            await session.commit()
+
+        logger.info("Audit logs created: count=%d", len(messages))
+
     async def handle(self, message: AuditLogMessage) -> None:
         """
         Handle an audit log message by writing to the database.
 
+        Used for the messages of a batch that failed to write.
+
         Args:
             message: The audit log message to process
         """
@@ -51,18 +77,7 @@ class AuditLogHandler(MessageConsumer[AuditLogMessage]):
         )
 
         async with self._session_factory() as session:
-            audit_log = AuditLog(
-                action=message.action,
-                entity_type=message.entity_type,
-                entity_id=message.entity_id,
-                actor_id=message.actor_id,
-                actor_ip=message.actor_ip,
-                actor_user_agent=message.actor_user_agent,
-                changes=message.changes,
-                extra_data=message.extra_data,
-            )
-
-            session.add(audit_log)
+            session.add(AuditLog(**self._to_row(message)))
             await session.commit()
 
         logger.info(
@@ -73,6 +88,20 @@ class AuditLogHandler(MessageConsumer[AuditLogMessage]):
             message.id,
         )
 
+    @staticmethod
+    def _to_row(message: AuditLogMessage) -> dict[str, Any]:
+        """Map an audit log message to AuditLog column values."""
+        return {
+            "action": message.action,
+            "entity_type": message.entity_type,
+            "entity_id": message.entity_id,
+            "actor_id": message.actor_id,
+            "actor_ip": message.actor_ip,
+            "actor_user_agent": message.actor_user_agent,
+            "changes": message.changes,
+            "extra_data": message.extra_data,
+        }
+
     async def close(self) -> None:
         """Close the database engine."""
         await self._engine.dispose()
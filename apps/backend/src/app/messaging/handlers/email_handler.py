@@ -20,6 +20,7 @@ class EmailHandler(MessageConsumer[EmailMessage]):
     routing_keys = ["email.generic"]
     message_type = EmailMessage
     prefetch_count = 10
+    idempotent = True
 
     async def handle(self, message: EmailMessage) -> None:
         """
@@ -59,6 +60,7 @@ class PasswordResetEmailHandler(MessageConsumer[PasswordResetEmailMessage]):
     routing_keys = ["email.password_reset"]
     message_type = PasswordResetEmailMessage
     prefetch_count = 10
+    idempotent = True
 
     async def handle(self, message: PasswordResetEmailMessage) -> None:
         """
@@ -92,6 +94,7 @@ class EmailVerificationHandler(MessageConsumer[EmailVerificationMessage]):
     routing_keys = ["email.verification"]
     message_type = EmailVerificationMessage
     prefetch_count = 10
+    idempotent = True
 
     async def handle(self, message: EmailVerificationMessage) -> None:
         """
@@ -2,12 +2,43 @@
 
 import logging
 
+from src.app.core.config import settings
 from src.app.messaging.consumer import MessageConsumer
 from src.app.messaging.types import FileProcessingMessage
 
 logger = logging.getLogger(__name__)
 
 
+# File operations are CPU-bound and run in the handler's process pool, so they
+# are module-level functions taking picklable arguments. They are placeholders
+# for now, so the pool is scaffolding until they do real work.
+
+
+def compress_file(file_path: str) -> None:
+    """Compress a file."""
+    logger.info("Compressing file: %s", file_path)
+    # TODO: Implement compression logic
+
+
+def generate_thumbnail(file_path: str) -> None:
+    """Generate a thumbnail for an image file."""
+    logger.info("Generating thumbnail: %s", file_path)
+    # TODO: Implement thumbnail generation logic
+
+
+def convert_file(file_path: str) -> None:
+    """Convert a file to a different format."""
+    logger.info("Converting file: %s", file_path)
+    # TODO: Implement file conversion logic
+
+
+_OPERATIONS = {
+    "compress": compress_file,
+    "thumbnail": generate_thumbnail,
+    "convert": convert_file,
+}
+
+
 class FileProcessingHandler(MessageConsumer[FileProcessingMessage]):
     """Handler for file processing messages."""
 
@@ -15,6 +46,9 @@ class FileProcessingHandler(MessageConsumer[FileProcessingMessage]):
     routing_keys = ["file.*"]
     message_type = FileProcessingMessage
     prefetch_count = 5
+    # One file per process; the other prefetched messages wait their turn
+    process_workers = settings.rabbitmq_file_processes
+    max_in_flight = settings.rabbitmq_file_processes or None
 
     async def handle(self, message: FileProcessingMessage) -> None:
         """
@@ -31,32 +65,14 @@ class FileProcessingHandler(MessageConsumer[FileProcessingMessage]):
 
         # TODO: Implement actual file processing logic based on operation
         # This is a placeholder that can be extended based on requirements
-        if message.operation == "compress":
-            await self._compress_file(message)
-        elif message.operation == "thumbnail":
-            await self._generate_thumbnail(message)
-        elif message.operation == "convert":
-            await self._convert_file(message)
-        else:
+        operation = _OPERATIONS.get(message.operation)
+        if operation is None:
             logger.warning("Unknown file operation: %s", message.operation)
+        else:
+            await self.run_cpu_bound(operation, message.file_path)
 
         logger.info(
             "File processing completed: file_id=%s, message_id=%s",
             message.file_id,
             message.id,
         )
-
-    async def _compress_file(self, message: FileProcessingMessage) -> None:
-        """Compress a file."""
-        logger.info("Compressing file: %s", message.file_path)
-        # TODO: Implement compression logic
-
-    async def _generate_thumbnail(self, message: FileProcessingMessage) -> None:
-        """Generate a thumbnail for an image file."""
-        logger.info("Generating thumbnail: %s", message.file_path)
-        # TODO: Implement thumbnail generation logic
-
-    async def _convert_file(self, message: FileProcessingMessage) -> None:
-        """Convert a file to a different format."""
-        logger.info("Converting file: %s", message.file_path)
-        # TODO: Implement file conversion logic
@@ -23,6 +23,7 @@ class ScheduledTaskHandler(MessageConsumer[ScheduledTaskMessage]):
     routing_keys = ["task.execute"]
     message_type = ScheduledTaskMessage
     prefetch_count = 5
+    idempotent = True
 
     async def handle(self, message: ScheduledTaskMessage) -> None:
         """
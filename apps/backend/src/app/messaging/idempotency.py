@@ -0,0 +1,186 @@
+"""Idempotent message processing.
+
+Delivery is at least once: a message is delivered again when a worker dies
+before acking it, and the outbox relay may publish it twice. Consumers with
+``idempotent = True`` claim each message id in Redis with ``SET NX`` before
+handling it. The key holds:
+
+- ``processing`` while a delivery handles the message. It expires after
+  ``lock_ttl`` seconds and is refreshed while the handler runs, so the claim
+  of a worker that died with the message ends shortly after.
+- ``done`` once the message was handled, for ``ttl`` seconds.
+
+A duplicate of a done message is acked without being handled. A duplicate
+arriving while another delivery holds the claim is parked in a retry queue
+for at least ``lock_ttl`` seconds, without using up its retries, since that
+delivery may still fail or be gone. A failed delivery releases its claim, so
+that its retry is handled.
+
+Ids known to be done are also kept in an in-process LRU, so repeated
+duplicates cost no Redis round trip. Without Redis (pool not initialized or
+unreachable), messages are handled without deduplication.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from enum import StrEnum
+from typing import Any
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+from src.app.core.config import settings
+from src.app.core.redis import RedisPool
+from src.app.services.cache import KEY_PREFIX
+
+logger = logging.getLogger(__name__)
+
+_PROCESSING = "processing"
+_DONE = "done"
+
+
+class ClaimResult(StrEnum):
+    """Outcome of claiming a message."""
+
+    CLAIMED = "claimed"  # Handle the message
+    DONE = "done"  # Already handled, skip it
+    IN_PROGRESS = "in_progress"  # Being handled by another delivery
+
+
+class IdempotencyStore:
+    """Processed message ids, in Redis with an in-process LRU in front."""
+
+    def __init__(
+        self, ttl: int = 86400, lock_ttl: int = 30, local_size: int = 10000
+    ) -> None:
+        self.ttl = ttl
+        self.lock_ttl = lock_ttl
+        self.local_size = local_size
+        self._redis: redis.Redis | None = None
+        self._done: OrderedDict[str, None] = OrderedDict()
+        self._claimed = 0
+        self._duplicates = 0
+        self._in_progress = 0
+        self._unavailable = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Get claim metrics."""
+        return {
+            "claimed": self._claimed,
+            "duplicates": self._duplicates,
+            "in_progress": self._in_progress,
+            "unavailable": self._unavailable,
+            "local_size": len(self._done),
+        }
+
+    async def claim(self, queue_name: str, message_id: str) -> ClaimResult:
+        """Claim a message before handling it.
+
+        Args:
+            queue_name: Queue the message was delivered from
+            message_id: Id of the message
+
+        Returns:
+            Whether to handle, skip or retry the message later
+        """
+        key = self._key(queue_name, message_id)
+        if key in self._done:
+            self._done.move_to_end(key)
+            self._duplicates += 1
+            return ClaimResult.DONE
+
+        client = self._get_redis()
+        if client is None:
+            self._unavailable += 1
+            return ClaimResult.CLAIMED
+        try:
+            if await client.set(key, _PROCESSING, nx=True, ex=self.lock_ttl):
+                self._claimed += 1
+                return ClaimResult.CLAIMED
+            state = await client.get(key)
+        except RedisError as e:
+            self._unavailable += 1
+            logger.warning("Failed to claim message %s: %s", message_id, str(e))
+            return ClaimResult.CLAIMED
+
+        if state == _DONE:
+            self._remember(key)
+            self._duplicates += 1
+            return ClaimResult.DONE
+        # Being handled, or its claim expired since SET: retry later either way
+        self._in_progress += 1
+        return ClaimResult.IN_PROGRESS
+
+    @asynccontextmanager
+    async def hold(self, queue_name: str, *message_ids: str) -> AsyncIterator[None]:
+        """Refresh the claims of messages while they are being handled."""
+        keys = [self._key(queue_name, message_id) for message_id in message_ids]
+        refresher = asyncio.create_task(self._keep_alive(keys))
+        try:
+            yield
+        finally:
+            refresher.cancel()
+            with suppress(asyncio.CancelledError):
+                await refresher
+
+    async def _keep_alive(self, keys: list[str]) -> None:
+        """Extend claims every third of their lifetime."""
+        while True:
+            await asyncio.sleep(self.lock_ttl / 3)
+            await self._update(keys, lambda pipe, key: pipe.expire(key, self.lock_ttl))
+
+    async def complete(self, queue_name: str, *message_ids: str) -> None:
+        """Mark claimed messages as handled."""
+        keys = [self._key(queue_name, message_id) for message_id in message_ids]
+        for key in keys:
+            self._remember(key)
+        await self._update(keys, lambda pipe, key: pipe.set(key, _DONE, ex=self.ttl))
+
+    async def release(self, queue_name: str, *message_ids: str) -> None:
+        """Release the claims of messages that failed, so they can be retried."""
+        keys = [self._key(queue_name, message_id) for message_id in message_ids]
+        await self._update(keys, lambda pipe, key: pipe.delete(key))
+
+    async def _update(self, keys: list[str], command: Any) -> None:
+        """Run a command per key in one pipelined round trip."""
+        client = self._get_redis()
+        if client is None or not keys:
+            return
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    command(pipe, key)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning("Failed to update %d message claims: %s", len(keys), e)
+
+    def _key(self, queue_name: str, message_id: str) -> str:
+        # Per queue, as a message routed to several queues is handled by each
+        return f"{KEY_PREFIX}processed:{queue_name}:{message_id}"
+
+    def _remember(self, key: str) -> None:
+        """Add a done message to the in-process tier, evicting the LRU entry."""
+        self._done[key] = None
+        self._done.move_to_end(key)
+        while len(self._done) > self.local_size:
+            self._done.popitem(last=False)
+
+    def _get_redis(self) -> redis.Redis | None:
+        """Get a client on the shared Redis pool, if it is initialized."""
+        try:
+            pool = RedisPool.get_pool()
+        except RuntimeError:
+            return None
+        if self._redis is None or self._redis.connection_pool is not pool:
+            self._redis = redis.Redis(connection_pool=pool)
+        return self._redis
+
+
+# Global idempotency store, shared by the idempotent consumers of a worker
+idempotency_store = IdempotencyStore(
+    ttl=settings.message_idempotency_ttl,
+    lock_ttl=settings.message_idempotency_lock_ttl,
+    local_size=settings.message_idempotency_local_size,
+)
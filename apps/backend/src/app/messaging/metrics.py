@@ -0,0 +1,120 @@
+"""Per-queue consumer metrics.
+
+Every ``MessageConsumer`` records how its deliveries went:
+
+- ``in_flight``: deliveries being handled right now.
+- ``acked``: deliveries handled successfully.
+- ``nacked``: deliveries whose handler failed; each is then either
+  ``retried`` (parked in a retry queue) or ``dead_lettered``.
+- ``dead_lettered``: deliveries rejected to the dead letter queue, including
+  ones that could not be deserialized.
+- ``deduplicated``: duplicates of handled messages, acked without handling.
+- A histogram of the time spent handling each delivery.
+
+Workers export them in the Prometheus text format (see
+``src.app.workers.metrics``).
+"""
+
+import bisect
+from typing import Any
+
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Metric name, Prometheus type and help text of the plain series
+_SERIES = (
+    ("in_flight", "gauge", "Deliveries being handled"),
+    ("acked", "counter", "Deliveries handled successfully"),
+    ("nacked", "counter", "Deliveries whose handler failed"),
+    ("retried", "counter", "Failed deliveries parked in a retry queue"),
+    ("dead_lettered", "counter", "Deliveries rejected to the dead letter queue"),
+    ("deduplicated", "counter", "Duplicate deliveries acked without handling"),
+)
+
+
+class QueueMetrics:
+    """Delivery counters and latency histogram of one queue."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.acked = 0
+        self.nacked = 0
+        self.retried = 0
+        self.dead_lettered = 0
+        self.deduplicated = 0
+        # One count per bucket plus +Inf, not cumulative
+        self._buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self._latency_sum = 0.0
+        self._latency_count = 0
+
+    def observe(self, seconds: float) -> None:
+        """Record the time spent handling one delivery."""
+        self._buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self._latency_sum += seconds
+        self._latency_count += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Get the queue metrics, with cumulative histogram buckets."""
+        cumulative = []
+        total = 0
+        for count in self._buckets:
+            total += count
+            cumulative.append(total)
+        return {
+            "in_flight": self.in_flight,
+            "acked": self.acked,
+            "nacked": self.nacked,
+            "retried": self.retried,
+            "dead_lettered": self.dead_lettered,
+            "deduplicated": self.deduplicated,
+            "latency_buckets": dict(
+                zip([*map(str, LATENCY_BUCKETS), "+Inf"], cumulative, strict=True)
+            ),
+            "latency_sum": self._latency_sum,
+            "latency_count": self._latency_count,
+        }
+
+
+class ConsumerMetrics:
+    """Metrics of the queues consumed by this process."""
+
+    def __init__(self) -> None:
+        self._queues: dict[str, QueueMetrics] = {}
+
+    def for_queue(self, queue_name: str) -> QueueMetrics:
+        """Get the metrics of a queue, creating them on first use."""
+        metrics = self._queues.get(queue_name)
+        if metrics is None:
+            metrics = self._queues[queue_name] = QueueMetrics()
+        return metrics
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Get the metrics of every queue."""
+        return {name: metrics.stats() for name, metrics in self._queues.items()}
+
+    def render(self) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        stats = self.stats()
+        lines: list[str] = []
+
+        for key, kind, help_text in _SERIES:
+            name = f"consumer_{key}_total" if kind == "counter" else f"consumer_{key}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for queue, values in stats.items():
+                lines.append(f'{name}{{queue="{queue}"}} {values[key]}')
+
+        name = "consumer_processing_seconds"
+        lines.append(f"# HELP {name} Time spent handling a delivery")
+        lines.append(f"# TYPE {name} histogram")
+        for queue, values in stats.items():
+            for bound, count in values["latency_buckets"].items():
+                lines.append(f'{name}_bucket{{queue="{queue}",le="{bound}"}} {count}')
+            lines.append(f'{name}_sum{{queue="{queue}"}} {values["latency_sum"]}')
+            lines.append(f'{name}_count{{queue="{queue}"}} {values["latency_count"]}')
+
+        return "\n".join(lines) + "\n"
+
+
+# Global consumer metrics, one entry per consumed queue
+consumer_metrics = ConsumerMetrics()
@@ -0,0 +1,242 @@
+"""Transactional outbox for RabbitMQ messages.
+
+Publishing after ``commit()`` makes requests wait for the broker, and the
+message is lost if the process dies between the commit and the publish.
+``enqueue`` instead adds the message to the ``outbox`` table within the
+caller's transaction, so it is committed or rolled back with the data.
+
+``OutboxRelay`` publishes the outbox in the background of each API worker.
+It claims a batch of rows with ``SELECT ... FOR UPDATE SKIP LOCKED``, so
+relays of other workers skip them, publishes them with
+``MessageProducer.publish_many`` and deletes them in the same transaction.
+If publishing fails, the transaction rolls back and the rows are published
+by a later poll: delivery is at least once.
+
+Fields a message lists in ``sensitive_fields`` (e.g. password reset tokens)
+are stored encrypted with a key derived from the JWT secret, so the outbox
+never holds them in plaintext.
+"""
+
+import asyncio
+import base64
+import hashlib
+import importlib
+import logging
+from collections.abc import Callable
+from itertools import groupby
+from typing import Any
+
+from cryptography.fernet import Fernet
+from sqlalchemy import delete, event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from src.app.core.config import settings
+from src.app.messaging.producer import message_producer
+from src.app.messaging.types import BaseMessage
+from src.app.models.outbox import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+# Session.info flag waking the relay once the session commits
+_PENDING = "outbox_pending"
+
+
+def enqueue(
+    db: AsyncSession,
+    message: BaseMessage,
+    routing_key: str,
+    exchange_name: str | None = None,
+) -> OutboxMessage:
+    """
+    Add a message to the outbox, to be published once ``db`` commits.
+
+    Args:
+        db: Session of the transaction making the business change
+        message: The message to publish
+        routing_key: The routing key for the message
+        exchange_name: Optional exchange name (defaults to main exchange)
+
+    Returns:
+        The pending outbox row
+    """
+    message_class = type(message)
+    row = OutboxMessage(
+        message_type=f"{message_class.__module__}.{message_class.__qualname__}",
+        routing_key=routing_key,
+        exchange_name=exchange_name,
+        payload=_encrypt_fields(message),
+    )
+    db.add(row)
+    db.info[_PENDING] = True
+    return row
+
+
+def _fernet() -> Fernet:
+    """Get the cipher of sensitive fields, keyed by the JWT secret."""
+    key = hashlib.sha256(settings.jwt_secret_key.encode()).digest()
+    return Fernet(base64.urlsafe_b64encode(key))
+
+
+def _encrypt_fields(message: BaseMessage) -> dict[str, Any]:
+    """Serialize a message, encrypting its sensitive fields."""
+    payload = message.model_dump(mode="json")
+    if message.sensitive_fields:
+        fernet = _fernet()
+        for field in message.sensitive_fields:
+            payload[field] = fernet.encrypt(payload[field].encode()).decode()
+    return payload
+
+
+def _load_message(row: OutboxMessage) -> BaseMessage:
+    """Rebuild the message stored in an outbox row."""
+    module_name, _, class_name = row.message_type.rpartition(".")
+    message_class = getattr(importlib.import_module(module_name), class_name)
+    payload = dict(row.payload)
+    if message_class.sensitive_fields:
+        fernet = _fernet()
+        for field in message_class.sensitive_fields:
+            payload[field] = fernet.decrypt(payload[field].encode()).decode()
+    return message_class.model_validate(payload)
+
+
+class OutboxRelay:
+    """Background task publishing the outbox to RabbitMQ.
+
+    Polls every ``interval`` seconds, and right away after a session that
+    enqueued messages commits in this worker.
+    """
+
+    def __init__(self, batch_size: int = 500, interval: float = 1.0):
+        self.batch_size = batch_size
+        self.interval = interval
+        self._runner: asyncio.Task | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._session_factory: Callable[[], AsyncSession] | None = None
+        self._published = 0
+        self._dropped = 0
+        self._failed = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the relay is publishing the outbox."""
+        return self._runner is not None
+
+    def stats(self) -> dict[str, Any]:
+        """Get relay metrics."""
+        return {
+            "running": self.running,
+            "published": self._published,
+            "dropped": self._dropped,
+            "failed": self._failed,
+        }
+
+    def start(self, session_factory: Callable[[], AsyncSession] | None = None) -> None:
+        """Start the background relay.
+
+        Args:
+            session_factory: Session factory for the outbox, defaults to the app's
+        """
+        if self.running:
+            return
+        if session_factory is None:
+            # Import here to avoid circular imports
+            from src.app.db.session import async_session_maker
+
+            session_factory = async_session_maker
+        self._session_factory = session_factory
+        self._wakeup = asyncio.Event()
+        self._runner = asyncio.create_task(self._run(), name="outbox_relay")
+
+    async def stop(self) -> None:
+        """Stop the relay; rows not yet published stay in the outbox."""
+        runner, self._runner = self._runner, None
+        if runner is None:
+            return
+        runner.cancel()
+        try:
+            await runner
+        except asyncio.CancelledError:
+            pass
+
+    def notify(self) -> None:
+        """Wake the relay up to publish newly committed messages."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def relay_once(self) -> int:
+        """Publish and delete one batch of outbox rows.
+
+        Returns:
+            The number of rows removed from the outbox
+        """
+        assert self._session_factory is not None
+        async with self._session_factory() as session:
+            result = await session.scalars(
+                select(OutboxMessage)
+                .order_by(OutboxMessage.id)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            rows = list(result.all())
+            if not rows:
+                return 0
+
+            # Keep the outbox order; each run of rows shares one exchange
+            dropped = 0
+            for exchange_name, group in groupby(rows, lambda r: r.exchange_name):
+                messages = []
+                for row in group:
+                    try:
+                        messages.append((_load_message(row), row.routing_key))
+                    except Exception as e:
+                        # Would block the outbox forever, so it is dropped
+                        dropped += 1
+                        logger.error(
+                            "Dropping unreadable outbox message %d (%s): %s",
+                            row.id,
+                            row.message_type,
+                            str(e),
+                        )
+                await message_producer.publish_many(messages, exchange_name)
+
+            await session.execute(
+                delete(OutboxMessage).where(
+                    OutboxMessage.id.in_([row.id for row in rows])
+                )
+            )
+            await session.commit()
+
+        self._published += len(rows) - dropped
+        self._dropped += dropped
+        return len(rows)
+
+    async def _run(self) -> None:
+        """Publish the outbox until stopped."""
+        assert self._wakeup is not None
+        while True:
+            try:
+                relayed = await self.relay_once()
+            except Exception as e:
+                self._failed += 1
+                relayed = 0
+                logger.warning("Failed to relay outbox messages: %s", str(e))
+            if relayed >= self.batch_size:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.interval)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+
+
+# Global outbox relay, started by the app lifespan when RabbitMQ is enabled
+outbox_relay = OutboxRelay(
+    batch_size=settings.outbox_relay_batch_size,
+    interval=settings.outbox_relay_interval,
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _committed(session: Session) -> None:
+    if session.info.pop(_PENDING, False):
+        outbox_relay.notify()
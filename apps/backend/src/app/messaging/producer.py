@@ -1,10 +1,14 @@
 """Message producer for publishing messages to RabbitMQ."""
 
+import asyncio
 import logging
 import uuid
+from collections.abc import Sequence
 from typing import Any
+from weakref import WeakKeyDictionary
 
-from aio_pika import DeliveryMode, Message
+from aio_pika import Channel, DeliveryMode, Message
+from aio_pika.abc import AbstractExchange
 from src.app.core.config import settings
 from src.app.core.rabbitmq import RabbitMQPool, get_channel
 from src.app.messaging.exceptions import MessagePublishError, MessageSerializationError
@@ -21,7 +25,60 @@ logger = logging.getLogger(__name__)
 
 
 class MessageProducer:
-    """Service for publishing messages to RabbitMQ."""
+    """
+    Service for publishing messages to RabbitMQ.
+
+    Exchange handles are cached per pooled channel, so only the first
+    publish on a channel checks that the exchange exists. Pooled channels
+    use publisher confirms: ``publish`` returns once the broker accepted the
+    message, and ``publish_many`` pipelines up to
+    ``rabbitmq_publish_confirm_window`` messages before waiting for their
+    confirms.
+    """
+
+    def __init__(self) -> None:
+        self._exchanges: WeakKeyDictionary[Channel, dict[str, AbstractExchange]] = (
+            WeakKeyDictionary()
+        )
+
+    async def _get_exchange(self, channel: Channel, name: str) -> AbstractExchange:
+        """
+        Get an exchange handle, checking the exchange once per channel.
+
+        Args:
+            channel: The pooled channel to publish on
+            name: The exchange name
+        """
+        exchanges = self._exchanges.setdefault(channel, {})
+        exchange = exchanges.get(name)
+        if exchange is None:
+            exchange = await channel.get_exchange(name)
+            exchanges[name] = exchange
+        return exchange
+
+    def _build_message(self, message: BaseMessage) -> Message:
+        """
+        Serialize a message for publishing.
+
+        Raises:
+            MessageSerializationError: If the message fails to serialize
+        """
+        try:
+            body = message.model_dump_json().encode()
+        except Exception as e:
+            raise MessageSerializationError(
+                f"Failed to serialize message: {e}",
+                cause=e,
+            ) from e
+
+        return Message(
+            body=body,
+            content_type="application/json",
+            delivery_mode=DeliveryMode.PERSISTENT,
+            priority=message.priority,
+            message_id=str(message.id),
+            timestamp=message.timestamp,
+        )
 
     async def publish(
         self,
@@ -41,52 +98,81 @@ class MessageProducer:
             MessagePublishError: If the message fails to publish
             MessageSerializationError: If the message fails to serialize
         """
+        await self.publish_many([(message, routing_key)], exchange_name)
+
+    async def publish_many(
+        self,
+        messages: Sequence[tuple[BaseMessage, str]],
+        exchange_name: str | None = None,
+    ) -> None:
+        """
+        Publish messages to RabbitMQ on one channel.
+
+        Publishes are pipelined: confirms are awaited for each window of
+        ``rabbitmq_publish_confirm_window`` messages instead of one by one.
+        Messages are not published atomically; after a failure, earlier
+        windows stay published.
+
+        Args:
+            messages: The messages to publish with their routing keys
+            exchange_name: Optional exchange name (defaults to main exchange)
+
+        Raises:
+            MessagePublishError: If a message fails to publish
+            MessageSerializationError: If a message fails to serialize
+        """
+        if not messages:
+            return
+
         if not settings.rabbitmq_enabled:
             logger.warning(
-                "RabbitMQ is disabled, message not published: %s",
-                message.id,
+                "RabbitMQ is disabled, %d message(s) not published: first id=%s",
+                len(messages),
+                messages[0][0].id,
             )
             return
 
         if not RabbitMQPool.is_initialized():
             raise MessagePublishError("RabbitMQ pool not initialized")
 
-        try:
-            body = message.model_dump_json().encode()
-        except Exception as e:
-            raise MessageSerializationError(
-                f"Failed to serialize message: {e}",
-                cause=e,
-            ) from e
+        outgoing = [
+            (message, self._build_message(message), routing_key)
+            for message, routing_key in messages
+        ]
+        window = max(settings.rabbitmq_publish_confirm_window, 1)
 
         try:
             async with get_channel() as channel:
-                exchange = await channel.get_exchange(
-                    exchange_name or settings.rabbitmq_exchange_name
+                exchange = await self._get_exchange(
+                    channel, exchange_name or settings.rabbitmq_exchange_name
                 )
+                try:
+                    for start in range(0, len(outgoing), window):
+                        await asyncio.gather(
+                            *(
+                                exchange.publish(amqp_message, routing_key=key)
+                                for _, amqp_message, key in outgoing[
+                                    start : start + window
+                                ]
+                            )
+                        )
+                except Exception:
+                    # The channel may have been closed along with its handles
+                    self._exchanges.pop(channel, None)
+                    raise
 
-                await exchange.publish(
-                    Message(
-                        body=body,
-                        content_type="application/json",
-                        delivery_mode=DeliveryMode.PERSISTENT,
-                        priority=message.priority,
-                        message_id=str(message.id),
-                        timestamp=message.timestamp,
-                    ),
-                    routing_key=routing_key,
-                )
-
-                logger.debug(
-                    "Message published: id=%s, routing_key=%s",
-                    message.id,
-                    routing_key,
-                )
+                for message, _, routing_key in outgoing:
+                    logger.debug(
+                        "Message published: id=%s, routing_key=%s",
+                        message.id,
+                        routing_key,
+                    )
 
         except Exception as e:
             logger.error(
-                "Failed to publish message: id=%s, error=%s",
-                message.id,
+                "Failed to publish %d message(s): first id=%s, error=%s",
+                len(outgoing),
+                outgoing[0][0].id,
                 str(e),
             )
             raise MessagePublishError(
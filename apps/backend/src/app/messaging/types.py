@@ -2,7 +2,7 @@
 
 from datetime import UTC, datetime
 from enum import IntEnum
-from typing import Any
+from typing import Any, ClassVar
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
@@ -28,6 +28,9 @@ class BaseMessage(BaseModel):
 
     model_config = {"frozen": False}
 
+    # Fields encrypted while the message waits in the outbox
+    sensitive_fields: ClassVar[tuple[str, ...]] = ()
+
     def increment_retry(self) -> "BaseMessage":
         """Increment retry count and return self."""
         self.retry_count += 1
@@ -53,6 +56,8 @@ class EmailMessage(BaseMessage):
 class PasswordResetEmailMessage(BaseMessage):
     """Password reset email message."""
 
+    sensitive_fields = ("reset_token",)
+
     to_email: str
     reset_token: str
     user_name: str | None = None
@@ -61,6 +66,8 @@ class PasswordResetEmailMessage(BaseMessage):
 class EmailVerificationMessage(BaseMessage):
     """Email verification message."""
 
+    sensitive_fields = ("verification_token",)
+
     to_email: str
     verification_token: str
     user_name: str | None = None
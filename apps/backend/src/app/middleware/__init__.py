@@ -2,6 +2,7 @@
 
 from src.app.middleware.access_log import AccessLogMiddleware
 from src.app.middleware.audit_context import AuditContextMiddleware
+from src.app.middleware.db_routing import DatabaseRoutingMiddleware
 from src.app.middleware.gzip import GzipMiddleware
 from src.app.middleware.https_redirect import HTTPSRedirectMiddleware
 from src.app.middleware.process_time import ProcessTimeMiddleware
@@ -17,6 +18,7 @@ from src.app.middleware.trusted_host import TrustedHostMiddleware
 __all__ = [
     "AccessLogMiddleware",
     "AuditContextMiddleware",
+    "DatabaseRoutingMiddleware",
     "GzipMiddleware",
     "HTTPSRedirectMiddleware",
     "ProcessTimeMiddleware",
@@ -1,21 +1,21 @@
 """Access logging middleware using structlog."""
 
 import time
-from collections.abc import Callable, Sequence
+from collections.abc import Sequence
 
-from fastapi import Request, Response
 from src.app.core.logging import get_logger
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = get_logger("access")
 
 
-class AccessLogMiddleware(BaseHTTPMiddleware):
+class AccessLogMiddleware:
     """Middleware for logging HTTP access requests with structured logging."""
 
     def __init__(
         self,
-        app: "ASGIApp",  # noqa: F821
+        app: ASGIApp,
         skip_paths: Sequence[str] | None = None,
     ) -> None:
         """Initialize with optional skip paths.
@@ -24,33 +24,50 @@ class AccessLogMiddleware(BaseHTTPMiddleware):
             app: ASGI application.
             skip_paths: Paths to skip from access logging (e.g., health checks).
         """
-        super().__init__(app)
+        self.app = app
         self.skip_paths = set(skip_paths) if skip_paths else set()
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Response]
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Log request and response details in structured format."""
-        path = request.url.path
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
 
         # Skip logging for configured paths
         if path in self.skip_paths:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         start_time = time.time()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
         # Process the request
-        response = await call_next(request)
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self._log(scope, path, status_code, start_time)
 
+    def _log(
+        self, scope: Scope, path: str, status_code: int, start_time: float
+    ) -> None:
+        """Emit the access log entry for a completed request."""
         # Calculate processing time in milliseconds
         duration_ms = (time.time() - start_time) * 1000
 
         # Get request details
-        client_ip = request.client.host if request.client else "unknown"
-        method = request.method
-        query = str(request.url.query) if request.url.query else None
-        status_code = response.status_code
-        user_agent = request.headers.get("user-agent", "unknown")
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        method = scope["method"]
+        query = scope.get("query_string", b"").decode("latin-1") or None
+        user_agent = Headers(scope=scope).get("user-agent", "unknown")
 
         # Build context dictionary matching log schema
         context = {
@@ -72,5 +89,3 @@ class AccessLogMiddleware(BaseHTTPMiddleware):
             logger.warning(message, **context)
         else:
             logger.info(message, **context)
-
-        return response
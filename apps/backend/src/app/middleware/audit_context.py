@@ -7,12 +7,11 @@ from src.app.core.audit import (
     get_user_agent,
 )
 from src.app.middleware.request_id import get_request_id
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 
-class AuditContextMiddleware(BaseHTTPMiddleware):
+class AuditContextMiddleware:
     """Middleware to set up audit context for each request.
 
     This middleware extracts client information (IP, User-Agent) from the
@@ -20,13 +19,19 @@ class AuditContextMiddleware(BaseHTTPMiddleware):
     the audit logging functions.
     """
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Set up audit context and process request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Extract client information
-        client_ip = get_client_ip(request)
-        user_agent = get_user_agent(request)
+        connection = HTTPConnection(scope)
+        client_ip = get_client_ip(connection)
+        user_agent = get_user_agent(connection)
         request_id = get_request_id()
 
         # Create audit context
@@ -42,8 +47,7 @@ class AuditContextMiddleware(BaseHTTPMiddleware):
         token = audit_context_var.set(context)
 
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send)
         finally:
             # Reset context
             audit_context_var.reset(token)
@@ -0,0 +1,24 @@
+"""Database routing middleware."""
+
+from src.app.db.routing import request_scope
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class DatabaseRoutingMiddleware:
+    """Middleware scoping the read replica primary pin to each request.
+
+    Once any session of a request writes, the remaining reads of that request
+    go to the primary so they see the write.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the request inside its own routing scope."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with request_scope():
+            await self.app(scope, receive, send)
@@ -1,28 +1,35 @@
 """Process time middleware."""
 
 import time
-from collections.abc import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class ProcessTimeMiddleware(BaseHTTPMiddleware):
+class ProcessTimeMiddleware:
     """Middleware for adding X-Process-Time header to responses.
 
     This middleware measures the time taken to process each request
     and adds it as a response header for monitoring purposes.
     """
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Response]
-    ) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Add processing time header to response."""
-        start_time = time.perf_counter()
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        response = await call_next(request)
+        start_time = time.perf_counter()
 
-        process_time = time.perf_counter() - start_time
-        response.headers["X-Process-Time"] = f"{process_time:.4f}"
+        async def send_with_process_time(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Headers go out before the body, so this measures time to
+                # first byte, which is what the header always reported
+                process_time = time.perf_counter() - start_time
+                MutableHeaders(scope=message)["X-Process-Time"] = f"{process_time:.4f}"
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_process_time)
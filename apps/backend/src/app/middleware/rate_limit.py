@@ -1,13 +1,20 @@
-"""Rate limiting middleware using sliding window algorithm."""
+"""Rate limiting middleware with in-memory and Redis backends."""
 
-import asyncio
+import math
 import time
-from collections import defaultdict
-from dataclasses import dataclass, field
-
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from dataclasses import dataclass
+from typing import Literal
+
+import redis.asyncio as redis
+from redis.commands.core import AsyncScript
+from redis.exceptions import RedisError
+from src.app.core.logging import get_logger
+from src.app.core.redis import RedisPool
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = get_logger(__name__)
 
 
 @dataclass
@@ -23,14 +30,20 @@ class RateLimitConfig:
 
 @dataclass
 class ClientState:
-    """Tracks request timestamps for a client."""
+    """Token bucket state for a client."""
 
-    timestamps: list[float] = field(default_factory=list)
-    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    tokens: float
+    updated_at: float
 
 
 class RateLimiter:
-    """In-memory rate limiter using sliding window algorithm."""
+    """In-memory rate limiter using a token bucket per client.
+
+    Each client holds a bucket of ``config.requests`` tokens that refills at
+    ``config.requests / config.window`` tokens per second, so every check is
+    O(1) regardless of traffic. Limits are per process; use
+    ``RedisRateLimiter`` to share them across workers.
+    """
 
     _instance: "RateLimiter | None" = None
 
@@ -44,7 +57,7 @@ class RateLimiter:
     def __init__(self):
         if self._initialized:
             return
-        self._clients: dict[str, ClientState] = defaultdict(ClientState)
+        self._clients: dict[str, ClientState] = {}
         self._cleanup_interval = 60  # Cleanup every 60 seconds
         self._last_cleanup = time.time()
         self._initialized = True
@@ -70,29 +83,33 @@ class RateLimiter:
             Tuple of (allowed, remaining_requests, retry_after_seconds)
         """
         now = time.time()
-        window_start = now - config.window
 
         # Periodic cleanup of old client data
         if now - self._last_cleanup > self._cleanup_interval:
             await self._cleanup()
 
-        client = self._clients[client_id]
-
-        async with client.lock:
-            # Remove expired timestamps
-            client.timestamps = [ts for ts in client.timestamps if ts > window_start]
+        # No await between reading and updating the bucket, so no lock is needed
+        refill_rate = config.requests / config.window
+        client = self._clients.get(client_id)
+        if client is None:
+            client = ClientState(tokens=float(config.requests), updated_at=now)
+            self._clients[client_id] = client
+        else:
+            elapsed = now - client.updated_at
+            client.tokens = min(
+                float(config.requests), client.tokens + elapsed * refill_rate
+            )
+            client.updated_at = now
 
-            # Check if allowed
-            if len(client.timestamps) < config.requests:
-                client.timestamps.append(now)
-                remaining = config.requests - len(client.timestamps)
-                return True, remaining, 0
+        # Check if allowed
+        if client.tokens >= 1:
+            client.tokens -= 1
+            return True, int(client.tokens), 0
 
-            # Calculate retry-after
-            oldest_in_window = min(client.timestamps) if client.timestamps else now
-            retry_after = int(oldest_in_window - window_start) + 1
+        # Calculate retry-after: time until one full token has refilled
+        retry_after = math.ceil((1 - client.tokens) / refill_rate)
 
-            return False, 0, retry_after
+        return False, 0, max(retry_after, 1)
 
     async def _cleanup(self):
         """Remove stale client entries."""
@@ -104,26 +121,120 @@ class RateLimiter:
         stale_clients = [
             client_id
             for client_id, state in self._clients.items()
-            if not state.timestamps or max(state.timestamps) < stale_threshold
+            if state.updated_at < stale_threshold
         ]
 
         for client_id in stale_clients:
             del self._clients[client_id]
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+# GCRA (generic cell rate algorithm) in a single atomic script. Only the
+# theoretical arrival time (TAT) is stored per client, and the Redis server
+# clock is used so every worker agrees on "now".
+#
+# KEYS[1] = rate limit key
+# ARGV[1] = emission interval in ms (window / requests)
+# ARGV[2] = burst tolerance in ms (emission interval * requests)
+# Returns {allowed, remaining, retry_after_ms}
+GCRA_SCRIPT = """
+local emission_interval = tonumber(ARGV[1])
+local tolerance = tonumber(ARGV[2])
+local time = redis.call("TIME")
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local tat = tonumber(redis.call("GET", KEYS[1]) or now)
+if tat < now then
+    tat = now
+end
+local new_tat = tat + emission_interval
+local diff = now - (new_tat - tolerance)
+if diff < 0 then
+    return {0, 0, -diff}
+end
+redis.call("SET", KEYS[1], new_tat, "PX", new_tat - now)
+return {1, math.floor((tolerance - (new_tat - now)) / emission_interval), 0}
+"""
+
+
+class RedisRateLimiter:
+    """Distributed rate limiter using GCRA on Redis.
+
+    Each check is one EVALSHA round trip on the shared ``RedisPool``, so the
+    configured limit holds across all workers. Falls back to the in-memory
+    ``RateLimiter`` while Redis is unavailable.
+    """
+
+    def __init__(self, fallback: RateLimiter | None = None):
+        # Imported here to avoid a circular import through the services package
+        from src.app.services.cache import KEY_PREFIX
+
+        self._key_prefix = f"{KEY_PREFIX}ratelimit:"
+        self._client: redis.Redis | None = None
+        self._script: AsyncScript | None = None
+        self._fallback = fallback or RateLimiter.get_instance()
+        self._degraded = False
+
+    def _get_script(self) -> AsyncScript:
+        """Get the registered GCRA script, rebinding if the pool was replaced."""
+        pool = RedisPool.get_pool()
+        if self._client is None or self._client.connection_pool is not pool:
+            self._client = redis.Redis(connection_pool=pool)
+            self._script = self._client.register_script(GCRA_SCRIPT)
+        return self._script
+
+    async def is_allowed(
+        self, client_id: str, config: RateLimitConfig
+    ) -> tuple[bool, int, int]:
+        """Check if request is allowed.
+
+        Returns:
+            Tuple of (allowed, remaining_requests, retry_after_seconds)
+        """
+        emission_interval = max(1, round(config.window * 1000 / config.requests))
+        tolerance = emission_interval * config.requests
+
+        try:
+            script = self._get_script()
+            allowed, remaining, retry_after_ms = await script(
+                keys=[self._key_prefix + client_id],
+                args=[emission_interval, tolerance],
+            )
+        except (RuntimeError, RedisError) as e:
+            # RuntimeError: pool not initialized
+            if not self._degraded:
+                self._degraded = True
+                logger.warning(
+                    "Redis rate limiter unavailable, using in-memory fallback",
+                    extra={"error": str(e)},
+                )
+            return await self._fallback.is_allowed(client_id, config)
+
+        if self._degraded:
+            self._degraded = False
+            logger.info("Redis rate limiter recovered")
+
+        return bool(allowed), int(remaining), math.ceil(int(retry_after_ms) / 1000)
+
+    def reset(self):
+        """Reset the in-memory fallback. Redis keys expire on their own."""
+        self._fallback.reset()
+
+
+class RateLimitMiddleware:
     """FastAPI middleware for rate limiting."""
 
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         default_limit: RateLimitConfig | None = None,
         route_limits: dict[str, RateLimitConfig] | None = None,
         exclude_paths: list[str] | None = None,
         trust_proxy: bool = False,
+        backend: Literal["memory", "redis"] = "memory",
     ):
-        super().__init__(app)
-        self.limiter = RateLimiter()
+        self.app = app
+        self.limiter: RateLimiter | RedisRateLimiter = (
+            RedisRateLimiter() if backend == "redis" else RateLimiter()
+        )
         self.default_limit = default_limit or RateLimitConfig(requests=100, window=60)
         self.route_limits = route_limits or {}
         self.exclude_paths = set(
@@ -131,19 +242,20 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         )
         self.trust_proxy = trust_proxy
 
-    def _get_client_id(self, request: Request) -> str:
+    def _get_client_id(self, scope: Scope) -> str:
         """Get client identifier from request.
 
         Only trusts X-Forwarded-For when trust_proxy is explicitly enabled.
         This prevents IP spoofing attacks when the server is directly exposed.
         """
         if self.trust_proxy:
-            forwarded = request.headers.get("X-Forwarded-For")
+            forwarded = Headers(scope=scope).get("X-Forwarded-For")
             if forwarded:
                 # Take the first IP in the chain (original client)
                 return forwarded.split(",")[0].strip()
 
-        return request.client.host if request.client else "unknown"
+        client = scope.get("client")
+        return client[0] if client else "unknown"
 
     def _get_rate_limit_config(self, path: str) -> RateLimitConfig | None:
         """Get rate limit config for a path."""
@@ -158,16 +270,21 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         return self.default_limit
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and apply rate limiting."""
-        path = request.url.path
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
         config = self._get_rate_limit_config(path)
 
         # Skip rate limiting for excluded paths
         if config is None:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
-        client_id = self._get_client_id(request)
+        client_id = self._get_client_id(scope)
         # Include path prefix in the key for per-route limiting
         rate_key = f"{client_id}:{path.split('/')[1] if '/' in path else path}"
 
@@ -176,7 +293,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         )
 
         if not allowed:
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=429,
                 content={
                     "error": "Too Many Requests",
@@ -190,12 +307,16 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                     "X-RateLimit-Reset": str(int(time.time()) + retry_after),
                 },
             )
+            await response(scope, receive, send)
+            return
 
-        response = await call_next(request)
-
-        # Add rate limit headers to successful responses
-        response.headers["X-RateLimit-Limit"] = str(config.requests)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
-        response.headers["X-RateLimit-Reset"] = str(int(time.time()) + config.window)
+        async def send_with_rate_limit_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add rate limit headers to successful responses
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(config.requests)
+                headers["X-RateLimit-Remaining"] = str(remaining)
+                headers["X-RateLimit-Reset"] = str(int(time.time()) + config.window)
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_rate_limit_headers)
@@ -3,9 +3,8 @@
 import uuid
 from contextvars import ContextVar
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # Context variable to store request ID for the current request
 request_id_ctx: ContextVar[str | None] = ContextVar("request_id", default=None)
@@ -19,27 +18,32 @@ def get_request_id() -> str | None:
     return request_id_ctx.get()
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+class RequestIDMiddleware:
     """Middleware to add request ID to each request for tracing."""
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Add request ID to request and response."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Get existing request ID from header or generate new one
-        request_id = request.headers.get(REQUEST_ID_HEADER) or str(uuid.uuid4())
+        request_id = Headers(scope=scope).get(REQUEST_ID_HEADER) or str(uuid.uuid4())
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add request ID to response header
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
 
         # Store in context for logging
         token = request_id_ctx.set(request_id)
 
         try:
-            # Process request
-            response = await call_next(request)
-
-            # Add request ID to response header
-            response.headers[REQUEST_ID_HEADER] = request_id
-
-            return response
+            await self.app(scope, receive, send_with_request_id)
         finally:
             # Reset context
             request_id_ctx.reset(token)
@@ -1,11 +1,10 @@
 """Security headers middleware."""
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware:
     """
     Middleware that adds security headers to all responses.
 
@@ -21,7 +20,7 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
 
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         hsts_enabled: bool = False,
         hsts_max_age: int = 31536000,
     ) -> None:
@@ -33,47 +32,55 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             hsts_enabled: Whether to enable HSTS header.
             hsts_max_age: HSTS max-age in seconds (default: 1 year).
         """
-        super().__init__(app)
+        self.app = app
         self.hsts_enabled = hsts_enabled
         self.hsts_max_age = hsts_max_age
+        # Header values are static, so build them once instead of per request
+        self.headers = self._build_headers()
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        """Add security headers to the response."""
-        response = await call_next(request)
-
-        # X-Content-Type-Options: Prevent MIME type sniffing
-        response.headers["X-Content-Type-Options"] = "nosniff"
-
-        # X-Frame-Options: Prevent clickjacking
-        response.headers["X-Frame-Options"] = "DENY"
-
-        # X-XSS-Protection: Enable XSS filter (for older browsers)
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-
-        # Referrer-Policy: Control Referer header
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-
-        # Permissions-Policy: Restrict browser features
-        response.headers["Permissions-Policy"] = (
-            "camera=(), microphone=(), geolocation=()"
-        )
-
-        # Content-Security-Policy
-        response.headers["Content-Security-Policy"] = (
-            "default-src 'self'; "
-            "script-src 'self' 'unsafe-inline' 'unsafe-eval'; "
-            "style-src 'self' 'unsafe-inline'; "
-            "img-src 'self' data: https:; "
-            "font-src 'self' data:; "
-            "connect-src 'self'"
-        )
+    def _build_headers(self) -> dict[str, str]:
+        """Build the security headers added to every response."""
+        headers = {
+            # X-Content-Type-Options: Prevent MIME type sniffing
+            "X-Content-Type-Options": "nosniff",
+            # X-Frame-Options: Prevent clickjacking
+            "X-Frame-Options": "DENY",
+            # X-XSS-Protection: Enable XSS filter (for older browsers)
+            "X-XSS-Protection": "1; mode=block",
+            # Referrer-Policy: Control Referer header
+            "Referrer-Policy": "strict-origin-when-cross-origin",
+            # Permissions-Policy: Restrict browser features
+            "Permissions-Policy": "camera=(), microphone=(), geolocation=()",
+            # Content-Security-Policy
+            "Content-Security-Policy": (
+                "default-src 'self'; "
+                "script-src 'self' 'unsafe-inline' 'unsafe-eval'; "
+                "style-src 'self' 'unsafe-inline'; "
+                "img-src 'self' data: https:; "
+                "font-src 'self' data:; "
+                "connect-src 'self'"
+            ),
+        }
 
         # Strict-Transport-Security (HSTS)
         if self.hsts_enabled:
-            response.headers["Strict-Transport-Security"] = (
+            headers["Strict-Transport-Security"] = (
                 f"max-age={self.hsts_max_age}; includeSubDomains"
             )
 
-        return response
+        return headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Add security headers to the response."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_security_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in self.headers.items():
+                    headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_security_headers)
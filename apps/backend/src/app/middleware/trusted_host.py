@@ -10,14 +10,12 @@ For simpler usage, use the built-in TrustedHostMiddleware from starlette:
 This custom implementation provides additional configuration options.
 """
 
-from collections.abc import Callable
-
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
 from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 
-class TrustedHostMiddleware(BaseHTTPMiddleware):
+class TrustedHostMiddleware:
     """Middleware for validating the Host header against a list of allowed hosts.
 
     This prevents HTTP Host header attacks by ensuring requests
@@ -32,28 +30,29 @@ class TrustedHostMiddleware(BaseHTTPMiddleware):
 
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         allowed_hosts: list[str] | None = None,
         allow_localhost: bool = True,
     ):
         """Initialize the middleware."""
-        super().__init__(app)
+        self.app = app
         self.allowed_hosts = set(allowed_hosts or [])
         self.allow_all = "*" in self.allowed_hosts
 
         if allow_localhost:
             self.allowed_hosts.update(["localhost", "127.0.0.1", "[::1]"])
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Response]
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Validate the Host header against allowed hosts."""
-        if self.allow_all:
-            return await call_next(request)
+        if scope["type"] != "http" or self.allow_all:
+            await self.app(scope, receive, send)
+            return
 
-        host = request.headers.get("host", "").split(":")[0]
+        host = Headers(scope=scope).get("host", "").split(":")[0]
 
         if host not in self.allowed_hosts:
-            return PlainTextResponse("Invalid host header", status_code=400)
+            response = PlainTextResponse("Invalid host header", status_code=400)
+            await response(scope, receive, send)
+            return
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
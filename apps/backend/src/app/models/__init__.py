@@ -2,6 +2,7 @@
 
 from src.app.models.audit_log import AuditLog
 from src.app.models.file import File
+from src.app.models.outbox import OutboxMessage
 from src.app.models.password_reset_token import PasswordResetToken
 from src.app.models.permission import Permission
 from src.app.models.role import Role
@@ -18,6 +19,7 @@ from src.app.models.user_role import user_roles
 __all__ = [
     "AuditLog",
     "File",
+    "OutboxMessage",
     "PasswordResetToken",
     "Permission",
     "Role",
@@ -0,0 +1,53 @@
+"""Relationship loader profiles.
+
+The back-references ``Role.users`` and ``Permission.roles`` are
+``lazy="raise"``: as ``selectin`` relationships, loading one user loaded its
+roles, then every user of those roles. ``User.roles`` and
+``Role.permissions`` still default to ``selectin`` so that objects refreshed
+after a write keep their collections, but queries state what they need with
+a profile:
+
+- ``auth``: a user's roles and their permissions, for authorization.
+- ``detail``: the entity's own collection (a user's roles, a role's
+  permissions), as returned by the REST endpoints.
+- ``list``: no relationships; GraphQL loads nested fields with DataLoaders.
+
+Every profile raises on anything else, back-references included; query the
+association tables to go from a role to its users.
+"""
+
+from typing import Literal
+
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.sql.base import ExecutableOption
+from src.app.models.role import Role
+from src.app.models.user import User
+
+LoadProfile = Literal["auth", "detail", "list"]
+
+
+def user_loader(profile: LoadProfile) -> list[ExecutableOption]:
+    """Get the loader options of a user query."""
+    if profile == "auth":
+        return [
+            selectinload(User.roles).selectinload(Role.permissions),
+            raiseload("*"),
+        ]
+    if profile == "detail":
+        return [selectinload(User.roles), raiseload("*")]
+    return [raiseload("*")]
+
+
+def role_loader(profile: LoadProfile) -> list[ExecutableOption]:
+    """Get the loader options of a role query."""
+    if profile in ("auth", "detail"):
+        return [selectinload(Role.permissions), raiseload("*")]
+    return [raiseload("*")]
+
+
+def permission_loader(profile: LoadProfile) -> list[ExecutableOption]:
+    """Get the loader options of a permission query.
+
+    Permissions only relate back to roles, so every profile loads nothing.
+    """
+    return [raiseload("*")]
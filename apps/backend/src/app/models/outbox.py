@@ -0,0 +1,26 @@
+"""Outbox model for messages waiting to be published to RabbitMQ."""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+from src.app.db.base import Base
+
+
+class OutboxMessage(Base):
+    """Message written with a business change, deleted once published."""
+
+    __tablename__ = "outbox"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    message_type: Mapped[str] = mapped_column(
+        String(255), comment="Import path of the BaseMessage subclass"
+    )
+    routing_key: Mapped[str] = mapped_column(String(255))
+    exchange_name: Mapped[str | None] = mapped_column(
+        String(255), nullable=True, comment="None publishes to the main exchange"
+    )
+    payload: Mapped[dict] = mapped_column(JSON)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, String, Text, func
+from sqlalchemy import DateTime, Index, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.app.db.base import Base
 
@@ -19,6 +19,7 @@ class Permission(Base):
     """
 
     __tablename__ = "permissions"
+    __table_args__ = (Index("ix_permissions_created_at_id", "created_at", "id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     code: Mapped[str] = mapped_column(String(100), unique=True, index=True)
@@ -37,9 +38,10 @@ class Permission(Base):
     )
 
     # Relationships
+    # Back-reference: never loaded implicitly, query role_permissions instead
     roles: Mapped[list["Role"]] = relationship(
         "Role",
         secondary="role_permissions",
         back_populates="permissions",
-        lazy="selectin",
+        lazy="raise",
     )
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, String, Text, func
+from sqlalchemy import Boolean, DateTime, Index, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.app.db.base import Base
 
@@ -20,6 +20,7 @@ class Role(Base):
     """
 
     __tablename__ = "roles"
+    __table_args__ = (Index("ix_roles_created_at_id", "created_at", "id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     code: Mapped[str] = mapped_column(String(50), unique=True, index=True)
@@ -43,9 +44,10 @@ class Role(Base):
         back_populates="roles",
         lazy="selectin",
     )
+    # Back-reference: never loaded implicitly, query user_roles instead
     users: Mapped[list["User"]] = relationship(
         "User",
         secondary="user_roles",
         back_populates="roles",
-        lazy="selectin",
+        lazy="raise",
     )
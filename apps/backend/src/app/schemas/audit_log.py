@@ -60,12 +60,22 @@ class AuditLogCreate(BaseModel):
 class AuditLogPaginationMeta(BaseModel):
     """Pagination metadata for audit logs."""
 
-    page: int = Field(..., description="Current page number")
+    page: int | None = Field(
+        ..., description="Current page number; null when paging by cursor"
+    )
     limit: int = Field(..., description="Number of items per page")
-    total_items: int = Field(..., description="Total number of items")
-    total_pages: int = Field(..., description="Total number of pages")
+    total_items: int | None = Field(
+        ..., description="Total number of items; null unless counted"
+    )
+    total_pages: int | None = Field(
+        ..., description="Total number of pages; null unless counted"
+    )
+    total_estimated: bool = Field(
+        False, description="Whether total_items is an estimate of a large table"
+    )
     has_next_page: bool = Field(..., description="Whether there is a next page")
     has_prev_page: bool = Field(..., description="Whether there is a previous page")
+    next_cursor: str | None = Field(None, description="Cursor of the next page")
 
 
 class PaginatedAuditLogs(BaseModel):
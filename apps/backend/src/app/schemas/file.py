@@ -95,7 +95,13 @@ class FileListResponse(BaseModel):
     """Response schema for file listing."""
 
     files: list[FileInfo] = Field(default_factory=list, description="List of files")
-    count: int = Field(..., description="Number of files returned")
+    count: int | None = Field(
+        ..., description="Total number of files; null unless counted"
+    )
+    count_estimated: bool = Field(
+        False, description="Whether count is an estimate of a large table"
+    )
+    next_cursor: str | None = Field(None, description="Cursor of the next page")
 
     model_config = {
         "json_schema_extra": {
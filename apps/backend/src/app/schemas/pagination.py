@@ -4,8 +4,7 @@ from enum import Enum
 from typing import Annotated, Generic, TypeVar
 
 from fastapi import Query
-from pydantic import BaseModel
-
+from pydantic import BaseModel, Field
 
 T = TypeVar("T")
 
@@ -22,17 +21,36 @@ class PaginationParams:
 
     def __init__(
         self,
-        page: Annotated[int, Query(ge=1, description="Page number (starts from 1)")] = 1,
+        page: Annotated[
+            int, Query(ge=1, description="Page number (starts from 1)")
+        ] = 1,
         limit: Annotated[
             int, Query(ge=1, le=100, description="Number of items to return")
         ] = 20,
         sort_by: Annotated[str, Query(description="Field to sort by")] = "created_at",
-        sort_order: Annotated[SortOrder, Query(description="Sort order")] = SortOrder.DESC,
+        sort_order: Annotated[
+            SortOrder, Query(description="Sort order")
+        ] = SortOrder.DESC,
+        cursor: Annotated[
+            str | None,
+            Query(description="next_cursor of the previous page; overrides page"),
+        ] = None,
+        include_total: Annotated[
+            bool | None,
+            Query(description="Count all items (default: only without a cursor)"),
+        ] = None,
+        exact_count: Annotated[
+            bool,
+            Query(description="Count exactly instead of a cached or estimated total"),
+        ] = False,
     ):
         self.page = page
         self.limit = limit
         self.sort_by = sort_by
         self.sort_order = sort_order
+        self.cursor = cursor
+        self.include_total = cursor is None if include_total is None else include_total
+        self.exact_count = exact_count
 
     @property
     def offset(self) -> int:
@@ -43,12 +61,16 @@ class PaginationParams:
 class PaginationMeta(BaseModel):
     """Pagination metadata."""
 
-    page: int
+    page: int | None = Field(description="Page number; null when paging by cursor")
     limit: int
-    total_items: int
-    total_pages: int
+    total_items: int | None = Field(description="Null unless the total was counted")
+    total_pages: int | None = Field(description="Null unless the total was counted")
+    total_estimated: bool = Field(
+        False, description="Whether total_items is an estimate of a large table"
+    )
     has_next_page: bool
     has_prev_page: bool
+    next_cursor: str | None = Field(None, description="Cursor of the next page")
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
@@ -79,3 +101,27 @@ def create_paginated_response(
             "has_prev_page": page > 1,
         },
     }
+
+
+def create_pagination_meta(
+    limit: int,
+    total: int | None,
+    next_cursor: str | None,
+    page: int = 1,
+    cursor: str | None = None,
+    total_estimated: bool = False,
+) -> dict:
+    """Create pagination metadata for a page or a cursor request."""
+    total_pages = None
+    if total is not None:
+        total_pages = ((total + limit - 1) // limit) if limit > 0 else 1
+    return {
+        "page": None if cursor else page,
+        "limit": limit,
+        "total_items": total,
+        "total_pages": total_pages,
+        "total_estimated": total_estimated,
+        "has_next_page": next_cursor is not None,
+        "has_prev_page": cursor is not None or page > 1,
+        "next_cursor": next_cursor,
+    }
@@ -15,11 +15,13 @@ from src.app.services.exceptions import (
     InactiveUserError,
     Invalid2FACodeError,
     InvalidCredentialsError,
+    InvalidCursorError,
     InvalidFileTypeError,
     InvalidResetTokenError,
     InvalidTokenError,
     InvalidTokenTypeError,
     InvalidVerificationTokenError,
+    PasswordHasherBusyError,
     PermissionCodeAlreadyExistsError,
     PermissionNotFoundError,
     RefreshTokenInvalidError,
@@ -39,12 +41,18 @@ from src.app.services.exceptions import (
 )
 from src.app.services.file_service import FileService
 from src.app.services.permission_service import PermissionService
+from src.app.services.principal_cache import (
+    Principal,
+    PrincipalCache,
+    principal_cache,
+)
 from src.app.services.role_service import RoleService
 from src.app.services.scheduled_task_service import ScheduledTaskService
 from src.app.services.storage_service import StorageService, storage_service
 from src.app.services.user_service import UserService
 
 __all__ = [
+    "Principal",
     # Services
     "AuditService",
     "AuthService",
@@ -52,12 +60,14 @@ __all__ = [
     "EmailService",
     "FileService",
     "PermissionService",
+    "PrincipalCache",
     "RoleService",
     "ScheduledTaskService",
     "StorageService",
     "UserService",
     # Service instances
     "email_service",
+    "principal_cache",
     "storage_service",
     # Exceptions
     "AuditLogNotFoundError",
@@ -65,10 +75,12 @@ __all__ = [
     "UserNotFoundError",
     "EmailAlreadyExistsError",
     "InvalidCredentialsError",
+    "InvalidCursorError",
     "InactiveUserError",
     "InvalidTokenError",
     "InvalidTokenTypeError",
     "RefreshTokenInvalidError",
+    "PasswordHasherBusyError",
     # Permission exceptions
     "PermissionNotFoundError",
     "PermissionCodeAlreadyExistsError",
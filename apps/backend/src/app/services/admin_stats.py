@@ -0,0 +1,288 @@
+"""Admin dashboard statistics.
+
+``query_dashboard_stats`` computes the statistics with a single aggregate
+query. With ``admin_stats_counters_enabled``, ``AdminStatsCounters`` keeps
+the same numbers in Redis instead, so the dashboard reads a few keys no
+matter how large the tables are:
+
+- A hash of running totals (users, active users, files, bytes stored),
+  adjusted by ``UserService``, ``AuthService`` and ``FileService`` after
+  each commit that adds, removes or (de)activates a row.
+- One key per day counting the users and files created that day, kept for
+  ``DAY_KEY_TTL`` seconds (long enough to sum the current week).
+
+Counters can drift, e.g. when a write fails halfway or rows change outside
+the services, so the ``admin_stats_reconcile`` task periodically replaces
+them with counts from the database. Until the first reconcile the hash has
+no ``reconciled_at`` field and reads fall back to the database.
+"""
+
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+from sqlalchemy import func, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.app.core.config import settings
+from src.app.core.redis import RedisPool
+from src.app.models import File, User
+from src.app.services.cache import KEY_PREFIX
+
+logger = logging.getLogger(__name__)
+
+TOTALS_KEY = KEY_PREFIX + "stats:admin"
+DAY_KEY_TTL = 8 * 86400
+
+
+@dataclass
+class DashboardStats:
+    """Admin dashboard statistics."""
+
+    users_total: int
+    users_active: int
+    users_new_today: int
+    users_new_this_week: int
+    files_total: int
+    files_total_size: int
+    files_uploaded_today: int
+
+
+def _period_starts(now: datetime) -> tuple[datetime, datetime]:
+    """Get the start of today and of this week (Monday), in UTC."""
+    today_start = now.astimezone(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+    return today_start, today_start - timedelta(days=today_start.weekday())
+
+
+def _day(value: datetime | date | str | None) -> date:
+    """Get the UTC day of a creation timestamp; None means today."""
+    if value is None:
+        return datetime.now(UTC).date()
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(UTC)
+        return value.date()
+    return value
+
+
+def _day_key(kind: str, day: date) -> str:
+    return f"{KEY_PREFIX}stats:{kind}:new:{day.isoformat()}"
+
+
+async def query_dashboard_stats(
+    db: AsyncSession, now: datetime | None = None
+) -> DashboardStats:
+    """Compute dashboard statistics in one round trip.
+
+    Each table is aggregated once with ``COUNT(*) FILTER (WHERE ...)``, and
+    both single-row aggregates are joined into one statement.
+    """
+    today_start, week_start = _period_starts(now or datetime.now(UTC))
+
+    users = (
+        select(
+            func.count().label("users_total"),
+            func.count().filter(User.is_active.is_(True)).label("users_active"),
+            func.count()
+            .filter(User.created_at >= today_start)
+            .label("users_new_today"),
+            func.count()
+            .filter(User.created_at >= week_start)
+            .label("users_new_this_week"),
+        )
+        .where(User.deleted_at.is_(None))
+        .subquery()
+    )
+    files = (
+        select(
+            func.count().label("files_total"),
+            func.coalesce(func.sum(File.size), 0).label("files_total_size"),
+            func.count()
+            .filter(File.created_at >= today_start)
+            .label("files_uploaded_today"),
+        )
+        .where(File.deleted_at.is_(None))
+        .subquery()
+    )
+
+    # Both sides are single rows, so join them unconditionally
+    query = select(users, files).select_from(users.join(files, true()))
+    row = (await db.execute(query)).mappings().one()
+    return DashboardStats(**{name: int(value or 0) for name, value in row.items()})
+
+
+async def _count_by_day(
+    db: AsyncSession, model: Any, since: datetime
+) -> dict[date, int]:
+    """Count live rows of ``model`` per creation day since ``since``."""
+    day = func.date(model.created_at)
+    result = await db.execute(
+        select(day, func.count())
+        .where(model.deleted_at.is_(None), model.created_at >= since)
+        .group_by(day)
+    )
+    return {_day(value): count for value, count in result.all()}
+
+
+class AdminStatsCounters:
+    """Dashboard statistics kept up to date in Redis."""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._redis: redis.Redis | None = None
+
+    async def get(self, now: datetime | None = None) -> DashboardStats | None:
+        """Read the statistics, or None if they are not available."""
+        client = self._get_redis()
+        if client is None:
+            return None
+
+        today_start, week_start = _period_starts(now or datetime.now(UTC))
+        today = today_start.date()
+        week = [week_start.date() + timedelta(days=i) for i in range(7)]
+        week = [day for day in week if day <= today]
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.hgetall(TOTALS_KEY)
+                pipe.mget([_day_key("users", day) for day in week])
+                pipe.get(_day_key("files", today))
+                totals, users_new, files_new = await pipe.execute()
+        except RedisError as e:
+            logger.warning("Failed to read admin stats counters: %s", e)
+            return None
+
+        if "reconciled_at" not in totals:
+            return None
+        users_by_day = [int(value or 0) for value in users_new]
+        return DashboardStats(
+            users_total=int(totals.get("users_total", 0)),
+            users_active=int(totals.get("users_active", 0)),
+            users_new_today=users_by_day[-1],
+            users_new_this_week=sum(users_by_day),
+            files_total=int(totals.get("files_total", 0)),
+            files_total_size=int(totals.get("files_total_size", 0)),
+            files_uploaded_today=int(files_new or 0),
+        )
+
+    async def reconcile(self, db: AsyncSession) -> DashboardStats:
+        """Replace the counters with counts from the database.
+
+        Returns:
+            The statistics counted from the database.
+        """
+        now = datetime.now(UTC)
+        stats = await query_dashboard_stats(db, now)
+
+        client = self._get_redis()
+        if client is None:
+            return stats
+
+        since = now.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(
+            days=DAY_KEY_TTL // 86400 - 1
+        )
+        users_by_day = await _count_by_day(db, User, since)
+        files_by_day = await _count_by_day(db, File, since)
+        try:
+            async with client.pipeline(transaction=True) as pipe:
+                pipe.hset(
+                    TOTALS_KEY,
+                    mapping={
+                        "users_total": stats.users_total,
+                        "users_active": stats.users_active,
+                        "files_total": stats.files_total,
+                        "files_total_size": stats.files_total_size,
+                        "reconciled_at": now.isoformat(),
+                    },
+                )
+                day = since.date()
+                while day <= now.date():
+                    for kind, counts in (
+                        ("users", users_by_day),
+                        ("files", files_by_day),
+                    ):
+                        pipe.set(
+                            _day_key(kind, day), counts.get(day, 0), ex=DAY_KEY_TTL
+                        )
+                    day += timedelta(days=1)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning("Failed to reconcile admin stats counters: %s", e)
+        return stats
+
+    async def track_users(self, *users: User, delta: int = 1) -> None:
+        """Count live users as added (``delta=1``) or removed (``delta=-1``)."""
+        active = sum(1 for user in users if user.is_active)
+        await self._apply(
+            {"users_total": delta * len(users), "users_active": delta * active},
+            "users",
+            [(_day(user.created_at), delta) for user in users],
+        )
+
+    async def track_user_activation(self, is_active: bool) -> None:
+        """Count a live user as activated or deactivated."""
+        await self._apply({"users_active": 1 if is_active else -1})
+
+    async def track_files(self, *files: Any, delta: int = 1) -> None:
+        """Count live files as added (``delta=1``) or removed (``delta=-1``).
+
+        Files may be ``File`` instances or dicts of their column values.
+        """
+
+        def value(file: Any, name: str) -> Any:
+            return file.get(name) if isinstance(file, dict) else getattr(file, name)
+
+        await self._apply(
+            {
+                "files_total": delta * len(files),
+                "files_total_size": delta * sum(value(f, "size") for f in files),
+            },
+            "files",
+            [(_day(value(f, "created_at")), delta) for f in files],
+        )
+
+    async def _apply(
+        self,
+        totals: dict[str, int],
+        kind: str | None = None,
+        days: Sequence[tuple[date, int]] = (),
+    ) -> None:
+        """Increment totals and per-day counts in one round trip."""
+        client = self._get_redis()
+        if client is None:
+            return
+
+        oldest = datetime.now(UTC).date() - timedelta(days=DAY_KEY_TTL // 86400 - 1)
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for field, amount in totals.items():
+                    if amount:
+                        pipe.hincrby(TOTALS_KEY, field, amount)
+                for day, amount in days:
+                    if kind and day >= oldest:
+                        pipe.incrby(_day_key(kind, day), amount)
+                        pipe.expire(_day_key(kind, day), DAY_KEY_TTL)
+                await pipe.execute()
+        except RedisError as e:
+            # The next reconcile corrects the drift
+            logger.warning("Failed to update admin stats counters: %s", e)
+
+    def _get_redis(self) -> redis.Redis | None:
+        """Get a client on the shared Redis pool, if enabled and initialized."""
+        if not self.enabled:
+            return None
+        try:
+            pool = RedisPool.get_pool()
+        except RuntimeError:
+            return None
+        if self._redis is None or self._redis.connection_pool is not pool:
+            self._redis = redis.Redis(connection_pool=pool)
+        return self._redis
+
+
+# Global admin stats counters instance
+admin_stats_counters = AdminStatsCounters(enabled=settings.admin_stats_counters_enabled)
@@ -3,11 +3,12 @@
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import Load, joinedload, raiseload
 from src.app.models import AuditLog
 from src.app.schemas.audit_log import AuditLogCreate, AuditLogFilter
+from src.app.services.pagination import Page, paginate
 
 
 class AuditLogNotFoundError(Exception):
@@ -22,15 +23,26 @@ class AuditService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_by_id(self, audit_log_id: UUID) -> AuditLog:
+    @staticmethod
+    def _actor_loader(include_actor: bool) -> Load:
+        """Get the loader option for the actor relationship."""
+        if include_actor:
+            return joinedload(AuditLog.actor)
+        return raiseload(AuditLog.actor)
+
+    async def get_by_id(
+        self, audit_log_id: UUID, include_actor: bool = True
+    ) -> AuditLog:
         """Get an audit log by ID.
 
         Args:
             audit_log_id: The audit log ID to look up.
+            include_actor: If False, skip loading the actor; it must then be
+                loaded explicitly (e.g. by a GraphQL DataLoader).
         """
         query = (
             select(AuditLog)
-            .options(joinedload(AuditLog.actor))
+            .options(self._actor_loader(include_actor))
             .where(AuditLog.id == audit_log_id)
         )
         result = await self.db.execute(query)
@@ -44,6 +56,7 @@ class AuditService:
         filter_params: AuditLogFilter | None = None,
         skip: int = 0,
         limit: int = 100,
+        include_actor: bool = True,
     ) -> tuple[list[AuditLog], int]:
         """List audit logs with optional filters. Returns (logs, total_count).
 
@@ -51,63 +64,72 @@ class AuditService:
             filter_params: Optional filter parameters.
             skip: Number of records to skip.
             limit: Maximum number of records to return.
+            include_actor: If False, skip loading the actor; it must then be
+                loaded explicitly (e.g. by a GraphQL DataLoader).
         """
-        # Build base query
-        base_query = select(AuditLog).options(joinedload(AuditLog.actor))
-        count_query = select(func.count()).select_from(AuditLog)
+        page = await self.paginate_logs(
+            filter_params,
+            limit=limit,
+            offset=skip,
+            include_total=True,
+            include_actor=include_actor,
+        )
+        return page.items, page.total or 0
+
+    async def paginate_logs(
+        self,
+        filter_params: AuditLogFilter | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+        offset: int = 0,
+        include_total: bool = False,
+        exact_total: bool = False,
+        include_actor: bool = True,
+    ) -> Page[AuditLog]:
+        """Get a page of audit logs with optional filters, newest first.
+
+        Args:
+            filter_params: Optional filter parameters.
+            limit: Maximum number of records to return.
+            cursor: Cursor of the previous page.
+            offset: Number of records to skip when no cursor is given.
+            include_total: If True, also count all matching audit logs.
+            exact_total: If True, count exactly instead of reusing a cached
+                total or a planner estimate.
+            include_actor: If False, skip loading the actor; it must then be
+                loaded explicitly (e.g. by a GraphQL DataLoader).
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed.
+        """
+        query = select(AuditLog)
 
         # Apply filters
         if filter_params:
             if filter_params.action:
-                base_query = base_query.where(AuditLog.action == filter_params.action)
-                count_query = count_query.where(AuditLog.action == filter_params.action)
+                query = query.where(AuditLog.action == filter_params.action)
             if filter_params.entity_type:
-                base_query = base_query.where(
-                    AuditLog.entity_type == filter_params.entity_type
-                )
-                count_query = count_query.where(
-                    AuditLog.entity_type == filter_params.entity_type
-                )
+                query = query.where(AuditLog.entity_type == filter_params.entity_type)
             if filter_params.entity_id:
-                base_query = base_query.where(
-                    AuditLog.entity_id == filter_params.entity_id
-                )
-                count_query = count_query.where(
-                    AuditLog.entity_id == filter_params.entity_id
-                )
+                query = query.where(AuditLog.entity_id == filter_params.entity_id)
             if filter_params.actor_id:
-                base_query = base_query.where(
-                    AuditLog.actor_id == filter_params.actor_id
-                )
-                count_query = count_query.where(
-                    AuditLog.actor_id == filter_params.actor_id
-                )
+                query = query.where(AuditLog.actor_id == filter_params.actor_id)
             if filter_params.start_date:
-                base_query = base_query.where(
-                    AuditLog.created_at >= filter_params.start_date
-                )
-                count_query = count_query.where(
-                    AuditLog.created_at >= filter_params.start_date
-                )
+                query = query.where(AuditLog.created_at >= filter_params.start_date)
             if filter_params.end_date:
-                base_query = base_query.where(
-                    AuditLog.created_at <= filter_params.end_date
-                )
-                count_query = count_query.where(
-                    AuditLog.created_at <= filter_params.end_date
-                )
-
-        # Get total count
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar() or 0
-
-        # Get paginated items (ordered by created_at desc)
-        result = await self.db.execute(
-            base_query.order_by(AuditLog.created_at.desc()).offset(skip).limit(limit)
-        )
-        logs = list(result.unique().scalars().all())
+                query = query.where(AuditLog.created_at <= filter_params.end_date)
 
-        return logs, total
+        return await paginate(
+            self.db,
+            query,
+            AuditLog,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            include_total=include_total,
+            exact_total=exact_total,
+            options=[self._actor_loader(include_actor)],
+        )
 
     async def get_by_entity(
         self,
@@ -115,6 +137,7 @@ class AuditService:
         entity_id: UUID,
         skip: int = 0,
         limit: int = 100,
+        include_actor: bool = True,
     ) -> tuple[list[AuditLog], int]:
         """Get audit logs for a specific entity. Returns (logs, total_count).
 
@@ -123,15 +146,18 @@ class AuditService:
             entity_id: The entity ID to filter by.
             skip: Number of records to skip.
             limit: Maximum number of records to return.
+            include_actor: If False, skip loading the actor; it must then be
+                loaded explicitly (e.g. by a GraphQL DataLoader).
         """
         filter_params = AuditLogFilter(entity_type=entity_type, entity_id=entity_id)
-        return await self.list_logs(filter_params, skip, limit)
+        return await self.list_logs(filter_params, skip, limit, include_actor)
 
     async def get_by_actor(
         self,
         actor_id: UUID,
         skip: int = 0,
         limit: int = 100,
+        include_actor: bool = True,
     ) -> tuple[list[AuditLog], int]:
         """Get audit logs for a specific actor. Returns (logs, total_count).
 
@@ -139,9 +165,11 @@ class AuditService:
             actor_id: The actor ID to filter by.
             skip: Number of records to skip.
             limit: Maximum number of records to return.
+            include_actor: If False, skip loading the actor; it must then be
+                loaded explicitly (e.g. by a GraphQL DataLoader).
         """
         filter_params = AuditLogFilter(actor_id=actor_id)
-        return await self.list_logs(filter_params, skip, limit)
+        return await self.list_logs(filter_params, skip, limit, include_actor)
 
     async def create(
         self,
@@ -16,13 +16,14 @@ from src.app.core import (
     create_access_token,
     create_refresh_token,
     decode_token,
-    get_password_hash,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
 )
 from src.app.core.audit import log_audit_from_context
 from src.app.core.config import settings
 from src.app.models import PasswordResetToken, User
 from src.app.schemas import Token, UserRegister
+from src.app.services.admin_stats import admin_stats_counters
 from src.app.services.email_service import email_service
 from src.app.services.exceptions import (
     EmailAlreadyExistsError,
@@ -104,11 +105,12 @@ class AuthService:
         user = User(
             email=user_in.email,
             name=user_in.name,
-            hashed_password=get_password_hash(user_in.password),
+            hashed_password=await hash_password_async(user_in.password),
         )
         self.db.add(user)
         await self.db.commit()
         await self.db.refresh(user)
+        await admin_stats_counters.track_users(user)
         return user
 
     async def login(
@@ -135,7 +137,7 @@ class AuthService:
         if not user or not user.hashed_password:
             raise InvalidCredentialsError("Invalid email or password")
 
-        if not verify_password(password, user.hashed_password):
+        if not await verify_password_async(password, user.hashed_password):
             raise InvalidCredentialsError("Invalid email or password")
 
         if not user.is_active:
@@ -210,18 +212,25 @@ class AuthService:
             expires_at=expires_at,
         )
         self.db.add(reset_token)
-        await self.db.commit()
 
-        # Send password reset email (via RabbitMQ if enabled, otherwise direct)
+        # Send password reset email (via the outbox if RabbitMQ is enabled,
+        # committed with the token, otherwise direct)
         if settings.rabbitmq_enabled:
-            from src.app.messaging.producer import message_producer
-
-            await message_producer.send_password_reset_email(
-                to_email=user.email,
-                reset_token=token,
-                user_name=user.name,
+            from src.app.messaging.outbox import enqueue
+            from src.app.messaging.types import PasswordResetEmailMessage
+
+            enqueue(
+                self.db,
+                PasswordResetEmailMessage(
+                    to_email=user.email,
+                    reset_token=token,
+                    user_name=user.name,
+                ),
+                "email.password_reset",
             )
-        else:
+        await self.db.commit()
+
+        if not settings.rabbitmq_enabled:
             await email_service.send_password_reset_email(
                 to_email=user.email,
                 reset_token=token,
@@ -263,7 +272,7 @@ class AuthService:
             raise UserNotFoundError("User not found")
 
         # Update password
-        user.hashed_password = get_password_hash(new_password)
+        user.hashed_password = await hash_password_async(new_password)
 
         # Mark token as used
         reset_token.used = True
@@ -307,18 +316,25 @@ class AuthService:
         # Store the hashed token
         user.email_verification_token = token_hash
         user.email_verification_expires_at = expires_at
-        await self.db.commit()
 
-        # Send verification email (via RabbitMQ if enabled, otherwise direct)
+        # Send verification email (via the outbox if RabbitMQ is enabled,
+        # committed with the token, otherwise direct)
         if settings.rabbitmq_enabled:
-            from src.app.messaging.producer import message_producer
-
-            await message_producer.send_email_verification(
-                to_email=user.email,
-                verification_token=token,
-                user_name=user.name,
+            from src.app.messaging.outbox import enqueue
+            from src.app.messaging.types import EmailVerificationMessage
+
+            enqueue(
+                self.db,
+                EmailVerificationMessage(
+                    to_email=user.email,
+                    verification_token=token,
+                    user_name=user.name,
+                ),
+                "email.verification",
             )
-        else:
+        await self.db.commit()
+
+        if not settings.rabbitmq_enabled:
             await email_service.send_email_verification(
                 to_email=user.email,
                 verification_token=token,
@@ -407,17 +423,17 @@ class AuthService:
             new_password: The new password to set
         """
         # Verify current password
-        if not user.hashed_password or not verify_password(
+        if not user.hashed_password or not await verify_password_async(
             current_password, user.hashed_password
         ):
             raise InvalidCredentialsError("Current password is incorrect")
 
         # Ensure new password is different
-        if verify_password(new_password, user.hashed_password):
+        if await verify_password_async(new_password, user.hashed_password):
             raise SamePasswordError("New password must be different from current")
 
         # Update password
-        user.hashed_password = get_password_hash(new_password)
+        user.hashed_password = await hash_password_async(new_password)
         await self.db.commit()
 
     # 2FA Methods
@@ -561,7 +577,7 @@ class AuthService:
             raise TwoFactorNotEnabledError("2FA is not enabled")
 
         # Verify password
-        if not user.hashed_password or not verify_password(
+        if not user.hashed_password or not await verify_password_async(
             password, user.hashed_password
         ):
             raise InvalidCredentialsError("Invalid password")
@@ -631,7 +647,7 @@ class AuthService:
             raise TwoFactorNotEnabledError("2FA is not enabled")
 
         # Verify password
-        if not user.hashed_password or not verify_password(
+        if not user.hashed_password or not await verify_password_async(
             password, user.hashed_password
         ):
             raise InvalidCredentialsError("Invalid password")
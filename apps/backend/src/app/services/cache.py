@@ -133,3 +133,13 @@ class CacheService:
     async def del_permissions(self, user_id: str) -> None:
         key = self._build_key("cache:permissions:{user_id}", user_id=user_id)
         await self.delete(key)
+
+    # List count operations
+    async def get_count(self, query_hash: str) -> int | None:
+        key = self._build_key("count:{query_hash}", query_hash=query_hash)
+        count = await self.get(key)
+        return int(count) if count is not None else None
+
+    async def set_count(self, query_hash: str, count: int, ttl: int) -> None:
+        key = self._build_key("count:{query_hash}", query_hash=query_hash)
+        await self.set(key, str(count), ttl)
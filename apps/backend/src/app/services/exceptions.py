@@ -11,6 +11,12 @@ class ServiceError(Exception):
     pass
 
 
+class InvalidCursorError(ServiceError):
+    """Raised when a pagination cursor is malformed."""
+
+    pass
+
+
 # User-related errors
 class UserNotFoundError(ServiceError):
     """Raised when user is not found."""
@@ -63,6 +69,12 @@ class RefreshTokenInvalidError(ServiceError):
     pass
 
 
+class PasswordHasherBusyError(ServiceError):
+    """Raised when too many password hashing calls are already queued."""
+
+    pass
+
+
 # Password reset errors
 class InvalidResetTokenError(ServiceError):
     """Raised when password reset token is invalid."""
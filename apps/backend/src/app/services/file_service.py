@@ -3,13 +3,15 @@
 import logging
 from datetime import UTC, datetime
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import func, select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.app.core.audit import log_audit_from_context
 from src.app.models import File
+from src.app.services.admin_stats import admin_stats_counters
 from src.app.services.exceptions import FileNotFoundError, HardDeleteNotAllowedError
+from src.app.services.pagination import Page, paginate
 
 logger = logging.getLogger(__name__)
 
@@ -85,29 +87,56 @@ class FileService:
             limit: Maximum number of records to return.
             include_deleted: If True, include soft-deleted files.
         """
-        # Build base query
-        base_query = select(File)
-        count_query = select(func.count()).select_from(File)
-
-        if not include_deleted:
-            base_query = base_query.where(File.deleted_at.is_(None))
-            count_query = count_query.where(File.deleted_at.is_(None))
+        page = await self.paginate_files(
+            user_id=user_id,
+            limit=limit,
+            offset=skip,
+            include_total=True,
+            include_deleted=include_deleted,
+        )
+        return page.items, page.total or 0
 
-        if user_id is not None:
-            base_query = base_query.where(File.user_id == user_id)
-            count_query = count_query.where(File.user_id == user_id)
+    async def paginate_files(
+        self,
+        user_id: UUID | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+        offset: int = 0,
+        include_total: bool = False,
+        exact_total: bool = False,
+        include_deleted: bool = False,
+    ) -> Page[File]:
+        """Get a page of files, newest first.
 
-        # Get total count
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar() or 0
+        Args:
+            user_id: Optional user ID to filter by.
+            limit: Maximum number of records to return.
+            cursor: Cursor of the previous page.
+            offset: Number of records to skip when no cursor is given.
+            include_total: If True, also count all matching files.
+            exact_total: If True, count exactly instead of reusing a cached
+                total or a planner estimate.
+            include_deleted: If True, include soft-deleted files.
 
-        # Get paginated items
-        result = await self.db.execute(
-            base_query.order_by(File.created_at.desc()).offset(skip).limit(limit)
+        Raises:
+            InvalidCursorError: If the cursor is malformed.
+        """
+        query = select(File)
+        if not include_deleted:
+            query = query.where(File.deleted_at.is_(None))
+        if user_id is not None:
+            query = query.where(File.user_id == user_id)
+
+        return await paginate(
+            self.db,
+            query,
+            File,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            include_total=include_total,
+            exact_total=exact_total,
         )
-        files = list(result.scalars().all())
-
-        return files, total
 
     async def create(
         self,
@@ -130,8 +159,7 @@ class FileService:
             file_metadata=metadata,
         )
         self.db.add(file)
-        await self.db.commit()
-        await self.db.refresh(file)
+        await self.db.flush()
 
         await self._log_audit(
             action="file.uploaded",
@@ -145,14 +173,65 @@ class FileService:
             },
         )
 
+        await self.db.commit()
+        await self.db.refresh(file)
+        await admin_stats_counters.track_files(file)
+
         return file
 
+    async def create_many(
+        self, files: list[dict[str, Any]], user_id: UUID
+    ) -> list[UUID]:
+        """Create file records for a batch upload in one statement and commit.
+
+        Args:
+            files: key, filename, size, bucket and content_type of each file.
+            user_id: The user who uploaded the files.
+
+        Returns:
+            The IDs of the new records, in order.
+        """
+        rows = [
+            {
+                "id": uuid4(),
+                "key": f["key"],
+                "filename": f["filename"],
+                "size": f["size"],
+                "bucket": f["bucket"],
+                "content_type": f.get("content_type") or "",
+                "user_id": user_id,
+            }
+            for f in files
+        ]
+        await self.db.execute(insert(File), rows)
+
+        # One audit entry for the whole batch
+        await self._log_audit(
+            action="file.batch_uploaded",
+            entity_type="File",
+            extra_metadata={
+                "user_id": str(user_id),
+                "count": len(rows),
+                "files": [
+                    {
+                        "id": str(row["id"]),
+                        "filename": row["filename"],
+                        "size": row["size"],
+                        "content_type": row["content_type"],
+                    }
+                    for row in rows
+                ],
+            },
+        )
+        await self.db.commit()
+        await admin_stats_counters.track_files(*rows)
+
+        return [row["id"] for row in rows]
+
     async def delete(self, file_id: UUID) -> None:
         """Soft delete a file record by ID."""
         file = await self.get_by_id(file_id)
         file.deleted_at = datetime.now(UTC)
-        await self.db.commit()
-
         await self._log_audit(
             action="file.deleted",
             entity_type="File",
@@ -160,14 +239,15 @@ class FileService:
             extra_metadata={"filename": file.filename, "soft_delete": True},
         )
 
+        await self.db.commit()
+        await admin_stats_counters.track_files(file, delta=-1)
+
     async def delete_by_key(self, key: str) -> None:
         """Soft delete a file record by storage key."""
         file = await self.get_by_key(key)
         if not file:
             raise FileNotFoundError(f"File with key {key} not found")
         file.deleted_at = datetime.now(UTC)
-        await self.db.commit()
-
         await self._log_audit(
             action="file.deleted",
             entity_type="File",
@@ -175,13 +255,14 @@ class FileService:
             extra_metadata={"filename": file.filename, "key": key, "soft_delete": True},
         )
 
+        await self.db.commit()
+        await admin_stats_counters.track_files(file, delta=-1)
+
     async def restore(self, file_id: UUID) -> File:
         """Restore a soft-deleted file."""
         file = await self.get_by_id(file_id, include_deleted=True)
+        was_deleted = file.deleted_at is not None
         file.deleted_at = None
-        await self.db.commit()
-        await self.db.refresh(file)
-
         await self._log_audit(
             action="file.restored",
             entity_type="File",
@@ -189,6 +270,11 @@ class FileService:
             extra_metadata={"filename": file.filename},
         )
 
+        await self.db.commit()
+        await self.db.refresh(file)
+        if was_deleted:
+            await admin_stats_counters.track_files(file)
+
         return file
 
     async def restore_by_key(self, key: str) -> File:
@@ -196,10 +282,8 @@ class FileService:
         file = await self.get_by_key(key, include_deleted=True)
         if not file:
             raise FileNotFoundError(f"File with key {key} not found")
+        was_deleted = file.deleted_at is not None
         file.deleted_at = None
-        await self.db.commit()
-        await self.db.refresh(file)
-
         await self._log_audit(
             action="file.restored",
             entity_type="File",
@@ -207,6 +291,11 @@ class FileService:
             extra_metadata={"filename": file.filename, "key": key},
         )
 
+        await self.db.commit()
+        await self.db.refresh(file)
+        if was_deleted:
+            await admin_stats_counters.track_files(file)
+
         return file
 
     async def hard_delete(self, file_id: UUID, is_super_admin: bool = False) -> None:
@@ -225,9 +314,8 @@ class FileService:
             )
         file = await self.get_by_id(file_id, include_deleted=True)
         filename = file.filename
+        was_live = file.deleted_at is None
         await self.db.delete(file)
-        await self.db.commit()
-
         await self._log_audit(
             action="file.force_deleted",
             entity_type="File",
@@ -235,6 +323,10 @@ class FileService:
             extra_metadata={"filename": filename, "hard_delete": True},
         )
 
+        await self.db.commit()
+        if was_live:
+            await admin_stats_counters.track_files(file, delta=-1)
+
     async def hard_delete_by_key(self, key: str, is_super_admin: bool = False) -> None:
         """Permanently delete a file record by key. Only allowed for super admins.
 
@@ -254,9 +346,8 @@ class FileService:
             raise FileNotFoundError(f"File with key {key} not found")
         file_id = file.id
         filename = file.filename
+        was_live = file.deleted_at is None
         await self.db.delete(file)
-        await self.db.commit()
-
         await self._log_audit(
             action="file.force_deleted",
             entity_type="File",
@@ -264,6 +355,10 @@ class FileService:
             extra_metadata={"filename": filename, "key": key, "hard_delete": True},
         )
 
+        await self.db.commit()
+        if was_live:
+            await admin_stats_counters.track_files(file, delta=-1)
+
     async def update(
         self,
         file_id: UUID,
@@ -284,9 +379,6 @@ class FileService:
             file.filename = filename
         if metadata is not None:
             file.file_metadata = metadata
-        await self.db.commit()
-        await self.db.refresh(file)
-
         await self._log_audit(
             action="file.updated",
             entity_type="File",
@@ -297,6 +389,9 @@ class FileService:
             },
         )
 
+        await self.db.commit()
+        await self.db.refresh(file)
+
         return file
 
     async def delete_by_ids(
@@ -311,6 +406,7 @@ class FileService:
         successful = 0
         failed = 0
         errors: list[str] = []
+        deleted: list[File] = []
 
         for file_id in file_ids:
             try:
@@ -321,10 +417,13 @@ class FileService:
                     errors.append(f"file {file_id}: access denied")
                     continue
                 file.deleted_at = datetime.now(UTC)
+                deleted.append(file)
                 successful += 1
             except FileNotFoundError:
                 failed += 1
                 errors.append(f"file {file_id}: not found")
 
         await self.db.commit()
+        if deleted:
+            await admin_stats_counters.track_files(*deleted, delta=-1)
         return successful, failed, errors
@@ -0,0 +1,263 @@
+"""Keyset (cursor) pagination for list queries.
+
+Pages are ordered by ``(created_at, id)`` and each page after the first
+starts where the previous one ended, so reading page 1000 costs the same
+as reading page 1, and rows inserted meanwhile neither repeat nor get
+skipped. Cursors are opaque to clients: the base64-encoded sort key of the
+last row of a page.
+
+Totals are the expensive part of a page, so unless an exact count is asked
+for they are served from a short-lived Redis cache and, on PostgreSQL, large
+unfiltered tables report the planner's row estimate instead. Filtered
+queries are always counted, as the planner's guess for them (e.g. an
+``ILIKE`` search) can be off by orders of magnitude.
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+import logging
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+from sqlalchemy import (
+    BigInteger,
+    Select,
+    cast,
+    column,
+    func,
+    select,
+    table,
+    tuple_,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.base import ExecutableOption
+from src.app.core.config import settings
+from src.app.core.redis import RedisPool
+from src.app.services.cache import CacheService
+from src.app.services.exceptions import InvalidCursorError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Page[T]:
+    """A page of results."""
+
+    items: list[T]
+    next_cursor: str | None
+    total: int | None = None
+    # Whether total is the planner's estimate rather than a count
+    total_estimated: bool = False
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+def encode_cursor(created_at: datetime, id: Any) -> str:
+    """Encode the sort key of a row as an opaque cursor."""
+    raw = json.dumps([created_at.isoformat(), str(id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, model: Any) -> tuple[datetime, Any]:
+    """Decode a cursor into the sort key of a row of ``model``.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, id = json.loads(raw)
+        return datetime.fromisoformat(created_at), model.id.type.python_type(id)
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+
+def _timestamp(db: AsyncSession) -> Callable[[Any], Any]:
+    """Get the expression comparing ``created_at`` values consistently."""
+    if db.bind.dialect.name == "sqlite":
+        # SQLite compares timestamps as text, and CURRENT_TIMESTAMP defaults
+        # are stored without the fractional seconds bound parameters carry
+        return func.julianday
+    return lambda value: value
+
+
+class CountCache:
+    """Short-lived Redis cache of list totals, keyed by the count query."""
+
+    def __init__(self, ttl: int = 30):
+        self.ttl = ttl
+        self._redis: redis.Redis | None = None
+
+    @staticmethod
+    def key(db: AsyncSession, count_query: Select, model: Any) -> str:
+        """Get the cache key of a count query, including its parameters."""
+        compiled = count_query.compile(dialect=db.bind.dialect)
+        digest = hashlib.sha256(f"{compiled}|{compiled.params!r}".encode())
+        return f"{model.__tablename__}:{digest.hexdigest()}"
+
+    async def get(self, key: str) -> int | None:
+        """Get a cached total, if any."""
+        cache = self._get_cache_service()
+        if cache is None:
+            return None
+        try:
+            return await cache.get_count(key)
+        except RedisError as e:
+            logger.warning("Failed to read cached count: %s", e)
+            return None
+
+    async def set(self, key: str, count: int) -> None:
+        """Cache a total for ``ttl`` seconds."""
+        cache = self._get_cache_service()
+        if cache is None:
+            return
+        try:
+            await cache.set_count(key, count, self.ttl)
+        except RedisError as e:
+            logger.warning("Failed to cache count: %s", e)
+
+    def _get_redis(self) -> redis.Redis | None:
+        """Get a client on the shared Redis pool, if it is initialized."""
+        try:
+            pool = RedisPool.get_pool()
+        except RuntimeError:
+            return None
+        if self._redis is None or self._redis.connection_pool is not pool:
+            self._redis = redis.Redis(connection_pool=pool)
+        return self._redis
+
+    def _get_cache_service(self) -> CacheService | None:
+        if self.ttl <= 0:
+            return None
+        client = self._get_redis()
+        return CacheService(client) if client is not None else None
+
+
+# Global count cache instance
+count_cache = CountCache(ttl=settings.pagination_count_cache_ttl)
+
+
+def _is_unfiltered(query: Select, model: Any) -> bool:
+    """Check whether ``query`` selects every row, or every row not deleted."""
+    where = query.whereclause
+    if where is None:
+        return True
+    deleted_at = getattr(model, "deleted_at", None)
+    return deleted_at is not None and where.compare(deleted_at.is_(None))
+
+
+async def estimate_rows(db: AsyncSession, query: Select, model: Any) -> int | None:
+    """Get the PostgreSQL table statistics' row count of an unfiltered query.
+
+    Only queries without filters besides the soft-delete one are estimated,
+    from ``pg_class``. Returns None for others, on other databases, or below
+    ``pagination_estimate_threshold`` rows, where an exact count is cheap.
+    """
+    if db.bind.dialect.name != "postgresql" or not _is_unfiltered(query, model):
+        return None
+
+    # A SELECT construct rather than raw SQL, so it may use a replica
+    estimate = await db.scalar(
+        select(cast(column("reltuples"), BigInteger))
+        .select_from(table("pg_class"))
+        .where(column("oid") == func.to_regclass(model.__tablename__))
+    )
+    if estimate is None or estimate < settings.pagination_estimate_threshold:
+        return None
+    return int(estimate)
+
+
+async def count_rows(
+    db: AsyncSession, query: Select, model: Any, exact: bool = False
+) -> int:
+    """Count the rows matched by ``query``.
+
+    Args:
+        db: Database session.
+        query: Select of ``model`` with its filters applied.
+        model: Model the query selects.
+        exact: If True, always run COUNT(*). Otherwise a recently cached
+            total may be returned instead.
+    """
+    count_query = query.with_only_columns(func.count(), maintain_column_froms=True)
+    key = CountCache.key(db, count_query, model)
+
+    if not exact:
+        total = await count_cache.get(key)
+        if total is not None:
+            return total
+    total = (await db.execute(count_query)).scalar() or 0
+
+    await count_cache.set(key, total)
+    return total
+
+
+async def paginate[T](
+    db: AsyncSession,
+    query: Select[tuple[T]],
+    model: Any,
+    limit: int,
+    cursor: str | None = None,
+    offset: int = 0,
+    descending: bool = True,
+    include_total: bool = False,
+    exact_total: bool = False,
+    options: Sequence[ExecutableOption] = (),
+) -> Page[T]:
+    """Get a page of ``query`` ordered by ``(created_at, id)``.
+
+    Args:
+        db: Database session.
+        query: Select of ``model`` with its filters applied.
+        model: Model with ``created_at`` and ``id`` columns.
+        limit: Maximum number of items to return.
+        cursor: ``next_cursor`` of the previous page; ``offset`` is ignored
+            when set.
+        offset: Number of items to skip, for clients still using page numbers.
+        descending: Newest first if True, oldest first otherwise.
+        include_total: If True, also count all matching rows.
+        exact_total: If True, the count is never cached or estimated.
+            Otherwise large unfiltered tables are estimated, see
+            ``estimate_rows``.
+        options: Loader options for the items.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed.
+    """
+    total = None
+    estimated = False
+    if include_total:
+        if not exact_total:
+            total = await estimate_rows(db, query, model)
+            estimated = total is not None
+        if total is None:
+            total = await count_rows(db, query, model, exact=exact_total)
+
+    timestamp = _timestamp(db)
+    key = tuple_(timestamp(model.created_at), model.id)
+    if cursor is not None:
+        after_created_at, after_id = decode_cursor(cursor, model)
+        after = tuple_(timestamp(after_created_at), after_id)
+        query = query.where(key < after if descending else key > after)
+    elif offset:
+        query = query.offset(offset)
+
+    order = [column.desc() if descending else column.asc() for column in key.clauses]
+    query = query.options(*options).order_by(*order).limit(limit + 1)
+    items = list((await db.execute(query)).unique().scalars().all())
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+    return Page(
+        items=items, next_cursor=next_cursor, total=total, total_estimated=estimated
+    )
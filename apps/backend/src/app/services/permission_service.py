@@ -2,15 +2,21 @@
 
 from datetime import UTC, datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.app.models import Permission
+from src.app.models.loading import permission_loader
 from src.app.schemas.permission import PermissionCreate, PermissionUpdate
 from src.app.services.exceptions import (
     HardDeleteNotAllowedError,
     PermissionCodeAlreadyExistsError,
     PermissionNotFoundError,
 )
+from src.app.services.pagination import Page, paginate
+from src.app.services.principal_cache import (
+    principal_cache,
+    users_with_permission,
+)
 
 
 class PermissionService:
@@ -20,7 +26,9 @@ class PermissionService:
         self.db = db
 
     async def get_by_id(
-        self, permission_id: int, include_deleted: bool = False
+        self,
+        permission_id: int,
+        include_deleted: bool = False,
     ) -> Permission:
         """Get a permission by ID.
 
@@ -31,6 +39,7 @@ class PermissionService:
         query = select(Permission).where(Permission.id == permission_id)
         if not include_deleted:
             query = query.where(Permission.deleted_at.is_(None))
+        query = query.options(*permission_loader("list"))
         result = await self.db.execute(query)
         permission = result.scalar_one_or_none()
         if not permission:
@@ -71,7 +80,10 @@ class PermissionService:
         return result.scalar_one_or_none()
 
     async def list_permissions(
-        self, skip: int = 0, limit: int = 10, include_deleted: bool = False
+        self,
+        skip: int = 0,
+        limit: int = 10,
+        include_deleted: bool = False,
     ) -> tuple[list[Permission], int]:
         """List permissions with pagination. Returns (permissions, total_count).
 
@@ -80,23 +92,53 @@ class PermissionService:
             limit: Maximum number of records to return.
             include_deleted: If True, include soft-deleted permissions.
         """
-        # Build base query with soft delete filter
-        base_query = select(Permission)
-        count_query = select(func.count()).select_from(Permission)
-
-        if not include_deleted:
-            base_query = base_query.where(Permission.deleted_at.is_(None))
-            count_query = count_query.where(Permission.deleted_at.is_(None))
+        page = await self.paginate_permissions(
+            limit=limit,
+            offset=skip,
+            include_total=True,
+            include_deleted=include_deleted,
+        )
+        return page.items, page.total or 0
+
+    async def paginate_permissions(
+        self,
+        limit: int = 10,
+        cursor: str | None = None,
+        offset: int = 0,
+        include_total: bool = False,
+        exact_total: bool = False,
+        include_deleted: bool = False,
+    ) -> Page[Permission]:
+        """Get a page of permissions, oldest first.
 
-        # Get total count
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar() or 0
+        Args:
+            limit: Maximum number of records to return.
+            cursor: Cursor of the previous page.
+            offset: Number of records to skip when no cursor is given.
+            include_total: If True, also count all permissions.
+            exact_total: If True, count exactly instead of reusing a cached
+                total or a planner estimate.
+            include_deleted: If True, include soft-deleted permissions.
 
-        # Get paginated items
-        result = await self.db.execute(base_query.offset(skip).limit(limit))
-        permissions = list(result.scalars().all())
+        Raises:
+            InvalidCursorError: If the cursor is malformed.
+        """
+        query = select(Permission)
+        if not include_deleted:
+            query = query.where(Permission.deleted_at.is_(None))
 
-        return permissions, total
+        return await paginate(
+            self.db,
+            query,
+            Permission,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            descending=False,
+            include_total=include_total,
+            exact_total=exact_total,
+            options=permission_loader("list"),
+        )
 
     def _parse_code(self, code: str) -> tuple[str, str]:
         """Parse permission code into resource and action.
@@ -157,6 +199,9 @@ class PermissionService:
             setattr(permission, field, value)
 
         await self.db.commit()
+        await principal_cache.invalidate(
+            *await users_with_permission(self.db, permission_id)
+        )
         await self.db.refresh(permission)
         return permission
 
@@ -191,5 +236,7 @@ class PermissionService:
                 "Hard delete is only allowed for super admins"
             )
         permission = await self.get_by_id(permission_id, include_deleted=True)
+        user_ids = await users_with_permission(self.db, permission_id)
         await self.db.delete(permission)
         await self.db.commit()
+        await principal_cache.invalidate(*user_ids)
@@ -0,0 +1,247 @@
+"""Two-tier cache of authenticated user snapshots (principals).
+
+Authorization checks only need a user's id, active flag, role codes and
+permission codes. Loading them on every request takes the user row plus its
+roles and permissions (the ``auth`` loader profile), so the snapshot is
+cached instead:
+
+- L1: in-process LRU keyed by ``(user_id, token_id)`` with a short TTL.
+- L2: Redis, through the existing ``CacheService`` user/permission keys, so
+  workers share snapshots after one of them has loaded a user.
+
+Writes that change a user's status, roles or a role's permissions must call
+``invalidate`` after committing. Other workers' L1 entries expire after
+``principal_cache_ttl`` seconds.
+"""
+
+import logging
+import time
+import uuid
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.app.core.config import settings
+from src.app.core.redis import RedisPool
+from src.app.models import Permission, Role, User, role_permissions, user_roles
+from src.app.services.cache import CacheService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """Compact, immutable snapshot of an authenticated user."""
+
+    id: uuid.UUID
+    is_active: bool
+    role_codes: frozenset[str]
+    permission_codes: frozenset[str]
+
+    def has_role(self, role_code: str) -> bool:
+        """Check if the principal has a role."""
+        return role_code in self.role_codes
+
+    def has_permission(self, permission_code: str) -> bool:
+        """Check if the principal has a permission through any of its roles."""
+        return permission_code in self.permission_codes
+
+
+async def load_principal(db: AsyncSession, user_id: uuid.UUID) -> Principal | None:
+    """Load a principal from the database.
+
+    Reads only the columns the snapshot needs, without loading ORM
+    relationships. Returns None if the user does not exist.
+    """
+    result = await db.execute(select(User.is_active).where(User.id == user_id))
+    is_active = result.scalar_one_or_none()
+    if is_active is None:
+        return None
+
+    result = await db.execute(
+        select(Role.code, Permission.code)
+        .select_from(user_roles)
+        .join(Role, Role.id == user_roles.c.role_id)
+        .outerjoin(role_permissions, role_permissions.c.role_id == Role.id)
+        .outerjoin(Permission, Permission.id == role_permissions.c.permission_id)
+        .where(user_roles.c.user_id == user_id)
+    )
+    rows = result.all()
+
+    return Principal(
+        id=user_id,
+        is_active=is_active,
+        role_codes=frozenset(role_code for role_code, _ in rows),
+        permission_codes=frozenset(code for _, code in rows if code is not None),
+    )
+
+
+async def users_with_role(db: AsyncSession, role_id: int) -> list[uuid.UUID]:
+    """Get the IDs of users assigned to a role."""
+    result = await db.execute(
+        select(user_roles.c.user_id).where(user_roles.c.role_id == role_id)
+    )
+    return list(result.scalars().all())
+
+
+async def users_with_permission(
+    db: AsyncSession, permission_id: int
+) -> list[uuid.UUID]:
+    """Get the IDs of users granted a permission through any role."""
+    result = await db.execute(
+        select(user_roles.c.user_id)
+        .join(role_permissions, role_permissions.c.role_id == user_roles.c.role_id)
+        .where(role_permissions.c.permission_id == permission_id)
+        .distinct()
+    )
+    return list(result.scalars().all())
+
+
+class PrincipalCache:
+    """In-process LRU of principals backed by the Redis user cache."""
+
+    def __init__(self, max_size: int = 10000, ttl: int = 30):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[uuid.UUID, str], tuple[float, Principal]] = (
+            OrderedDict()
+        )
+        self._keys_by_user: dict[uuid.UUID, set[tuple[uuid.UUID, str]]] = defaultdict(
+            set
+        )
+        self._redis: redis.Redis | None = None
+
+    def reset(self) -> None:
+        """Clear the in-process tier. Useful for testing."""
+        self._entries.clear()
+        self._keys_by_user.clear()
+
+    async def get(
+        self, db: AsyncSession, user_id: uuid.UUID, token_id: str = ""
+    ) -> Principal | None:
+        """Get the principal for a user, loading it on a miss.
+
+        Args:
+            db: Session used only when both cache tiers miss.
+            user_id: The authenticated user's ID.
+            token_id: The token's ``jti`` (or ``iat``), so each token gets its
+                own entry and a freshly issued token never sees an older one.
+        """
+        if not settings.principal_cache_enabled:
+            return await load_principal(db, user_id)
+
+        key = (user_id, token_id)
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, principal = entry
+            if expires_at > now:
+                self._entries.move_to_end(key)
+                return principal
+            self._remove(key)
+
+        principal = await self._get_shared(user_id)
+        if principal is None:
+            principal = await load_principal(db, user_id)
+            if principal is None:
+                return None
+            await self._set_shared(principal)
+
+        self._put(key, principal, now)
+        return principal
+
+    async def invalidate(self, *user_ids: uuid.UUID) -> None:
+        """Drop cached principals for users in both tiers."""
+        for user_id in user_ids:
+            for key in self._keys_by_user.pop(user_id, ()):
+                self._entries.pop(key, None)
+
+        cache = self._get_cache_service()
+        if cache is None:
+            return
+        try:
+            for user_id in user_ids:
+                await cache.del_user(str(user_id))
+                await cache.del_permissions(str(user_id))
+        except RedisError as e:
+            logger.warning("Failed to invalidate cached principals: %s", e)
+
+    def _put(self, key: tuple[uuid.UUID, str], principal: Principal, now: float):
+        """Store a principal in the in-process tier, evicting the LRU entry."""
+        self._entries[key] = (now + self.ttl, principal)
+        self._entries.move_to_end(key)
+        self._keys_by_user[key[0]].add(key)
+        while len(self._entries) > self.max_size:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    def _remove(self, key: tuple[uuid.UUID, str]) -> None:
+        """Remove an in-process entry and its user index."""
+        self._entries.pop(key, None)
+        keys = self._keys_by_user.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[key[0]]
+
+    def _get_cache_service(self) -> CacheService | None:
+        """Get a cache service on the shared Redis pool, if it is initialized."""
+        try:
+            pool = RedisPool.get_pool()
+        except RuntimeError:
+            return None
+        if self._redis is None or self._redis.connection_pool is not pool:
+            self._redis = redis.Redis(connection_pool=pool)
+        return CacheService(self._redis)
+
+    async def _get_shared(self, user_id: uuid.UUID) -> Principal | None:
+        """Read a principal from the Redis tier."""
+        cache = self._get_cache_service()
+        if cache is None:
+            return None
+        try:
+            user_data = await cache.get_user(str(user_id))
+            if user_data is None:
+                return None
+            permissions = await cache.get_permissions(str(user_id))
+        except RedisError as e:
+            logger.warning("Failed to read cached principal: %s", e)
+            return None
+        if permissions is None:
+            return None
+
+        return Principal(
+            id=user_id,
+            is_active=user_data["is_active"],
+            role_codes=frozenset(user_data["roles"]),
+            permission_codes=frozenset(permissions),
+        )
+
+    async def _set_shared(self, principal: Principal) -> None:
+        """Write a principal to the Redis tier."""
+        cache = self._get_cache_service()
+        if cache is None:
+            return
+        user_id = str(principal.id)
+        try:
+            await cache.set_user(
+                user_id,
+                {
+                    "id": user_id,
+                    "is_active": principal.is_active,
+                    "roles": sorted(principal.role_codes),
+                },
+            )
+            await cache.set_permissions(user_id, sorted(principal.permission_codes))
+        except RedisError as e:
+            logger.warning("Failed to cache principal: %s", e)
+
+
+# Global principal cache instance
+principal_cache = PrincipalCache(
+    max_size=settings.principal_cache_max_size,
+    ttl=settings.principal_cache_ttl,
+)
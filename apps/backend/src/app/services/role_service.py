@@ -4,11 +4,11 @@ import logging
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 from src.app.core.audit import log_audit_from_context
 from src.app.models import Permission, Role
+from src.app.models.loading import role_loader
 from src.app.schemas.role import RoleCreate, RoleUpdate
 from src.app.services.exceptions import (
     HardDeleteNotAllowedError,
@@ -17,6 +17,8 @@ from src.app.services.exceptions import (
     RoleNotFoundError,
     SystemRoleModificationError,
 )
+from src.app.services.pagination import Page, paginate
+from src.app.services.principal_cache import principal_cache, users_with_role
 
 logger = logging.getLogger(__name__)
 
@@ -64,8 +66,7 @@ class RoleService:
         query = select(Role).where(Role.id == role_id)
         if not include_deleted:
             query = query.where(Role.deleted_at.is_(None))
-        if include_permissions:
-            query = query.options(selectinload(Role.permissions))
+        query = query.options(*role_loader("detail" if include_permissions else "list"))
 
         result = await self.db.execute(query)
         role = result.scalar_one_or_none()
@@ -76,7 +77,9 @@ class RoleService:
         return role
 
     async def get_by_code(
-        self, code: str, include_deleted: bool = False
+        self,
+        code: str,
+        include_deleted: bool = False,
     ) -> Role | None:
         """Get a role by code.
 
@@ -87,11 +90,14 @@ class RoleService:
         query = select(Role).where(Role.code == code)
         if not include_deleted:
             query = query.where(Role.deleted_at.is_(None))
+        query = query.options(*role_loader("list"))
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
     async def get_by_name(
-        self, name: str, include_deleted: bool = False
+        self,
+        name: str,
+        include_deleted: bool = False,
     ) -> Role | None:
         """Get a role by name.
 
@@ -102,6 +108,7 @@ class RoleService:
         query = select(Role).where(Role.name == name)
         if not include_deleted:
             query = query.where(Role.deleted_at.is_(None))
+        query = query.options(*role_loader("list"))
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
@@ -120,27 +127,56 @@ class RoleService:
             include_deleted: If True, include soft-deleted roles.
             include_permissions: If True, eagerly load permissions.
         """
-        # Build base query with soft delete filter
-        base_query = select(Role)
-        count_query = select(func.count()).select_from(Role)
-
-        if not include_deleted:
-            base_query = base_query.where(Role.deleted_at.is_(None))
-            count_query = count_query.where(Role.deleted_at.is_(None))
+        page = await self.paginate_roles(
+            limit=limit,
+            offset=skip,
+            include_total=True,
+            include_deleted=include_deleted,
+            include_permissions=include_permissions,
+        )
+        return page.items, page.total or 0
 
-        # Get total count
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar() or 0
+    async def paginate_roles(
+        self,
+        limit: int = 10,
+        cursor: str | None = None,
+        offset: int = 0,
+        include_total: bool = False,
+        exact_total: bool = False,
+        include_deleted: bool = False,
+        include_permissions: bool = False,
+    ) -> Page[Role]:
+        """Get a page of roles, oldest first.
 
-        # Get paginated items
-        query = base_query.offset(skip).limit(limit)
-        if include_permissions:
-            query = query.options(selectinload(Role.permissions))
+        Args:
+            limit: Maximum number of records to return.
+            cursor: Cursor of the previous page.
+            offset: Number of records to skip when no cursor is given.
+            include_total: If True, also count all roles.
+            exact_total: If True, count exactly instead of reusing a cached
+                total or a planner estimate.
+            include_deleted: If True, include soft-deleted roles.
+            include_permissions: If True, eagerly load permissions.
 
-        result = await self.db.execute(query)
-        roles = list(result.scalars().all())
+        Raises:
+            InvalidCursorError: If the cursor is malformed.
+        """
+        query = select(Role)
+        if not include_deleted:
+            query = query.where(Role.deleted_at.is_(None))
 
-        return roles, total
+        return await paginate(
+            self.db,
+            query,
+            Role,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            descending=False,
+            include_total=include_total,
+            exact_total=exact_total,
+            options=role_loader("detail" if include_permissions else "list"),
+        )
 
     async def _get_permissions_by_ids(
         self, permission_ids: list[int]
@@ -185,9 +221,6 @@ class RoleService:
         await self.db.refresh(role, ["permissions"])
         role.permissions = permissions
 
-        await self.db.commit()
-        await self.db.refresh(role, ["permissions"])
-
         await self._log_audit(
             action="role.created",
             entity_type="Role",
@@ -195,6 +228,9 @@ class RoleService:
             extra_metadata={"code": role.code, "name": role.name},
         )
 
+        await self.db.commit()
+        await self.db.refresh(role, ["permissions"])
+
         return role
 
     async def update(self, role_id: int, role_in: RoleUpdate) -> Role:
@@ -232,9 +268,6 @@ class RoleService:
             permissions = await self._get_permissions_by_ids(role_in.permission_ids)
             role.permissions = permissions
 
-        await self.db.commit()
-        await self.db.refresh(role)
-
         await self._log_audit(
             action="role.updated",
             entity_type="Role",
@@ -245,6 +278,10 @@ class RoleService:
             },
         )
 
+        await self.db.commit()
+        await principal_cache.invalidate(*await users_with_role(self.db, role_id))
+        await self.db.refresh(role)
+
         return role
 
     async def delete(self, role_id: int) -> None:
@@ -258,8 +295,6 @@ class RoleService:
             )
 
         role.deleted_at = datetime.now(UTC)
-        await self.db.commit()
-
         await self._log_audit(
             action="role.deleted",
             entity_type="Role",
@@ -267,13 +302,12 @@ class RoleService:
             extra_metadata={"code": role.code, "soft_delete": True},
         )
 
+        await self.db.commit()
+
     async def restore(self, role_id: int) -> Role:
         """Restore a soft-deleted role."""
         role = await self.get_by_id(role_id, include_deleted=True)
         role.deleted_at = None
-        await self.db.commit()
-        await self.db.refresh(role)
-
         await self._log_audit(
             action="role.restored",
             entity_type="Role",
@@ -281,6 +315,9 @@ class RoleService:
             extra_metadata={"code": role.code},
         )
 
+        await self.db.commit()
+        await self.db.refresh(role)
+
         return role
 
     async def hard_delete(self, role_id: int, is_super_admin: bool = False) -> None:
@@ -307,9 +344,8 @@ class RoleService:
             )
 
         role_code = role.code
+        user_ids = await users_with_role(self.db, role_id)
         await self.db.delete(role)
-        await self.db.commit()
-
         await self._log_audit(
             action="role.force_deleted",
             entity_type="Role",
@@ -317,6 +353,9 @@ class RoleService:
             extra_metadata={"code": role_code, "hard_delete": True},
         )
 
+        await self.db.commit()
+        await principal_cache.invalidate(*user_ids)
+
     async def add_permission(self, role_id: int, permission_id: int) -> Role:
         """Add a permission to a role."""
         role = await self.get_by_id(role_id, include_permissions=True)
@@ -341,9 +380,6 @@ class RoleService:
         # Add if not already present
         if permission not in role.permissions:
             role.permissions.append(permission)
-            await self.db.commit()
-            await self.db.refresh(role, ["permissions"])
-
             await self._log_audit(
                 action="permission.granted",
                 entity_type="Role",
@@ -354,6 +390,10 @@ class RoleService:
                 },
             )
 
+            await self.db.commit()
+            await principal_cache.invalidate(*await users_with_role(self.db, role_id))
+            await self.db.refresh(role, ["permissions"])
+
         return role
 
     async def remove_permission(self, role_id: int, permission_id: int) -> Role:
@@ -373,9 +413,6 @@ class RoleService:
 
         # Find and remove the permission
         role.permissions = [p for p in role.permissions if p.id != permission_id]
-        await self.db.commit()
-        await self.db.refresh(role, ["permissions"])
-
         if removed_permission:
             await self._log_audit(
                 action="permission.revoked",
@@ -387,6 +424,10 @@ class RoleService:
                 },
             )
 
+        await self.db.commit()
+        await principal_cache.invalidate(*await users_with_role(self.db, role_id))
+        await self.db.refresh(role, ["permissions"])
+
         return role
 
     async def assign_permissions(self, role_id: int, permission_ids: list[int]) -> Role:
@@ -403,9 +444,6 @@ class RoleService:
         permissions = await self._get_permissions_by_ids(permission_ids)
         role.permissions = permissions
 
-        await self.db.commit()
-        await self.db.refresh(role, ["permissions"])
-
         await self._log_audit(
             action="permissions.replaced",
             entity_type="Role",
@@ -416,4 +454,8 @@ class RoleService:
             },
         )
 
+        await self.db.commit()
+        await principal_cache.invalidate(*await users_with_role(self.db, role_id))
+        await self.db.refresh(role, ["permissions"])
+
         return role
@@ -1,12 +1,19 @@
 """S3-compatible storage service for file operations."""
 
+import asyncio
+import contextlib
+import logging
 import os
+import time
 import uuid
-from contextlib import asynccontextmanager
+from collections import OrderedDict
+from collections.abc import Iterable
+from contextlib import AsyncExitStack, asynccontextmanager
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, Protocol
 
 import aioboto3
+from aiobotocore.config import AioConfig
 from botocore.exceptions import ClientError
 from src.app.core.config import settings
 from src.app.services.exceptions import (
@@ -17,12 +24,94 @@ from src.app.services.exceptions import (
     StorageError,
 )
 
+logger = logging.getLogger(__name__)
+
+
+class AsyncReadable(Protocol):
+    """An async file-like object, such as FastAPI's ``UploadFile``."""
+
+    async def read(self, size: int = -1) -> bytes: ...
+
+
+async def _read_chunk(stream: AsyncReadable, size: int) -> bytes:
+    """Read up to ``size`` bytes, stopping short only at the end of the stream."""
+    chunk = await stream.read(size)
+    if len(chunk) in (0, size):
+        return chunk
+    buffer = bytearray(chunk)
+    while len(buffer) < size:
+        chunk = await stream.read(size - len(buffer))
+        if not chunk:
+            break
+        buffer += chunk
+    return bytes(buffer)
+
+
+class PresignedUrlCache:
+    """LRU of presigned URLs, handed out again while most of their life remains.
+
+    Entries are keyed by (key, method, expires_in, window) where ``window`` is
+    the current time divided into slots of ``min(ttl, expires_in / 10)``
+    seconds, so a cached URL always has at least 90% of its lifetime left.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: int = 300):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[str, str, int, int], str] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def reset(self) -> None:
+        """Clear the cache. Useful for testing."""
+        self._entries.clear()
+
+    def get(self, key: str, method: str, expires_in: int) -> str | None:
+        """Get a cached URL that is still valid for most of ``expires_in``."""
+        cache_key = self._cache_key(key, method, expires_in)
+        if cache_key is None:
+            return None
+        url = self._entries.get(cache_key)
+        if url is not None:
+            self._entries.move_to_end(cache_key)
+        return url
+
+    def put(self, key: str, method: str, expires_in: int, url: str) -> None:
+        """Cache a URL just signed for ``expires_in`` seconds."""
+        cache_key = self._cache_key(key, method, expires_in)
+        if cache_key is None or self.max_size <= 0:
+            return
+        self._entries[cache_key] = url
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _cache_key(
+        self, key: str, method: str, expires_in: int
+    ) -> tuple[str, str, int, int] | None:
+        window = min(self.ttl, expires_in // 10)
+        if window < 1:
+            return None
+        return key, method, expires_in, int(time.time() // window)
+
 
 class StorageService:
-    """Service for S3-compatible storage operations."""
+    """Service for S3-compatible storage operations.
+
+    Call ``start()`` (done by the app lifespan) to share one client, and its
+    HTTP connection pool, across all operations. Until then, each operation
+    opens its own client.
+    """
 
     def __init__(self) -> None:
         self._session = aioboto3.Session()
+        self._client: Any = None
+        self._exit_stack: AsyncExitStack | None = None
+        self.presigned_urls = PresignedUrlCache(
+            max_size=settings.s3_presigned_url_cache_size,
+            ttl=settings.s3_presigned_url_cache_ttl,
+        )
 
     def _get_client_config(self) -> dict[str, Any]:
         """Get boto3 client configuration."""
@@ -39,22 +128,59 @@ class StorageService:
         if not settings.s3_use_ssl:
             config["use_ssl"] = False
 
+        config["config"] = AioConfig(
+            max_pool_connections=settings.s3_max_pool_connections,
+            connector_args={"keepalive_timeout": settings.s3_keepalive_timeout},
+        )
+
         return config
 
+    async def start(self) -> None:
+        """Open the shared client."""
+        if self._client is not None:
+            return
+        exit_stack = AsyncExitStack()
+        self._client = await exit_stack.enter_async_context(
+            self._session.client(**self._get_client_config())
+        )
+        self._exit_stack = exit_stack
+        logger.info(
+            "S3 client started: max_pool_connections=%d, keepalive_timeout=%ss",
+            settings.s3_max_pool_connections,
+            settings.s3_keepalive_timeout,
+        )
+
+    async def close(self) -> None:
+        """Close the shared client and its connections."""
+        exit_stack, self._exit_stack = self._exit_stack, None
+        self._client = None
+        if exit_stack is not None:
+            await exit_stack.aclose()
+
     @asynccontextmanager
     async def _get_client(self):
         """Get S3 client context manager."""
+        if self._client is not None:
+            yield self._client
+            return
         async with self._session.client(**self._get_client_config()) as client:
             yield client
 
     def _validate_file(self, filename: str, file_size: int) -> None:
         """Validate file before upload."""
+        self._validate_size(file_size)
+        self._validate_extension(filename)
+
+    def _validate_size(self, file_size: int) -> None:
+        """Validate the size of a file, or of the part of it read so far."""
         if file_size > settings.s3_max_file_size:
             raise FileTooLargeError(
                 f"File size {file_size} exceeds maximum allowed size "
                 f"{settings.s3_max_file_size}"
             )
 
+    def _validate_extension(self, filename: str) -> None:
+        """Validate the type of a file from its name."""
         ext = os.path.splitext(filename)[1].lower()
         if ext not in settings.s3_allowed_extensions:
             raise InvalidFileTypeError(
@@ -91,7 +217,7 @@ class StorageService:
 
     async def upload_file(
         self,
-        file_content: bytes,
+        file_content: bytes | AsyncReadable,
         filename: str,
         content_type: str | None = None,
         prefix: str = "",
@@ -100,7 +226,8 @@ class StorageService:
         Upload a file to S3 storage.
 
         Args:
-            file_content: File content as bytes
+            file_content: File content as bytes, or a stream (e.g. an
+                ``UploadFile``) that is read and uploaded in parts
             filename: Original filename
             content_type: MIME type of the file
             prefix: Optional prefix for the storage key
@@ -108,6 +235,11 @@ class StorageService:
         Returns:
             Dict containing file metadata (key, size, content_type, url)
         """
+        if not isinstance(file_content, bytes | bytearray):
+            return await self._upload_stream(
+                file_content, filename, content_type, prefix
+            )
+
         file_size = len(file_content)
         self._validate_file(filename, file_size)
 
@@ -135,6 +267,176 @@ class StorageService:
         except ClientError as e:
             raise StorageError(f"Failed to upload file: {e}") from e
 
+    async def upload_files(
+        self,
+        files: list[tuple[bytes | AsyncReadable, str, str | None]],
+        prefix: str = "",
+    ) -> list[dict[str, Any] | StorageError]:
+        """
+        Upload several files concurrently.
+
+        At most ``S3_BATCH_UPLOAD_CONCURRENCY`` files are uploaded at once.
+        A failed file does not affect the others.
+
+        Args:
+            files: (content, filename, content_type) of each file
+            prefix: Optional prefix for the storage keys
+
+        Returns:
+            For each file, in order, its metadata as returned by
+            ``upload_file`` or the ``StorageError`` it failed with
+        """
+        slots = asyncio.Semaphore(settings.s3_batch_upload_concurrency)
+
+        async def upload(
+            content: bytes | AsyncReadable, filename: str, content_type: str | None
+        ) -> dict[str, Any] | StorageError:
+            async with slots:
+                try:
+                    return await self.upload_file(
+                        file_content=content,
+                        filename=filename,
+                        content_type=content_type,
+                        prefix=prefix,
+                    )
+                except StorageError as e:
+                    return e
+
+        return await asyncio.gather(*(upload(*file) for file in files))
+
+    async def delete_files(self, keys: list[str]) -> None:
+        """Delete several files concurrently, logging failures."""
+        results = await asyncio.gather(
+            *(self.delete_file(key) for key in keys), return_exceptions=True
+        )
+        for key, result in zip(keys, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning("Failed to delete %s: %s", key, result)
+
+    async def _upload_stream(
+        self,
+        stream: AsyncReadable,
+        filename: str,
+        content_type: str | None,
+        prefix: str,
+    ) -> dict[str, Any]:
+        """Upload a stream without holding more than a few parts in memory.
+
+        Files that fit in one part are sent with a single ``put_object``;
+        larger ones use a multipart upload.
+        """
+        self._validate_extension(filename)
+        # UploadFile knows its size once the request body has been received
+        known_size = getattr(stream, "size", None)
+        if isinstance(known_size, int):
+            self._validate_size(known_size)
+
+        part_size = settings.s3_multipart_part_size
+        first_part = await _read_chunk(stream, part_size)
+        key = self._generate_key(filename, prefix)
+        extra_args: dict[str, Any] = {}
+        if content_type:
+            extra_args["ContentType"] = content_type
+
+        try:
+            async with self._get_client() as client:
+                if len(first_part) < part_size:
+                    file_size = len(first_part)
+                    self._validate_size(file_size)
+                    await client.put_object(
+                        Bucket=settings.s3_bucket_name,
+                        Key=key,
+                        Body=first_part,
+                        **extra_args,
+                    )
+                else:
+                    file_size = await self._multipart_upload(
+                        client, key, stream, first_part, extra_args
+                    )
+        except ClientError as e:
+            raise StorageError(f"Failed to upload file: {e}") from e
+
+        return {
+            "key": key,
+            "size": file_size,
+            "content_type": content_type,
+            "bucket": settings.s3_bucket_name,
+        }
+
+    async def _multipart_upload(
+        self,
+        client: Any,
+        key: str,
+        stream: AsyncReadable,
+        first_part: bytes,
+        extra_args: dict[str, Any],
+    ) -> int:
+        """Upload a stream in parts, with a bounded number of parts in flight.
+
+        The upload is aborted if the stream exceeds the maximum file size or a
+        part fails, so no incomplete parts are left behind.
+
+        Returns:
+            The size of the uploaded file
+        """
+        bucket = settings.s3_bucket_name
+        upload = await client.create_multipart_upload(
+            Bucket=bucket, Key=key, **extra_args
+        )
+        upload_id = upload["UploadId"]
+        # Bounds memory use to this many parts, whatever the file size
+        slots = asyncio.Semaphore(settings.s3_multipart_concurrency)
+        tasks: list[asyncio.Task] = []
+        errors: list[BaseException] = []
+
+        async def upload_part(part_number: int, body: bytes) -> dict[str, Any]:
+            try:
+                response = await client.upload_part(
+                    Bucket=bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=body,
+                )
+                return {"ETag": response["ETag"], "PartNumber": part_number}
+            except Exception as e:
+                errors.append(e)
+                raise
+            finally:
+                slots.release()
+
+        file_size = 0
+        try:
+            part = first_part
+            while part:
+                file_size += len(part)
+                self._validate_size(file_size)
+                await slots.acquire()
+                if errors:
+                    slots.release()
+                    raise errors[0]
+                tasks.append(asyncio.create_task(upload_part(len(tasks) + 1, part)))
+                part = await _read_chunk(stream, settings.s3_multipart_part_size)
+
+            parts = await asyncio.gather(*tasks)
+            await client.complete_multipart_upload(
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            with contextlib.suppress(ClientError):
+                await client.abort_multipart_upload(
+                    Bucket=bucket, Key=key, UploadId=upload_id
+                )
+            raise
+
+        return file_size
+
     async def download_file(self, key: str) -> tuple[bytes, dict[str, Any]]:
         """
         Download a file from S3 storage.
@@ -194,16 +496,55 @@ class StorageService:
         Returns:
             Presigned URL string
         """
+        urls = await self.get_presigned_urls([key], expires_in, method)
+        return urls[key]
+
+    async def get_presigned_urls(
+        self,
+        keys: Iterable[str],
+        expires_in: int = 3600,
+        method: str = "get_object",
+    ) -> dict[str, str]:
+        """
+        Generate presigned URLs for many files at once.
+
+        Signing is local, so URLs are signed with one client and no requests
+        to S3. Recently signed URLs that are still valid for most of
+        ``expires_in`` are reused from the cache.
+
+        Args:
+            keys: Storage keys of the files
+            expires_in: URL expiration time in seconds (default: 1 hour)
+            method: S3 method ('get_object' or 'put_object')
+
+        Returns:
+            Dict mapping each key to its presigned URL
+        """
+        urls: dict[str, str] = {}
+        missing: list[str] = []
+        for key in dict.fromkeys(keys):
+            url = self.presigned_urls.get(key, method, expires_in)
+            if url is None:
+                missing.append(key)
+            else:
+                urls[key] = url
+
+        if not missing:
+            return urls
+
         try:
             async with self._get_client() as client:
-                url = await client.generate_presigned_url(
-                    ClientMethod=method,
-                    Params={"Bucket": settings.s3_bucket_name, "Key": key},
-                    ExpiresIn=expires_in,
-                )
-                return url
+                for key in missing:
+                    url = await client.generate_presigned_url(
+                        ClientMethod=method,
+                        Params={"Bucket": settings.s3_bucket_name, "Key": key},
+                        ExpiresIn=expires_in,
+                    )
+                    self.presigned_urls.put(key, method, expires_in, url)
+                    urls[key] = url
         except ClientError as e:
             raise StorageError(f"Failed to generate presigned URL: {e}") from e
+        return urls
 
     async def list_files(
         self, prefix: str = "", max_keys: int = 100
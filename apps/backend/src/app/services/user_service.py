@@ -5,18 +5,21 @@ from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 from src.app.core.audit import log_audit_from_context
 from src.app.models import Permission, Role, User
+from src.app.models.loading import user_loader
 from src.app.schemas import UserCreate, UserUpdate
+from src.app.services.admin_stats import admin_stats_counters
 from src.app.services.exceptions import (
     EmailAlreadyExistsError,
     HardDeleteNotAllowedError,
     RoleNotFoundError,
     UserNotFoundError,
 )
+from src.app.services.pagination import Page, paginate
+from src.app.services.principal_cache import principal_cache
 
 logger = logging.getLogger(__name__)
 
@@ -59,13 +62,13 @@ class UserService:
         Args:
             user_id: The user ID to look up.
             include_deleted: If True, include soft-deleted users.
-            include_roles: If True, eagerly load roles.
+            include_roles: If True, eagerly load roles. Otherwise no
+                relationship is loaded (e.g. GraphQL uses DataLoaders).
         """
         query = select(User).where(User.id == user_id)
         if not include_deleted:
             query = query.where(User.deleted_at.is_(None))
-        if include_roles:
-            query = query.options(selectinload(User.roles))
+        query = query.options(*user_loader("detail" if include_roles else "list"))
         result = await self.db.execute(query)
         user = result.scalar_one_or_none()
         if not user:
@@ -83,7 +86,7 @@ class UserService:
             email: The email to look up.
             include_deleted: If True, include soft-deleted users.
         """
-        query = select(User).where(User.email == email)
+        query = select(User).where(User.email == email).options(*user_loader("list"))
         if not include_deleted:
             query = query.where(User.deleted_at.is_(None))
         result = await self.db.execute(query)
@@ -104,27 +107,56 @@ class UserService:
             include_deleted: If True, include soft-deleted users.
             include_roles: If True, eagerly load roles.
         """
-        # Build base query with soft delete filter
-        base_query = select(User)
-        count_query = select(func.count()).select_from(User)
-
-        if not include_deleted:
-            base_query = base_query.where(User.deleted_at.is_(None))
-            count_query = count_query.where(User.deleted_at.is_(None))
+        page = await self.paginate_users(
+            limit=limit,
+            offset=skip,
+            include_total=True,
+            include_deleted=include_deleted,
+            include_roles=include_roles,
+        )
+        return page.items, page.total or 0
 
-        # Get total count
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar() or 0
+    async def paginate_users(
+        self,
+        limit: int = 10,
+        cursor: str | None = None,
+        offset: int = 0,
+        include_total: bool = False,
+        exact_total: bool = False,
+        include_deleted: bool = False,
+        include_roles: bool = False,
+    ) -> Page[User]:
+        """Get a page of users, newest first.
 
-        # Get paginated items
-        query = base_query.offset(skip).limit(limit)
-        if include_roles:
-            query = query.options(selectinload(User.roles))
+        Args:
+            limit: Maximum number of records to return.
+            cursor: Cursor of the previous page.
+            offset: Number of records to skip when no cursor is given.
+            include_total: If True, also count all users.
+            exact_total: If True, count exactly instead of reusing a cached
+                total or a planner estimate.
+            include_deleted: If True, include soft-deleted users.
+            include_roles: If True, eagerly load roles. Otherwise no
+                relationship is loaded (e.g. GraphQL uses DataLoaders).
 
-        result = await self.db.execute(query)
-        users = list(result.scalars().all())
+        Raises:
+            InvalidCursorError: If the cursor is malformed.
+        """
+        query = select(User)
+        if not include_deleted:
+            query = query.where(User.deleted_at.is_(None))
 
-        return users, total
+        return await paginate(
+            self.db,
+            query,
+            User,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            include_total=include_total,
+            exact_total=exact_total,
+            options=user_loader("detail" if include_roles else "list"),
+        )
 
     async def _get_roles_by_ids(self, role_ids: list[int]) -> list[Role]:
         """Get roles by their IDs."""
@@ -165,9 +197,6 @@ class UserService:
         await self.db.refresh(user, ["roles"])
         user.roles = roles
 
-        await self.db.commit()
-        await self.db.refresh(user, ["roles"])
-
         await self._log_audit(
             action="user.created",
             entity_type="User",
@@ -175,12 +204,17 @@ class UserService:
             extra_metadata={"email": user.email, "name": user.name},
         )
 
+        await self.db.commit()
+        await self.db.refresh(user, ["roles"])
+        await admin_stats_counters.track_users(user)
+
         return user
 
     async def update(self, user_id: UUID, user_in: UserUpdate) -> User:
         """Update a user."""
         user = await self.get_by_id(user_id, include_roles=True)
         before_data = {"email": user.email, "name": user.name}
+        was_active = user.is_active
 
         # Update basic fields
         update_data = user_in.model_dump(exclude_unset=True, exclude={"role_ids"})
@@ -192,9 +226,6 @@ class UserService:
             roles = await self._get_roles_by_ids(user_in.role_ids)
             user.roles = roles
 
-        await self.db.commit()
-        await self.db.refresh(user)
-
         await self._log_audit(
             action="user.updated",
             entity_type="User",
@@ -205,14 +236,18 @@ class UserService:
             },
         )
 
+        await self.db.commit()
+        await principal_cache.invalidate(user_id)
+        await self.db.refresh(user)
+        if user.is_active != was_active and user.deleted_at is None:
+            await admin_stats_counters.track_user_activation(user.is_active)
+
         return user
 
     async def delete(self, user_id: UUID) -> None:
         """Soft delete a user by setting deleted_at timestamp."""
         user = await self.get_by_id(user_id)
         user.deleted_at = datetime.now(UTC)
-        await self.db.commit()
-
         await self._log_audit(
             action="user.deleted",
             entity_type="User",
@@ -220,13 +255,14 @@ class UserService:
             extra_metadata={"email": user.email, "soft_delete": True},
         )
 
+        await self.db.commit()
+        await admin_stats_counters.track_users(user, delta=-1)
+
     async def restore(self, user_id: UUID) -> User:
         """Restore a soft-deleted user."""
         user = await self.get_by_id(user_id, include_deleted=True)
+        was_deleted = user.deleted_at is not None
         user.deleted_at = None
-        await self.db.commit()
-        await self.db.refresh(user)
-
         await self._log_audit(
             action="user.restored",
             entity_type="User",
@@ -234,6 +270,11 @@ class UserService:
             extra_metadata={"email": user.email},
         )
 
+        await self.db.commit()
+        await self.db.refresh(user)
+        if was_deleted:
+            await admin_stats_counters.track_users(user)
+
         return user
 
     async def hard_delete(self, user_id: UUID, is_super_admin: bool = False) -> None:
@@ -252,9 +293,8 @@ class UserService:
             )
         user = await self.get_by_id(user_id, include_deleted=True)
         user_email = user.email
+        was_live = user.deleted_at is None
         await self.db.delete(user)
-        await self.db.commit()
-
         await self._log_audit(
             action="user.force_deleted",
             entity_type="User",
@@ -262,6 +302,11 @@ class UserService:
             extra_metadata={"email": user_email, "hard_delete": True},
         )
 
+        await self.db.commit()
+        await principal_cache.invalidate(user_id)
+        if was_live:
+            await admin_stats_counters.track_users(user, delta=-1)
+
     async def assign_role(self, user_id: UUID, role_id: int) -> User:
         """Assign a role to a user."""
         user = await self.get_by_id(user_id, include_roles=True)
@@ -277,9 +322,6 @@ class UserService:
         # Add if not already present
         if role not in user.roles:
             user.roles.append(role)
-            await self.db.commit()
-            await self.db.refresh(user, ["roles"])
-
             await self._log_audit(
                 action="role.assigned",
                 entity_type="User",
@@ -287,6 +329,10 @@ class UserService:
                 extra_metadata={"role_id": role_id, "role_name": role.name},
             )
 
+            await self.db.commit()
+            await principal_cache.invalidate(user_id)
+            await self.db.refresh(user, ["roles"])
+
         return user
 
     async def remove_role(self, user_id: UUID, role_id: int) -> User:
@@ -298,9 +344,6 @@ class UserService:
 
         # Find and remove the role
         user.roles = [r for r in user.roles if r.id != role_id]
-        await self.db.commit()
-        await self.db.refresh(user, ["roles"])
-
         if removed_role:
             await self._log_audit(
                 action="role.removed",
@@ -309,6 +352,10 @@ class UserService:
                 extra_metadata={"role_id": role_id, "role_name": removed_role.name},
             )
 
+        await self.db.commit()
+        await principal_cache.invalidate(user_id)
+        await self.db.refresh(user, ["roles"])
+
         return user
 
     async def replace_roles(self, user_id: UUID, role_ids: list[int]) -> User:
@@ -322,9 +369,6 @@ class UserService:
         # Replace all roles
         user.roles = roles
 
-        await self.db.commit()
-        await self.db.refresh(user, ["roles"])
-
         await self._log_audit(
             action="roles.replaced",
             entity_type="User",
@@ -335,6 +379,10 @@ class UserService:
             },
         )
 
+        await self.db.commit()
+        await principal_cache.invalidate(user_id)
+        await self.db.refresh(user, ["roles"])
+
         return user
 
     async def add_roles(self, user_id: UUID, role_ids: list[int]) -> User:
@@ -352,9 +400,6 @@ class UserService:
                 user.roles.append(role)
                 new_roles.append(role)
 
-        await self.db.commit()
-        await self.db.refresh(user, ["roles"])
-
         if new_roles:
             await self._log_audit(
                 action="role.assigned",
@@ -366,6 +411,10 @@ class UserService:
                 },
             )
 
+        await self.db.commit()
+        await principal_cache.invalidate(user_id)
+        await self.db.refresh(user, ["roles"])
+
         return user
 
     async def remove_roles(self, user_id: UUID, role_ids: list[int]) -> User:
@@ -379,9 +428,6 @@ class UserService:
         # Remove roles that are in the list
         user.roles = [r for r in user.roles if r.id not in role_ids_set]
 
-        await self.db.commit()
-        await self.db.refresh(user, ["roles"])
-
         if removed_roles:
             await self._log_audit(
                 action="role.removed",
@@ -393,15 +439,17 @@ class UserService:
                 },
             )
 
+        await self.db.commit()
+        await principal_cache.invalidate(user_id)
+        await self.db.refresh(user, ["roles"])
+
         return user
 
     async def get_user_permissions(self, user_id: UUID) -> list[Permission]:
         """Get all permissions for a user through their roles."""
         # Query user with roles and their permissions
         result = await self.db.execute(
-            select(User)
-            .where(User.id == user_id)
-            .options(selectinload(User.roles).selectinload(Role.permissions))
+            select(User).where(User.id == user_id).options(*user_loader("auth"))
         )
         user = result.scalar_one_or_none()
         if not user:
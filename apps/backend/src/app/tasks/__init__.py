@@ -1,5 +1,6 @@
 """Task executors for scheduled tasks."""
 
+from src.app.tasks.admin_stats import AdminStatsReconcileTaskExecutor
 from src.app.tasks.base import TaskContext, TaskExecutor, TaskResult
 from src.app.tasks.cleanup import CleanupTaskExecutor
 from src.app.tasks.notification import NotificationTaskExecutor
@@ -15,4 +16,5 @@ __all__ = [
     "CleanupTaskExecutor",
     "ReportTaskExecutor",
     "NotificationTaskExecutor",
+    "AdminStatsReconcileTaskExecutor",
 ]
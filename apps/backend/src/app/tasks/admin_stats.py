@@ -0,0 +1,39 @@
+"""Admin stats task executor for reconciling the dashboard counters."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import asdict
+
+from src.app.db.session import async_session_maker
+from src.app.services.admin_stats import admin_stats_counters
+from src.app.tasks.base import TaskContext, TaskExecutor, TaskResult
+
+logger = logging.getLogger(__name__)
+
+
+class AdminStatsReconcileTaskExecutor(TaskExecutor):
+    """Executor for reconciling the admin dashboard counters."""
+
+    task_type = "admin_stats_reconcile"
+    name = "Admin Stats Reconcile"
+    description = "Recount the admin dashboard statistics kept in Redis"
+    default_cron = "*/15 * * * *"  # Every 15 minutes
+
+    async def execute(self, context: TaskContext) -> TaskResult:
+        """Execute the reconcile task."""
+        if not admin_stats_counters.enabled:
+            return TaskResult(
+                success=True,
+                message="Admin stats counters are disabled, nothing to reconcile",
+            )
+
+        async with async_session_maker() as db:
+            stats = await admin_stats_counters.reconcile(db)
+
+        logger.info("Reconciled admin stats counters: %s", stats)
+        return TaskResult(
+            success=True,
+            message="Admin stats counters reconciled",
+            data=asdict(stats),
+        )
@@ -109,6 +109,7 @@ task_registry = TaskExecutorRegistry()
 
 def register_default_executors() -> None:
     """Register all default task executors."""
+    from src.app.tasks.admin_stats import AdminStatsReconcileTaskExecutor
     from src.app.tasks.cleanup import CleanupTaskExecutor
     from src.app.tasks.notification import NotificationTaskExecutor
     from src.app.tasks.report import ReportTaskExecutor
@@ -116,5 +117,6 @@ def register_default_executors() -> None:
     task_registry.register(CleanupTaskExecutor())
     task_registry.register(ReportTaskExecutor())
     task_registry.register(NotificationTaskExecutor())
+    task_registry.register(AdminStatsReconcileTaskExecutor())
 
     logger.info(f"Registered {len(task_registry.list_types())} default task executors")
@@ -7,7 +7,9 @@ from collections.abc import Sequence
 
 from src.app.core.config import settings
 from src.app.core.rabbitmq import RabbitMQPool
+from src.app.core.redis import RedisPool
 from src.app.messaging.consumer import MessageConsumer
+from src.app.workers.metrics import MetricsServer
 
 logger = logging.getLogger(__name__)
 
@@ -17,19 +19,35 @@ class BaseWorker:
     Base class for worker processes that consume RabbitMQ messages.
 
     This class manages the lifecycle of multiple message consumers,
-    including startup, shutdown, and signal handling.
+    including startup, shutdown, and signal handling, and serves their
+    metrics at ``/metrics``.
     """
 
-    def __init__(self, handlers: Sequence[MessageConsumer]) -> None:
+    def __init__(
+        self,
+        handlers: Sequence[MessageConsumer],
+        metrics_port: int | None = None,
+    ) -> None:
         """
         Initialize the worker with a list of message handlers.
 
         Args:
             handlers: List of message consumers to run
+            metrics_port: Port of the metrics endpoint, 0 disables it
+                (defaults to settings.worker_metrics_port)
         """
         self._handlers = list(handlers)
         self._running = False
         self._tasks: list[asyncio.Task] = []
+        # Idempotent handlers track processed messages in Redis
+        self._uses_redis = any(handler.idempotent for handler in self._handlers)
+        if metrics_port is None:
+            metrics_port = settings.worker_metrics_port
+        self._metrics_server = (
+            MetricsServer(settings.worker_metrics_host, metrics_port)
+            if metrics_port
+            else None
+        )
 
     async def _setup(self) -> None:
         """Set up the worker (initialize connections, etc.)."""
@@ -37,10 +55,29 @@ class BaseWorker:
             raise RuntimeError("RabbitMQ is disabled, cannot start worker")
 
         await RabbitMQPool.init_pool()
+        if self._uses_redis:
+            try:
+                await RedisPool.init_pool()
+            except Exception as e:
+                # Idempotent handlers then handle duplicates again
+                logger.warning(
+                    "Redis unavailable, messages will not be deduplicated: %s",
+                    str(e),
+                )
+        if self._metrics_server is not None:
+            try:
+                await self._metrics_server.start()
+            except OSError as e:
+                # Metrics are not worth failing the worker over
+                logger.warning("Failed to start metrics endpoint: %s", str(e))
         logger.info("Worker setup complete")
 
     async def _teardown(self) -> None:
         """Tear down the worker (close connections, etc.)."""
+        if self._metrics_server is not None:
+            await self._metrics_server.stop()
+        if self._uses_redis:
+            await RedisPool.close_pool()
         await RabbitMQPool.close_pool()
         logger.info("Worker teardown complete")
 
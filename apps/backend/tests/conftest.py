@@ -1,14 +1,22 @@
 """Shared test fixtures."""
 
+from contextlib import contextmanager
+
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from src.app.core.security import get_password_hash
 from src.app.db.base import Base
-from src.app.db.session import get_db
+from src.app.db.pool import ReleasingSession
+from src.app.db.routing import RoutingSession
+from src.app.db.session import get_db, get_read_db
+from src.app.graphql.document_cache import document_cache
 from src.app.main import app
 from src.app.middleware.rate_limit import RateLimiter
 from src.app.models import Permission, Role, User
+from src.app.services.principal_cache import principal_cache
+from src.app.services.storage_service import storage_service
 
 # Use in-memory SQLite for tests
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -16,11 +24,31 @@ TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 test_engine = create_async_engine(TEST_DATABASE_URL, echo=False)
 test_async_session_maker = async_sessionmaker(
     test_engine,
-    class_=AsyncSession,
+    class_=ReleasingSession,
+    sync_session_class=RoutingSession,
     expire_on_commit=False,
 )
 
 
+@contextmanager
+def count_statements():
+    """Count SQL statements executed on the test engine."""
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(
+        test_engine.sync_engine, "before_cursor_execute", before_cursor_execute
+    )
+    try:
+        yield statements
+    finally:
+        event.remove(
+            test_engine.sync_engine, "before_cursor_execute", before_cursor_execute
+        )
+
+
 async def override_get_db():
     """Override database dependency for tests."""
     async with test_async_session_maker() as session:
@@ -30,8 +58,11 @@ async def override_get_db():
 @pytest.fixture(autouse=True)
 async def setup_database():
     """Create tables before each test and drop after."""
-    # Reset rate limiter before each test
+    # Reset rate limiter and in-process caches before each test
     RateLimiter.get_instance().reset()
+    principal_cache.reset()
+    document_cache.reset()
+    storage_service.presigned_urls.reset()
 
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -44,6 +75,7 @@ async def setup_database():
 async def client():
     """Create async test client with overridden database."""
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     async with AsyncClient(
         transport=ASGITransport(app=app), base_url="http://test"
     ) as ac:
@@ -18,7 +18,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from src.app.db.base import Base
 from src.app.db.seeds import seed_all
-from src.app.db.session import get_db
+from src.app.db.session import get_db, get_read_db
 from src.app.main import app
 from src.app.middleware.rate_limit import RateLimiter
 from src.app.models import User
@@ -65,6 +65,7 @@ async def setup_database():
 async def client():
     """Create async test client with overridden database."""
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     async with AsyncClient(
         transport=ASGITransport(app=app), base_url="http://test"
     ) as ac:
@@ -18,7 +18,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from src.app.core.config import settings
 from src.app.core.security import get_password_hash
 from src.app.db.base import Base
-from src.app.db.session import get_db
+from src.app.db.session import get_db, get_read_db
 from src.app.main import app
 from src.app.middleware.rate_limit import RateLimiter
 from src.app.models import Permission, Role, User
@@ -28,6 +28,7 @@ from src.app.services.exceptions import (
 from src.app.services.exceptions import (
     FileTooLargeError,
     InvalidFileTypeError,
+    StorageError,
 )
 
 # Use in-memory SQLite for tests
@@ -57,12 +58,14 @@ class MockStorageService:
 
     async def upload_file(
         self,
-        file_content: bytes,
+        file_content: Any,
         filename: str,
         content_type: str | None = None,
         prefix: str = "",
     ) -> dict[str, Any]:
         """Mock: Store file in memory."""
+        if not isinstance(file_content, bytes):
+            file_content = await file_content.read()
         file_size = len(file_content)
 
         # Validate file size
@@ -98,6 +101,20 @@ class MockStorageService:
             "bucket": "test-bucket",
         }
 
+    async def upload_files(
+        self, files: list[tuple[Any, str, str | None]], prefix: str = ""
+    ) -> list[dict[str, Any] | StorageError]:
+        """Mock: Store files in memory, returning errors instead of raising."""
+        results: list[dict[str, Any] | StorageError] = []
+        for content, filename, content_type in files:
+            try:
+                results.append(
+                    await self.upload_file(content, filename, content_type, prefix)
+                )
+            except StorageError as e:
+                results.append(e)
+        return results
+
     async def download_file(self, key: str) -> tuple[bytes, dict[str, Any]]:
         """Mock: Retrieve file from memory."""
         if key not in self.files:
@@ -117,12 +134,23 @@ class MockStorageService:
             del self.files[key]
         return True
 
+    async def delete_files(self, keys: list[str]) -> None:
+        """Mock: Remove files from memory."""
+        for key in keys:
+            await self.delete_file(key)
+
     async def get_presigned_url(
         self, key: str, expires_in: int = 3600, method: str = "get_object"
     ) -> str:
         """Mock: Return a fake presigned URL."""
         return f"http://mock-s3/{key}?signed=true&expires={expires_in}"
 
+    async def get_presigned_urls(
+        self, keys: Any, expires_in: int = 3600, method: str = "get_object"
+    ) -> dict[str, str]:
+        """Mock: Return fake presigned URLs."""
+        return {key: await self.get_presigned_url(key, expires_in) for key in keys}
+
     async def list_files(
         self, prefix: str = "", max_keys: int = 100
     ) -> list[dict[str, Any]]:
@@ -182,14 +210,16 @@ async def setup_database():
 async def client():
     """Create async test client with overridden database and storage."""
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
 
     # Reset mock storage for each test
     mock_storage_service.files.clear()
 
-    # Patch the storage_service in api.files and graphql.resolvers.files modules
+    # Patch the storage_service in api.files, graphql.resolvers.files and loaders
     with (
         patch("src.app.api.files.storage_service", mock_storage_service),
         patch("src.app.graphql.resolvers.files.storage_service", mock_storage_service),
+        patch("src.app.graphql.loaders.storage_service", mock_storage_service),
     ):
         async with AsyncClient(
             transport=ASGITransport(app=app), base_url="http://test"
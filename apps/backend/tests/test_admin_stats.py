@@ -0,0 +1,235 @@
+"""Admin dashboard statistics tests."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.app.models import Permission, Role, User, role_permissions
+from src.app.schemas import UserCreate, UserUpdate
+from src.app.services import FileService, UserService
+from src.app.services.admin_stats import (
+    DashboardStats,
+    admin_stats_counters,
+    query_dashboard_stats,
+)
+from src.app.tasks import AdminStatsReconcileTaskExecutor, TaskContext
+
+from tests import conftest
+from tests.conftest import count_statements
+
+
+class FakePipeline:
+    """Pipeline queuing commands and running them on execute."""
+
+    def __init__(self, client: "FakeRedis"):
+        self.client = client
+        self.commands: list = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    def __getattr__(self, name: str):
+        def queue(*args, **kwargs):
+            self.commands.append((getattr(self.client, name), args, kwargs))
+
+        return queue
+
+    async def execute(self) -> list:
+        return [await method(*args, **kwargs) for method, args, kwargs in self.commands]
+
+
+class FakeRedis:
+    """Minimal async Redis storing strings and hashes in dicts."""
+
+    def __init__(self):
+        self.values: dict[str, str] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.values.get(key) for key in keys]
+
+    async def set(self, key: str, value, ex: int | None = None) -> None:
+        self.values[key] = str(value)
+
+    async def incrby(self, key: str, amount: int) -> int:
+        self.values[key] = str(int(self.values.get(key, 0)) + amount)
+        return int(self.values[key])
+
+    async def expire(self, key: str, seconds: int) -> None:
+        pass
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        return dict(self.hashes.get(key, {}))
+
+    async def hset(self, key: str, mapping: dict) -> None:
+        self.hashes.setdefault(key, {}).update(
+            {field: str(value) for field, value in mapping.items()}
+        )
+
+    async def hincrby(self, key: str, field: str, amount: int) -> int:
+        fields = self.hashes.setdefault(key, {})
+        fields[field] = str(int(fields.get(field, 0)) + amount)
+        return int(fields[field])
+
+
+@pytest.fixture
+def redis_client():
+    client = FakeRedis()
+    with (
+        patch.object(admin_stats_counters, "enabled", True),
+        patch.object(admin_stats_counters, "_get_redis", return_value=client),
+    ):
+        yield client
+
+
+@pytest.fixture
+async def owner(db_session: AsyncSession) -> User:
+    user = User(email="owner@example.com", name="Owner")
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+async def create_data(db_session: AsyncSession, owner: User) -> None:
+    now = datetime.now(UTC)
+    db_session.add_all(
+        [
+            User(email="inactive@example.com", name="Inactive", is_active=False),
+            User(
+                email="old@example.com",
+                name="Old",
+                created_at=now - timedelta(days=30),
+            ),
+            User(email="deleted@example.com", name="Deleted", deleted_at=now),
+        ]
+    )
+    await db_session.commit()
+    service = FileService(db_session)
+    for i, size in enumerate([100, 250]):
+        await service.create(
+            key=f"stats/{i}.txt",
+            filename=f"{i}.txt",
+            size=size,
+            bucket="uploads",
+            user_id=owner.id,
+        )
+    await db_session.commit()
+
+
+async def test_query_dashboard_stats(db_session: AsyncSession, owner: User):
+    """Test the statistics are computed with a single statement."""
+    await create_data(db_session, owner)
+
+    with count_statements() as statements:
+        stats = await query_dashboard_stats(db_session)
+
+    assert len(statements) == 1
+    assert stats == DashboardStats(
+        users_total=3,
+        users_active=2,
+        users_new_today=2,
+        users_new_this_week=2,
+        files_total=2,
+        files_total_size=350,
+        files_uploaded_today=2,
+    )
+
+
+async def test_counters_need_reconcile(
+    db_session: AsyncSession, owner: User, redis_client
+):
+    """Test counters are only read after they were reconciled."""
+    await create_data(db_session, owner)
+
+    assert await admin_stats_counters.get() is None
+    stats = await admin_stats_counters.reconcile(db_session)
+
+    assert await admin_stats_counters.get() == stats
+    assert stats.users_total == 3
+
+
+async def test_services_update_counters(
+    db_session: AsyncSession, owner: User, redis_client
+):
+    """Test service writes keep the counters equal to the database."""
+    await admin_stats_counters.reconcile(db_session)
+    users = UserService(db_session)
+    files = FileService(db_session)
+
+    user = await users.create(UserCreate(email="new@example.com", name="New"))
+    await users.update(user.id, UserUpdate(is_active=False))
+    await users.delete(owner.id)
+    await users.restore(owner.id)
+    await users.hard_delete(user.id, is_super_admin=True)
+    await files.create_many(
+        [
+            {"key": "a.txt", "filename": "a.txt", "size": 10, "bucket": "uploads"},
+            {"key": "b.txt", "filename": "b.txt", "size": 20, "bucket": "uploads"},
+        ],
+        owner.id,
+    )
+    await files.delete_by_key("a.txt")
+    await files.restore_by_key("a.txt")
+    await files.hard_delete_by_key("b.txt", is_super_admin=True)
+
+    stats = await admin_stats_counters.get()
+    assert stats == await query_dashboard_stats(db_session)
+    assert (stats.users_total, stats.files_total, stats.files_total_size) == (1, 1, 10)
+
+
+async def test_reconcile_task(db_session: AsyncSession, owner: User, redis_client):
+    """Test the reconcile task replaces drifted counters."""
+    await admin_stats_counters.reconcile(db_session)
+    redis_client.hashes[next(iter(redis_client.hashes))]["users_total"] = "42"
+    context = TaskContext(
+        task_id="1",
+        task_name="reconcile",
+        task_type="admin_stats_reconcile",
+        execution_id="1",
+    )
+
+    with patch(
+        "src.app.tasks.admin_stats.async_session_maker",
+        conftest.test_async_session_maker,
+    ):
+        result = await AdminStatsReconcileTaskExecutor().execute(context)
+
+    assert result.success
+    assert result.data["users_total"] == 1
+    assert (await admin_stats_counters.get()).users_total == 1
+
+
+async def test_admin_stats_endpoint(
+    client: AsyncClient, db_session: AsyncSession, superadmin_headers: dict
+):
+    """Test the endpoint returns the dashboard statistics."""
+    permission = Permission(
+        code="admin:access", name="Admin Access", resource="admin", action="access"
+    )
+    db_session.add(permission)
+    await db_session.flush()
+    role_id = await db_session.scalar(select(Role.id).where(Role.code == "super_admin"))
+    await db_session.execute(
+        insert(role_permissions).values(role_id=role_id, permission_id=permission.id)
+    )
+    await db_session.commit()
+
+    response = await client.get("/api/v1/admin/stats", headers=superadmin_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["users"]["total"] == 1
+    assert data["users"]["active"] == 1
+    assert data["files"] == {"total": 0, "total_size": 0, "uploads_today": 0}
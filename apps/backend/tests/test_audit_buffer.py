@@ -0,0 +1,213 @@
+"""Audit buffer tests."""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.app.core.audit import AuditBuffer, audit_buffer, log_audit_action
+from src.app.models import AuditLog
+
+from tests import conftest
+from tests.conftest import count_statements
+
+
+def make_entry(action: str = "user.updated", **values) -> dict:
+    """Build AuditLog column values for the buffer."""
+    return {
+        "action": action,
+        "entity_type": "User",
+        "actor_ip": "127.0.0.1",
+        **values,
+    }
+
+
+async def count_audit_logs() -> int:
+    async with conftest.test_async_session_maker() as session:
+        return await session.scalar(select(func.count()).select_from(AuditLog))
+
+
+@pytest.fixture
+async def buffer():
+    """An audit buffer writing to the test database."""
+    buffer = AuditBuffer(max_size=100, batch_size=50)
+    buffer.start(conftest.test_async_session_maker)
+    yield buffer
+    await buffer.stop()
+
+
+async def test_put_requires_running_buffer():
+    """Test entries are refused before the buffer is started."""
+    buffer = AuditBuffer()
+
+    assert buffer.put(make_entry()) is False
+    assert buffer.stats()["running"] is False
+
+
+async def test_queued_entries_are_written_in_one_insert(buffer):
+    """Test entries queued together are written with a single INSERT."""
+    with count_statements() as statements:
+        for i in range(30):
+            assert buffer.put(make_entry(entity_id=str(i)))
+        await buffer.stop()
+
+    inserts = [s for s in statements if s.startswith("INSERT INTO audit_logs")]
+    assert len(inserts) == 1
+    assert await count_audit_logs() == 30
+    assert buffer.stats()["written"] == 30
+
+
+async def test_stop_drains_queue(buffer):
+    """Test stopping writes every queued entry and refuses new ones."""
+    for _ in range(60):
+        buffer.put(make_entry())
+    await buffer.stop()
+
+    assert buffer.stats()["queued"] == 0
+    assert buffer.put(make_entry()) is False
+    assert await count_audit_logs() == 60
+
+
+async def test_overflow_is_reported():
+    """Test a full buffer refuses entries and counts the overflow."""
+    buffer = AuditBuffer(max_size=2)
+    buffer.start(conftest.test_async_session_maker)
+    try:
+        assert buffer.put(make_entry())
+        assert buffer.put(make_entry())
+        assert buffer.put(make_entry()) is False
+        assert buffer.stats()["overflowed"] == 1
+    finally:
+        await buffer.stop()
+
+    assert await count_audit_logs() == 2
+
+
+async def test_failed_entry_does_not_drop_batch(buffer):
+    """Test a bad entry falls back to single inserts for its batch."""
+    buffer.put(make_entry())
+    # Violates the NOT NULL constraint on actor_ip
+    buffer.put(make_entry(actor_ip=None))
+    buffer.put(make_entry())
+    await buffer.stop()
+
+    stats = buffer.stats()
+    assert stats["written"] == 2
+    assert stats["failed"] == 1
+    assert await count_audit_logs() == 2
+
+
+async def test_log_audit_action_uses_buffer(db_session: AsyncSession):
+    """Test audit logs skip the caller's session while the buffer runs."""
+    audit_buffer.start(conftest.test_async_session_maker)
+    try:
+        await log_audit_action(db_session, action="user.created", entity_type="User")
+        assert not db_session.new
+    finally:
+        await audit_buffer.stop()
+
+    assert await count_audit_logs() == 1
+
+
+async def test_log_audit_action_without_buffer_uses_session(db_session: AsyncSession):
+    """Test audit logs are written with the caller's session as a fallback."""
+    await log_audit_action(db_session, action="user.created", entity_type="User")
+
+    # Committed, as the session had nothing else to commit
+    assert not db_session.new
+    assert await count_audit_logs() == 1
+
+
+async def test_overflowed_entry_is_stored(db_session: AsyncSession):
+    """Test an entry refused by a full buffer is still written."""
+    from src.app.models import User
+
+    with patch.object(audit_buffer, "put", return_value=False):
+        # Committed by the audit call itself
+        await log_audit_action(db_session, action="a.logged", entity_type="User")
+        # Committed with the caller's change
+        db_session.add(User(email="overflow@example.com", name="Overflow"))
+        await log_audit_action(db_session, action="b.logged", entity_type="User")
+        await db_session.commit()
+
+    assert await count_audit_logs() == 2
+
+
+async def test_buffered_entry_waits_for_commit(db_session: AsyncSession):
+    """Test an entry logged with the change is only queued once it commits."""
+    from src.app.models import User
+
+    audit_buffer.start(conftest.test_async_session_maker)
+    try:
+        db_session.add(User(email="rolled@example.com", name="Rolled"))
+        await log_audit_action(db_session, action="user.created", entity_type="User")
+        assert audit_buffer.stats()["queued"] == 0
+        await db_session.rollback()
+
+        db_session.add(User(email="kept@example.com", name="Kept"))
+        await log_audit_action(db_session, action="user.created", entity_type="User")
+        await db_session.commit()
+    finally:
+        await audit_buffer.stop()
+
+    assert await count_audit_logs() == 1
+    assert audit_buffer.stats()["reserved"] == 0
+
+
+async def test_full_buffer_entry_is_committed_with_change(db_session: AsyncSession):
+    """Test an entry deferred to the commit does not wait for a full buffer."""
+    from src.app.models import User
+
+    buffer = AuditBuffer(max_size=1)
+    buffer.start(conftest.test_async_session_maker)
+    try:
+        assert buffer.reserve()
+        with patch("src.app.core.audit.audit_buffer", buffer):
+            db_session.add(User(email="full@example.com", name="Full"))
+            await log_audit_action(db_session, action="a.logged", entity_type="User")
+            assert any(isinstance(obj, AuditLog) for obj in db_session.new)
+            await db_session.commit()
+        buffer.release()
+    finally:
+        await buffer.stop()
+
+    assert buffer.stats()["overflowed"] == 1
+    assert await count_audit_logs() == 1
+
+
+async def test_rollback_releases_reserved_slot(db_session: AsyncSession):
+    """Test a deferred entry gives its slot back when its change rolls back."""
+    from src.app.models import User
+
+    buffer = AuditBuffer(max_size=1)
+    buffer.start(conftest.test_async_session_maker)
+    try:
+        with patch("src.app.core.audit.audit_buffer", buffer):
+            db_session.add(User(email="undone@example.com", name="Undone"))
+            await log_audit_action(db_session, action="a.logged", entity_type="User")
+            assert buffer.stats()["reserved"] == 1
+            await db_session.rollback()
+        assert buffer.stats()["reserved"] == 0
+    finally:
+        await buffer.stop()
+
+    assert await count_audit_logs() == 0
+
+
+async def test_entry_committed_after_stop_is_reported_as_dropped(
+    db_session: AsyncSession,
+):
+    """Test an entry whose change commits after the buffer stopped is counted."""
+    from src.app.models import User
+
+    buffer = AuditBuffer()
+    buffer.start(conftest.test_async_session_maker)
+    with patch("src.app.core.audit.audit_buffer", buffer):
+        db_session.add(User(email="dropped@example.com", name="Dropped"))
+        await log_audit_action(db_session, action="a.logged", entity_type="User")
+        await buffer.stop()
+        await db_session.commit()
+
+    assert buffer.stats()["dropped"] == 1
+    assert buffer.stats()["reserved"] == 0
+    assert await count_audit_logs() == 0
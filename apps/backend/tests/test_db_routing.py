@@ -0,0 +1,170 @@
+"""Read replica routing tests."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
+from src.app.db.base import Base
+from src.app.db.pool import ReleasingSession
+from src.app.db.routing import (
+    ReplicaSet,
+    RoutingSession,
+    is_pinned_to_primary,
+    request_scope,
+)
+from src.app.models import Permission
+from src.app.services.pagination import paginate
+
+
+async def create_engine(code: str):
+    """Create an in-memory database holding one permission."""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(
+            Permission.__table__.insert().values(
+                code=code, name=code, resource="items", action=code
+            )
+        )
+    return engine
+
+
+@pytest.fixture
+async def databases():
+    primary = await create_engine("primary")
+    replica = await create_engine("replica")
+    yield primary, replica
+    await primary.dispose()
+    await replica.dispose()
+
+
+@pytest.fixture
+def session_maker(databases):
+    primary, replica = databases
+    return async_sessionmaker(
+        primary,
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        expire_on_commit=False,
+        replicas=ReplicaSet([replica]),
+    )
+
+
+async def codes(session: AsyncSession, query=None) -> list[str]:
+    query = query if query is not None else select(Permission.code)
+    return list((await session.scalars(query)).all())
+
+
+async def test_reads_go_to_replica(session_maker):
+    """Test plain selects are read from the replica."""
+    async with session_maker() as session:
+        assert await codes(session) == ["replica"]
+
+
+async def test_writes_pin_session_to_primary(session_maker):
+    """Test reads after a write see it on the primary."""
+    async with session_maker() as session:
+        session.add(Permission(code="new", name="new", resource="items", action="new"))
+        await session.commit()
+
+        assert sorted(await codes(session)) == ["new", "primary"]
+
+
+async def test_locking_and_raw_reads_use_primary(session_maker):
+    """Test SELECT ... FOR UPDATE and raw SQL are sent to the primary."""
+    async with session_maker() as session:
+        locked = await codes(session, select(Permission.code).with_for_update())
+        assert locked == ["primary"]
+
+    async with session_maker() as session:
+        raw = await session.scalar(text("SELECT code FROM permissions"))
+        assert raw == "primary"
+
+
+async def test_read_only_session_uses_replica(session_maker):
+    """Test read-only sessions send raw SQL to the replica too."""
+    async with session_maker(read_only=True) as session:
+        assert await session.scalar(text("SELECT code FROM permissions")) == "replica"
+
+
+async def test_request_pin_covers_other_sessions(session_maker):
+    """Test a write pins the rest of the request to the primary."""
+    with request_scope():
+        async with session_maker() as writer:
+            await writer.execute(text("SELECT 1"))
+        async with session_maker(read_only=True) as reader:
+            assert await codes(reader) == ["primary"]
+
+    async with session_maker() as session:
+        assert await codes(session) == ["replica"]
+
+
+async def test_pagination_reads_from_replica(databases):
+    """Test paginating with a total neither pins nor keeps a transaction open."""
+    primary, replica = databases
+    session_maker = async_sessionmaker(
+        primary,
+        class_=ReleasingSession,
+        sync_session_class=RoutingSession,
+        expire_on_commit=False,
+        replicas=ReplicaSet([replica]),
+    )
+
+    with request_scope():
+        async with session_maker() as session:
+            page = await paginate(
+                session, select(Permission), Permission, limit=10, include_total=True
+            )
+
+            assert [permission.code for permission in page.items] == ["replica"]
+            assert page.total == 1
+            assert not session.sync_session.pinned
+            assert not session.sync_session.in_write_transaction
+            assert not session.in_transaction()
+            assert not is_pinned_to_primary()
+
+
+async def test_lagging_replica_is_skipped(session_maker):
+    """Test reads fall back to the primary while replicas lag or fail."""
+    replicas = session_maker.kw["replicas"]
+    replicas.max_lag = 5.0
+
+    with patch("src.app.db.routing._measure_lag", AsyncMock(return_value=12.0)):
+        await replicas.check_lag()
+    async with session_maker() as session:
+        assert await codes(session) == ["primary"]
+
+    with patch("src.app.db.routing._measure_lag", AsyncMock(side_effect=OSError)):
+        await replicas.check_lag()
+    assert replicas.choose() is None
+
+    await replicas.check_lag()
+    assert replicas.replicas[0].lag == 0
+    async with session_maker() as session:
+        assert await codes(session) == ["replica"]
+
+
+async def test_round_robin_balancing():
+    """Test round-robin balancing alternates between replicas."""
+    engines = [create_async_engine("sqlite+aiosqlite://") for _ in range(2)]
+    replicas = ReplicaSet(engines)
+
+    assert [replicas.choose() for _ in range(4)] == engines * 2
+
+
+async def test_least_connections_balancing():
+    """Test least-connections balancing avoids busy replicas."""
+    engines = [
+        create_async_engine("sqlite+aiosqlite://", poolclass=AsyncAdaptedQueuePool)
+        for _ in range(2)
+    ]
+    replicas = ReplicaSet(engines, balancing="least_connections")
+
+    async with engines[0].connect():
+        assert replicas.choose() is engines[1]
+    async with engines[1].connect():
+        assert replicas.choose() is engines[0]
+
+    await replicas.stop()
@@ -278,7 +278,9 @@ class TestChangePassword:
         user = MagicMock(spec=User)
         user.hashed_password = "hashed_password"
 
-        with patch("src.app.services.auth_service.verify_password", return_value=False):
+        with patch(
+            "src.app.services.auth_service.verify_password_async", return_value=False
+        ):
             with pytest.raises(InvalidCredentialsError):
                 await service.change_password(user, "wrong_password", "new_password")
 
@@ -288,7 +290,9 @@ class TestChangePassword:
         user = MagicMock(spec=User)
         user.hashed_password = "hashed_password"
 
-        with patch("src.app.services.auth_service.verify_password") as mock_verify:
+        with patch(
+            "src.app.services.auth_service.verify_password_async"
+        ) as mock_verify:
             # First call (current password check) returns True
             # Second call (same password check) returns True
             mock_verify.side_effect = [True, True]
@@ -304,12 +308,16 @@ class TestChangePassword:
         user = MagicMock(spec=User)
         user.hashed_password = "old_hashed_password"
 
-        with patch("src.app.services.auth_service.verify_password") as mock_verify:
+        with patch(
+            "src.app.services.auth_service.verify_password_async"
+        ) as mock_verify:
             # First call (current password check) returns True
             # Second call (same password check) returns False
             mock_verify.side_effect = [True, False]
 
-            with patch("src.app.services.auth_service.get_password_hash") as mock_hash:
+            with patch(
+                "src.app.services.auth_service.hash_password_async"
+            ) as mock_hash:
                 mock_hash.return_value = "new_hashed_password"
 
                 await service.change_password(user, "current_password", "new_password")
@@ -20,6 +20,7 @@ from src.app.services.exceptions import (
     InvalidFileTypeError,
     InvalidTokenError,
     InvalidTokenTypeError,
+    PasswordHasherBusyError,
     ServiceError,
     StorageConnectionError,
     StorageError,
@@ -113,6 +114,16 @@ class TestServiceExceptionHandler:
         body = response.body.decode()
         assert "INACTIVE_USER" in body
 
+    @pytest.mark.asyncio
+    async def test_password_hasher_busy_error(self, mock_request):
+        """Test handling PasswordHasherBusyError."""
+        exc = PasswordHasherBusyError()
+        response = await service_exception_handler(mock_request, exc)
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.headers["Retry-After"] == "1"
+        body = response.body.decode()
+        assert "SERVICE_UNAVAILABLE" in body
+
     @pytest.mark.asyncio
     async def test_user_not_found_error_without_id(self, mock_request):
         """Test handling UserNotFoundError without user_id."""
@@ -254,6 +265,16 @@ class TestGraphQLExceptionMapper:
         result = map_service_exception_to_graphql(exc)
         assert isinstance(result, GQLError)
 
+    def test_map_password_hasher_busy(self):
+        """Test mapping PasswordHasherBusyError to GraphQL."""
+        from src.app.graphql.errors import ServiceUnavailableError as GQLError
+        from src.app.graphql.exception_mapper import map_service_exception_to_graphql
+
+        exc = PasswordHasherBusyError()
+        result = map_service_exception_to_graphql(exc)
+        assert isinstance(result, GQLError)
+        assert result.extensions["retry_after"] == 1
+
     def test_map_user_not_found(self):
         """Test mapping UserNotFoundError to GraphQL."""
         from src.app.graphql.errors import UserNotFoundError as GQLError
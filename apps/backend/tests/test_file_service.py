@@ -1,11 +1,14 @@
 """Tests for FileService database operations."""
 
 import pytest
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.app.models import User
+from src.app.models import AuditLog, User
 from src.app.services import FileNotFoundError, FileService
 from src.app.services.exceptions import HardDeleteNotAllowedError
 
+from tests.conftest import count_statements
+
 
 @pytest.fixture
 async def test_user(db_session: AsyncSession) -> User:
@@ -41,6 +44,40 @@ async def test_create_file(db_session: AsyncSession, test_user: User):
     assert file.created_at is not None
 
 
+@pytest.mark.asyncio
+async def test_create_many(db_session: AsyncSession, test_user: User):
+    """Test a batch of file records is saved with one insert and one audit entry."""
+    service = FileService(db_session)
+    files = [
+        {
+            "key": f"2024/01/01/batch{i}.txt",
+            "filename": f"batch{i}.txt",
+            "size": 100 * i,
+            "bucket": "uploads",
+            "content_type": "text/plain",
+        }
+        for i in range(5)
+    ]
+
+    with count_statements() as statements:
+        file_ids = await service.create_many(files, user_id=test_user.id)
+
+    inserts = [s for s in statements if s.startswith("INSERT INTO files")]
+    assert len(inserts) == 1
+    assert len(file_ids) == 5
+
+    stored, total = await service.list_files(user_id=test_user.id)
+    assert total == 5
+    assert {f.id for f in stored} == set(file_ids)
+    assert {f.key for f in stored} == {f["key"] for f in files}
+
+    result = await db_session.execute(select(AuditLog))
+    audit_logs = result.scalars().all()
+    assert len(audit_logs) == 1
+    assert audit_logs[0].action == "file.batch_uploaded"
+    assert audit_logs[0].extra_data["count"] == 5
+
+
 @pytest.mark.asyncio
 async def test_get_by_id(db_session: AsyncSession, test_user: User):
     """Test getting a file by ID."""
@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from httpx import AsyncClient
+from src.app.services.pagination import Page
 
 
 @pytest.fixture
@@ -176,9 +177,9 @@ async def test_list_files_success(client: AsyncClient, auth_headers: dict[str, s
     mock_files[1].content_type = "text/plain"
 
     with patch(
-        "src.app.api.files.FileService.list_files",
+        "src.app.api.files.FileService.paginate_files",
         new_callable=AsyncMock,
-        return_value=(mock_files, 2),
+        return_value=Page(items=mock_files, next_cursor=None, total=2),
     ):
         response = await client.get("/api/v1/files", headers=auth_headers)
 
@@ -207,9 +208,9 @@ async def test_list_files_with_pagination(
     mock_file.content_type = "text/plain"
 
     with patch(
-        "src.app.api.files.FileService.list_files",
+        "src.app.api.files.FileService.paginate_files",
         new_callable=AsyncMock,
-        return_value=([mock_file], 10),
+        return_value=Page(items=[mock_file], next_cursor=None, total=10),
     ):
         response = await client.get(
             "/api/v1/files?skip=5&limit=10", headers=auth_headers
@@ -507,9 +508,9 @@ async def test_batch_upload_success(client: AsyncClient, auth_headers: dict[str,
             side_effect=[mock_result1, mock_result2],
         ),
         patch(
-            "src.app.api.files.storage_service.get_presigned_url",
+            "src.app.api.files.storage_service.get_presigned_urls",
             new_callable=AsyncMock,
-            return_value="http://localhost:8333/uploads/...",
+            side_effect=lambda keys: dict.fromkeys(keys, "http://localhost:8333/..."),
         ),
         patch(
             "src.app.api.files.FileService.create",
@@ -533,6 +534,53 @@ async def test_batch_upload_success(client: AsyncClient, auth_headers: dict[str,
         assert all(r["success"] for r in data["results"])
 
 
+@pytest.mark.asyncio
+async def test_batch_upload_signs_urls_in_one_call(
+    client: AsyncClient, auth_headers: dict[str, str]
+):
+    """Test batch upload signs the URLs of all uploaded files at once."""
+    results = [
+        {
+            "key": f"2024/01/01/abc{i}_file{i}.txt",
+            "size": 9,
+            "content_type": "text/plain",
+            "bucket": "uploads",
+        }
+        for i in range(3)
+    ]
+
+    with (
+        patch(
+            "src.app.api.files.storage_service.upload_file",
+            new_callable=AsyncMock,
+            side_effect=results,
+        ),
+        patch(
+            "src.app.api.files.storage_service.get_presigned_urls",
+            new_callable=AsyncMock,
+            side_effect=lambda keys: {key: f"http://s3/{key}" for key in keys},
+        ) as mock_presign,
+        patch(
+            "src.app.api.files.FileService.create",
+            new_callable=AsyncMock,
+        ),
+    ):
+        response = await client.post(
+            "/api/v1/files/upload/batch",
+            files=[
+                ("files", (f"file{i}.txt", BytesIO(b"content"), "text/plain"))
+                for i in range(3)
+            ],
+            headers=auth_headers,
+        )
+
+    assert response.status_code == 201
+    assert [r["url"] for r in response.json()["results"]] == [
+        f"http://s3/{r['key']}" for r in results
+    ]
+    mock_presign.assert_awaited_once_with([r["key"] for r in results])
+
+
 @pytest.mark.asyncio
 async def test_batch_upload_unauthorized(client: AsyncClient):
     """Test batch upload without authentication."""
@@ -564,9 +612,9 @@ async def test_batch_upload_partial_success(
             side_effect=[mock_result, InvalidFileTypeError("Not allowed")],
         ),
         patch(
-            "src.app.api.files.storage_service.get_presigned_url",
+            "src.app.api.files.storage_service.get_presigned_urls",
             new_callable=AsyncMock,
-            return_value="http://localhost:8333/uploads/...",
+            side_effect=lambda keys: dict.fromkeys(keys, "http://localhost:8333/..."),
         ),
         patch(
             "src.app.api.files.FileService.create",
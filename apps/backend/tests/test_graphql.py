@@ -1,6 +1,22 @@
 """GraphQL endpoint tests."""
 
 from httpx import AsyncClient
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.app.models import Permission, Role, role_permissions
+
+
+async def grant_super_admin(db_session: AsyncSession, code: str) -> None:
+    """Grant a permission the superadmin fixture does not create."""
+    resource, action = code.split(":")
+    permission = Permission(code=code, name=code, resource=resource, action=action)
+    db_session.add(permission)
+    await db_session.flush()
+    role_id = await db_session.scalar(select(Role.id).where(Role.code == "super_admin"))
+    await db_session.execute(
+        insert(role_permissions).values(role_id=role_id, permission_id=permission.id)
+    )
+    await db_session.commit()
 
 
 class TestGraphQLEndpoint:
@@ -105,6 +121,130 @@ class TestGraphQLUserQueries:
         data = response.json()
         assert data["data"]["user"] is None
 
+    async def test_users_connection(
+        self, client: AsyncClient, superadmin_headers: dict
+    ):
+        """Test walking the users connection with cursors."""
+        for i in range(2):
+            await client.post(
+                "/api/v1/users",
+                json={"email": f"user{i}@example.com", "name": f"User {i}"},
+                headers=superadmin_headers,
+            )
+        query = """
+            query ($after: String) {
+                usersConnection(first: 2, after: $after) {
+                    edges { cursor node { id } }
+                    pageInfo { hasNextPage hasPreviousPage endCursor }
+                    totalCount
+                    totalCountEstimated
+                }
+            }
+        """
+        response = await client.post(
+            "/graphql", json={"query": query}, headers=superadmin_headers
+        )
+        first_page = response.json()["data"]["usersConnection"]
+        assert len(first_page["edges"]) == 2
+        assert first_page["totalCount"] == 3
+        assert first_page["totalCountEstimated"] is False
+        assert first_page["pageInfo"]["hasNextPage"] is True
+        assert first_page["pageInfo"]["hasPreviousPage"] is False
+
+        response = await client.post(
+            "/graphql",
+            json={
+                "query": query,
+                "variables": {"after": first_page["pageInfo"]["endCursor"]},
+            },
+            headers=superadmin_headers,
+        )
+        second_page = response.json()["data"]["usersConnection"]
+        assert len(second_page["edges"]) == 1
+        assert second_page["pageInfo"]["hasNextPage"] is False
+        assert second_page["pageInfo"]["hasPreviousPage"] is True
+        seen = {edge["node"]["id"] for edge in first_page["edges"]}
+        assert second_page["edges"][0]["node"]["id"] not in seen
+
+    async def test_users_connection_invalid_cursor(
+        self, client: AsyncClient, superadmin_headers: dict
+    ):
+        """Test a malformed cursor is reported as a validation error."""
+        query = """
+            query {
+                usersConnection(after: "not-a-cursor") {
+                    edges { cursor }
+                }
+            }
+        """
+        response = await client.post(
+            "/graphql", json={"query": query}, headers=superadmin_headers
+        )
+        error = response.json()["errors"][0]
+        assert error["extensions"]["code"] == "VALIDATION_ERROR"
+        assert error["extensions"]["field"] == "after"
+
+
+class TestGraphQLListQueries:
+    """Test GraphQL skip/limit list queries."""
+
+    async def test_files_query(self, client: AsyncClient, auth_headers: dict):
+        """Test files query accepts skip and limit."""
+        query = """
+            query {
+                files(skip: 0, limit: 500) {
+                    items { id }
+                    total
+                    hasMore
+                }
+            }
+        """
+        response = await client.post(
+            "/graphql", json={"query": query}, headers=auth_headers
+        )
+        data = response.json()
+        assert "errors" not in data
+        assert data["data"]["files"]["total"] == 0
+
+    async def test_audit_logs_query(
+        self, client: AsyncClient, superadmin_headers: dict, db_session: AsyncSession
+    ):
+        """Test auditLogs query accepts skip and limit."""
+        await grant_super_admin(db_session, "audit:read")
+        query = """
+            query {
+                auditLogs(skip: 0, limit: 500) {
+                    items { id }
+                    hasMore
+                }
+            }
+        """
+        response = await client.post(
+            "/graphql", json={"query": query}, headers=superadmin_headers
+        )
+        data = response.json()
+        assert "errors" not in data
+        assert data["data"]["auditLogs"]["hasMore"] is False
+
+    async def test_audit_logs_query_rejects_negative_skip(
+        self, client: AsyncClient, superadmin_headers: dict, db_session: AsyncSession
+    ):
+        """Test auditLogs query validates skip."""
+        await grant_super_admin(db_session, "audit:read")
+        query = """
+            query {
+                auditLogs(skip: -1) {
+                    items { id }
+                }
+            }
+        """
+        response = await client.post(
+            "/graphql", json={"query": query}, headers=superadmin_headers
+        )
+        error = response.json()["errors"][0]
+        assert error["extensions"]["code"] == "VALIDATION_ERROR"
+        assert error["extensions"]["field"] == "skip"
+
 
 class TestGraphQLUserMutations:
     """Test GraphQL user mutations."""
@@ -1,7 +1,9 @@
 """Unit tests for GraphQL security extensions."""
 
 from graphql import parse
+from src.app.graphql.complexity import analyze_document
 from src.app.graphql.extensions import DepthLimitExtension, QueryComplexityExtension
+from src.app.graphql.schema import schema
 
 
 class TestDepthLimitExtension:
@@ -239,8 +241,8 @@ class TestQueryComplexityExtension:
         # users(1) + items(1) + id(1) + email(1) = 4
         assert complexity == 4
 
-    def test_calculate_complexity_with_fragment_prevents_recount(self):
-        """Test that fragments are tracked to prevent infinite loops."""
+    def test_calculate_complexity_counts_each_fragment_spread(self):
+        """Test that a fragment is counted at every spread."""
         query = """
             fragment UserFields on UserType {
                 id
@@ -261,9 +263,8 @@ class TestQueryComplexityExtension:
         ext = QueryComplexityExtension(execution_context=None, max_complexity=100)
         doc = parse(query)
         complexity = ext._calculate_complexity(doc)
-        # users(1) + items(1) + id(1) + email(1) + user(1) = 5
-        # Fragment is tracked per-traversal, second spread doesn't count again
-        assert complexity == 5
+        # users(1) + items(1) + id(1) + email(1) + user(1) + id(1) + email(1) = 7
+        assert complexity == 7
 
     def test_complexity_exceeded_value(self):
         """Test complexity calculation correctly identifies exceeding queries."""
@@ -305,6 +306,151 @@ class TestQueryComplexityExtension:
         assert complexity == 1
         assert complexity <= ext.max_complexity
 
+    def test_introspection_fields_are_ignored(self):
+        """Test introspection fields do not count towards depth or complexity."""
+        query = """
+            query {
+                hello
+                __typename
+                __schema {
+                    types {
+                        fields {
+                            type {
+                                ofType {
+                                    name
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        """
+        doc = parse(query)
+        assert DepthLimitExtension._calculate_depth(doc) == 1
+        assert QueryComplexityExtension._calculate_complexity(doc) == 1
+
+
+class TestCostModel:
+    """Unit tests for list multipliers and field weights."""
+
+    def test_limit_multiplies_list_fields_of_wrapper(self):
+        """Test limit applies to the wrapper's list, not to its metadata."""
+        query = """
+            query {
+                users(limit: 50) {
+                    data {
+                        id
+                        email
+                    }
+                    meta {
+                        totalItems
+                    }
+                }
+            }
+        """
+        analysis = analyze_document(parse(query), schema._schema)
+        # users(1) + data(1) + 50 * (id + email) + meta(1) + totalItems(1) = 104
+        assert analysis.complexity == 104
+        assert analysis.depth == 3
+        assert analysis.uses_variables is False
+
+    def test_default_limit_is_used(self):
+        """Test the argument's schema default is used when it is omitted."""
+        query = "query { users { data { id } } }"
+        analysis = analyze_document(parse(query), schema._schema)
+        # users(1) + data(1) + 20 * id
+        assert analysis.complexity == 22
+
+    def test_limit_from_variables(self):
+        """Test list sizes given as variables are resolved per request."""
+        query = """
+            query Users($limit: Int = 10) {
+                users(limit: $limit) {
+                    data {
+                        id
+                    }
+                }
+            }
+        """
+        doc = parse(query)
+
+        with_variable = analyze_document(doc, schema._schema, {"limit": 5})
+        with_default = analyze_document(doc, schema._schema)
+
+        assert with_variable.complexity == 7
+        assert with_default.complexity == 12
+        assert with_variable.uses_variables is True
+
+    def test_multipliers_compound_for_nested_lists(self):
+        """Test nested selections inside a sized list are multiplied."""
+        query = """
+            query {
+                users(limit: 10) {
+                    data {
+                        roles {
+                            permissions {
+                                code
+                            }
+                        }
+                    }
+                }
+            }
+        """
+        analysis = analyze_document(parse(query), schema._schema)
+        # users(1) + data(1) + 10 * (roles + permissions + code)
+        assert analysis.complexity == 32
+
+    def test_cost_directive_sets_field_weight(self):
+        """Test @cost annotations override the default weight."""
+        query = "query { health { status } }"
+        analysis = analyze_document(parse(query), schema._schema)
+        # health(10) + status(1)
+        assert analysis.complexity == 11
+
+    def test_limit_without_schema_multiplies_selection(self):
+        """Test limit multiplies the whole selection when types are unknown."""
+        query = "query { users(limit: 10) { data { id } } }"
+        complexity = QueryComplexityExtension._calculate_complexity(parse(query))
+        # users(1) + 10 * (data + id)
+        assert complexity == 21
+
+    def test_reused_fragment_counts_every_spread(self):
+        """Test a fragment costs as much at each spread as inline selections."""
+        fields = "data { id email name isActive createdAt }"
+        inline = f"""
+            query {{
+                a: users(limit: 100) {{ {fields} }}
+                b: users(limit: 100) {{ {fields} }}
+                c: users(limit: 100) {{ {fields} }}
+            }}
+        """
+        with_fragment = f"""
+            fragment F on PaginatedUsers {{ {fields} }}
+            query {{
+                a: users(limit: 100) {{ ...F }}
+                b: users(limit: 100) {{ ...F }}
+                c: users(limit: 100) {{ ...F }}
+            }}
+        """
+
+        expected = analyze_document(parse(inline), schema._schema)
+        analysis = analyze_document(parse(with_fragment), schema._schema)
+
+        assert expected.complexity == 1506
+        assert analysis.complexity == expected.complexity
+        assert analysis.depth == expected.depth
+
+    def test_cyclic_fragments_terminate(self):
+        """Test fragments spreading each other stop at the cycle."""
+        query = """
+            fragment A on UserType { id ...B }
+            fragment B on UserType { email ...A }
+            query { users { data { ...A } } }
+        """
+        analysis = analyze_document(parse(query), schema._schema)
+        # users(1) + data(1) + 20 * (id + email)
+        assert analysis.complexity == 42
+
 
 class TestExtensionsDefaultValues:
     """Test that extensions use default values from settings."""
@@ -318,8 +464,8 @@ class TestExtensionsDefaultValues:
     def test_complexity_limit_uses_settings_default(self):
         """Test that QueryComplexityExtension uses settings.graphql_max_complexity."""
         ext = QueryComplexityExtension(execution_context=None)
-        # Default from settings is 100
-        assert ext.max_complexity == 100
+        # Default from settings is 1000
+        assert ext.max_complexity == 1000
 
     def test_depth_limit_custom_value(self):
         """Test that custom max_depth is used."""
@@ -0,0 +1,142 @@
+"""GraphQL DataLoader tests."""
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.app.core.security import get_password_hash
+from src.app.graphql.loaders import create_loaders
+from src.app.models import Permission, Role, User
+
+from tests.conftest import count_statements
+
+NESTED_USERS_QUERY = """
+    query {
+        users(page: 1, limit: 100) {
+            data {
+                email
+                roles {
+                    code
+                    permissions {
+                        code
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+async def create_users_with_roles(db_session: AsyncSession, count: int) -> list[User]:
+    """Helper to create users, each with its own role and permission."""
+    users = []
+    for i in range(count):
+        permission = Permission(
+            code=f"loader{i}:read",
+            name=f"Loader {i} Read",
+            resource=f"loader{i}",
+            action="read",
+        )
+        role = Role(code=f"loader_role_{i}", name=f"Loader Role {i}")
+        role.permissions = [permission]
+        user = User(
+            email=f"loader{i}@example.com",
+            name=f"Loader User {i}",
+            hashed_password=get_password_hash("password123"),
+        )
+        user.roles = [role]
+        db_session.add(user)
+        users.append(user)
+    await db_session.commit()
+    return users
+
+
+async def run_query(client: AsyncClient, headers: dict, query: str) -> dict:
+    """Execute a GraphQL query and return its data."""
+    response = await client.post("/graphql", json={"query": query}, headers=headers)
+    assert response.status_code == 200
+    payload = response.json()
+    assert "errors" not in payload, payload.get("errors")
+    return payload["data"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("user_count", [3, 12])
+async def test_nested_users_query_batches_per_level(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    superadmin_headers: dict,
+    user_count: int,
+):
+    """Test users { roles { permissions } } runs one query per level."""
+    await create_users_with_roles(db_session, user_count)
+    # Warm the principal cache so authentication does not touch the database
+    await run_query(
+        client, superadmin_headers, "query { users { meta { totalItems } } }"
+    )
+
+    with count_statements() as statements:
+        data = await run_query(client, superadmin_headers, NESTED_USERS_QUERY)
+
+    users = {u["email"]: u for u in data["users"]["data"]}
+    assert len(users) == user_count + 1
+    assert users["loader0@example.com"]["roles"] == [
+        {"code": "loader_role_0", "permissions": [{"code": "loader0:read"}]}
+    ]
+    # count + users + roles by user + permissions by role
+    assert len(statements) == 4
+
+
+@pytest.mark.asyncio
+async def test_unselected_nested_fields_are_not_loaded(
+    client: AsyncClient, db_session: AsyncSession, superadmin_headers: dict
+):
+    """Test relationships are only loaded when the field is selected."""
+    await create_users_with_roles(db_session, 3)
+    await run_query(
+        client, superadmin_headers, "query { users { meta { totalItems } } }"
+    )
+
+    with count_statements() as statements:
+        await run_query(
+            client, superadmin_headers, "query { users { data { email } } }"
+        )
+
+    # count + users
+    assert len(statements) == 2
+
+
+@pytest.mark.asyncio
+async def test_users_loader_batches_concurrent_loads(db_session: AsyncSession):
+    """Test concurrent loads (e.g. audit log actors) share one query."""
+    users = await create_users_with_roles(db_session, 5)
+    loaders = create_loaders(db_session)
+    user_ids = [user.id for user in users] + [uuid.uuid4()]
+
+    with count_statements() as statements:
+        loaded = await asyncio.gather(*(loaders.users.load(i) for i in user_ids))
+
+    assert [u.email if u else None for u in loaded] == [
+        user.email for user in users
+    ] + [None]
+    assert len(statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_presigned_urls_loader_signs_in_one_batch(db_session: AsyncSession):
+    """Test File.url loads share one get_presigned_urls call."""
+    loaders = create_loaders(db_session)
+    keys = [f"2024/01/01/file{i}.txt" for i in range(5)]
+
+    with patch(
+        "src.app.graphql.loaders.storage_service.get_presigned_urls",
+        new_callable=AsyncMock,
+        side_effect=lambda keys: {key: f"http://s3/{key}" for key in keys},
+    ) as mock_presign:
+        urls = await asyncio.gather(*(loaders.presigned_urls.load(k) for k in keys))
+
+    assert urls == [f"http://s3/{key}" for key in keys]
+    mock_presign.assert_awaited_once_with(keys)
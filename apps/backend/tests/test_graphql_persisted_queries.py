@@ -0,0 +1,204 @@
+"""GraphQL persisted query and document cache tests."""
+
+import hashlib
+from unittest.mock import patch
+
+import pytest
+import strawberry.schema.schema as strawberry_schema
+from graphql import parse, validate
+from httpx import AsyncClient
+from src.app.graphql.complexity import QueryAnalysis
+from src.app.graphql.document_cache import (
+    CachedDocument,
+    DocumentCache,
+    document_cache,
+    query_hash,
+)
+
+HELLO_QUERY = "query Hello { hello }"
+HELLO_HASH = hashlib.sha256(HELLO_QUERY.encode()).hexdigest()
+
+
+def persisted_query(sha256_hash: str = HELLO_HASH) -> dict:
+    """Helper to build the APQ request extension."""
+    return {"persistedQuery": {"version": 1, "sha256Hash": sha256_hash}}
+
+
+def make_entry(query: str) -> CachedDocument:
+    """Helper to build a cache entry."""
+    return CachedDocument(
+        query=query, document=parse(query), analysis=QueryAnalysis(1, 1)
+    )
+
+
+class TestDocumentCache:
+    """Test the in-process document cache."""
+
+    def test_query_hash(self):
+        """Test the hash matches the APQ sha256 hex digest."""
+        assert query_hash(HELLO_QUERY) == HELLO_HASH
+
+    def test_evicts_least_recently_used(self):
+        """Test the cache is bounded by max_size."""
+        cache = DocumentCache(max_size=2)
+        cache.put("a", make_entry("{ a }"))
+        cache.put("b", make_entry("{ b }"))
+
+        # Touch the first entry so the second becomes least recently used
+        assert cache.get("a") is not None
+        cache.put("c", make_entry("{ c }"))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_zero_size_disables_cache(self):
+        """Test nothing is cached when max_size is 0."""
+        cache = DocumentCache(max_size=0)
+        cache.put("a", make_entry("{ a }"))
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_get_query_without_redis(self):
+        """Test persisted queries resolve from the in-process tier."""
+        cache = DocumentCache()
+        cache.put(HELLO_HASH, make_entry(HELLO_QUERY))
+
+        assert await cache.get_query(HELLO_HASH) == HELLO_QUERY
+        assert await cache.get_query("unknown") is None
+
+
+class TestParsedDocumentCache:
+    """Test operations are parsed and validated once."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_skips_parse_and_validation(self, client: AsyncClient):
+        """Test a repeated operation is served from the document cache."""
+        with (
+            patch.object(
+                strawberry_schema, "parse", wraps=strawberry_schema.parse
+            ) as mock_parse,
+            patch(
+                "src.app.graphql.extensions.validate", wraps=validate
+            ) as mock_validate,
+        ):
+            for _ in range(3):
+                response = await client.post("/graphql", json={"query": HELLO_QUERY})
+                assert response.json()["data"] == {"hello": "Hello from GraphQL!"}
+
+        assert mock_parse.call_count == 1
+        assert mock_validate.call_count == 1
+        cached = document_cache.get(HELLO_HASH)
+        assert cached is not None
+        assert cached.analysis == QueryAnalysis(depth=1, complexity=1)
+
+    @pytest.mark.asyncio
+    async def test_invalid_query_is_not_cached(self, client: AsyncClient):
+        """Test documents failing validation are not cached."""
+        response = await client.post("/graphql", json={"query": "{ unknownField }"})
+
+        assert response.json()["errors"]
+        assert len(document_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_depth_limit_applies_to_cached_documents(self, client: AsyncClient):
+        """Test the depth limit is enforced on both fresh and cached documents."""
+        query = "{ users { data { roles { code } } } }"
+
+        with patch("src.app.graphql.extensions.settings.graphql_max_depth", 3):
+            for _ in range(2):
+                response = await client.post("/graphql", json={"query": query})
+                errors = response.json()["errors"]
+                assert errors[0]["extensions"]["code"] == "QUERY_TOO_DEEP"
+                assert errors[0]["extensions"]["depth"] == 4
+
+    @pytest.mark.asyncio
+    async def test_complexity_limit_is_enforced(self, client: AsyncClient):
+        """Test the complexity limit rejects the operation."""
+        query = "{ users { data { id email name } } }"
+
+        with patch("src.app.graphql.extensions.settings.graphql_max_complexity", 3):
+            response = await client.post("/graphql", json={"query": query})
+
+        errors = response.json()["errors"]
+        assert errors[0]["extensions"]["code"] == "QUERY_TOO_COMPLEX"
+
+
+class TestAutomaticPersistedQueries:
+    """Test the Automatic Persisted Queries protocol."""
+
+    @pytest.mark.asyncio
+    async def test_unknown_hash_is_not_found(self, client: AsyncClient):
+        """Test a hash-only request for an unknown query asks for the query."""
+        response = await client.post("/graphql", json={"extensions": persisted_query()})
+
+        assert response.status_code == 200
+        error = response.json()["errors"][0]
+        assert error["message"] == "PersistedQueryNotFound"
+        assert error["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+    @pytest.mark.asyncio
+    async def test_register_then_execute_by_hash(self, client: AsyncClient):
+        """Test a query sent with its hash can then be executed by hash alone."""
+        response = await client.post(
+            "/graphql",
+            json={"query": HELLO_QUERY, "extensions": persisted_query()},
+        )
+        assert response.json()["data"] == {"hello": "Hello from GraphQL!"}
+
+        response = await client.post("/graphql", json={"extensions": persisted_query()})
+        assert response.json()["data"] == {"hello": "Hello from GraphQL!"}
+
+    @pytest.mark.asyncio
+    async def test_hash_mismatch_is_rejected(self, client: AsyncClient):
+        """Test a query whose hash does not match is rejected."""
+        response = await client.post(
+            "/graphql",
+            json={"query": HELLO_QUERY, "extensions": persisted_query("0" * 64)},
+        )
+
+        error = response.json()["errors"][0]
+        assert error["extensions"]["code"] == "INVALID_PERSISTED_QUERY"
+        assert document_cache.get("0" * 64) is None
+
+    @pytest.mark.asyncio
+    async def test_unsupported_version_is_rejected(self, client: AsyncClient):
+        """Test only version 1 of the protocol is accepted."""
+        response = await client.post(
+            "/graphql",
+            json={
+                "query": HELLO_QUERY,
+                "extensions": {
+                    "persistedQuery": {"version": 2, "sha256Hash": HELLO_HASH}
+                },
+            },
+        )
+
+        error = response.json()["errors"][0]
+        assert error["extensions"]["code"] == "INVALID_PERSISTED_QUERY"
+
+    @pytest.mark.asyncio
+    async def test_disabled(self, client: AsyncClient):
+        """Test persisted queries can be disabled."""
+        with patch("src.app.graphql.extensions.settings.graphql_apq_enabled", False):
+            response = await client.post(
+                "/graphql", json={"extensions": persisted_query()}
+            )
+
+        error = response.json()["errors"][0]
+        assert error["message"] == "PersistedQueryNotSupported"
+        assert error["extensions"]["code"] == "PERSISTED_QUERY_NOT_SUPPORTED"
+
+    @pytest.mark.asyncio
+    async def test_hash_is_resolved_from_redis(self, client: AsyncClient):
+        """Test a hash registered by another worker is resolved through Redis."""
+        with patch.object(
+            document_cache, "get_query", return_value=HELLO_QUERY
+        ) as mock_get_query:
+            response = await client.post(
+                "/graphql", json={"extensions": persisted_query()}
+            )
+
+        mock_get_query.assert_awaited_once_with(HELLO_HASH)
+        assert response.json()["data"] == {"hello": "Hello from GraphQL!"}
+        assert document_cache.get(HELLO_HASH) is not None
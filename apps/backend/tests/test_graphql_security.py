@@ -62,6 +62,40 @@ class TestGraphQLDepthLimit:
 class TestGraphQLComplexity:
     """Test GraphQL query complexity limiting."""
 
+    async def test_depth_and_cost_reported_in_extensions(self, client: AsyncClient):
+        """Test the response extensions carry the query depth and cost."""
+        response = await client.post("/graphql", json={"query": "{ hello }"})
+        extensions = response.json()["extensions"]
+        assert extensions["queryDepth"] == 1
+        assert extensions["queryComplexity"] == 1
+        assert extensions["maxQueryDepth"] == 10
+        assert extensions["maxQueryComplexity"] == 1000
+
+    async def test_large_limit_variable_rejected(self, client: AsyncClient):
+        """Test the cost of a cached document is recomputed with its variables."""
+        query = """
+            query Users($limit: Int) {
+                users(limit: $limit) {
+                    data {
+                        id
+                        email
+                    }
+                }
+            }
+        """
+        response = await client.post(
+            "/graphql", json={"query": query, "variables": {"limit": 10}}
+        )
+        codes = [e["extensions"]["code"] for e in response.json().get("errors", [])]
+        assert "QUERY_TOO_COMPLEX" not in codes
+
+        response = await client.post(
+            "/graphql", json={"query": query, "variables": {"limit": 10000}}
+        )
+        error = response.json()["errors"][0]
+        assert error["extensions"]["code"] == "QUERY_TOO_COMPLEX"
+        assert error["extensions"]["complexity"] == 20002
+
     async def test_simple_query_succeeds(self, client: AsyncClient):
         """Test that simple queries work normally."""
         query = """
@@ -174,3 +208,32 @@ class TestGraphQLFragments:
             for error in data["errors"]:
                 code = error.get("extensions", {}).get("code")
                 assert code not in ["QUERY_TOO_DEEP", "QUERY_TOO_COMPLEX"]
+
+    async def test_reused_fragment_rejected_like_inline_query(
+        self, client: AsyncClient
+    ):
+        """Test moving a heavy selection into a fragment does not lower its cost."""
+        fields = "data { id email name isActive createdAt }"
+        inline = f"""
+            query {{
+                a: users(limit: 100) {{ {fields} }}
+                b: users(limit: 100) {{ {fields} }}
+                c: users(limit: 100) {{ {fields} }}
+            }}
+        """
+        with_fragment = f"""
+            fragment F on PaginatedUsers {{ {fields} }}
+            query {{
+                a: users(limit: 100) {{ ...F }}
+                b: users(limit: 100) {{ ...F }}
+                c: users(limit: 100) {{ ...F }}
+            }}
+        """
+
+        errors = []
+        for query in (inline, with_fragment):
+            response = await client.post("/graphql", json={"query": query})
+            errors.append(response.json()["errors"][0]["extensions"])
+
+        assert errors[0]["code"] == "QUERY_TOO_COMPLEX"
+        assert errors[1] == errors[0]
@@ -1,9 +1,19 @@
 """Tests for GraphQL subscriptions."""
 
 import asyncio
+import json
 from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from redis.exceptions import RedisError
+from src.app.graphql.errors import SubscriberTooSlowError
+from src.app.graphql.pubsub import (
+    CHANNEL_PREFIX,
+    OverflowPolicy,
+    PubSubBroker,
+    RedisPubSubBroker,
+)
 from src.app.graphql.subscriptions import (
     UserActivity,
     UserActivityPubSub,
@@ -22,7 +32,7 @@ class TestUserActivityPubSub:
     @pytest.fixture
     def pubsub(self):
         """Create a fresh pubsub instance for testing."""
-        return UserActivityPubSub()
+        return UserActivityPubSub(PubSubBroker())
 
     async def test_publish_to_subscriber(self, pubsub: UserActivityPubSub):
         """Test that published activities are received by subscribers."""
@@ -100,7 +110,7 @@ class TestUserActivityPubSub:
 
     async def test_subscriber_cleanup_on_cancel(self, pubsub: UserActivityPubSub):
         """Test that subscribers are removed when cancelled."""
-        assert len(pubsub._subscribers) == 0
+        assert pubsub.subscriber_count == 0
 
         async def subscriber():
             async for _ in pubsub.subscribe():
@@ -110,7 +120,7 @@ class TestUserActivityPubSub:
         await asyncio.sleep(0.01)
 
         # Subscriber should be registered
-        assert len(pubsub._subscribers) == 1
+        assert pubsub.subscriber_count == 1
 
         # Cancel the subscriber
         task.cancel()
@@ -120,18 +130,227 @@ class TestUserActivityPubSub:
             pass
 
         # Subscriber should be cleaned up
-        assert len(pubsub._subscribers) == 0
+        assert pubsub.subscriber_count == 0
+
+
+async def start_subscriber(
+    broker: PubSubBroker, channel: str, received: list, delay: float = 0
+) -> asyncio.Task:
+    """Start a subscriber that handles each message in ``delay`` seconds."""
+
+    async def subscriber():
+        async for message in broker.subscribe(channel):
+            received.append(message)
+            await asyncio.sleep(delay)
+
+    task = asyncio.create_task(subscriber())
+    await asyncio.sleep(0)
+    return task
+
+
+async def stop(task: asyncio.Task) -> None:
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+class TestPubSubBroker:
+    """Tests for bounded per-subscriber queues."""
+
+    async def test_publish_does_not_wait_for_slow_subscribers(self):
+        """Test a stalled subscriber does not delay delivery to the others."""
+        broker = PubSubBroker(max_queue_size=10)
+        slow, fast = [], []
+        slow_task = await start_subscriber(broker, "events", slow, delay=60)
+        fast_task = await start_subscriber(broker, "events", fast)
+
+        for i in range(5):
+            await asyncio.wait_for(broker.publish("events", {"n": i}), timeout=0.1)
+        await asyncio.sleep(0.01)
+
+        assert [m["n"] for m in fast] == [0, 1, 2, 3, 4]
+        assert [m["n"] for m in slow] == [0]
+        await stop(slow_task)
+        await stop(fast_task)
+
+    async def test_drop_oldest_policy(self):
+        """Test a full queue drops its oldest message."""
+        broker = PubSubBroker(max_queue_size=2)
+        received = []
+        task = await start_subscriber(broker, "events", received, delay=60)
+        await broker.publish("events", {"n": 0})
+        await asyncio.sleep(0)
+
+        # 0 is being handled, 1-2 fill the queue and 3-4 push out the oldest
+        for i in range(1, 5):
+            await broker.publish("events", {"n": i})
+
+        subscriber = next(iter(broker._channels["events"]))
+        assert [subscriber.queue.get_nowait()["n"] for _ in range(2)] == [3, 4]
+        stats = broker.stats()
+        assert stats["dropped"] == 2
+        assert stats["delivered"] == 5
+        assert stats["disconnected"] == 0
+        await stop(task)
+
+    async def test_disconnect_policy(self):
+        """Test a subscriber that falls behind is closed with an error."""
+        broker = PubSubBroker(
+            max_queue_size=2, overflow_policy=OverflowPolicy.DISCONNECT
+        )
+        subscription = broker.subscribe("events")
+        first = asyncio.create_task(anext(subscription))
+        await asyncio.sleep(0)
+        await broker.publish("events", {"n": 0})
+        assert (await first)["n"] == 0
+
+        # The subscriber stops reading: 1-2 fill its queue and 3 overflows it
+        for i in range(1, 4):
+            await broker.publish("events", {"n": i})
+
+        with pytest.raises(SubscriberTooSlowError):
+            await anext(subscription)
+        stats = broker.stats()
+        assert stats["disconnected"] == 1
+        assert stats["dropped"] == 3
+        assert stats["subscribers"] == 0
+
+    async def test_subscriber_counts(self):
+        """Test subscribers are counted per channel and removed on exit."""
+        broker = PubSubBroker()
+        tasks = [
+            await start_subscriber(broker, "a", []),
+            await start_subscriber(broker, "a", []),
+            await start_subscriber(broker, "b", []),
+        ]
+
+        assert broker.subscriber_count() == 3
+        assert broker.subscriber_count("a") == 2
+        assert broker.stats()["channels"] == {"a": 2, "b": 1}
+
+        for task in tasks:
+            await stop(task)
+        assert broker.subscriber_count() == 0
+        assert broker.stats()["channels"] == {}
+
+
+class TestRedisPubSubBroker:
+    """Tests for relaying events through Redis."""
+
+    @pytest.fixture
+    def redis_client(self):
+        """Mock Redis client whose pub/sub replays published messages."""
+        messages: asyncio.Queue = asyncio.Queue()
+        pubsub = MagicMock()
+        pubsub.channels = {}
+
+        async def subscribe(*channels):
+            pubsub.channels.update(dict.fromkeys(channels))
+
+        pubsub.subscribe = AsyncMock(side_effect=subscribe)
+        pubsub.unsubscribe = AsyncMock()
+        pubsub.aclose = AsyncMock()
+
+        async def get_message(ignore_subscribe_messages=False, timeout=None):
+            try:
+                return await asyncio.wait_for(messages.get(), timeout=0.01)
+            except TimeoutError:
+                return None
+
+        async def publish(channel, data):
+            await messages.put({"type": "message", "channel": channel, "data": data})
+
+        pubsub.get_message = get_message
+        client = MagicMock()
+        client.pubsub.return_value = pubsub
+        client.publish = AsyncMock(side_effect=publish)
+        return client
+
+    async def test_publish_is_relayed_through_redis(self, redis_client):
+        """Test events go through Redis and reach local subscribers."""
+        broker = RedisPubSubBroker()
+        received = []
+        with patch.object(broker, "_get_redis", return_value=redis_client):
+            task = await start_subscriber(broker, "events", received)
+            await broker.publish("events", {"n": 1})
+            await asyncio.sleep(0.05)
+            await stop(task)
+            await broker.close()
+
+        channel = CHANNEL_PREFIX + "events"
+        redis_client.pubsub.return_value.subscribe.assert_awaited_once_with(channel)
+        redis_client.publish.assert_awaited_once_with(channel, json.dumps({"n": 1}))
+        assert received == [{"n": 1}]
+
+    async def test_one_redis_subscription_per_channel(self, redis_client):
+        """Test local subscribers share the worker's Redis subscription."""
+        broker = RedisPubSubBroker()
+        with patch.object(broker, "_get_redis", return_value=redis_client):
+            tasks = [await start_subscriber(broker, "events", []) for _ in range(3)]
+            await asyncio.sleep(0)
+            for task in tasks:
+                await stop(task)
+
+        pubsub = redis_client.pubsub.return_value
+        assert pubsub.subscribe.await_count == 1
+        # The last subscriber leaving closes the subscription connection
+        pubsub.aclose.assert_awaited_once()
+        assert broker._listener is None
+
+    async def test_failed_subscribe_is_retried(self, redis_client):
+        """Test the next subscriber retries a Redis subscription that failed."""
+        broker = RedisPubSubBroker()
+        pubsub = redis_client.pubsub.return_value
+        subscribe = pubsub.subscribe.side_effect
+        pubsub.subscribe.side_effect = RedisError("down")
+        first, second = [], []
+        with patch.object(broker, "_get_redis", return_value=redis_client):
+            tasks = [await start_subscriber(broker, "events", first)]
+            pubsub.subscribe.side_effect = subscribe
+            tasks.append(await start_subscriber(broker, "events", second))
+            await broker.publish("events", {"n": 1})
+            await asyncio.sleep(0.05)
+            for task in tasks:
+                await stop(task)
+            await broker.close()
+
+        assert pubsub.subscribe.await_count == 2
+        assert first == second == [{"n": 1}]
+
+    async def test_falls_back_to_local_delivery(self):
+        """Test events are delivered in-process when Redis is not initialized."""
+        broker = RedisPubSubBroker()
+        received = []
+        task = await start_subscriber(broker, "events", received)
+        await broker.publish("events", {"n": 1})
+        await asyncio.sleep(0)
+        await stop(task)
+
+        assert received == [{"n": 1}]
+
+    async def test_publish_error_delivers_locally(self, redis_client):
+        """Test a failed Redis publish still reaches local subscribers."""
+        broker = RedisPubSubBroker()
+        redis_client.publish.side_effect = RedisError("down")
+        received = []
+        with patch.object(broker, "_get_redis", return_value=redis_client):
+            task = await start_subscriber(broker, "events", received)
+            await broker.publish("events", {"n": 1})
+            await asyncio.sleep(0)
+            await stop(task)
+
+        assert received == [{"n": 1}]
 
 
 class TestPublishHelperFunctions:
     """Tests for publish helper functions."""
 
     @pytest.fixture(autouse=True)
-    def clear_subscribers(self):
-        """Clear global pubsub subscribers before each test."""
-        user_activity_pubsub._subscribers.clear()
-        yield
-        user_activity_pubsub._subscribers.clear()
+    def fresh_broker(self, monkeypatch):
+        """Use an empty in-process broker for the global pubsub."""
+        monkeypatch.setattr(user_activity_pubsub, "broker", PubSubBroker())
 
     async def test_publish_user_created(self):
         """Test publish_user_created helper."""
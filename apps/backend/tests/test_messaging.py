@@ -1,17 +1,23 @@
 """Tests for RabbitMQ messaging module."""
 
+import asyncio
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import func, select
+from src.app.messaging.consumer import BatchMessageConsumer, MessageConsumer
 from src.app.messaging.exceptions import (
     ConsumerNotStartedError,
     MessageDeserializationError,
     MessagePublishError,
+    MessageRetryExhaustedError,
     MessageSerializationError,
     MessagingError,
 )
 from src.app.messaging.types import (
+    AuditLogMessage,
     BaseMessage,
     DomainEvent,
     EmailMessage,
@@ -22,6 +28,10 @@ from src.app.messaging.types import (
     UserLoggedInEvent,
     UserRegisteredEvent,
 )
+from src.app.models import AuditLog
+
+from tests import conftest
+from tests.conftest import count_statements
 
 
 class TestMessageTypes:
@@ -341,6 +351,76 @@ class TestMessageProducer:
         await message_producer.publish_event(event)
 
 
+class TestMessageProducerPublishing:
+    """Tests for publishing through a pooled channel."""
+
+    @pytest.fixture
+    def channel(self):
+        """Pooled channel whose exchange records published messages."""
+        channel = MagicMock()
+        channel.exchange = MagicMock()
+        channel.exchange.publish = AsyncMock()
+        channel.get_exchange = AsyncMock(return_value=channel.exchange)
+
+        @asynccontextmanager
+        async def get_channel():
+            yield channel
+
+        with (
+            patch("src.app.messaging.producer.settings") as settings,
+            patch("src.app.messaging.producer.RabbitMQPool") as pool,
+            patch("src.app.messaging.producer.get_channel", get_channel),
+        ):
+            settings.rabbitmq_enabled = True
+            settings.rabbitmq_exchange_name = "test_exchange"
+            settings.rabbitmq_publish_confirm_window = 2
+            pool.is_initialized.return_value = True
+            yield channel
+
+    async def test_exchange_is_cached_per_channel(self, channel):
+        """Test the exchange is looked up once for many publishes."""
+        from src.app.messaging.producer import MessageProducer
+
+        producer = MessageProducer()
+        await producer.publish(BaseMessage(), "test.one")
+        await producer.publish(BaseMessage(), "test.two")
+
+        channel.get_exchange.assert_awaited_once_with("test_exchange")
+        assert channel.exchange.publish.await_count == 2
+
+    async def test_publish_many(self, channel):
+        """Test publish_many publishes every message with its routing key."""
+        from src.app.messaging.producer import MessageProducer
+
+        messages = [(BaseMessage(), f"test.{n}") for n in range(5)]
+
+        await MessageProducer().publish_many(messages)
+
+        calls = channel.exchange.publish.await_args_list
+        assert [call.kwargs["routing_key"] for call in calls] == [
+            key for _, key in messages
+        ]
+        assert [call.args[0].message_id for call in calls] == [
+            str(message.id) for message, _ in messages
+        ]
+
+    async def test_publish_many_failure(self, channel):
+        """Test a failed publish raises and drops the cached exchange."""
+        from src.app.messaging.producer import MessageProducer
+
+        producer = MessageProducer()
+        channel.exchange.publish.side_effect = [None, ConnectionError("closed")]
+
+        with pytest.raises(MessagePublishError, match="closed"):
+            await producer.publish_many(
+                [(BaseMessage(), "test.one"), (BaseMessage(), "test.two")]
+            )
+
+        channel.exchange.publish.side_effect = None
+        await producer.publish(BaseMessage(), "test.three")
+        assert channel.get_exchange.await_count == 2
+
+
 class TestMessageConsumer:
     """Tests for MessageConsumer base class."""
 
@@ -404,6 +484,638 @@ class TestMessageConsumer:
             await handler.stop()
 
 
+class FakeIncomingMessage:
+    """Incoming AMQP delivery recording how it was settled."""
+
+    def __init__(self, message: BaseMessage | bytes) -> None:
+        self.body = (
+            message
+            if isinstance(message, bytes)
+            else message.model_dump_json().encode()
+        )
+        self.routing_key = "test.batch"
+        self.settled: str | None = None
+
+    async def ack(self) -> None:
+        self.settled = "ack"
+
+    async def reject(self, requeue: bool = False) -> None:
+        self.settled = "reject"
+
+    @asynccontextmanager
+    async def process(self, requeue: bool = False):
+        try:
+            yield
+        except Exception:
+            await self.reject(requeue)
+            raise
+        await self.ack()
+
+
+class RecordingBatchConsumer(BatchMessageConsumer[BaseMessage]):
+    """Batch consumer recording the batches and messages it handles."""
+
+    queue_name = "test_batch_queue"
+    routing_keys = ["test.batch"]
+    message_type = BaseMessage
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.batches: list[list[BaseMessage]] = []
+        self.handled: list[BaseMessage] = []
+        self.fail_batches = False
+
+    async def handle_batch(self, messages: list[BaseMessage]) -> None:
+        if self.fail_batches:
+            raise RuntimeError("batch failed")
+        self.batches.append(messages)
+
+    async def handle(self, message: BaseMessage) -> None:
+        self.handled.append(message)
+
+
+class TestBatchMessageConsumer:
+    """Tests for BatchMessageConsumer."""
+
+    async def test_flushes_when_batch_is_full(self):
+        """Test a full batch is handled at once and acked afterwards."""
+        consumer = RecordingBatchConsumer(batch_size=3, batch_timeout=10000)
+        raws = [FakeIncomingMessage(BaseMessage()) for _ in range(3)]
+
+        for raw in raws[:2]:
+            await consumer._process_message(raw)
+        assert consumer.batches == []
+        assert all(raw.settled is None for raw in raws)
+
+        await consumer._process_message(raws[2])
+
+        assert len(consumer.batches) == 1
+        assert len(consumer.batches[0]) == 3
+        assert all(raw.settled == "ack" for raw in raws)
+
+    async def test_flushes_after_timeout(self):
+        """Test a partial batch is handled once the timeout passes."""
+        consumer = RecordingBatchConsumer(batch_size=100, batch_timeout=10)
+        raw = FakeIncomingMessage(BaseMessage())
+
+        await consumer._process_message(raw)
+        assert raw.settled is None
+        await asyncio.sleep(0.05)
+
+        assert len(consumer.batches) == 1
+        assert raw.settled == "ack"
+
+    async def test_failed_batch_falls_back_to_single_messages(self):
+        """Test each message of a failed batch is handled on its own."""
+        consumer = RecordingBatchConsumer(batch_size=2, batch_timeout=10000)
+        consumer.fail_batches = True
+        raws = [FakeIncomingMessage(BaseMessage()) for _ in range(2)]
+
+        for raw in raws:
+            await consumer._process_message(raw)
+
+        assert consumer.batches == []
+        assert len(consumer.handled) == 2
+        assert all(raw.settled == "ack" for raw in raws)
+
+    async def test_invalid_message_is_rejected(self):
+        """Test an undeserializable message is rejected without a batch."""
+        consumer = RecordingBatchConsumer(batch_size=2, batch_timeout=10000)
+        raw = FakeIncomingMessage(b"invalid json")
+
+        await consumer._process_message(raw)
+        await consumer.flush()
+
+        assert raw.settled == "reject"
+        assert consumer.batches == []
+
+    async def test_stop_flushes_pending_messages(self):
+        """Test stopping the consumer handles the pending batch."""
+        consumer = RecordingBatchConsumer(batch_size=100, batch_timeout=10000)
+        consumer._running = True
+        raw = FakeIncomingMessage(BaseMessage())
+        await consumer._process_message(raw)
+
+        await consumer.stop()
+
+        assert len(consumer.batches) == 1
+        assert raw.settled == "ack"
+
+
+class RecordingConsumer(MessageConsumer[BaseMessage]):
+    """Consumer failing every message it handles."""
+
+    queue_name = "test_queue"
+    routing_keys = ["test.#"]
+    message_type = BaseMessage
+
+    async def handle(self, message: BaseMessage) -> None:
+        raise RuntimeError("handler failed")
+
+
+class TestRetryQueues:
+    """Tests for delayed retries through TTL retry queues."""
+
+    @pytest.fixture
+    def mock_settings(self):
+        """Mock settings with 5 retries from 1s to 4s."""
+        with patch("src.app.core.rabbitmq.settings") as mock:
+            mock.rabbitmq_max_retries = 5
+            mock.rabbitmq_retry_delay_base = 1000
+            mock.rabbitmq_retry_delay_max = 4000
+            yield mock
+
+    def test_retry_delays(self, mock_settings):
+        """Test retry tiers double up to the maximum delay."""
+        from src.app.core.rabbitmq import retry_delays
+
+        assert retry_delays() == [1000, 2000, 4000]
+
+    async def test_declare_queue_declares_retry_queues(self, mock_settings):
+        """Test each tier's retry queue dead-letters back to the queue."""
+        from src.app.core.rabbitmq import declare_queue
+
+        channel = AsyncMock()
+
+        await declare_queue(channel, "test_queue", ["test.#"])
+
+        retry_queues = {
+            call.args[0]: call.kwargs["arguments"]
+            for call in channel.declare_queue.await_args_list[1:]
+        }
+        assert retry_queues == {
+            f"test_queue.retry.{delay}": {
+                "x-message-ttl": delay,
+                "x-dead-letter-exchange": "",
+                "x-dead-letter-routing-key": "test_queue",
+            }
+            for delay in (1000, 2000, 4000)
+        }
+
+    async def test_failure_is_parked_in_retry_queue(self, mock_settings):
+        """Test a failed message is acked and published to its retry tier."""
+        consumer = RecordingConsumer()
+        consumer._channel = MagicMock()
+        consumer._channel.default_exchange.publish = AsyncMock()
+        raw = FakeIncomingMessage(BaseMessage(retry_count=1, max_retries=5))
+
+        with patch("asyncio.sleep") as sleep:
+            await consumer._process_message(raw)
+
+        sleep.assert_not_called()
+        assert raw.settled == "ack"
+        published, kwargs = consumer._channel.default_exchange.publish.await_args
+        assert kwargs["routing_key"] == "test_queue.retry.2000"
+        assert BaseMessage.model_validate_json(published[0].body).retry_count == 2
+
+    async def test_exhausted_message_is_rejected(self, mock_settings):
+        """Test a message out of retries goes to the DLQ."""
+        consumer = RecordingConsumer()
+        consumer._channel = MagicMock()
+        consumer._channel.default_exchange.publish = AsyncMock()
+        raw = FakeIncomingMessage(BaseMessage(retry_count=2, max_retries=3))
+
+        with pytest.raises(MessageRetryExhaustedError):
+            await consumer._process_message(raw)
+
+        assert raw.settled == "reject"
+        consumer._channel.default_exchange.publish.assert_not_awaited()
+
+
+def square(number: int) -> int:
+    """Module-level function, so it can run in a process pool."""
+    return number * number
+
+
+def root_logging() -> tuple[int, int]:
+    """Get the root logger's level and handler count in a pool process."""
+    import logging
+
+    root = logging.getLogger()
+    return root.level, len(root.handlers)
+
+
+class SlowConsumer(MessageConsumer[BaseMessage]):
+    """Consumer recording how many messages it handles at once."""
+
+    queue_name = "test_slow_queue"
+    routing_keys = ["test.#"]
+    message_type = BaseMessage
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.active = 0
+        self.max_active = 0
+
+    async def handle(self, message: BaseMessage) -> None:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+
+
+class TestConsumerConcurrency:
+    """Tests for in-flight limits, CPU-bound work and consumer metrics."""
+
+    async def test_max_in_flight_limits_concurrency(self):
+        """Test at most max_in_flight messages are handled at once."""
+        consumer = SlowConsumer(queue_name=f"test_{uuid4().hex}", max_in_flight=2)
+        raws = [FakeIncomingMessage(BaseMessage()) for _ in range(6)]
+
+        await asyncio.gather(*(consumer._process_message(raw) for raw in raws))
+
+        assert consumer.max_active == 2
+        assert all(raw.settled == "ack" for raw in raws)
+
+    async def test_run_cpu_bound_uses_process_pool(self):
+        """Test run_cpu_bound runs functions in the consumer's process pool."""
+        consumer = SlowConsumer(process_workers=1)
+        consumer._running = True
+
+        assert await consumer.run_cpu_bound(square, 7) == 49
+        assert consumer._executor is not None
+
+        await consumer.stop()
+        assert consumer._executor is None
+
+    async def test_pool_processes_log_like_the_worker(self):
+        """Test pool processes get the worker's log level and a handler."""
+        import logging
+
+        consumer = SlowConsumer(process_workers=1)
+        consumer._running = True
+        root = logging.getLogger()
+        level = root.level
+        root.setLevel(logging.INFO)
+        try:
+            child_level, handlers = await consumer.run_cpu_bound(root_logging)
+        finally:
+            root.setLevel(level)
+            await consumer.stop()
+
+        assert child_level == logging.INFO
+        assert handlers == 1
+
+    async def test_metrics_count_outcomes(self):
+        """Test acks, retries and dead letters are counted per queue."""
+        from src.app.messaging.metrics import consumer_metrics
+
+        queue_name = f"test_{uuid4().hex}"
+        ok = SlowConsumer(queue_name=queue_name)
+        failing = RecordingConsumer(queue_name=queue_name)
+        failing._channel = MagicMock()
+        failing._channel.default_exchange.publish = AsyncMock()
+
+        await ok._process_message(FakeIncomingMessage(BaseMessage()))
+        await failing._process_message(
+            FakeIncomingMessage(BaseMessage(retry_count=0, max_retries=3))
+        )
+        with pytest.raises(MessageRetryExhaustedError):
+            await failing._process_message(
+                FakeIncomingMessage(BaseMessage(retry_count=2, max_retries=3))
+            )
+        with pytest.raises(MessageDeserializationError):
+            await ok._process_message(FakeIncomingMessage(b"invalid json"))
+
+        stats = consumer_metrics.stats()[queue_name]
+        assert stats["in_flight"] == 0
+        assert stats["acked"] == 1
+        assert stats["nacked"] == 2
+        assert stats["retried"] == 1
+        assert stats["dead_lettered"] == 2
+        assert stats["latency_count"] == 4
+        assert stats["latency_buckets"]["+Inf"] == 4
+
+    async def test_batch_metrics(self):
+        """Test messages of a successful batch are counted as acked."""
+        from src.app.messaging.metrics import consumer_metrics
+
+        queue_name = f"test_{uuid4().hex}"
+        consumer = RecordingBatchConsumer(queue_name=queue_name, batch_size=2)
+
+        for _ in range(2):
+            await consumer._process_message(FakeIncomingMessage(BaseMessage()))
+        await consumer._process_message(FakeIncomingMessage(b"invalid json"))
+
+        stats = consumer_metrics.stats()[queue_name]
+        assert stats["acked"] == 2
+        assert stats["dead_lettered"] == 1
+        assert stats["latency_count"] == 2
+
+    async def test_metrics_endpoint(self):
+        """Test the worker metrics endpoint serves the Prometheus text format."""
+        from src.app.messaging.metrics import consumer_metrics
+        from src.app.workers.metrics import MetricsServer
+
+        queue_name = f"test_{uuid4().hex}"
+        consumer_metrics.for_queue(queue_name).acked = 3
+        server = MetricsServer("127.0.0.1", 0)
+        await server.start()
+        try:
+            reader, writer = await asyncio.open_connection(*server.address)
+            writer.write(b"GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n")
+            response = (await reader.read()).decode()
+            writer.close()
+        finally:
+            await server.stop()
+
+        assert response.startswith("HTTP/1.1 200 OK")
+        assert "# TYPE consumer_acked_total counter" in response
+        assert f'consumer_acked_total{{queue="{queue_name}"}} 3' in response
+        assert (
+            f'consumer_processing_seconds_count{{queue="{queue_name}"}} 0' in response
+        )
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the Redis commands of the idempotency store."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+        self.expires: dict[str, int] = {}
+
+    async def set(self, key: str, value: str, nx: bool = False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        self.expires[key] = ex
+        return True
+
+    async def expire(self, key: str, seconds: int) -> None:
+        self.expires[key] = seconds
+
+    async def get(self, key: str) -> str | None:
+        return self.data.get(key)
+
+    async def delete(self, key: str) -> None:
+        self.data.pop(key, None)
+
+    def pipeline(self, transaction: bool = True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Pipeline queueing commands until ``execute``."""
+
+    def __init__(self, client: FakeRedis) -> None:
+        self._client = client
+        self._commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+    def set(self, *args, **kwargs) -> None:
+        self._commands.append(self._client.set(*args, **kwargs))
+
+    def delete(self, *args) -> None:
+        self._commands.append(self._client.delete(*args))
+
+    def expire(self, *args) -> None:
+        self._commands.append(self._client.expire(*args))
+
+    async def execute(self) -> list:
+        return [await command for command in self._commands]
+
+
+class IdempotentConsumer(MessageConsumer[BaseMessage]):
+    """Idempotent consumer recording the messages it handles."""
+
+    queue_name = "test_idempotent_queue"
+    routing_keys = ["test.#"]
+    message_type = BaseMessage
+    idempotent = True
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.handled: list[BaseMessage] = []
+        self.fail = False
+
+    async def handle(self, message: BaseMessage) -> None:
+        if self.fail:
+            raise RuntimeError("handler failed")
+        self.handled.append(message)
+
+
+class TestIdempotency:
+    """Tests for skipping messages that were already handled."""
+
+    @pytest.fixture
+    def store(self):
+        """Fresh idempotency store on a fake Redis."""
+        from src.app.messaging.idempotency import IdempotencyStore
+
+        store = IdempotencyStore(local_size=2)
+        fake = FakeRedis()
+        with (
+            patch.object(store, "_get_redis", return_value=fake),
+            patch("src.app.messaging.consumer.idempotency_store", store),
+        ):
+            yield store
+
+    async def test_duplicate_is_skipped(self, store):
+        """Test a redelivered message is acked without being handled again."""
+        consumer = IdempotentConsumer(queue_name=f"test_{uuid4().hex}")
+        message = BaseMessage()
+
+        first = FakeIncomingMessage(message)
+        duplicate = FakeIncomingMessage(message)
+        await consumer._process_message(first)
+        store._done.clear()  # Answered by Redis, not the local tier
+        await consumer._process_message(duplicate)
+
+        assert consumer.handled == [message]
+        assert duplicate.settled == "ack"
+        assert consumer._metrics.deduplicated == 1
+        assert store.stats()["duplicates"] == 1
+
+    async def test_local_tier_skips_redis(self, store):
+        """Test known duplicates are answered by the in-process LRU."""
+        from src.app.messaging.idempotency import ClaimResult
+
+        await store.complete("q", "a", "b", "c")
+        store._get_redis.reset_mock()
+
+        assert list(store._done) == [store._key("q", "b"), store._key("q", "c")]
+        assert await store.claim("q", "c") is ClaimResult.DONE
+        store._get_redis.assert_not_called()
+
+    async def test_failed_message_is_handled_on_retry(self, store):
+        """Test a failure releases the claim so the retry is handled."""
+        consumer = IdempotentConsumer(queue_name=f"test_{uuid4().hex}")
+        consumer._channel = MagicMock()
+        consumer._channel.default_exchange.publish = AsyncMock()
+        message = BaseMessage(max_retries=3)
+
+        consumer.fail = True
+        await consumer._process_message(FakeIncomingMessage(message))
+        consumer.fail = False
+        await consumer._process_message(FakeIncomingMessage(message))
+
+        assert consumer.handled == [message]
+
+    async def test_in_progress_duplicate_is_retried(self, store):
+        """Test a duplicate of a message being handled waits out the claim."""
+        consumer = IdempotentConsumer(queue_name=f"test_{uuid4().hex}")
+        consumer._channel = MagicMock()
+        consumer._channel.default_exchange.publish = AsyncMock()
+        message = BaseMessage(max_retries=3)
+        await store.claim(consumer._queue_name, str(message.id))
+
+        raw = FakeIncomingMessage(message)
+        with patch("src.app.core.rabbitmq.settings") as mock_settings:
+            mock_settings.rabbitmq_max_retries = 3
+            mock_settings.rabbitmq_retry_delay_base = 10000
+            mock_settings.rabbitmq_retry_delay_max = 60000
+            await consumer._process_message(raw)
+
+        assert consumer.handled == []
+        assert raw.settled == "ack"
+        published, kwargs = consumer._channel.default_exchange.publish.await_args
+        # First tier at least as long as the claim's lifetime (30s)
+        assert kwargs["routing_key"].endswith(".retry.40000")
+        assert BaseMessage.model_validate_json(published[0].body).retry_count == 0
+
+    async def test_redelivery_after_crash_is_handled(self, store):
+        """Test a message whose worker died is handled once its claim expires."""
+        consumer = IdempotentConsumer(queue_name=f"test_{uuid4().hex}")
+        consumer._channel = MagicMock()
+        consumer._channel.default_exchange.publish = AsyncMock()
+        message = BaseMessage(retry_count=2, max_retries=3)
+        # Claimed by a worker that died before acking
+        await store.claim(consumer._queue_name, str(message.id))
+        fake = store._get_redis()
+
+        # Redelivered while the claim is alive: parked, retries untouched
+        for _ in range(5):
+            raw = FakeIncomingMessage(message)
+            await consumer._process_message(raw)
+            assert raw.settled == "ack"
+            published, _ = consumer._channel.default_exchange.publish.await_args
+            message = BaseMessage.model_validate_json(published[0].body)
+            assert message.retry_count == 2
+
+        # Claim expired, no refresh from the dead worker
+        fake.data.clear()
+        raw = FakeIncomingMessage(message)
+        await consumer._process_message(raw)
+
+        assert consumer.handled == [message]
+        assert raw.settled == "ack"
+
+    async def test_claim_refreshed_while_handling(self, store):
+        """Test a long handler keeps its claim alive."""
+        store.lock_ttl = 0.03
+        consumer = IdempotentConsumer(queue_name=f"test_{uuid4().hex}")
+        fake = store._get_redis()
+        message = BaseMessage()
+        handle = consumer.handle
+
+        async def slow_handle(message: BaseMessage) -> None:
+            await asyncio.sleep(0.05)
+            key = store._key(consumer._queue_name, str(message.id))
+            # Refreshed to the claim lifetime by the keep-alive
+            assert fake.data[key] == "processing"
+            assert fake.expires[key] == store.lock_ttl
+            fake.expires[key] = None
+            await asyncio.sleep(0.05)
+            assert fake.expires[key] == store.lock_ttl
+            await handle(message)
+
+        consumer.handle = slow_handle
+        await consumer._process_message(FakeIncomingMessage(message))
+
+        assert consumer.handled == [message]
+
+    async def test_batch_skips_duplicates(self, store):
+        """Test duplicates are left out of batches."""
+        consumer = RecordingBatchConsumer(
+            queue_name=f"test_{uuid4().hex}", batch_size=2
+        )
+        consumer.idempotent = True
+        message = BaseMessage()
+
+        await consumer._process_message(FakeIncomingMessage(message))
+        await consumer._process_message(FakeIncomingMessage(BaseMessage()))
+        duplicate = FakeIncomingMessage(message)
+        await consumer._process_message(duplicate)
+
+        assert [len(batch) for batch in consumer.batches] == [2]
+        assert duplicate.settled == "ack"
+        assert consumer._batch == []
+
+    async def test_without_redis_messages_are_handled(self):
+        """Test messages are handled when Redis is not available."""
+        from src.app.messaging.idempotency import ClaimResult, IdempotencyStore
+
+        store = IdempotencyStore()
+        with patch("src.app.messaging.idempotency.RedisPool") as mock_pool:
+            mock_pool.get_pool.side_effect = RuntimeError("Redis pool not initialized")
+            assert await store.claim("q", "a") is ClaimResult.CLAIMED
+            await store.release("q", "a")
+            assert await store.claim("q", "a") is ClaimResult.CLAIMED
+
+
+class TestAuditLogHandler:
+    """Tests for the batched audit log handler."""
+
+    @pytest.fixture
+    def handler(self):
+        from src.app.messaging.handlers.audit_handler import AuditLogHandler
+
+        handler = AuditLogHandler()
+        handler._session_factory = conftest.test_async_session_maker
+        return handler
+
+    async def test_batch_is_written_with_one_insert(self, handler):
+        """Test a batch of audit logs is one INSERT and one commit."""
+        messages = [
+            AuditLogMessage(action="user.updated", entity_type="User", entity_id=str(i))
+            for i in range(20)
+        ]
+
+        with count_statements() as statements:
+            await handler.handle_batch(messages)
+
+        inserts = [s for s in statements if s.startswith("INSERT INTO audit_logs")]
+        assert len(inserts) == 1
+        async with conftest.test_async_session_maker() as session:
+            count = await session.scalar(select(func.count()).select_from(AuditLog))
+        assert count == 20
+
+    async def test_bad_row_only_fails_its_own_message(self, handler):
+        """Test a batch with an invalid row falls back to single inserts."""
+        handler._batch_size = 3
+        messages = [
+            AuditLogMessage(action="user.updated", entity_type="User"),
+            # Violates the foreign key on actor_id
+            AuditLogMessage(
+                action="user.updated", entity_type="User", actor_id=uuid4()
+            ),
+            AuditLogMessage(action="user.updated", entity_type="User"),
+        ]
+        raws = [FakeIncomingMessage(message) for message in messages]
+
+        async with conftest.test_engine.connect() as conn:
+            await conn.exec_driver_sql("PRAGMA foreign_keys=ON")
+        try:
+            with patch.object(
+                handler, "_handle_failure", AsyncMock(side_effect=Exception)
+            ):
+                for raw in raws:
+                    await handler._process_message(raw)
+        finally:
+            async with conftest.test_engine.connect() as conn:
+                await conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+
+        assert [raw.settled for raw in raws] == ["ack", "reject", "ack"]
+        async with conftest.test_async_session_maker() as session:
+            count = await session.scalar(select(func.count()).select_from(AuditLog))
+        assert count == 2
+
+
 class TestEmailHandlers:
     """Tests for email message handlers."""
 
@@ -1,14 +1,21 @@
 """Tests for custom middleware."""
 
+import asyncio
+
 import pytest
 from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
 from httpx import ASGITransport, AsyncClient
 from src.app.middleware import (
     AccessLogMiddleware,
+    AuditContextMiddleware,
     GzipMiddleware,
     HTTPSRedirectMiddleware,
     ProcessTimeMiddleware,
+    RequestIDMiddleware,
+    SecurityHeadersMiddleware,
     TrustedHostMiddleware,
+    get_request_id,
 )
 
 
@@ -234,3 +241,126 @@ async def test_gzip_middleware_no_accept_encoding():
         response = await client.get("/large", headers={"accept-encoding": "identity"})
         assert response.status_code == 200
         assert response.headers.get("content-encoding") is None
+
+
+# RequestIDMiddleware tests
+
+
+@pytest.mark.asyncio
+async def test_request_id_middleware_generates_id():
+    """Test that a request ID is generated and returned in the response."""
+    app = create_test_app()
+    app.add_middleware(RequestIDMiddleware)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/")
+        assert response.status_code == 200
+        assert response.headers.get("x-request-id")
+
+
+@pytest.mark.asyncio
+async def test_request_id_middleware_preserves_incoming_id():
+    """Test that an incoming X-Request-ID is echoed back and visible to handlers."""
+    app = create_test_app()
+
+    @app.get("/request-id")
+    async def request_id():
+        return {"request_id": get_request_id()}
+
+    app.add_middleware(RequestIDMiddleware)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/request-id", headers={"X-Request-ID": "abc-123"})
+        assert response.headers["x-request-id"] == "abc-123"
+        assert response.json() == {"request_id": "abc-123"}
+
+
+# SecurityHeadersMiddleware tests
+
+
+@pytest.mark.asyncio
+async def test_security_headers_middleware():
+    """Test that security headers are added to the response."""
+    app = create_test_app()
+    app.add_middleware(SecurityHeadersMiddleware, hsts_enabled=True, hsts_max_age=60)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/")
+        assert response.headers["x-content-type-options"] == "nosniff"
+        assert response.headers["x-frame-options"] == "DENY"
+        assert "default-src 'self'" in response.headers["content-security-policy"]
+        assert (
+            response.headers["strict-transport-security"]
+            == "max-age=60; includeSubDomains"
+        )
+
+
+# ASGI stack tests
+
+
+@pytest.mark.asyncio
+async def test_middleware_stack_preserves_streaming_responses():
+    """Test that streamed chunks pass through the stack without buffering."""
+    app = create_test_app()
+    chunks = [b"first,", b"second,", b"third"]
+
+    @app.get("/stream")
+    async def stream():
+        async def generate():
+            for chunk in chunks:
+                yield chunk
+
+        return StreamingResponse(generate(), media_type="text/plain")
+
+    app.add_middleware(ProcessTimeMiddleware)
+    app.add_middleware(SecurityHeadersMiddleware)
+    app.add_middleware(AccessLogMiddleware)
+    app.add_middleware(AuditContextMiddleware)
+    app.add_middleware(RequestIDMiddleware)
+
+    sent: list[dict] = []
+    request_received = False
+    response_complete = asyncio.Event()
+
+    async def receive():
+        nonlocal request_received
+        if not request_received:
+            request_received = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+        if message["type"] == "http.response.body" and not message.get("more_body"):
+            response_complete.set()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/stream",
+        "raw_path": b"/stream",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"test")],
+        "client": ("127.0.0.1", 12345),
+        "server": ("test", 80),
+    }
+    await app(scope, receive, send)
+
+    start = sent[0]
+    header_names = {name.lower() for name, _ in start["headers"]}
+    assert start["status"] == 200
+    assert {b"x-request-id", b"x-process-time", b"x-frame-options"} <= header_names
+
+    bodies = [m["body"] for m in sent[1:] if m.get("body")]
+    assert bodies == chunks
@@ -212,6 +212,10 @@ class TestMigrationExecution:
         assert "ix_files_key" in files_index_names, "Missing key index on files"
         assert "ix_files_user_id" in files_index_names, "Missing user_id index on files"
 
+        # Verify keyset pagination indexes
+        assert "ix_users_created_at_id" in users_index_names
+        assert "ix_files_created_at_id" in files_index_names
+
     def test_foreign_key_constraint(self, migration_db):
         """Verify foreign key constraint on files.user_id."""
         config = migration_db["config"]
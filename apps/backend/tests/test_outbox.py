@@ -0,0 +1,220 @@
+"""Transactional outbox tests."""
+
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.app.core.audit import audit_log, log_audit_action, log_audit_from_context
+from src.app.messaging.exceptions import MessagePublishError
+from src.app.messaging.outbox import OutboxRelay, enqueue
+from src.app.messaging.types import AuditLogMessage, EmailMessage, UserRegisteredEvent
+from src.app.models import OutboxMessage, PasswordResetToken, User
+from src.app.services.auth_service import AuthService
+
+from tests import conftest
+
+
+@pytest.fixture
+def publish_many():
+    with patch(
+        "src.app.messaging.outbox.message_producer.publish_many", AsyncMock()
+    ) as mock:
+        yield mock
+
+
+@pytest.fixture
+def relay():
+    relay = OutboxRelay(batch_size=2)
+    relay._session_factory = conftest.test_async_session_maker
+    return relay
+
+
+async def outbox_size(db: AsyncSession) -> int:
+    return await db.scalar(select(func.count()).select_from(OutboxMessage))
+
+
+async def test_enqueue_commits_with_transaction(db_session: AsyncSession):
+    """Test enqueued messages are only kept if the transaction commits."""
+    enqueue(
+        db_session,
+        EmailMessage(to_email="a@b.c", subject="s", template_name="t"),
+        "email.generic",
+    )
+    await db_session.rollback()
+    assert await outbox_size(db_session) == 0
+
+    enqueue(
+        db_session,
+        EmailMessage(to_email="a@b.c", subject="s", template_name="t"),
+        "email.generic",
+    )
+    await db_session.commit()
+    assert await outbox_size(db_session) == 1
+
+
+async def test_relay_publishes_in_order(
+    db_session: AsyncSession, relay: OutboxRelay, publish_many: AsyncMock
+):
+    """Test the relay publishes batches in order and deletes them."""
+    events = [
+        UserRegisteredEvent(user_id=uuid4(), email=f"{n}@example.com") for n in range(3)
+    ]
+    for event in events:
+        enqueue(db_session, event, "event.user.registered")
+    await db_session.commit()
+
+    assert await relay.relay_once() == 2
+    assert await relay.relay_once() == 1
+    assert await relay.relay_once() == 0
+
+    published = [
+        message for call in publish_many.await_args_list for message, _ in call.args[0]
+    ]
+    assert [message.id for message in published] == [event.id for event in events]
+    assert all(isinstance(message, UserRegisteredEvent) for message in published)
+    assert await outbox_size(db_session) == 0
+    assert relay.stats()["published"] == 3
+
+
+async def test_relay_keeps_rows_when_publish_fails(
+    db_session: AsyncSession, relay: OutboxRelay, publish_many: AsyncMock
+):
+    """Test rows stay in the outbox until they are published."""
+    enqueue(
+        db_session,
+        EmailMessage(to_email="a@b.c", subject="s", template_name="t"),
+        "email.generic",
+    )
+    await db_session.commit()
+    publish_many.side_effect = MessagePublishError("broker down")
+
+    with pytest.raises(MessagePublishError):
+        await relay.relay_once()
+    assert await outbox_size(db_session) == 1
+
+    publish_many.side_effect = None
+    assert await relay.relay_once() == 1
+    assert await outbox_size(db_session) == 0
+
+
+async def test_relay_drops_unreadable_rows(
+    db_session: AsyncSession, relay: OutboxRelay, publish_many: AsyncMock
+):
+    """Test a row whose message type is gone does not block the outbox."""
+    db_session.add(
+        OutboxMessage(
+            message_type="src.app.messaging.types.Removed", routing_key="x", payload={}
+        )
+    )
+    await db_session.commit()
+
+    assert await relay.relay_once() == 1
+    assert relay.stats()["dropped"] == 1
+    assert await outbox_size(db_session) == 0
+
+
+async def test_password_reset_email_goes_through_outbox(db_session: AsyncSession):
+    """Test the reset email is committed with the token, not published in-line."""
+    user = User(email="reset@example.com", name="Reset")
+    db_session.add(user)
+    await db_session.commit()
+
+    with (
+        patch("src.app.services.auth_service.settings.rabbitmq_enabled", True),
+        patch("src.app.messaging.producer.message_producer.publish") as publish,
+    ):
+        await AuthService(db_session).forgot_password(user.email)
+
+    publish.assert_not_called()
+    row = await db_session.scalar(select(OutboxMessage))
+    assert row.routing_key == "email.password_reset"
+    assert row.payload["to_email"] == "reset@example.com"
+
+
+async def test_reset_token_is_encrypted_in_outbox(
+    db_session: AsyncSession, relay: OutboxRelay, publish_many: AsyncMock
+):
+    """Test the outbox only holds the reset token encrypted."""
+    user = User(email="secret@example.com", name="Secret")
+    db_session.add(user)
+    await db_session.commit()
+
+    with patch("src.app.services.auth_service.settings.rabbitmq_enabled", True):
+        await AuthService(db_session).forgot_password(user.email)
+
+    row = await db_session.scalar(select(OutboxMessage))
+    stored = await db_session.scalar(select(PasswordResetToken))
+    await relay.relay_once()
+
+    [(message, _)] = publish_many.await_args.args[0]
+    assert AuthService._hash_token(message.reset_token) == stored.token_hash
+    assert row.payload["reset_token"] != message.reset_token
+    assert message.reset_token not in str(row.payload)
+
+
+async def test_audit_log_is_committed_with_change(db_session: AsyncSession):
+    """Test the audit outbox row is committed by the change's own commit."""
+    with patch("src.app.core.audit.settings.rabbitmq_enabled", True):
+        db_session.add(User(email="audited@example.com", name="Audited"))
+        await log_audit_action(db_session, action="user.created", entity_type="User")
+
+        # Not committed on its own
+        async with conftest.test_async_session_maker() as session:
+            assert await outbox_size(session) == 0
+
+        await db_session.commit()
+
+    async with conftest.test_async_session_maker() as session:
+        row = await session.scalar(select(OutboxMessage))
+    assert row.routing_key == "audit.log"
+    assert row.message_type.endswith(AuditLogMessage.__name__)
+
+
+async def test_service_audit_log_shares_transaction(db_session: AsyncSession):
+    """Test services log audits before committing the change they record."""
+    from src.app.core.audit import _has_pending_writes
+    from src.app.schemas import UserCreate
+    from src.app.services.user_service import UserService
+
+    pending = []
+
+    async def record(db, **kwargs):
+        pending.append(_has_pending_writes(db))
+        await log_audit_from_context(db, **kwargs)
+
+    with (
+        patch("src.app.core.audit.settings.rabbitmq_enabled", True),
+        patch("src.app.services.user_service.log_audit_from_context", record),
+    ):
+        await UserService(db_session).create(
+            UserCreate(email="service@example.com", name="Service")
+        )
+
+    assert pending == [True]
+    row = await db_session.scalar(select(OutboxMessage))
+    assert row.payload["action"] == "user.created"
+
+
+async def test_audit_log_decorator_commits_outbox_row(db_session: AsyncSession):
+    """Test audits logged after the decorated method committed are kept."""
+
+    class Service:
+        def __init__(self, db: AsyncSession):
+            self.db = db
+
+        @audit_log(action="user.created", entity_type="User")
+        async def create(self) -> User:
+            user = User(email="decorated@example.com", name="Decorated")
+            self.db.add(user)
+            await self.db.commit()
+            return user
+
+    with patch("src.app.core.audit.settings.rabbitmq_enabled", True):
+        user = await Service(db_session).create()
+
+    async with conftest.test_async_session_maker() as session:
+        row = await session.scalar(select(OutboxMessage))
+    assert row.payload["action"] == "user.created"
+    assert row.payload["entity_id"] == str(user.id)
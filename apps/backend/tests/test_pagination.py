@@ -0,0 +1,165 @@
+"""List total counting tests."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.app.models import Permission
+from src.app.services.pagination import (
+    count_cache,
+    count_rows,
+    estimate_rows,
+    paginate,
+)
+
+from tests.conftest import count_statements
+
+
+class FakeRedis:
+    """Minimal async Redis storing values in a dict."""
+
+    def __init__(self):
+        self.values: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.values[key] = value
+
+
+@pytest.fixture
+def redis_client():
+    client = FakeRedis()
+    with patch.object(count_cache, "_get_redis", return_value=client):
+        yield client
+
+
+async def create_permissions(
+    db_session: AsyncSession, count: int, start: int = 0
+) -> None:
+    for i in range(start, start + count):
+        db_session.add(
+            Permission(
+                code=f"items:action{i}",
+                name=f"Permission {i}",
+                resource="items",
+                action=f"action{i}",
+            )
+        )
+    await db_session.commit()
+
+
+def count_queries(statements: list[str]) -> list[str]:
+    return [s for s in statements if "count(*)" in s.lower()]
+
+
+async def test_total_is_cached(db_session: AsyncSession, redis_client):
+    """Test a cached total is reused instead of counting again."""
+    await create_permissions(db_session, 3)
+    query = select(Permission)
+
+    assert await count_rows(db_session, query, Permission) == 3
+    await create_permissions(db_session, 1, start=3)
+    with count_statements() as statements:
+        assert await count_rows(db_session, query, Permission) == 3
+
+    assert count_queries(statements) == []
+    assert len(redis_client.values) == 1
+
+
+async def test_cache_key_includes_filters(db_session: AsyncSession, redis_client):
+    """Test differently filtered queries are cached separately."""
+    await create_permissions(db_session, 3)
+
+    total = await count_rows(db_session, select(Permission), Permission)
+    filtered = await count_rows(
+        db_session,
+        select(Permission).where(Permission.code == "items:action0"),
+        Permission,
+    )
+
+    assert (total, filtered) == (3, 1)
+    assert len(redis_client.values) == 2
+
+
+async def test_exact_count_refreshes_cache(db_session: AsyncSession, redis_client):
+    """Test exact counts skip the cache and replace the cached total."""
+    await create_permissions(db_session, 3)
+    query = select(Permission)
+    await count_rows(db_session, query, Permission)
+    await create_permissions(db_session, 1, start=3)
+
+    assert await count_rows(db_session, query, Permission, exact=True) == 4
+    assert await count_rows(db_session, query, Permission) == 4
+
+
+async def test_estimate_replaces_count(db_session: AsyncSession, redis_client):
+    """Test a large table estimate is returned without counting or caching."""
+    with (
+        patch(
+            "src.app.services.pagination.estimate_rows",
+            new_callable=AsyncMock,
+            return_value=250000,
+        ),
+        count_statements() as statements,
+    ):
+        page = await paginate(
+            db_session, select(Permission), Permission, limit=10, include_total=True
+        )
+
+    assert (page.total, page.total_estimated) == (250000, True)
+    assert count_queries(statements) == []
+    assert redis_client.values == {}
+
+
+async def test_exact_total_is_not_estimated(db_session: AsyncSession):
+    """Test exact totals skip the estimate."""
+    await create_permissions(db_session, 3)
+    with patch(
+        "src.app.services.pagination.estimate_rows",
+        new_callable=AsyncMock,
+        return_value=250000,
+    ) as estimate:
+        page = await paginate(
+            db_session,
+            select(Permission),
+            Permission,
+            limit=10,
+            include_total=True,
+            exact_total=True,
+        )
+
+    estimate.assert_not_called()
+    assert (page.total, page.total_estimated) == (3, False)
+
+
+async def test_filtered_query_is_not_estimated(db_session: AsyncSession):
+    """Test only unfiltered (or soft-delete filtered) queries are estimated."""
+    query = select(Permission).where(Permission.deleted_at.is_(None))
+    search = query.where(Permission.name.ilike("%items%"))
+
+    with (
+        patch.object(db_session.bind.dialect, "name", "postgresql"),
+        patch.object(db_session, "scalar", AsyncMock(return_value=250000)),
+    ):
+        assert await estimate_rows(db_session, query, Permission) == 250000
+        assert await estimate_rows(db_session, search, Permission) is None
+
+
+async def test_no_estimate_on_sqlite(db_session: AsyncSession):
+    """Test estimates are only used on PostgreSQL."""
+    assert await estimate_rows(db_session, select(Permission), Permission) is None
+
+
+async def test_list_exact_count(client: AsyncClient, superadmin_headers: dict):
+    """Test list endpoints accept exact_count."""
+    response = await client.get(
+        "/api/v1/permissions?exact_count=true", headers=superadmin_headers
+    )
+
+    assert response.status_code == 200
+    assert response.json()["meta"]["total_items"] == 19
+    assert response.json()["meta"]["total_estimated"] is False
@@ -206,7 +206,7 @@ class TestResetPassword:
 
         mock_db.execute.side_effect = [mock_result1, mock_result2]
 
-        with patch("src.app.services.auth_service.get_password_hash") as mock_hash:
+        with patch("src.app.services.auth_service.hash_password_async") as mock_hash:
             mock_hash.return_value = "hashed_new_password"
 
             await service.reset_password("valid-token", "newpassword123")
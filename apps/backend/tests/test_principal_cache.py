@@ -0,0 +1,304 @@
+"""Principal cache tests."""
+
+import uuid
+from unittest.mock import patch
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.app.core.security import get_password_hash
+from src.app.models import Permission, Role, User
+from src.app.services import UserService
+from src.app.services.principal_cache import (
+    Principal,
+    PrincipalCache,
+    load_principal,
+)
+
+
+async def create_user(
+    db_session: AsyncSession,
+    email: str = "cached@example.com",
+    roles: list[Role] | None = None,
+    is_active: bool = True,
+) -> User:
+    """Helper to create a user with a known password."""
+    user = User(
+        email=email,
+        name="Cached User",
+        hashed_password=get_password_hash("password123"),
+        is_active=is_active,
+    )
+    user.roles = roles or []
+    db_session.add(user)
+    await db_session.commit()
+    await db_session.refresh(user)
+    return user
+
+
+async def create_role(
+    db_session: AsyncSession, code: str, permission_codes: list[str]
+) -> Role:
+    """Helper to create a role with permissions."""
+    permissions = []
+    for perm_code in permission_codes:
+        resource, action = perm_code.split(":")
+        permissions.append(
+            Permission(code=perm_code, name=perm_code, resource=resource, action=action)
+        )
+    role = Role(code=code, name=code.title())
+    role.permissions = permissions
+    db_session.add(role)
+    await db_session.commit()
+    await db_session.refresh(role)
+    return role
+
+
+async def login(client: AsyncClient, email: str) -> dict[str, str]:
+    """Helper to log in and return auth headers."""
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": email, "password": "password123"},
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def make_principal(**kwargs) -> Principal:
+    """Helper to build a principal."""
+    defaults = {
+        "id": uuid.uuid4(),
+        "is_active": True,
+        "role_codes": frozenset(),
+        "permission_codes": frozenset(),
+    }
+    defaults.update(kwargs)
+    return Principal(**defaults)
+
+
+class TestPrincipal:
+    """Test the principal snapshot."""
+
+    def test_has_role_and_permission(self):
+        """Test role and permission lookups."""
+        principal = make_principal(
+            role_codes=frozenset({"admin"}),
+            permission_codes=frozenset({"users:read"}),
+        )
+        assert principal.has_role("admin")
+        assert not principal.has_role("super_admin")
+        assert principal.has_permission("users:read")
+        assert not principal.has_permission("users:delete")
+
+    @pytest.mark.asyncio
+    async def test_load_principal(self, db_session: AsyncSession):
+        """Test loading a principal collects codes across roles."""
+        reader = await create_role(db_session, "reader", ["users:read"])
+        writer = await create_role(db_session, "writer", ["users:create"])
+        empty = await create_role(db_session, "empty", [])
+        user = await create_user(db_session, roles=[reader, writer, empty])
+
+        principal = await load_principal(db_session, user.id)
+
+        assert principal is not None
+        assert principal.id == user.id
+        assert principal.is_active is True
+        assert principal.role_codes == {"reader", "writer", "empty"}
+        assert principal.permission_codes == {"users:read", "users:create"}
+
+    @pytest.mark.asyncio
+    async def test_load_principal_unknown_user(self, db_session: AsyncSession):
+        """Test loading a principal for a missing user returns None."""
+        assert await load_principal(db_session, uuid.uuid4()) is None
+
+
+class TestPrincipalCache:
+    """Test the in-process cache tier."""
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_database(self):
+        """Test a cached principal is served without loading it again."""
+        cache = PrincipalCache()
+        principal = make_principal()
+
+        with patch(
+            "src.app.services.principal_cache.load_principal", return_value=principal
+        ) as mock_load:
+            assert await cache.get(None, principal.id, "t1") is principal
+            assert await cache.get(None, principal.id, "t1") is principal
+
+        mock_load.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_entries_are_per_token(self):
+        """Test a new token for the same user is loaded separately."""
+        cache = PrincipalCache()
+        principal = make_principal()
+
+        with patch(
+            "src.app.services.principal_cache.load_principal", return_value=principal
+        ) as mock_load:
+            await cache.get(None, principal.id, "t1")
+            await cache.get(None, principal.id, "t2")
+
+        assert mock_load.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_miss_is_not_cached(self):
+        """Test unknown users are not cached."""
+        cache = PrincipalCache()
+
+        with patch(
+            "src.app.services.principal_cache.load_principal", return_value=None
+        ) as mock_load:
+            assert await cache.get(None, uuid.uuid4(), "t1") is None
+
+        mock_load.assert_awaited_once()
+        assert len(cache._entries) == 0
+
+    @pytest.mark.asyncio
+    async def test_entries_expire(self):
+        """Test entries are reloaded after the TTL."""
+        cache = PrincipalCache(ttl=30)
+        principal = make_principal()
+
+        with (
+            patch(
+                "src.app.services.principal_cache.load_principal",
+                return_value=principal,
+            ) as mock_load,
+            patch("src.app.services.principal_cache.time.monotonic") as mock_time,
+        ):
+            mock_time.return_value = 1000.0
+            await cache.get(None, principal.id, "t1")
+            mock_time.return_value = 1029.0
+            await cache.get(None, principal.id, "t1")
+            mock_time.return_value = 1031.0
+            await cache.get(None, principal.id, "t1")
+
+        assert mock_load.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        """Test the cache is bounded by max_size."""
+        cache = PrincipalCache(max_size=2)
+        first, second, third = make_principal(), make_principal(), make_principal()
+
+        for principal in (first, second):
+            with patch(
+                "src.app.services.principal_cache.load_principal",
+                return_value=principal,
+            ):
+                await cache.get(None, principal.id, "t")
+
+        # Touch the first entry so the second becomes least recently used
+        await cache.get(None, first.id, "t")
+
+        with patch(
+            "src.app.services.principal_cache.load_principal", return_value=third
+        ):
+            await cache.get(None, third.id, "t")
+
+        assert list(cache._entries) == [(first.id, "t"), (third.id, "t")]
+        assert second.id not in cache._keys_by_user
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_all_tokens(self):
+        """Test invalidation drops every entry of a user."""
+        cache = PrincipalCache()
+        principal = make_principal()
+        other = make_principal()
+
+        with patch(
+            "src.app.services.principal_cache.load_principal", return_value=principal
+        ):
+            await cache.get(None, principal.id, "t1")
+            await cache.get(None, principal.id, "t2")
+        with patch(
+            "src.app.services.principal_cache.load_principal", return_value=other
+        ):
+            await cache.get(None, other.id, "t1")
+
+        await cache.invalidate(principal.id)
+
+        assert list(cache._entries) == [(other.id, "t1")]
+
+    @pytest.mark.asyncio
+    async def test_disabled_always_loads(self):
+        """Test the cache is bypassed when disabled."""
+        cache = PrincipalCache()
+        principal = make_principal()
+
+        with (
+            patch(
+                "src.app.services.principal_cache.settings.principal_cache_enabled",
+                False,
+            ),
+            patch(
+                "src.app.services.principal_cache.load_principal",
+                return_value=principal,
+            ) as mock_load,
+        ):
+            await cache.get(None, principal.id, "t1")
+            await cache.get(None, principal.id, "t1")
+
+        assert mock_load.await_count == 2
+        assert len(cache._entries) == 0
+
+
+class TestPrincipalAuthentication:
+    """Test authentication through the principal cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_requests_load_principal_once(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        """Test permission checks reuse the cached principal."""
+        role = await create_role(db_session, "reader", ["users:read"])
+        await create_user(db_session, roles=[role])
+        headers = await login(client, "cached@example.com")
+
+        with patch(
+            "src.app.services.principal_cache.load_principal", wraps=load_principal
+        ) as mock_load:
+            for _ in range(3):
+                response = await client.get("/api/v1/users", headers=headers)
+                assert response.status_code == 200
+
+        mock_load.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_inactive_user_is_rejected(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        """Test an inactive user's principal is rejected."""
+        role = await create_role(db_session, "reader", ["users:read"])
+        user = await create_user(db_session, roles=[role])
+        headers = await login(client, "cached@example.com")
+
+        user.is_active = False
+        await db_session.commit()
+
+        response = await client.get("/api/v1/users", headers=headers)
+        assert response.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_role_change_invalidates_principal(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        """Test role changes through the service are visible immediately."""
+        role = await create_role(db_session, "reader", ["users:read"])
+        user = await create_user(db_session)
+        headers = await login(client, "cached@example.com")
+
+        response = await client.get("/api/v1/users", headers=headers)
+        assert response.status_code == 403
+
+        await UserService(db_session).assign_role(user.id, role.id)
+
+        response = await client.get("/api/v1/users", headers=headers)
+        assert response.status_code == 200
+
+        await UserService(db_session).remove_role(user.id, role.id)
+
+        response = await client.get("/api/v1/users", headers=headers)
+        assert response.status_code == 403
@@ -1,9 +1,18 @@
 """Rate limiting middleware tests."""
 
 import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from httpx import AsyncClient
-from src.app.middleware.rate_limit import RateLimitConfig, RateLimiter
+from redis.exceptions import ConnectionError as RedisConnectionError
+from src.app.middleware.rate_limit import (
+    ClientState,
+    RateLimitConfig,
+    RateLimiter,
+    RateLimitMiddleware,
+    RedisRateLimiter,
+)
 
 
 class TestRateLimitConfig:
@@ -58,8 +67,8 @@ class TestRateLimiterUnit:
         await limiter.is_allowed("stale_client", config)
         assert "stale_client" in limiter._clients
 
-        # Make timestamps stale (older than 10 minutes)
-        limiter._clients["stale_client"].timestamps = [time.time() - 700]
+        # Make the client stale (no activity for over 10 minutes)
+        limiter._clients["stale_client"].updated_at = time.time() - 700
 
         # Trigger cleanup
         await limiter._cleanup()
@@ -88,6 +97,115 @@ class TestRateLimiterUnit:
         assert retry_after > 0
         assert retry_after <= 60  # Should be within the window
 
+    async def test_tokens_refill_over_time(self):
+        """Test that the bucket refills at requests/window tokens per second."""
+        limiter = RateLimiter.get_instance()
+        limiter.reset()
+
+        config = RateLimitConfig(requests=2, window=60)
+
+        await limiter.is_allowed("refill_client", config)
+        await limiter.is_allowed("refill_client", config)
+        allowed, _, retry_after = await limiter.is_allowed("refill_client", config)
+        assert allowed is False
+        assert retry_after == 30  # One token every 30 seconds
+
+        # Rewind the clock by one refill interval
+        limiter._clients["refill_client"].updated_at -= 30
+
+        allowed, remaining, _ = await limiter.is_allowed("refill_client", config)
+        assert allowed is True
+        assert remaining == 0
+
+
+class TestRedisRateLimiter:
+    """Unit tests for RedisRateLimiter class."""
+
+    @pytest.fixture
+    def mock_script(self):
+        """Patch the Redis pool and return the registered script mock."""
+        script = AsyncMock()
+        client = MagicMock()
+        client.register_script.return_value = script
+        with (
+            patch("src.app.middleware.rate_limit.RedisPool") as mock_pool,
+            patch("src.app.middleware.rate_limit.redis.Redis", return_value=client),
+        ):
+            client.connection_pool = mock_pool.get_pool.return_value
+            yield script
+
+    async def test_allowed(self, mock_script):
+        """Test an allowed request maps the script result."""
+        mock_script.return_value = [1, 99, 0]
+        limiter = RedisRateLimiter()
+
+        config = RateLimitConfig(requests=100, window=60)
+        result = await limiter.is_allowed("client:api", config)
+
+        assert result == (True, 99, 0)
+        mock_script.assert_awaited_once_with(
+            keys=["starter:ratelimit:client:api"], args=[600, 60000]
+        )
+
+    async def test_denied_rounds_retry_after_up(self, mock_script):
+        """Test retry_after is converted from milliseconds to whole seconds."""
+        mock_script.return_value = [0, 0, 1200]
+        limiter = RedisRateLimiter()
+
+        result = await limiter.is_allowed(
+            "client:api", RateLimitConfig(requests=100, window=60)
+        )
+
+        assert result == (False, 0, 2)
+
+    async def test_script_registered_once(self, mock_script):
+        """Test the script is registered once and reused per request."""
+        mock_script.return_value = [1, 1, 0]
+        limiter = RedisRateLimiter()
+        config = RateLimitConfig(requests=2, window=60)
+
+        await limiter.is_allowed("client:api", config)
+        await limiter.is_allowed("client:api", config)
+
+        assert limiter._client.register_script.call_count == 1
+        assert mock_script.await_count == 2
+
+    async def test_falls_back_when_pool_not_initialized(self):
+        """Test the in-memory limiter is used when Redis is not available."""
+        fallback = RateLimiter.get_instance()
+        fallback.reset()
+        limiter = RedisRateLimiter(fallback=fallback)
+
+        with patch("src.app.middleware.rate_limit.RedisPool") as mock_pool:
+            mock_pool.get_pool.side_effect = RuntimeError("Redis pool not initialized")
+            allowed, remaining, _ = await limiter.is_allowed(
+                "client:api", RateLimitConfig(requests=5, window=60)
+            )
+
+        assert allowed is True
+        assert remaining == 4
+        assert "client:api" in fallback._clients
+
+    async def test_falls_back_on_redis_error(self, mock_script):
+        """Test the in-memory limiter is used when the script call fails."""
+        mock_script.side_effect = RedisConnectionError("connection refused")
+        RateLimiter.get_instance().reset()
+        limiter = RedisRateLimiter()
+
+        allowed, remaining, _ = await limiter.is_allowed(
+            "client:api", RateLimitConfig(requests=5, window=60)
+        )
+
+        assert allowed is True
+        assert remaining == 4
+
+    def test_middleware_selects_backend(self):
+        """Test the middleware picks the limiter from the backend option."""
+        assert isinstance(
+            RateLimitMiddleware(app=None, backend="redis").limiter, RedisRateLimiter
+        )
+        assert isinstance(RateLimitMiddleware(app=None).limiter, RateLimiter)
+
 
 class TestRateLimiting:
     """Test rate limiting functionality."""
@@ -199,19 +317,17 @@ class TestRateLimitPerRoute:
         assert response.status_code == 200
         assert "X-RateLimit-Remaining" in response.headers
 
-    async def test_cleanup_empty_timestamps(self):
-        """Test cleanup handles clients with empty timestamps."""
+    async def test_cleanup_keeps_active_clients(self):
+        """Test cleanup keeps clients with recent activity."""
         limiter = RateLimiter.get_instance()
         limiter.reset()
 
-        # Add a client with empty timestamps
-        from src.app.middleware.rate_limit import ClientState
-
-        limiter._clients["empty_client"] = ClientState()
-        limiter._clients["empty_client"].timestamps = []
+        limiter._clients["active_client"] = ClientState(
+            tokens=5.0, updated_at=time.time()
+        )
 
         # Trigger cleanup
         await limiter._cleanup()
 
-        # Empty client should be removed
-        assert "empty_client" not in limiter._clients
+        # Active client should be kept
+        assert "active_client" in limiter._clients
@@ -1,12 +1,20 @@
 """Tests for security utilities."""
 
+import asyncio
+import threading
+
+import pytest
 from src.app.core.security import (
+    PasswordHasher,
     create_access_token,
     create_refresh_token,
     decode_token,
     get_password_hash,
+    hash_password_async,
     verify_password,
+    verify_password_async,
 )
+from src.app.services.exceptions import PasswordHasherBusyError
 
 
 def test_password_hash():
@@ -19,6 +27,50 @@ def test_password_hash():
     assert not verify_password("wrongpassword", hashed)
 
 
+@pytest.mark.asyncio
+async def test_password_hash_async():
+    """Test password hashing on the hashing pool."""
+    password = "testpassword123"
+    hashed = await hash_password_async(password)
+
+    assert hashed != password
+    assert await verify_password_async(password, hashed)
+    assert not await verify_password_async("wrongpassword", hashed)
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_rejects_when_queue_is_full():
+    """Test calls are rejected once the queue is full."""
+    hasher = PasswordHasher(max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    # One call occupies the worker and one waits in the queue
+    running = asyncio.create_task(hasher.run(release.wait))
+    queued = asyncio.create_task(hasher.run(release.wait))
+    await asyncio.sleep(0)
+
+    assert hasher.stats() == {
+        "workers": 1,
+        "in_flight": 1,
+        "queue_depth": 1,
+        "max_queue": 1,
+        "rejected": 0,
+    }
+
+    with pytest.raises(PasswordHasherBusyError):
+        await hasher.run(release.wait)
+    assert hasher.stats()["rejected"] == 1
+
+    release.set()
+    await asyncio.gather(running, queued)
+    assert hasher.stats()["in_flight"] == 0
+    assert hasher.stats()["queue_depth"] == 0
+
+    # Accepts calls again once the queue drains
+    assert await hasher.run(release.wait) is True
+    hasher.shutdown()
+
+
 def test_create_access_token():
     """Test access token creation."""
     token = create_access_token(subject="123")
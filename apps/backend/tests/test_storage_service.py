@@ -1,12 +1,19 @@
 """Storage service unit tests."""
 
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
+from botocore.exceptions import ClientError
 from src.app.core.config import settings
 from src.app.services.exceptions import (
     FileTooLargeError,
     InvalidFileTypeError,
+    StorageError,
 )
-from src.app.services.storage_service import StorageService
+from src.app.services.storage_service import PresignedUrlCache, StorageService
 
 
 @pytest.fixture
@@ -98,3 +105,326 @@ def test_get_client_config_without_endpoint(storage_settings, monkeypatch):
 
     assert "endpoint_url" not in config
     assert "use_ssl" not in config  # True is default, not explicitly set
+
+
+def test_get_client_config_connection_pool(storage_service_instance, monkeypatch):
+    """Test the client's connection pool and keep-alive are configurable."""
+    monkeypatch.setattr(settings, "s3_max_pool_connections", 50)
+    monkeypatch.setattr(settings, "s3_keepalive_timeout", 15)
+
+    config = storage_service_instance._get_client_config()["config"]
+
+    assert config.max_pool_connections == 50
+    assert config.connector_args == {"keepalive_timeout": 15}
+
+
+@pytest.fixture
+def client_factory(storage_service_instance, monkeypatch):
+    """Count the S3 clients opened by the storage service."""
+    opened: list[MagicMock] = []
+
+    @asynccontextmanager
+    async def client(**kwargs):
+        s3 = MagicMock(head_object=AsyncMock(), closed=False)
+        opened.append(s3)
+        try:
+            yield s3
+        finally:
+            s3.closed = True
+
+    monkeypatch.setattr(storage_service_instance._session, "client", client)
+    return opened
+
+
+async def test_operations_share_started_client(
+    storage_service_instance, client_factory
+):
+    """Test one client is reused by every operation once started."""
+    await storage_service_instance.start()
+    await storage_service_instance.file_exists("a.txt")
+    await storage_service_instance.file_exists("b.txt")
+
+    assert len(client_factory) == 1
+    assert client_factory[0].head_object.await_count == 2
+    assert client_factory[0].closed is False
+
+    await storage_service_instance.close()
+    assert client_factory[0].closed is True
+
+
+async def test_operations_open_own_client_when_not_started(
+    storage_service_instance, client_factory
+):
+    """Test each operation opens and closes a client before start()."""
+    await storage_service_instance.file_exists("a.txt")
+    await storage_service_instance.file_exists("b.txt")
+
+    assert len(client_factory) == 2
+    assert all(client.closed for client in client_factory)
+
+
+class ChunkedStream:
+    """Async stream that counts how many bytes have been read from it."""
+
+    def __init__(self, size: int):
+        self.remaining = size
+        self.bytes_read = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            size = self.remaining
+        # Return short reads, as sockets do
+        size = min(size, self.remaining, 300)
+        self.remaining -= size
+        self.bytes_read += size
+        return b"x" * size
+
+
+class FakeS3Client:
+    """S3 client double recording multipart calls and parts in flight."""
+
+    def __init__(self, fail_part: int | None = None):
+        self.fail_part = fail_part
+        self.calls: list[str] = []
+        self.parts: dict[int, int] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.completed_parts: list[dict] = []
+
+    async def put_object(self, **kwargs):
+        self.calls.append("put_object")
+        self.put_size = len(kwargs["Body"])
+
+    async def create_multipart_upload(self, **kwargs):
+        self.calls.append("create_multipart_upload")
+        return {"UploadId": "upload-1"}
+
+    async def upload_part(self, PartNumber, Body, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if PartNumber == self.fail_part:
+                raise ClientError({"Error": {"Code": "500"}}, "UploadPart")
+            self.parts[PartNumber] = len(Body)
+            return {"ETag": f'"etag-{PartNumber}"'}
+        finally:
+            self.in_flight -= 1
+
+    async def complete_multipart_upload(self, MultipartUpload, **kwargs):
+        self.calls.append("complete_multipart_upload")
+        self.completed_parts = MultipartUpload["Parts"]
+
+    async def abort_multipart_upload(self, **kwargs):
+        self.calls.append("abort_multipart_upload")
+
+
+@pytest.fixture
+def fake_s3(storage_service_instance, monkeypatch):
+    """Route the storage service to a fake S3 client with 1KB parts."""
+    monkeypatch.setattr(settings, "s3_multipart_part_size", 1024)
+    monkeypatch.setattr(settings, "s3_multipart_concurrency", 2)
+    client = FakeS3Client()
+
+    @asynccontextmanager
+    async def get_client():
+        yield client
+
+    monkeypatch.setattr(storage_service_instance, "_get_client", get_client)
+    return client
+
+
+async def test_stream_upload_small_file_uses_put_object(
+    storage_service_instance, fake_s3
+):
+    """Test streams that fit in one part are sent in a single request."""
+    result = await storage_service_instance.upload_file(
+        ChunkedStream(1000), "small.txt", "text/plain"
+    )
+
+    assert fake_s3.calls == ["put_object"]
+    assert fake_s3.put_size == 1000
+    assert result["size"] == 1000
+
+
+async def test_stream_upload_uses_multipart(storage_service_instance, fake_s3):
+    """Test larger streams are uploaded in parts with bounded concurrency."""
+    result = await storage_service_instance.upload_file(
+        ChunkedStream(10 * 1024 + 100), "large.txt", "text/plain"
+    )
+
+    assert result["size"] == 10 * 1024 + 100
+    assert fake_s3.calls == ["create_multipart_upload", "complete_multipart_upload"]
+    assert fake_s3.parts == {**dict.fromkeys(range(1, 11), 1024), 11: 100}
+    assert [p["PartNumber"] for p in fake_s3.completed_parts] == list(range(1, 12))
+    assert fake_s3.completed_parts[0]["ETag"] == '"etag-1"'
+    assert fake_s3.max_in_flight == 2
+
+
+async def test_stream_upload_too_large_aborts(
+    storage_service_instance, fake_s3, monkeypatch
+):
+    """Test the size limit is enforced while reading, aborting the upload."""
+    monkeypatch.setattr(settings, "s3_max_file_size", 4 * 1024)
+    stream = ChunkedStream(100 * 1024)
+
+    with pytest.raises(FileTooLargeError):
+        await storage_service_instance.upload_file(stream, "large.txt")
+
+    assert fake_s3.calls == ["create_multipart_upload", "abort_multipart_upload"]
+    # Reading stops at the first part past the limit
+    assert stream.bytes_read == 5 * 1024
+
+
+async def test_stream_upload_rejects_type_before_reading(
+    storage_service_instance, fake_s3
+):
+    """Test the extension is checked before any data is read."""
+    stream = ChunkedStream(1000)
+
+    with pytest.raises(InvalidFileTypeError):
+        await storage_service_instance.upload_file(stream, "script.exe")
+
+    assert stream.bytes_read == 0
+    assert fake_s3.calls == []
+
+
+async def test_stream_upload_part_failure_aborts(storage_service_instance, fake_s3):
+    """Test a failed part aborts the multipart upload."""
+    fake_s3.fail_part = 2
+
+    with pytest.raises(StorageError):
+        await storage_service_instance.upload_file(ChunkedStream(8 * 1024), "f.txt")
+
+    assert fake_s3.calls[0] == "create_multipart_upload"
+    assert fake_s3.calls[-1] == "abort_multipart_upload"
+    assert "complete_multipart_upload" not in fake_s3.calls
+
+
+async def test_upload_files_runs_concurrently_and_keeps_order(
+    storage_service_instance, monkeypatch
+):
+    """Test batch uploads are bounded, ordered and isolate failures."""
+    monkeypatch.setattr(settings, "s3_batch_upload_concurrency", 2)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def upload_file(file_content, filename, content_type=None, prefix=""):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if filename.endswith(".exe"):
+            raise InvalidFileTypeError(".exe")
+        return {"key": f"{prefix}{filename}"}
+
+    monkeypatch.setattr(storage_service_instance, "upload_file", upload_file)
+    files = [(b"x", f"file{i}.txt", "text/plain") for i in range(5)]
+    files.insert(2, (b"x", "script.exe", None))
+
+    results = await storage_service_instance.upload_files(files, prefix="uploads/")
+
+    assert max_in_flight == 2
+    assert isinstance(results[2], InvalidFileTypeError)
+    assert [r["key"] for r in results if isinstance(r, dict)] == [
+        f"uploads/file{i}.txt" for i in range(5)
+    ]
+
+
+@pytest.fixture
+def signing_client(storage_service_instance, monkeypatch):
+    """Route the storage service to a client that counts signed URLs."""
+    client = MagicMock()
+    client.generate_presigned_url = AsyncMock(
+        side_effect=lambda ClientMethod, Params, ExpiresIn: (
+            f"https://s3/{Params['Key']}?method={ClientMethod}&expires={ExpiresIn}"
+        )
+    )
+    opened = []
+
+    @asynccontextmanager
+    async def get_client():
+        opened.append(client)
+        yield client
+
+    monkeypatch.setattr(storage_service_instance, "_get_client", get_client)
+    client.opened = opened
+    return client
+
+
+async def test_get_presigned_urls_signs_batch_with_one_client(
+    storage_service_instance, signing_client
+):
+    """Test many keys are signed with a single client."""
+    keys = [f"file{i}.txt" for i in range(5)]
+
+    urls = await storage_service_instance.get_presigned_urls(keys + keys[:2])
+
+    assert list(urls) == keys
+    assert urls["file0.txt"].startswith("https://s3/file0.txt")
+    assert len(signing_client.opened) == 1
+    assert signing_client.generate_presigned_url.await_count == 5
+
+
+async def test_get_presigned_urls_reuses_cached_urls(
+    storage_service_instance, signing_client
+):
+    """Test recently signed URLs are reused instead of signed again."""
+    first = await storage_service_instance.get_presigned_urls(["a.txt", "b.txt"])
+    second = await storage_service_instance.get_presigned_urls(["a.txt", "c.txt"])
+    single = await storage_service_instance.get_presigned_url("b.txt")
+
+    assert second["a.txt"] == first["a.txt"]
+    assert single == first["b.txt"]
+    assert signing_client.generate_presigned_url.await_count == 3
+    assert len(signing_client.opened) == 2
+
+
+async def test_get_presigned_urls_cache_is_per_method_and_expiry(
+    storage_service_instance, signing_client
+):
+    """Test URLs for another method or lifetime are signed separately."""
+    await storage_service_instance.get_presigned_url("a.txt")
+    await storage_service_instance.get_presigned_url("a.txt", expires_in=7200)
+    await storage_service_instance.get_presigned_url("a.txt", method="put_object")
+
+    assert signing_client.generate_presigned_url.await_count == 3
+
+
+def test_presigned_url_cache_window(monkeypatch):
+    """Test cached URLs are reused for at most a tenth of their lifetime."""
+    cache = PresignedUrlCache(ttl=300)
+    now = 1_000_200.0  # Aligned with both windows
+    monkeypatch.setattr(time, "time", lambda: now)
+
+    cache.put("a.txt", "get_object", 3600, "url-1h")
+    cache.put("a.txt", "get_object", 600, "url-10m")
+    cache.put("a.txt", "get_object", 5, "url-5s")
+
+    assert cache.get("a.txt", "get_object", 3600) == "url-1h"
+    assert cache.get("a.txt", "get_object", 600) == "url-10m"
+    # Too short-lived to be worth caching
+    assert cache.get("a.txt", "get_object", 5) is None
+
+    # 10 minute URLs are reused for at most 60 seconds
+    now += 60
+    assert cache.get("a.txt", "get_object", 600) is None
+    assert cache.get("a.txt", "get_object", 3600) == "url-1h"
+
+    # 1 hour URLs are reused for at most the TTL
+    now += 240
+    assert cache.get("a.txt", "get_object", 3600) is None
+
+
+def test_presigned_url_cache_evicts_least_recently_used():
+    """Test the cache is bounded."""
+    cache = PresignedUrlCache(max_size=2)
+    cache.put("a.txt", "get_object", 3600, "a")
+    cache.put("b.txt", "get_object", 3600, "b")
+    cache.get("a.txt", "get_object", 3600)
+    cache.put("c.txt", "get_object", 3600, "c")
+
+    assert len(cache) == 2
+    assert cache.get("a.txt", "get_object", 3600) == "a"
+    assert cache.get("b.txt", "get_object", 3600) is None
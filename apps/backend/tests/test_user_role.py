@@ -1,11 +1,18 @@
 """User-Role relationship tests."""
 
+import uuid
+
 import pytest
-from sqlalchemy import select
+from sqlalchemy import event, insert, select
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from src.app.models import user_roles
 from src.app.models.role import Role
 from src.app.models.user import User
+from src.app.services.user_service import UserService
+
+from tests import conftest
 
 
 @pytest.mark.asyncio
@@ -294,3 +301,54 @@ async def test_get_user_with_roles_and_permissions(db_session: AsyncSession):
 
     assert "users:read" in all_permissions
     assert "users:write" in all_permissions
+
+
+def track_loaded(session: AsyncSession) -> list[object]:
+    """Collect the objects loaded from rows by a session."""
+    loaded: list[object] = []
+    event.listen(
+        session.sync_session,
+        "loaded_as_persistent",
+        lambda _, instance: loaded.append(instance),
+    )
+    return loaded
+
+
+@pytest.mark.asyncio
+async def test_fetch_user_does_not_load_users_of_shared_role(
+    db_session: AsyncSession,
+):
+    """Test fetching one user loads its role but not the role's other users."""
+    role = Role(code="user", name="Regular User")
+    db_session.add(role)
+    await db_session.commit()
+
+    user_ids = [uuid.uuid4() for _ in range(100_000)]
+    await db_session.execute(
+        insert(User),
+        [
+            {"id": user_id, "email": f"user{n}@example.com", "name": f"User {n}"}
+            for n, user_id in enumerate(user_ids)
+        ],
+    )
+    await db_session.execute(
+        insert(user_roles),
+        [{"user_id": user_id, "role_id": role.id} for user_id in user_ids],
+    )
+    await db_session.commit()
+
+    async with conftest.test_async_session_maker() as session:
+        loaded = track_loaded(session)
+        user = await UserService(session).get_by_id(user_ids[0], include_roles=True)
+
+        # One user row and one role row, not the 100k users of the role
+        assert [r.code for r in user.roles] == ["user"]
+        assert len(loaded) == 2
+        with pytest.raises(InvalidRequestError):
+            _ = user.roles[0].users
+
+    async with conftest.test_async_session_maker() as session:
+        loaded = track_loaded(session)
+        await UserService(session).get_user_permissions(user_ids[0])
+
+        assert len(loaded) == 2
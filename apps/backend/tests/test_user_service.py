@@ -1,12 +1,16 @@
 """User service tests."""
 
+from datetime import UTC, datetime
+
 import pytest
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.app.models import Permission, Role
+from src.app.models import Permission, Role, User
 from src.app.schemas.user import UserCreate, UserUpdate
 from src.app.services.exceptions import (
     EmailAlreadyExistsError,
     HardDeleteNotAllowedError,
+    InvalidCursorError,
     RoleNotFoundError,
     UserNotFoundError,
 )
@@ -204,6 +208,45 @@ async def test_list_users_with_roles(db_session: AsyncSession):
     assert len(users[0].roles) == 1
 
 
+@pytest.mark.asyncio
+async def test_paginate_users_with_cursor(db_session: AsyncSession):
+    """Test walking users page by page with cursors, including timestamp ties."""
+    service = UserService(db_session)
+    for i in range(7):
+        await service.create(UserCreate(email=f"user{i}@example.com", name=f"User {i}"))
+    # Most rows share one timestamp, so ordering relies on the id tie-breaker
+    await db_session.execute(
+        update(User)
+        .where(User.email != "user0@example.com")
+        .values(created_at=datetime(2025, 1, 1, tzinfo=UTC))
+    )
+    await db_session.commit()
+
+    seen = []
+    cursor = None
+    pages = 0
+    while True:
+        page = await service.paginate_users(limit=3, cursor=cursor)
+        seen.extend(user.id for user in page.items)
+        pages += 1
+        assert page.total is None
+        if not page.has_next:
+            break
+        cursor = page.next_cursor
+
+    assert pages == 3
+    assert len(seen) == len(set(seen)) == 7
+
+
+@pytest.mark.asyncio
+async def test_paginate_users_invalid_cursor(db_session: AsyncSession):
+    """Test a malformed cursor is rejected."""
+    service = UserService(db_session)
+
+    with pytest.raises(InvalidCursorError):
+        await service.paginate_users(cursor="not-a-cursor")
+
+
 @pytest.mark.asyncio
 async def test_update_user(db_session: AsyncSession):
     """Test updating a user."""
@@ -160,6 +160,53 @@ async def test_list_users_pagination(client: AsyncClient, superadmin_headers: di
     assert data["meta"]["has_next_page"] is True
 
 
+@pytest.mark.asyncio
+async def test_list_users_cursor_pagination(
+    client: AsyncClient, superadmin_headers: dict
+):
+    """Test walking users with next_cursor instead of page numbers."""
+    for i in range(4):
+        await client.post(
+            "/api/v1/users",
+            json={"email": f"user{i}@example.com", "name": f"User {i}"},
+            headers=superadmin_headers,
+        )
+
+    response = await client.get("/api/v1/users?limit=2", headers=superadmin_headers)
+    first_page = response.json()
+    cursor = first_page["meta"]["next_cursor"]
+    assert cursor is not None
+
+    response = await client.get(
+        f"/api/v1/users?limit=2&cursor={cursor}", headers=superadmin_headers
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["data"]) == 2
+    # Counting is skipped for cursor requests unless asked for
+    assert data["meta"]["total_items"] is None
+    assert data["meta"]["page"] is None
+    assert data["meta"]["has_prev_page"] is True
+    first_ids = {user["id"] for user in first_page["data"]}
+    assert first_ids.isdisjoint(user["id"] for user in data["data"])
+
+    response = await client.get(
+        f"/api/v1/users?limit=2&cursor={cursor}&include_total=true",
+        headers=superadmin_headers,
+    )
+    assert response.json()["meta"]["total_items"] == 5
+
+
+@pytest.mark.asyncio
+async def test_list_users_invalid_cursor(client: AsyncClient, superadmin_headers: dict):
+    """Test a malformed cursor returns 400."""
+    response = await client.get(
+        "/api/v1/users?cursor=not-a-cursor", headers=superadmin_headers
+    )
+    assert response.status_code == 400
+    assert response.json()["code"] == "INVALID_CURSOR"
+
+
 @pytest.mark.asyncio
 async def test_list_users_pagination_validation(
     client: AsyncClient, superadmin_headers: dict